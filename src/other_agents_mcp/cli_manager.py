@@ -80,14 +80,14 @@ def get_cli_version(command: str) -> Optional[str]:
             return version_output if version_output else None
         else:
             # --version이 실패하면 None 반환
-            logger.debug(f"{command} --version 실패 (코드 {result.returncode})")
+            logger.debug("%s --version 실패 (코드 %s)", command, result.returncode)
             return None
 
     except subprocess.TimeoutExpired:
         logger.warning(f"{command} --version 타임아웃")
         return None
     except FileNotFoundError:
-        logger.debug(f"{command} 명령어를 찾을 수 없음")
+        logger.debug("%s 명령어를 찾을 수 없음", command)
         return None
     except Exception as e:
         logger.error(f"{command} 버전 조회 중 예외: {e}")
@@ -122,7 +122,7 @@ def check_cli_auth(command: str) -> Optional[bool]:
         # 인증 실패 키워드 확인
         for keyword in AUTH_FAILURE_KEYWORDS:
             if keyword in output:
-                logger.debug(f"{command} 인증 필요: '{keyword}' 감지")
+                logger.debug("%s 인증 필요: '%s' 감지", command, keyword)
                 return False
 
         # 정상 응답이면 인증됨
@@ -136,7 +136,7 @@ def check_cli_auth(command: str) -> Optional[bool]:
         logger.warning(f"{command} 인증 체크 타임아웃")
         return None
     except Exception as e:
-        logger.debug(f"{command} 인증 체크 실패: {e}")
+        logger.debug("%s 인증 체크 실패: %s", command, e)
         return None
 
 
@@ -4,17 +4,35 @@
 - 기본 CLI (config.py)
 - 파일 기반 (custom_clis.json)
 - 런타임 추가 (add_cli)
+
+레지스트리 내용이 바뀔 수 있는 지점(인스턴스 생성, add_cli, custom_clis.json 수정)마다
+version 값이 달라지므로, 설정에서 파생한 값(file_handler 실행 계획 등)의 캐시 키로 사용합니다.
+
+환경 변수:
+    MCP_CUSTOM_CLIS_CHECK_INTERVAL: custom_clis.json 변경 확인 간격 (초, 기본값: 1)
 """
 
+import itertools
 import json
+import os
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .config import CLI_CONFIGS, CLIConfig
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# custom_clis.json 경로 (프로젝트 루트)
+CUSTOM_CLIS_PATH = Path(__file__).parent.parent.parent / "custom_clis.json"
+
+# version 조회 시 custom_clis.json을 다시 stat하는 최소 간격 (CLI 호출마다 stat하지 않도록)
+CUSTOM_CLIS_CHECK_INTERVAL = float(os.environ.get("MCP_CUSTOM_CLIS_CHECK_INTERVAL", "1"))
+
+# 레지스트리 인스턴스와 런타임 추가마다 증가하는 버전 번호 (인스턴스를 다시 만들어도 겹치지 않음)
+_version_counter = itertools.count(1)
+
 
 class CLIRegistry:
     """CLI 레지스트리 (싱글톤)"""
@@ -31,8 +49,36 @@ class CLIRegistry:
         if not hasattr(self, "_initialized"):
             self._initialized = True
             self._runtime_clis: Dict[str, CLIConfig] = {}
+            self._version = next(_version_counter)
+            # (파일 시그니처, 파싱 결과) - 파일이 바뀌지 않았으면 다시 읽지 않음
+            self._file_cache: Optional[Tuple[Optional[tuple], Dict[str, CLIConfig]]] = None
+            # version에 사용하는 마지막 파일 시그니처와 확인 시각 (time.monotonic)
+            self._signature: Optional[tuple] = None
+            self._signature_checked_at: Optional[float] = None
             logger.info("CLI Registry initialized")
 
+    @property
+    def version(self) -> tuple:
+        """
+        레지스트리 버전
+
+        런타임 추가 버전과 custom_clis.json 시그니처(mtime, 크기, inode)의 조합이며,
+        값이 같으면 get_all_clis() 결과도 같습니다.
+        파일 시그니처는 CUSTOM_CLIS_CHECK_INTERVAL초마다 한 번만 확인하므로
+        파일 수정은 최대 그 간격만큼 늦게 반영됩니다 (add_cli는 즉시 반영).
+
+        Returns:
+            비교 가능한 버전 튜플
+        """
+        now = time.monotonic()
+        if (
+            self._signature_checked_at is None
+            or now - self._signature_checked_at >= CUSTOM_CLIS_CHECK_INTERVAL
+        ):
+            self._signature = self._file_signature()
+            self._signature_checked_at = now
+        return (self._version, self._signature)
+
     def get_all_clis(self) -> Dict[str, CLIConfig]:
         """
         모든 CLI 설정 반환 (3단계 병합)
@@ -44,20 +90,20 @@ class CLIRegistry:
         """
         # 1. 기본 CLI (config.py)
         merged = dict(CLI_CONFIGS)
-        logger.debug(f"Loaded {len(merged)} base CLIs from config.py")
+        logger.debug("Loaded %d base CLIs from config.py", len(merged))
 
         # 2. 파일 기반 (custom_clis.json)
         file_clis = self._load_from_file()
         if file_clis:
             merged.update(file_clis)
-            logger.debug(f"Loaded {len(file_clis)} CLIs from custom_clis.json")
+            logger.debug("Loaded %d CLIs from custom_clis.json", len(file_clis))
 
         # 3. 런타임 추가
         if self._runtime_clis:
             merged.update(self._runtime_clis)
-            logger.debug(f"Loaded {len(self._runtime_clis)} runtime CLIs")
+            logger.debug("Loaded %d runtime CLIs", len(self._runtime_clis))
 
-        logger.info(f"Total {len(merged)} CLIs available")
+        logger.debug("Total %d CLIs available", len(merged))
         return merged
 
     def add_cli(
@@ -70,6 +116,7 @@ class CLIRegistry:
         supports_skip_git_check: Optional[bool] = None,
         skip_git_check_position: Optional[str] = None,
         supported_args: Optional[list] = None,
+        json_output_args: Optional[list] = None,
     ) -> None:
         """
         런타임에 CLI 추가
@@ -83,6 +130,7 @@ class CLIRegistry:
             supports_skip_git_check: Git 체크 스킵 지원 (선택, 기본값: False)
             skip_git_check_position: 플래그 위치 (선택, 기본값: "before_extra_args")
             supported_args: 지원하는 CLI 인자 (선택, 기본값: [])
+            json_output_args: JSON 출력 요청 인자 (선택, 기본값: [])
         """
         cli_config: CLIConfig = {
             "command": command,
@@ -98,17 +146,35 @@ class CLIRegistry:
                 else "before_extra_args"
             ),
             "supported_args": supported_args if supported_args is not None else [],
+            "json_output_args": json_output_args if json_output_args is not None else [],
         }
 
         self._runtime_clis[name] = cli_config
-        logger.info(f"Added runtime CLI: {name} -> {command}")
+        self._version = next(_version_counter)
+        logger.info("Added runtime CLI: %s -> %s", name, command)
+
+    def _file_signature(self) -> Optional[tuple]:
+        """custom_clis.json 변경 감지용 시그니처 (파일이 없으면 None)"""
+        try:
+            stat = os.stat(CUSTOM_CLIS_PATH)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     def _load_from_file(self) -> Dict[str, CLIConfig]:
-        """custom_clis.json 파일에서 CLI 로드"""
-        config_path = Path(__file__).parent.parent.parent / "custom_clis.json"
+        """custom_clis.json 파일에서 CLI 로드 (파일이 바뀌었을 때만 다시 파싱)"""
+        signature = self._file_signature()
+        if self._file_cache is not None and self._file_cache[0] == signature:
+            return self._file_cache[1]
+
+        clis = self._read_file(CUSTOM_CLIS_PATH)
+        self._file_cache = (signature, clis)
+        return clis
 
+    def _read_file(self, config_path: Path) -> Dict[str, CLIConfig]:
+        """custom_clis.json 파일 파싱 및 검증"""
         if not config_path.exists():
-            logger.debug(f"custom_clis.json not found at {config_path}")
+            logger.debug("custom_clis.json not found at %s", config_path)
             return {}
 
         try:
@@ -119,7 +185,7 @@ class CLIRegistry:
             for name, config in custom_clis.items():
                 # 메타 필드 무시 (_로 시작하는 키)
                 if name.startswith("_"):
-                    logger.debug(f"Skipping meta field: {name}")
+                    logger.debug("Skipping meta field: %s", name)
                     continue
 
                 if not isinstance(config, dict):
@@ -134,7 +200,7 @@ class CLIRegistry:
                 # 기본값 적용
                 validated[name] = self._apply_defaults(config)
 
-            logger.info(f"Loaded {len(validated)} CLIs from custom_clis.json")
+            logger.info("Loaded %s CLIs from custom_clis.json", len(validated))
             return validated
 
         except json.JSONDecodeError as e:
@@ -154,6 +220,7 @@ class CLIRegistry:
             "supports_skip_git_check": config.get("supports_skip_git_check", False),
             "skip_git_check_position": config.get("skip_git_check_position", "before_extra_args"),
             "supported_args": config.get("supported_args", []),
+            "json_output_args": config.get("json_output_args", []),
         }
 
 
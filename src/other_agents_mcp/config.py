@@ -6,16 +6,45 @@ import os
 from pathlib import Path
 from typing import TypedDict, Literal
 
-
 # --- Task Manager Configuration ---
-# STORAGE_TYPE: "memory" 또는 "sqlite"
+# STORAGE_TYPE: "memory", "sqlite" 또는 "tiered" (메모리 LRU + SQLite)
 # MCP_STORAGE_TYPE 환경 변수로 오버라이드 가능
-STORAGE_TYPE: Literal["memory", "sqlite"] = os.environ.get("MCP_STORAGE_TYPE", "memory")
+STORAGE_TYPE: Literal["memory", "sqlite", "tiered"] = os.environ.get("MCP_STORAGE_TYPE", "memory")
 
 # SQLite 데이터베이스 경로
 # 프로젝트 루트의 .data 폴더에 저장
 SQLITE_DB_PATH = Path(__file__).parent.parent.parent / ".data" / "tasks.db"
 
+# 큰 작업 결과를 보관하는 폴더 (MCP_RESULT_SPILL_BYTES 초과 결과)
+# MCP_RESULT_DIR 환경 변수로 오버라이드 가능
+RESULT_SPILL_DIR = Path(
+    os.environ.get("MCP_RESULT_DIR", Path(__file__).parent.parent.parent / ".data" / "results")
+)
+
+# 회의 발언 기록(JSONL) 저장 폴더
+# MCP_MEETING_TRANSCRIPT_DIR 환경 변수로 오버라이드 가능
+MEETING_TRANSCRIPT_DIR = Path(
+    os.environ.get(
+        "MCP_MEETING_TRANSCRIPT_DIR",
+        Path(__file__).parent.parent.parent / ".data" / "meetings",
+    )
+)
+
+# 도구 호출 프로파일(.pstats/.collapsed)과 메모리 스냅샷 저장 폴더
+# MCP_PROFILE_DIR 환경 변수로 오버라이드 가능
+PROFILE_DIR = Path(
+    os.environ.get("MCP_PROFILE_DIR", Path(__file__).parent.parent.parent / ".data" / "profiles")
+)
+
+# 항상 프로파일링할 도구 이름 (쉼표 구분, "*"는 전체, 비어 있으면 _profile 인자로 요청한 호출만)
+# MCP_PROFILE_TOOLS 환경 변수로 설정 (서버는 프로파일링이 필요할 때만 profiling 모듈을 불러옴)
+PROFILE_TOOLS = frozenset(
+    name.strip() for name in os.environ.get("MCP_PROFILE_TOOLS", "").split(",") if name.strip()
+)
+
+# 도구 인자로 개별 호출의 프로파일링을 요청하는 예약 키 (도구에는 전달하지 않음)
+PROFILE_ARGUMENT = "_profile"
+
 
 class CLIConfig(TypedDict):
     """CLI 설정 타입"""
@@ -27,6 +56,7 @@ class CLIConfig(TypedDict):
     supports_skip_git_check: bool  # --skip-git-repo-check 플래그 지원 여부
     skip_git_check_position: str  # 플래그 위치: "before_extra_args" 또는 "after_extra_args"
     supported_args: list[str]  # 지원하는 CLI 인자 목록
+    json_output_args: list[str]  # JSON 출력 요청 인자 (구조화된 회의 투표용, 미지원 시 [])
 
 
 # CLI별 설정
@@ -55,6 +85,7 @@ CLI_CONFIGS: dict[str, CLIConfig] = {
             "--output-format",
             "--dangerously-skip-permissions",
         ],
+        "json_output_args": ["--output-format", "json"],
     },
     "gemini": {
         "command": "gemini",
@@ -79,6 +110,7 @@ CLI_CONFIGS: dict[str, CLIConfig] = {
             "--list-sessions",
             "--delete-session",
         ],
+        "json_output_args": ["--output-format", "json"],
     },
     "codex": {
         "command": "codex",
@@ -104,6 +136,8 @@ CLI_CONFIGS: dict[str, CLIConfig] = {
             "--add-dir",
             "--output-last-message",
         ],
+        # --json은 이벤트 스트림(JSONL), --output-schema는 스키마 파일이 필요하여 사용하지 않음
+        "json_output_args": [],
     },
     "qwen": {
         "command": "qwen",
@@ -131,5 +165,6 @@ CLI_CONFIGS: dict[str, CLIConfig] = {
             "--google-search-engine-id",
             "--web-search-default",
         ],
+        "json_output_args": ["--output-format", "json"],
     },
 }
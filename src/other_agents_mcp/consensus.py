@@ -6,6 +6,7 @@
 - 만장일치 판정
 """
 
+import json
 import re
 from typing import Optional
 
@@ -16,6 +17,7 @@ logger = get_logger(__name__)
 
 
 # 투표 키워드 패턴 (DISAGREE를 먼저 검사하여 "disagreed"가 "agreed"로 매칭되지 않도록 함)
+# 대소문자 구분 없이 비교합니다 (결합 정규식은 소문자로 변환하여 사용).
 VOTE_PATTERNS = {
     VoteType.DISAGREE: [
         r"\[DISAGREE\]",
@@ -33,7 +35,8 @@ VOTE_PATTERNS = {
         r"동의합니다",
         r"찬성합니다",
         r"I agree",
-        r"(?<!\bdis)agreed",
+        # "disagreed"의 일부가 아닌 "agreed" (후방 탐색을 뒤에 두어 접두 검색 최적화 유지)
+        r"agreed(?<!\bdisagreed)",
     ],
     VoteType.ABSTAIN: [
         r"\[ABSTAIN\]",
@@ -44,8 +47,75 @@ VOTE_PATTERNS = {
     ],
 }
 
+# 투표 우선순위 (DISAGREE > AGREE > ABSTAIN, 낮을수록 우선)
+_VOTE_PRECEDENCE = {vote_type: rank for rank, vote_type in enumerate(VOTE_PATTERNS)}
 
-def generate_meeting_system_prompt(topic: str, round_number: int, previous_responses: list[dict] = None) -> str:
+# 응답 끝에서 명시적 투표 태그를 찾는 범위 (문자)
+VOTE_TAIL_CHARS = 200
+
+
+def _is_vote_tag(pattern: str) -> bool:
+    """명시적 투표 태그 패턴인지 확인 ([AGREE] 등)"""
+    return pattern.startswith(r"\[")
+
+
+def _compile_vote_matcher(only_tags: bool = False) -> re.Pattern:
+    """
+    VOTE_PATTERNS를 소문자 단일 정규식으로 결합
+
+    캡처 그룹과 IGNORECASE를 쓰지 않아야 정규식 엔진의 접두 문자 검색 최적화가
+    적용되므로, 입력을 소문자로 바꾼 뒤 매칭하고 투표 타입은 별도로 분류합니다.
+    """
+    patterns = [
+        p.lower()
+        for vote_patterns in VOTE_PATTERNS.values()
+        for p in vote_patterns
+        if not only_tags or _is_vote_tag(p)
+    ]
+    return re.compile("|".join(patterns))
+
+
+# 모든 투표 패턴 (단일 패스 전체 검사용)
+_VOTE_MATCHER = _compile_vote_matcher()
+# 명시적 투표 태그만 (응답 끝 우선 검사용)
+_VOTE_TAG_MATCHER = _compile_vote_matcher(only_tags=True)
+# 매칭된 문자열의 투표 타입 분류용 (우선순위 순서)
+_VOTE_CLASSIFIERS = [
+    (vote_type, re.compile("|".join(p.lower() for p in patterns)))
+    for vote_type, patterns in VOTE_PATTERNS.items()
+]
+# 합의 내용에서 제거할 동의 표현
+_AGREE_MATCHER = re.compile("|".join(VOTE_PATTERNS[VoteType.AGREE]), re.IGNORECASE)
+
+# 구조화된 투표 응답 형식 안내 (structured_votes 사용 시)
+STRUCTURED_VOTE_INSTRUCTION = (
+    "응답은 다른 텍스트 없이 JSON 객체 하나로 작성하세요: "
+    '{"opinion": "의견", "vote": "agree" | "disagree" | "abstain"}'
+)
+
+# 구조화된 응답의 vote 값 → VoteType
+_STRUCTURED_VOTE_VALUES = {
+    "agree": VoteType.AGREE,
+    "disagree": VoteType.DISAGREE,
+    "abstain": VoteType.ABSTAIN,
+    "동의": VoteType.AGREE,
+    "찬성": VoteType.AGREE,
+    "반대": VoteType.DISAGREE,
+    "기권": VoteType.ABSTAIN,
+}
+
+# CLI JSON 출력에서 모델 응답 텍스트를 담는 키 (claude: result, gemini/qwen: response)
+_OUTPUT_ENVELOPE_KEYS = ("result", "response")
+
+
+def generate_meeting_system_prompt(
+    topic: str,
+    round_number: int,
+    previous_responses: list[dict] = None,
+    max_response_chars: Optional[int] = 500,
+    structured_votes: bool = False,
+    context: Optional[str] = None,
+) -> str:
     """
     회의용 시스템 프롬프트 생성
 
@@ -53,6 +123,9 @@ def generate_meeting_system_prompt(topic: str, round_number: int, previous_respo
         topic: 회의 주제
         round_number: 현재 라운드 번호
         previous_responses: 이전 라운드 응답들
+        max_response_chars: 응답당 최대 길이 (None이면 자르지 않음, 압축된 발언용)
+        structured_votes: JSON 형식({opinion, vote})으로 응답 요청
+        context: 참고 자료 (선택, 주제 다음에 포함)
 
     Returns:
         시스템 프롬프트 문자열
@@ -63,6 +136,12 @@ def generate_meeting_system_prompt(topic: str, round_number: int, previous_respo
         "## 회의 주제",
         f"{topic}",
         "",
+    ]
+
+    if context:
+        prompt_parts.extend(["## 참고 자료", context, ""])
+
+    prompt_parts += [
         f"## 현재 라운드: {round_number}",
         "",
         "## 규칙",
@@ -78,46 +157,263 @@ def generate_meeting_system_prompt(topic: str, round_number: int, previous_respo
         "- 투표 없이 응답하면 [ABSTAIN]으로 처리됩니다.",
     ]
 
+    if structured_votes:
+        prompt_parts.append("")
+        prompt_parts.append("## 응답 형식 (JSON)")
+        prompt_parts.append(STRUCTURED_VOTE_INSTRUCTION)
+        prompt_parts.append("- 투표는 태그 대신 vote 필드로 표시합니다.")
+
     # 이전 라운드 응답 추가 (투표 결과는 마스킹하여 순응성 방지)
     if previous_responses:
         prompt_parts.append("")
         prompt_parts.append("## 이전 라운드 발언")
-        prompt_parts.append("(참고: 다른 에이전트의 투표 결과는 공개되지 않습니다. 의견 내용만 참고하세요.)")
-        for resp in previous_responses:
-            agent = resp.get("agent_name", "Unknown")
-            content = resp.get("response", "")[:500]  # 최대 500자
-            # 투표 결과 마스킹 - 의견만 공개
-            prompt_parts.append(f"- **{agent}**: {content}")
+        prompt_parts.extend(_format_previous_responses(previous_responses, max_response_chars))
 
     return "\n".join(prompt_parts)
 
 
+def generate_meeting_round_delta(
+    round_number: int,
+    previous_responses: list[dict] = None,
+    agent_name: str = None,
+    max_response_chars: Optional[int] = 500,
+    structured_votes: bool = False,
+) -> str:
+    """
+    세션 모드 회의용 라운드 증분 프롬프트 생성
+
+    세션에 이미 주제, 규칙, 자신의 이전 발언이 남아 있으므로
+    새 라운드 번호와 다른 에이전트의 지난 라운드 발언만 전달합니다.
+
+    Args:
+        round_number: 현재 라운드 번호
+        previous_responses: 직전 라운드 응답들 (세션에 이미 전달한 이전 라운드 발언은 제외)
+        agent_name: 프롬프트를 받을 에이전트 (자신의 발언은 제외)
+        max_response_chars: 응답당 최대 길이 (None이면 자르지 않음, 압축된 발언용)
+        structured_votes: JSON 형식({opinion, vote})으로 응답 요청
+
+    Returns:
+        유저 프롬프트 문자열
+    """
+    others = [r for r in (previous_responses or []) if r.get("agent_name") != agent_name]
+
+    prompt_parts = [f"## 현재 라운드: {round_number}"]
+
+    if others:
+        prompt_parts.append("")
+        prompt_parts.append("## 다른 에이전트의 지난 라운드 발언")
+        prompt_parts.extend(_format_previous_responses(others, max_response_chars))
+
+    prompt_parts.append("")
+    if structured_votes:
+        prompt_parts.append(f"위 의견을 고려하여 의견을 제시하세요. {STRUCTURED_VOTE_INSTRUCTION}")
+    else:
+        prompt_parts.append(
+            "위 의견을 고려하여 의견을 제시하고, 마지막에 [AGREE], [DISAGREE], [ABSTAIN] 중 하나로 투표해주세요."
+        )
+
+    return "\n".join(prompt_parts)
+
+
+def _format_previous_responses(
+    previous_responses: list[dict],
+    max_response_chars: Optional[int] = 500,
+) -> list[str]:
+    """이전 라운드 발언 목록 포맷 (투표 결과 마스킹)"""
+    lines = ["(참고: 다른 에이전트의 투표 결과는 공개되지 않습니다. 의견 내용만 참고하세요.)"]
+    for resp in previous_responses:
+        agent = resp.get("agent_name", "Unknown")
+        if resp.get("carried_over"):
+            # 이전 라운드 마감 이후 도착한 응답
+            agent = f"{agent} (지난 라운드 지연 응답)"
+        content = resp.get("response", "")
+        if max_response_chars is not None:
+            content = content[:max_response_chars]  # 기본 최대 500자
+        # 투표 결과 마스킹 - 의견만 공개
+        lines.append(f"- **{agent}**: {content}")
+    return lines
+
+
 def parse_vote_from_response(response: str) -> VoteType:
     """
     응답에서 투표 추출
 
+    응답 끝(VOTE_TAIL_CHARS)의 명시적 태그([AGREE] 등)를 우선 사용하고,
+    없으면 전체 응답에서 투표 표현을 찾습니다. 어느 경우든 여러 투표가 있으면
+    DISAGREE > AGREE > ABSTAIN 우선순위를 따릅니다.
+
     Args:
         response: 에이전트 응답 문자열
 
     Returns:
         VoteType (기본값: ABSTAIN)
     """
-    # 각 투표 타입별 패턴 검사 (VOTE_PATTERNS 순서: DISAGREE > AGREE > ABSTAIN)
-    # DISAGREE를 먼저 검사하여 "disagreed"가 "agreed"로 오인식되지 않도록 함
-    for vote_type, patterns in VOTE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                logger.debug(f"투표 감지: {vote_type.value} (패턴: {pattern})")
-                return vote_type
+    # 1. 투표 태그는 응답 마지막에 요구되므로 끝부분의 명시적 태그를 먼저 확인
+    vote_type = _scan_votes(_VOTE_TAG_MATCHER, response[-VOTE_TAIL_CHARS:].lower())
+    if vote_type is not None:
+        logger.debug("투표 감지 (응답 끝 태그): %s", vote_type.value)
+        return vote_type
+
+    # 2. 태그가 없으면 전체 응답을 한 번만 훑어 우선순위가 가장 높은 표현 선택
+    vote_type = _scan_votes(_VOTE_MATCHER, response.lower())
+    if vote_type is not None:
+        logger.debug("투표 감지: %s", vote_type.value)
+        return vote_type
 
     # 패턴 미발견 시 기권 처리
     logger.warning("투표 패턴을 찾지 못함. 기권으로 처리")
     return VoteType.ABSTAIN
 
 
+def _scan_votes(matcher: re.Pattern, text: str) -> Optional[VoteType]:
+    """
+    결합 정규식으로 텍스트를 한 번 훑어 우선순위가 가장 높은 투표 반환
+
+    Args:
+        matcher: 소문자 결합 정규식
+        text: 소문자로 변환된 검사 대상 텍스트
+
+    Returns:
+        VoteType 또는 None (매칭 없음)
+    """
+    best: Optional[VoteType] = None
+    for match in matcher.finditer(text):
+        vote_type = _classify_vote(match.group())
+        if vote_type == VoteType.DISAGREE:
+            # 최우선 투표이므로 더 볼 필요 없음
+            return vote_type
+        if best is None or _VOTE_PRECEDENCE[vote_type] < _VOTE_PRECEDENCE[best]:
+            best = vote_type
+    return best
+
+
+def _classify_vote(matched: str) -> VoteType:
+    """결합 정규식에 매칭된 문자열의 투표 타입 판별"""
+    for vote_type, classifier in _VOTE_CLASSIFIERS:
+        if classifier.fullmatch(matched):
+            return vote_type
+    return VoteType.ABSTAIN
+
+
+def parse_structured_vote(output: str) -> tuple[str, Optional[VoteType]]:
+    """
+    구조화된 투표 응답({opinion, vote}) 파싱
+
+    CLI의 JSON 출력 래퍼(claude의 result, gemini/qwen의 response)를 벗긴 뒤
+    응답 텍스트에서 JSON 객체를 찾습니다. 코드 블록이나 앞뒤 설명이 있어도 동작합니다.
+
+    Args:
+        output: CLI 출력 문자열
+
+    Returns:
+        (의견 텍스트, VoteType) - 구조화된 투표를 찾지 못하면 (응답 텍스트, None)
+        None이면 호출 측에서 parse_vote_from_response로 대체합니다.
+    """
+    text = _unwrap_output_envelope(output)
+    payload = _find_vote_payload(text)
+    if payload is None:
+        return text, None
+
+    vote = _STRUCTURED_VOTE_VALUES.get(str(payload.get("vote", "")).strip().strip("[]").lower())
+    if vote is None:
+        return text, None
+
+    opinion = payload.get("opinion")
+    return (opinion if isinstance(opinion, str) else text), vote
+
+
+def _unwrap_output_envelope(output: str) -> str:
+    """CLI JSON 출력 래퍼에서 모델 응답 텍스트 추출 (래퍼가 아니면 그대로 반환)"""
+    stripped = output.strip()
+    if not stripped.startswith("{"):
+        return output
+    try:
+        data = json.loads(stripped)
+    except ValueError:
+        return output
+    if not isinstance(data, dict) or "vote" in data:
+        return output
+    for key in _OUTPUT_ENVELOPE_KEYS:
+        if isinstance(data.get(key), str):
+            return data[key]
+    return output
+
+
+def _find_vote_payload(text: str) -> Optional[dict]:
+    """텍스트에서 vote 키를 가진 JSON 객체 탐색 (투표가 요구되는 끝부분부터)"""
+    decoder = json.JSONDecoder()
+    start = text.rfind("{")
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and "vote" in data:
+            return data
+        start = text.rfind("{", 0, start)
+    return None
+
+
+# 합의 유형별 임계값 이름 (로깅용)
+CONSENSUS_THRESHOLD_NAMES = {
+    ConsensusType.UNANIMOUS: "만장일치 (100%)",
+    ConsensusType.SUPERMAJORITY: "절대다수 (2/3)",
+    ConsensusType.MAJORITY: "과반수 (50%+)",
+}
+
+
+def _is_threshold_met(agree_votes: int, total_votes: int, consensus_type: ConsensusType) -> bool:
+    """찬성 수가 합의 유형의 임계값을 충족하는지 확인"""
+    if total_votes <= 0:
+        return False
+
+    agree_ratio = agree_votes / total_votes
+
+    if consensus_type == ConsensusType.UNANIMOUS:
+        return agree_ratio == 1.0
+    elif consensus_type == ConsensusType.SUPERMAJORITY:
+        return agree_ratio >= 2 / 3
+    elif consensus_type == ConsensusType.MAJORITY:
+        return agree_ratio > 0.5
+
+    return False
+
+
+def predict_consensus(
+    votes: list[VoteType],
+    total_agents: int,
+    consensus_type: ConsensusType = ConsensusType.UNANIMOUS,
+) -> Optional[bool]:
+    """
+    일부 에이전트만 응답한 상태에서 라운드 결과가 확정되었는지 판단
+
+    아직 응답하지 않은 에이전트는 기권(ABSTAIN)으로 기록된다는 전제에서
+    남은 투표와 무관하게 결과가 정해졌는지 확인합니다.
+
+    Args:
+        votes: 지금까지 도착한 투표 목록
+        total_agents: 라운드 참여 에이전트 수
+        consensus_type: 합의 유형
+
+    Returns:
+        True: 합의 확정, False: 합의 불가능 확정, None: 아직 미정
+    """
+    agree_votes = sum(1 for v in votes if v == VoteType.AGREE)
+    pending = total_agents - len(votes)
+
+    # 남은 에이전트가 모두 반대해도 임계값 충족 → 합의 확정
+    if _is_threshold_met(agree_votes, total_agents, consensus_type):
+        return True
+
+    # 남은 에이전트가 모두 찬성해도 임계값 미달 → 합의 불가능
+    if not _is_threshold_met(agree_votes + pending, total_agents, consensus_type):
+        return False
+
+    return None
+
+
 def check_consensus(
-    round_result: MeetingRound,
-    consensus_type: ConsensusType = ConsensusType.UNANIMOUS
+    round_result: MeetingRound, consensus_type: ConsensusType = ConsensusType.UNANIMOUS
 ) -> bool:
     """
     합의 확인 (다양한 합의 유형 지원)
@@ -137,18 +433,8 @@ def check_consensus(
     agree_ratio = agree_votes / total_votes
 
     # 합의 유형별 임계값 확인
-    threshold_met = False
-    threshold_name = ""
-
-    if consensus_type == ConsensusType.UNANIMOUS:
-        threshold_met = agree_ratio == 1.0
-        threshold_name = "만장일치 (100%)"
-    elif consensus_type == ConsensusType.SUPERMAJORITY:
-        threshold_met = agree_ratio >= 2/3
-        threshold_name = "절대다수 (2/3)"
-    elif consensus_type == ConsensusType.MAJORITY:
-        threshold_met = agree_ratio > 0.5
-        threshold_name = "과반수 (50%+)"
+    threshold_met = _is_threshold_met(agree_votes, total_votes, consensus_type)
+    threshold_name = CONSENSUS_THRESHOLD_NAMES.get(consensus_type, "")
 
     if threshold_met:
         logger.info(
@@ -161,8 +447,7 @@ def check_consensus(
     # 투표 요약 로깅
     summary = round_result.get_vote_summary()
     logger.info(
-        f"라운드 {round_result.round_number}: 합의 미도달 - {summary} "
-        f"(필요: {threshold_name})"
+        f"라운드 {round_result.round_number}: 합의 미도달 - {summary} " f"(필요: {threshold_name})"
     )
 
     return False
@@ -181,11 +466,7 @@ def check_unanimous(round_result: MeetingRound) -> bool:
     return check_consensus(round_result, ConsensusType.UNANIMOUS)
 
 
-def should_continue_meeting(
-    current_round: int,
-    max_rounds: int,
-    is_unanimous: bool
-) -> bool:
+def should_continue_meeting(current_round: int, max_rounds: int, is_unanimous: bool) -> bool:
     """
     회의 계속 여부 판단
 
@@ -204,7 +485,7 @@ def should_continue_meeting(
 
     # 최대 라운드 도달 시 종료
     if current_round >= max_rounds:
-        logger.info(f"최대 라운드({max_rounds}) 도달로 회의 종료")
+        logger.info("최대 라운드(%s) 도달로 회의 종료", max_rounds)
         return False
 
     return True
@@ -226,9 +507,7 @@ def extract_consensus_statement(round_result: MeetingRound) -> Optional[str]:
     for response in round_result.responses:
         if response.vote == VoteType.AGREE:
             # 투표 태그 제거 후 첫 200자 반환
-            content = response.response
-            for pattern in VOTE_PATTERNS[VoteType.AGREE]:
-                content = re.sub(pattern, "", content, flags=re.IGNORECASE)
+            content = _AGREE_MATCHER.sub("", response.response)
             return content.strip()[:200]
 
     return None
@@ -0,0 +1,216 @@
+"""Fake CLI
+
+부하/지연 테스트용 가짜 AI CLI (네트워크, 과금 없음)
+- 실제 CLI처럼 stdin으로 프롬프트를 읽고 stdout으로 응답을 출력
+- 시작 지연, 출력 속도, 출력 크기, 투표, 종료 코드, 무응답(hang)을 인자로 설정
+- add_agent 또는 custom_clis.json으로 등록하여 실제 실행 경로(_execute_cli, 세마포어, 회의)를 그대로 사용
+
+실행:
+    python -m other_agents_mcp.fake_cli --delay 0.5 --size 4096 --vote agree < prompt.txt
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+from typing import Optional
+
+from .cli_registry import get_cli_registry
+
+VOTE_CHOICES = ("agree", "disagree", "abstain", "random", "none")
+
+# 스트리밍 출력 단위 (바이트)
+DEFAULT_CHUNK_BYTES = 4096
+
+_FILLER_LINE = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """가짜 CLI 인자 파서를 생성합니다."""
+    parser = argparse.ArgumentParser(
+        prog="other-agents-fake-cli",
+        description="부하/지연 테스트용 가짜 AI CLI",
+    )
+    parser.add_argument("--delay", type=float, default=0.0, help="첫 출력 전 대기 시간 (초)")
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="시작 지연에 더할 최대 무작위 시간 (초)"
+    )
+    parser.add_argument(
+        "--rate", type=int, default=0, help="출력 속도 (바이트/초, 0이면 제한 없음)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_BYTES, help="스트리밍 출력 단위 (바이트)"
+    )
+    parser.add_argument("--size", type=int, default=0, help="응답 크기 (바이트, 0이면 요약 한 줄)")
+    parser.add_argument(
+        "--vote", choices=VOTE_CHOICES, default="agree", help="응답 끝에 붙일 투표 태그"
+    )
+    parser.add_argument(
+        "--exit-code", type=int, default=0, help="종료 코드 (0이 아니면 stderr에 에러 출력)"
+    )
+    parser.add_argument("--error", default="fake cli failure", help="실패 시 stderr 메시지")
+    parser.add_argument(
+        "--hang", action="store_true", help="시작 지연 후 종료하지 않고 대기 (타임아웃 테스트)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="무작위 값 시드 (기본값: 프롬프트 해시)"
+    )
+    return parser
+
+
+def build_response(prompt: str, size: int, vote: str, rng: random.Random) -> str:
+    """
+    응답 본문 생성
+
+    Args:
+        prompt: stdin으로 받은 프롬프트
+        size: 목표 응답 크기 (바이트, 0이면 요약 한 줄)
+        vote: 투표 선택 (random이면 rng로 결정, none이면 태그 없음)
+        rng: 무작위 값 생성기
+
+    Returns:
+        응답 문자열 (ASCII라 문자 수 = 바이트 수)
+    """
+    if vote == "random":
+        vote = rng.choice(("agree", "disagree", "abstain"))
+    footer = f"[{vote.upper()}]\n" if vote != "none" else ""
+
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    header = f"fake-cli response ({len(prompt)} chars, sha256:{digest})\n"
+
+    body_size = max(size - len(header) - len(footer), 0)
+    repeats, remainder = divmod(body_size, len(_FILLER_LINE))
+    body = _FILLER_LINE * repeats + _FILLER_LINE[:remainder]
+    return header + body + footer
+
+
+def stream_output(text: str, rate: int, chunk_size: int, out=None) -> None:
+    """
+    응답을 조각 단위로 출력 (rate > 0이면 바이트/초 속도에 맞춰 대기)
+
+    Args:
+        text: 출력할 응답
+        rate: 출력 속도 (바이트/초, 0이면 제한 없음)
+        chunk_size: 한 번에 쓸 바이트 수
+        out: 출력 스트림 (기본값: sys.stdout)
+    """
+    out = out or sys.stdout
+    chunk_size = max(chunk_size, 1)
+    started = time.monotonic()
+    written = 0
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start : start + chunk_size]
+        out.write(chunk)
+        out.flush()
+        written += len(chunk)
+        if rate > 0:
+            # 누적 기준으로 대기하여 sleep 오차가 쌓이지 않도록 함
+            ahead = written / rate - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    가짜 CLI 진입점
+
+    Args:
+        argv: 명령행 인자 (기본값: sys.argv[1:]). 알 수 없는 인자는 무시
+
+    Returns:
+        종료 코드
+    """
+    # 서버가 덧붙이는 CLI 전용 인자(--skip-git-repo-check 등)는 무시
+    options, _ = build_parser().parse_known_args(argv)
+
+    prompt = sys.stdin.read()
+    # 시드가 없으면 프롬프트로 결정하여 같은 입력에는 같은 응답/투표
+    seed = options.seed
+    if seed is None:
+        seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+
+    time.sleep(options.delay + rng.uniform(0, options.jitter))
+
+    if options.hang:
+        while True:
+            time.sleep(3600)
+
+    if options.exit_code != 0:
+        sys.stderr.write(options.error + "\n")
+        return options.exit_code
+
+    response = build_response(prompt, options.size, options.vote, rng)
+    stream_output(response, options.rate, options.chunk_size)
+    return 0
+
+
+def fake_cli_args(
+    delay: float = 0.0,
+    jitter: float = 0.0,
+    rate: int = 0,
+    size: int = 0,
+    vote: str = "agree",
+    exit_code: int = 0,
+    hang: bool = False,
+    seed: Optional[int] = None,
+) -> list[str]:
+    """
+    가짜 CLI 실행 인자 생성 (custom_clis.json의 extra_args로도 사용 가능)
+
+    Args:
+        delay: 시작 지연 (초)
+        jitter: 시작 지연에 더할 최대 무작위 시간 (초)
+        rate: 출력 속도 (바이트/초, 0이면 제한 없음)
+        size: 응답 크기 (바이트)
+        vote: 투표 (agree, disagree, abstain, random, none)
+        exit_code: 종료 코드
+        hang: 종료하지 않고 대기
+        seed: 무작위 값 시드
+
+    Returns:
+        ["-m", "other_agents_mcp.fake_cli", ...] 형태의 인자 목록
+    """
+    if vote not in VOTE_CHOICES:
+        raise ValueError(f"알 수 없는 투표: {vote} (가능한 값: {', '.join(VOTE_CHOICES)})")
+
+    args = ["-m", "other_agents_mcp.fake_cli", "--vote", vote]
+    if delay:
+        args += ["--delay", str(delay)]
+    if jitter:
+        args += ["--jitter", str(jitter)]
+    if rate:
+        args += ["--rate", str(rate)]
+    if size:
+        args += ["--size", str(size)]
+    if exit_code:
+        args += ["--exit-code", str(exit_code)]
+    if hang:
+        args.append("--hang")
+    if seed is not None:
+        args += ["--seed", str(seed)]
+    return args
+
+
+def register_fake_cli(name: str = "fake", timeout: Optional[int] = None, **options) -> None:
+    """
+    가짜 CLI를 런타임 CLI로 등록 (add_agent와 동일한 경로)
+
+    현재 Python 인터프리터로 모듈을 실행하므로 별도 설치 없이 사용할 수 있습니다.
+
+    Args:
+        name: 등록할 CLI 이름
+        timeout: 실행 타임아웃 (초, 기본값: 레지스트리 기본값)
+        **options: fake_cli_args 인자 (delay, rate, size, vote, exit_code, hang 등)
+    """
+    get_cli_registry().add_cli(
+        name=name,
+        command=sys.executable,
+        extra_args=fake_cli_args(**options),
+        timeout=timeout,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,15 +4,23 @@
 """
 
 import asyncio
-import glob
+import atexit
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import uuid
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
 
-import yaml
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from .cli_manager import is_cli_installed
 from .cli_registry import get_cli_registry
@@ -95,38 +103,175 @@ DANGEROUS_ARG_PATTERN = re.compile(r'[;&|`$\\"\'\n\r]')
 TEMP_FILE_PREFIX = "other_agents_mcp_"
 
 # 임시 파일 최대 유지 시간 (초) - 기본 1시간
+# 잠금으로 인스턴스 생존을 확인할 수 없는 플랫폼(Windows)에서 오래된 인스턴스 폴더 판단에 사용
 TEMP_FILE_MAX_AGE = int(os.environ.get("MCP_TEMP_FILE_MAX_AGE", "3600"))
 
+# 임시 파일 루트 폴더 (tmpfs 경로 권장, 예: /dev/shm) - 기본값: 시스템 임시 폴더
+TEMP_ROOT = os.environ.get("MCP_TEMP_DIR", "")
+
+# 인스턴스 폴더가 살아 있는 동안 잠가 두는 파일
+TEMP_LOCK_NAME = ".lock"
+
+# 생성 직후(잠금 전) 인스턴스 폴더를 정리하지 않도록 두는 유예 시간 (초)
+TEMP_DIR_GRACE_SECONDS = 10
+
+# CLI 출력 최대 수집 크기 (바이트) - 기본 10MB, 초과분은 버림
+MAX_OUTPUT_BYTES = int(os.environ.get("MCP_MAX_OUTPUT_BYTES", "10485760"))
+
+# 취소된 CLI 프로세스에 SIGTERM 후 SIGKILL을 보내기 전까지 기다리는 시간 (초)
+CLI_TERMINATE_GRACE = int(os.environ.get("MCP_CLI_TERMINATE_GRACE", "2"))
+
+
+# =============================================================================
+# Output Capture
+# =============================================================================
+
+
+def _read_output(output_path: str) -> str:
+    """
+    CLI 출력 파일 읽기 (MAX_OUTPUT_BYTES까지만)
+
+    Args:
+        output_path: 출력 파일 경로
+
+    Returns:
+        출력 문자열 (초과 시 UTF-8 문자 경계에서 잘라내고 안내 문구 추가)
+    """
+    with open(output_path, "r") as f:
+        # 문자 수는 바이트 수 이하이므로 한도+1 문자만 읽어도 초과 여부를 판단 가능
+        response = f.read(MAX_OUTPUT_BYTES + 1)
+
+    data = response.encode("utf-8")
+    if len(data) <= MAX_OUTPUT_BYTES:
+        return response
+
+    logger.warning(f"CLI 출력이 {MAX_OUTPUT_BYTES} 바이트를 넘어 잘렸습니다: {output_path}")
+    truncated = data[:MAX_OUTPUT_BYTES].decode("utf-8", errors="ignore")
+    return (
+        f"{truncated}\n\n[출력이 {MAX_OUTPUT_BYTES} 바이트에서 잘렸습니다 (MCP_MAX_OUTPUT_BYTES)]"
+    )
+
 
 # =============================================================================
 # Temp File Cleanup
 # =============================================================================
 
 
+_instance_temp_dir: str | None = None
+_instance_lock_fd: int | None = None
+_temp_dir_lock = threading.Lock()
+
+
+def _temp_parent_dir() -> str:
+    """인스턴스 폴더들의 상위 폴더 (사용자별로 분리하여 권한 충돌 방지)"""
+    owner = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(TEMP_ROOT or tempfile.gettempdir(), f"{TEMP_FILE_PREFIX}{owner}")
+
+
+def get_temp_dir() -> str:
+    """
+    이 서버 인스턴스 전용 임시 폴더 반환 (싱글톤, 처음 호출 시 생성)
+
+    폴더 안의 잠금 파일을 프로세스가 살아 있는 동안 잠가 두어
+    다른 인스턴스가 파일을 스캔하지 않고 생존 여부를 판단할 수 있게 합니다.
+
+    Returns:
+        인스턴스 임시 폴더 경로 ({루트}/other_agents_mcp_{uid}/{pid}-{랜덤})
+    """
+    global _instance_temp_dir, _instance_lock_fd
+    with _temp_dir_lock:
+        if _instance_temp_dir is None:
+            parent = _temp_parent_dir()
+            os.makedirs(parent, mode=0o700, exist_ok=True)
+            path = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=parent)
+            fd = os.open(os.path.join(path, TEMP_LOCK_NAME), os.O_CREAT | os.O_RDWR, 0o600)
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            _instance_temp_dir, _instance_lock_fd = path, fd
+            logger.debug("인스턴스 임시 폴더: %s", path)
+        return _instance_temp_dir
+
+
+def remove_temp_dir() -> None:
+    """인스턴스 임시 폴더를 통째로 삭제 (종료 시 atexit로 호출, 여러 번 호출해도 안전)"""
+    global _instance_temp_dir, _instance_lock_fd
+    with _temp_dir_lock:
+        path, fd = _instance_temp_dir, _instance_lock_fd
+        _instance_temp_dir = _instance_lock_fd = None
+    if path is None:
+        return
+    shutil.rmtree(path, ignore_errors=True)
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+atexit.register(remove_temp_dir)
+
+
+def _is_stale_instance_dir(path: str) -> bool:
+    """
+    다른 인스턴스의 임시 폴더가 버려졌는지 확인
+
+    Args:
+        path: 인스턴스 폴더 경로
+
+    Returns:
+        소유 프로세스가 종료되어 잠금을 얻을 수 있으면 True, 생성 직후이거나 사용 중이면 False
+    """
+    age = time.time() - os.path.getmtime(path)
+    if fcntl is None:
+        return age > TEMP_FILE_MAX_AGE
+    if age < TEMP_DIR_GRACE_SECONDS:
+        return False
+
+    try:
+        fd = os.open(os.path.join(path, TEMP_LOCK_NAME), os.O_RDWR)
+    except FileNotFoundError:
+        # 잠금 파일을 만들기 전에 종료된 인스턴스
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    finally:
+        os.close(fd)
+    return True
+
+
 def cleanup_stale_temp_files() -> int:
     """
-    오래된 임시 파일 정리 (서버 시작 시 호출)
+    종료된 인스턴스의 임시 폴더 정리 (서버 시작 시 호출)
+
+    시스템 임시 폴더 전체가 아니라 인스턴스 폴더 목록만 확인하므로
+    비용은 /tmp의 파일 수와 무관하게 인스턴스 수에 비례합니다.
 
     Returns:
-        삭제된 파일 수
+        삭제된 인스턴스 폴더 수
     """
-    temp_dir = tempfile.gettempdir()
-    pattern = os.path.join(temp_dir, f"{TEMP_FILE_PREFIX}*")
+    parent = _temp_parent_dir()
     deleted_count = 0
-    current_time = time.time()
 
-    for filepath in glob.glob(pattern):
+    try:
+        entries = list(os.scandir(parent))
+    except FileNotFoundError:
+        return 0
+
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False) or entry.path == _instance_temp_dir:
+            continue
         try:
-            file_age = current_time - os.path.getmtime(filepath)
-            if file_age > TEMP_FILE_MAX_AGE:
-                os.remove(filepath)
+            if _is_stale_instance_dir(entry.path):
+                shutil.rmtree(entry.path)
                 deleted_count += 1
-                logger.debug(f"Stale temp file removed: {filepath}")
+                logger.debug("Stale temp dir removed: %s", entry.path)
         except OSError as e:
-            logger.warning(f"Failed to remove temp file {filepath}: {e}")
+            logger.warning(f"Failed to remove temp dir {entry.path}: {e}")
 
     if deleted_count > 0:
-        logger.info(f"Cleaned up {deleted_count} stale temp files")
+        logger.info("Cleaned up %s stale temp dirs", deleted_count)
 
     return deleted_count
 
@@ -214,7 +359,7 @@ def validate_env_vars(env_vars: dict[str, str] | None) -> dict[str, str]:
         # 화이트리스트 체크 (선택적 - 알려진 변수만 허용)
         # 현재는 블랙리스트만 적용하고 로깅
         if key.upper() not in ALLOWED_ENV_VARS:
-            logger.debug(f"알려지지 않은 환경 변수 허용: {key}")
+            logger.debug("알려지지 않은 환경 변수 허용: %s", key)
 
         validated[key] = value
 
@@ -259,6 +404,309 @@ class CLIExecutionError(Exception):
     pass
 
 
+# =============================================================================
+# Process Cancellation
+# =============================================================================
+
+
+class CLIProcessHandle:
+    """
+    실행 중인 CLI 프로세스 취소 핸들
+
+    실행 스레드가 프로세스를 등록하고, 다른 스레드가 cancel()로 종료합니다.
+    프로세스 시작 전에 취소되면 프로세스를 시작하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen | None = None
+        self._cancelled = False
+        self._launched = False
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancelled
+
+    @property
+    def launched(self) -> bool:
+        """프로세스가 한 번이라도 시작되었는지 여부 (종료 후에도 유지)"""
+        return self._launched
+
+    def attach(self, process: subprocess.Popen) -> bool:
+        """
+        실행 중인 프로세스 등록
+
+        Args:
+            process: 방금 시작한 CLI 프로세스
+
+        Returns:
+            등록 여부 (이미 취소되었으면 False)
+        """
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._process = process
+            self._launched = True
+            return True
+
+    def detach(self) -> None:
+        """프로세스 종료 후 등록 해제"""
+        with self._lock:
+            self._process = None
+
+    def cancel(self) -> None:
+        """
+        실행 중인 프로세스 종료 (프로세스가 끝날 때까지 블로킹)
+
+        이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+        """
+        with self._lock:
+            self._cancelled = True
+            process = self._process
+        if process is not None:
+            _terminate_process(process)
+
+
+def _terminate_process(process: subprocess.Popen) -> None:
+    """SIGTERM 후 CLI_TERMINATE_GRACE초 안에 끝나지 않으면 SIGKILL"""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=CLI_TERMINATE_GRACE)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _run_cancellable(
+    command: Sequence[str],
+    stdin,
+    stdout,
+    timeout: int,
+    env: Mapping[str, str] | None,
+    process_handle: CLIProcessHandle,
+) -> tuple[int, str]:
+    """
+    취소 가능한 CLI 프로세스 실행 (타임아웃 처리는 subprocess.run과 동일)
+
+    Args:
+        command: 실행할 명령어
+        stdin: 입력 파일
+        stdout: 출력 파일
+        timeout: 타임아웃 (초)
+        env: 프로세스 환경 (None이면 서버 환경 상속)
+        process_handle: 취소 핸들
+
+    Returns:
+        (리턴 코드, stderr)
+
+    Raises:
+        CLIExecutionError: 실행 전 또는 실행 중 취소됨
+        subprocess.TimeoutExpired: 타임아웃
+    """
+    if process_handle.cancelled:
+        raise CLIExecutionError("CLI 실행이 취소되었습니다")
+
+    process = subprocess.Popen(
+        command, stdin=stdin, stdout=stdout, stderr=subprocess.PIPE, text=True, env=env
+    )
+    if not process_handle.attach(process):
+        _terminate_process(process)
+    try:
+        _, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    finally:
+        process_handle.detach()
+
+    if process_handle.cancelled:
+        raise CLIExecutionError("CLI 실행이 취소되었습니다")
+    return process.returncode, stderr
+
+
+# =============================================================================
+# Execution Plans
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    CLI별로 미리 계산해 둔 실행 계획 (불변)
+
+    레지스트리 설정에서 요청과 무관하게 정해지는 값(실행 파일 경로, 명령어 앞부분,
+    검증된 환경 변수, 지원 인자 집합)을 한 번만 계산하여 요청마다 재사용합니다.
+    레지스트리 버전이 바뀌면 다시 만들어집니다.
+    """
+
+    cli_name: str
+    command: str
+    # shutil.which로 찾은 실행 파일 경로 (설치되지 않았으면 None)
+    executable: str | None
+    timeout: int
+    extra_args: tuple[str, ...]
+    # 검증된 CLI 환경 변수 (읽기 전용)
+    env_vars: Mapping[str, str]
+    # 서버 환경 변수에 env_vars를 덮어쓴 환경 (env_vars가 없으면 None - 서버 환경 상속)
+    env: Mapping[str, str] | None
+    supports_skip_git_check: bool
+    skip_git_check_position: str
+    supported_args: frozenset[str]
+    # 구조화된 투표용 JSON 출력 인자 (서버가 붙이므로 supported_args와 무관)
+    json_output_args: tuple[str, ...]
+    # 실행 파일 + extra_args (skip-git 플래그 없음/포함)
+    argv: tuple[str, ...]
+    skip_git_argv: tuple[str, ...]
+
+    def base_argv(self, skip_git_repo_check: bool) -> tuple[str, ...]:
+        """요청의 skip_git_repo_check 값에 맞는 명령어 앞부분 반환"""
+        return self.skip_git_argv if skip_git_repo_check else self.argv
+
+
+# 레지스트리 버전별 실행 계획 캐시 (설치된 CLI만 저장)
+_execution_plans: dict[str, ExecutionPlan] = {}
+_execution_plans_version: object = None
+_execution_plans_lock = threading.Lock()
+
+
+def _build_execution_plan(cli_name: str, config: Mapping) -> ExecutionPlan:
+    """
+    CLI 설정으로 실행 계획 생성
+
+    Args:
+        cli_name: CLI 이름
+        config: 레지스트리의 CLI 설정
+
+    Returns:
+        ExecutionPlan
+    """
+    command = config["command"]
+    extra_args = tuple(config.get("extra_args", []))
+    env_vars = validate_env_vars(config.get("env_vars", {}))
+    supports_skip_git_check = config.get("supports_skip_git_check", False)
+    skip_git_check_position = config.get("skip_git_check_position", "before_extra_args")
+
+    executable = None
+    if is_cli_installed(command):
+        executable = shutil.which(command) or command
+
+    program = executable or command
+    return ExecutionPlan(
+        cli_name=cli_name,
+        command=command,
+        executable=executable,
+        timeout=config["timeout"],
+        extra_args=extra_args,
+        env_vars=MappingProxyType(env_vars),
+        env=_merge_env(env_vars),
+        supports_skip_git_check=supports_skip_git_check,
+        skip_git_check_position=skip_git_check_position,
+        supported_args=frozenset(config.get("supported_args", [])),
+        json_output_args=tuple(config.get("json_output_args", [])),
+        argv=_build_base_argv(program, extra_args, False, skip_git_check_position),
+        skip_git_argv=_build_base_argv(
+            program, extra_args, supports_skip_git_check, skip_git_check_position
+        ),
+    )
+
+
+def get_execution_plan(cli_name: str) -> ExecutionPlan:
+    """
+    CLI 실행 계획 조회 (레지스트리 버전이 같으면 캐시 재사용)
+
+    설치되지 않은 CLI의 계획은 캐시하지 않으므로 요청마다 설치 여부를 다시 확인합니다.
+
+    Args:
+        cli_name: CLI 이름
+
+    Returns:
+        ExecutionPlan (executable이 None이면 미설치)
+
+    Raises:
+        CLINotFoundError: 레지스트리에 없는 CLI
+    """
+    global _execution_plans_version
+
+    registry = get_cli_registry()
+    version = registry.version
+
+    with _execution_plans_lock:
+        if _execution_plans_version != version:
+            _execution_plans.clear()
+            _execution_plans_version = version
+        plan = _execution_plans.get(cli_name)
+    if plan is not None:
+        return plan
+
+    all_clis = registry.get_all_clis()
+    if cli_name not in all_clis:
+        raise CLINotFoundError(f"알 수 없는 CLI: {cli_name}")
+
+    plan = _build_execution_plan(cli_name, all_clis[cli_name])
+    if plan.executable is not None:
+        with _execution_plans_lock:
+            if _execution_plans_version == version:
+                _execution_plans[cli_name] = plan
+        logger.debug("Execution plan built: %s -> %s", cli_name, plan.executable)
+    return plan
+
+
+def clear_execution_plans() -> None:
+    """실행 계획 캐시 비우기 (CLI 설치/제거 후 또는 테스트에서 사용)"""
+    global _execution_plans_version
+    with _execution_plans_lock:
+        _execution_plans.clear()
+        _execution_plans_version = None
+
+
+def _merge_env(env_vars: Mapping[str, str]) -> Mapping[str, str] | None:
+    """
+    CLI 프로세스 환경 생성
+
+    Args:
+        env_vars: 검증된 CLI 환경 변수
+
+    Returns:
+        서버 환경에 env_vars를 덮어쓴 환경 (env_vars가 없으면 None - 복사 없이 서버 환경 상속)
+    """
+    if not env_vars:
+        return None
+    env = os.environ.copy()
+    env.update(env_vars)
+    return MappingProxyType(env)
+
+
+def _build_base_argv(
+    program: str,
+    extra_args: Sequence[str],
+    skip_git_repo_check: bool,
+    skip_git_check_position: str,
+) -> tuple[str, ...]:
+    """
+    실행 파일과 extra_args로 명령어 앞부분 구성 (skip-git 플래그 위치 반영)
+
+    Args:
+        program: 실행 파일 (명령어 또는 경로)
+        extra_args: CLI 설정의 추가 인자
+        skip_git_repo_check: --skip-git-repo-check 플래그 추가 여부 (CLI 지원 여부 반영된 값)
+        skip_git_check_position: 플래그 위치 ("before_extra_args" 또는 "after_extra_args")
+
+    Returns:
+        명령어 튜플
+    """
+    if not skip_git_repo_check:
+        return (program, *extra_args)
+    if skip_git_check_position == "before_extra_args" or not extra_args:
+        # codex --skip-git-repo-check exec - 형태
+        return (program, "--skip-git-repo-check", *extra_args)
+    # codex exec --skip-git-repo-check - 형태 (서브커맨드 뒤에 삽입)
+    return (program, extra_args[0], "--skip-git-repo-check", *extra_args[1:])
+
+
 def execute_cli_file_based(
     cli_name: str,
     message: str,
@@ -266,6 +714,8 @@ def execute_cli_file_based(
     system_prompt: str = None,
     args: list[str] = None,
     timeout: int = None,
+    process_handle: CLIProcessHandle | None = None,
+    json_output: bool = False,
 ) -> str:
     """
     파일 기반 CLI 실행 (시스템 프롬프트 및 args 지원)
@@ -285,6 +735,8 @@ def execute_cli_file_based(
                       - 나머지: YAML 형식으로 input에 포함
         args: 추가 CLI 인자 (선택사항). 각 CLI가 지원하는 옵션만 전달됨
         timeout: 실행 타임아웃 (초, 선택사항). 제공 시 CLI 기본 설정을 덮어씀
+        process_handle: 다른 스레드에서 실행 중인 프로세스를 종료하기 위한 핸들 (선택사항)
+        json_output: CLI 설정의 json_output_args를 붙여 JSON 출력 요청 (기본값: False)
 
     Returns:
         CLI 응답 문자열
@@ -301,36 +753,32 @@ def execute_cli_file_based(
     validated_timeout = validate_timeout(timeout)
     validated_system_prompt = validate_system_prompt(system_prompt)
 
-    # 1. CLI 설정 가져오기 (Registry에서)
-    registry = get_cli_registry()
-    all_clis = registry.get_all_clis()
-
-    if cli_name not in all_clis:
-        raise CLINotFoundError(f"알 수 없는 CLI: {cli_name}")
-
-    config = all_clis[cli_name]
-    command = config["command"]
-
-    # 환경 변수 검증
-    validated_env_vars = validate_env_vars(config.get("env_vars", {}))
+    # 1. CLI 실행 계획 가져오기 (레지스트리 버전별 캐시, 환경 변수 검증 포함)
+    plan = get_execution_plan(cli_name)
 
     # 요청별 타임아웃이 있으면 우선 사용, 없으면 설정값 사용
-    execution_timeout = validated_timeout if validated_timeout is not None else config["timeout"]
+    execution_timeout = validated_timeout if validated_timeout is not None else plan.timeout
 
     # 2. args 검증 및 필터링 (각 CLI별 지원 옵션 확인)
-    validated_args = _validate_and_filter_args(cli_name, args, config)
+    # (JSON 출력 인자는 서버가 CLI 설정에서 붙이므로 supported_args 허용 목록과 무관하게 전달)
+    validated_args = _filter_args(cli_name, args, plan.supported_args)
+    if json_output:
+        validated_args += plan.json_output_args
 
     # 3. CLI 설치 확인
-    if not is_cli_installed(command):
-        raise CLINotFoundError(f"{cli_name} ({command})가 설치되지 않았습니다")
+    if plan.executable is None:
+        raise CLINotFoundError(f"{cli_name} ({plan.command})가 설치되지 않았습니다")
 
     # 4. 임시 파일 생성
     session_id = str(uuid.uuid4())
     input_fd, input_path = tempfile.mkstemp(
-        suffix=".txt", prefix=f"other_agents_mcp_input_{session_id}_", text=True
+        suffix=".txt", prefix=f"other_agents_mcp_input_{session_id}_", dir=get_temp_dir(), text=True
     )
     output_fd, output_path = tempfile.mkstemp(
-        suffix=".txt", prefix=f"other_agents_mcp_output_{session_id}_", text=True
+        suffix=".txt",
+        prefix=f"other_agents_mcp_output_{session_id}_",
+        dir=get_temp_dir(),
+        text=True,
     )
 
     try:
@@ -342,8 +790,7 @@ def execute_cli_file_based(
                 f.write(message)
             elif validated_system_prompt:
                 # 나머지 CLI: YAML 형식으로 시스템 프롬프트와 프롬프트 분리
-                yaml_data = {"system_prompt": validated_system_prompt, "prompt": message}
-                yaml.dump(yaml_data, f, default_flow_style=False, allow_unicode=True)
+                _write_yaml_prompt(f, validated_system_prompt, message)
             else:
                 # 시스템 프롬프트 없음: 일반 메시지 작성
                 f.write(message)
@@ -354,25 +801,25 @@ def execute_cli_file_based(
         # 5. CLI 실행
         # cat input.txt | cli [extra_args] [validated_args] > output.txt
         _execute_cli(
-            command=command,
-            extra_args=config.get("extra_args", []),
-            env_vars=validated_env_vars,
+            command=plan.command,
+            extra_args=plan.extra_args,
+            env_vars=plan.env_vars,
             input_path=input_path,
             output_path=output_path,
             timeout=execution_timeout,
             skip_git_repo_check=skip_git_repo_check,
-            supports_skip_git_check=config.get("supports_skip_git_check", False),
-            skip_git_check_position=config.get("skip_git_check_position", "before_extra_args"),
+            supports_skip_git_check=plan.supports_skip_git_check,
+            skip_git_check_position=plan.skip_git_check_position,
             cli_name=cli_name,
             system_prompt=validated_system_prompt if cli_name == "claude" else None,
             additional_args=validated_args,
+            base_argv=plan.base_argv(skip_git_repo_check),
+            env=plan.env,
+            process_handle=process_handle,
         )
 
         # 6. output 파일 읽기
-        with open(output_path, "r") as f:
-            response = f.read()
-
-        return response
+        return _read_output(output_path)
 
     finally:
         # 7. 임시 파일 정리
@@ -392,6 +839,9 @@ def _execute_cli(
     cli_name: str = None,
     system_prompt: str = None,
     additional_args: list = None,
+    base_argv: Sequence[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    process_handle: CLIProcessHandle | None = None,
 ) -> int:
     """
     CLI 실행 (환경 변수 설정 포함, 시스템 프롬프트 및 추가 인자 지원)
@@ -409,6 +859,9 @@ def _execute_cli(
         cli_name: CLI 이름 (claude 감지용)
         system_prompt: 시스템 프롬프트 (Claude --append-system-prompt 플래그용)
         additional_args: 검증된 추가 CLI 인자
+        base_argv: 실행 계획에서 미리 구성한 명령어 앞부분 (없으면 위 인자로 구성)
+        env: 실행 계획에서 미리 병합한 환경 (없으면 env_vars로 구성)
+        process_handle: 취소 핸들 (선택, 지정 시 cancel()로 프로세스 종료 가능)
 
     Returns:
         리턴 코드
@@ -419,16 +872,22 @@ def _execute_cli(
     """
     if additional_args is None:
         additional_args = []
+    if base_argv is None:
+        base_argv = _build_base_argv(
+            command,
+            extra_args,
+            skip_git_repo_check and supports_skip_git_check,
+            skip_git_check_position,
+        )
+    if env is None:
+        # env_vars가 없으면 None (서버 환경 상속)
+        env = _merge_env(env_vars)
     try:
-        # 환경 변수 설정
-        env = os.environ.copy()
-        env.update(env_vars)
-
         # CLI 실행: input을 stdin으로, output을 파일로
         with open(input_path, "r") as input_file:
             with open(output_path, "w") as output_file:
                 # 기본 명령어 구성
-                full_command = [command]
+                full_command = [base_argv[0]]
 
                 # Claude 특수 처리: --append-system-prompt 플래그 추가
                 if cli_name == "claude" and system_prompt:
@@ -436,58 +895,37 @@ def _execute_cli(
                     full_command.append("--print")
                     full_command.append("--append-system-prompt")
                     full_command.append(system_prompt)
-                    logger.debug(f"Claude with system prompt: {full_command}")
-
-                # skip_git_check_position에 따라 플래그 위치 결정
-                if skip_git_repo_check and supports_skip_git_check:
-                    if skip_git_check_position == "before_extra_args":
-                        # codex --skip-git-repo-check exec - 형태
-                        full_command.append("--skip-git-repo-check")
-                        full_command.extend(extra_args)
-                        logger.debug(
-                            f"Adding --skip-git-repo-check before extra_args: {full_command}"
-                        )
-                    else:  # after_extra_args
-                        # codex exec --skip-git-repo-check - 형태
-                        # extra_args를 분해해서 중간에 삽입
-                        if len(extra_args) > 0:
-                            full_command.append(extra_args[0])  # "exec"
-                            full_command.append("--skip-git-repo-check")
-                            full_command.extend(extra_args[1:])  # "-"
-                            logger.debug(
-                                f"Adding --skip-git-repo-check after subcommand: {full_command}"
-                            )
-                        else:
-                            full_command.append("--skip-git-repo-check")
-                            logger.debug(
-                                f"Adding --skip-git-repo-check (no subcommand): {full_command}"
-                            )
-                else:
-                    # skip 플래그 없이 일반 실행
-                    full_command.extend(extra_args)
 
-                # 검증된 추가 인자 추가
+                # extra_args (skip-git 플래그 위치 반영됨) + 검증된 추가 인자
+                full_command.extend(base_argv[1:])
                 full_command.extend(additional_args)
-
-                result = subprocess.run(
-                    full_command,
-                    stdin=input_file,
-                    stdout=output_file,
-                    stderr=subprocess.PIPE,
-                    timeout=timeout,
-                    text=True,
-                    env=env,  # 환경 변수 전달
-                )
+                logger.debug("CLI command: %s", full_command)
+
+                if process_handle is None:
+                    result = subprocess.run(
+                        full_command,
+                        stdin=input_file,
+                        stdout=output_file,
+                        stderr=subprocess.PIPE,
+                        timeout=timeout,
+                        text=True,
+                        env=env,  # 환경 변수 전달
+                    )
+                    returncode, stderr = result.returncode, result.stderr
+                else:
+                    returncode, stderr = _run_cancellable(
+                        full_command, input_file, output_file, timeout, env, process_handle
+                    )
 
         # stderr 확인 (개선: stdout도 확인)
-        if result.returncode != 0:
-            error_msg = result.stderr or "알 수 없는 에러"
+        if returncode != 0:
+            error_msg = stderr or "알 수 없는 에러"
             logger.error(f"CLI 실행 실패 ({command}): {error_msg}")
-            raise CLIExecutionError(f"CLI 실행 실패 (코드 {result.returncode}): {error_msg}")
+            raise CLIExecutionError(f"CLI 실행 실패 (코드 {returncode}): {error_msg}")
 
-        logger.debug(f"CLI 실행 성공: {command}")
+        logger.debug("CLI 실행 성공: %s", command)
 
-        return result.returncode
+        return returncode
 
     except subprocess.TimeoutExpired as e:
         raise CLITimeoutError(f"CLI 실행 타임아웃 ({timeout}초)") from e
@@ -509,8 +947,21 @@ def _validate_and_filter_args(cli_name: str, args: list[str], config: dict) -> l
     Returns:
         검증된 args (지원하지 않는 옵션은 제외)
     """
-    supported_args = config.get("supported_args", [])
+    return _filter_args(cli_name, args, config.get("supported_args", []))
+
 
+def _filter_args(cli_name: str, args: list[str], supported_args: Collection[str]) -> list[str]:
+    """
+    지원 인자 목록으로 args 검증 및 필터링
+
+    Args:
+        cli_name: CLI 이름
+        args: 입력된 CLI 인자
+        supported_args: 지원하는 옵션 (실행 계획의 frozenset 또는 설정의 목록)
+
+    Returns:
+        검증된 args (지원하지 않는 옵션은 제외)
+    """
     if not args:
         return []
 
@@ -530,7 +981,7 @@ def _validate_and_filter_args(cli_name: str, args: list[str], config: dict) -> l
             # 플래그가 지원되는지 확인
             if arg in supported_args:
                 validated_args.append(arg)
-                logger.debug(f"CLI '{cli_name}': 옵션 '{arg}' 허용됨")
+                logger.debug("CLI '%s': 옵션 '%s' 허용됨", cli_name, arg)
 
                 # 다음 인자가 값인지 확인 (플래그가 = 형식이 아니고, 다음 인자가 플래그가 아닌 경우)
                 if "=" not in arg and i + 1 < len(args) and not args[i + 1].startswith("-"):
@@ -538,10 +989,10 @@ def _validate_and_filter_args(cli_name: str, args: list[str], config: dict) -> l
                     # 값 새니타이징
                     sanitized_value = sanitize_arg_value(args[i])
                     validated_args.append(sanitized_value)
-                    logger.debug(f"CLI '{cli_name}': 옵션 값 '{sanitized_value}' 추가됨")
+                    logger.debug("CLI '%s': 옵션 값 '%s' 추가됨", cli_name, sanitized_value)
             else:
                 logger.warning(
-                    f"CLI '{cli_name}': 지원하지 않는 옵션 '{arg}' 무시됨. (지원 옵션: {supported_args})"
+                    f"CLI '{cli_name}': 지원하지 않는 옵션 '{arg}' 무시됨. (지원 옵션: {sorted(supported_args)})"
                 )
         else:
             # 플래그가 아닌 경우 (값) - 새니타이징 적용
@@ -550,7 +1001,7 @@ def _validate_and_filter_args(cli_name: str, args: list[str], config: dict) -> l
                 # 이전 항목이 플래그가 아닌 경우, 단독 인자로 추가
                 validated_args.append(sanitized_value)
             else:
-                logger.debug(f"CLI '{cli_name}': 값 '{sanitized_value}' 추가됨")
+                logger.debug("CLI '%s': 값 '%s' 추가됨", cli_name, sanitized_value)
                 validated_args.append(sanitized_value)
 
         i += 1
@@ -558,13 +1009,29 @@ def _validate_and_filter_args(cli_name: str, args: list[str], config: dict) -> l
     return validated_args
 
 
+def _write_yaml_prompt(f, system_prompt: str, message: str) -> None:
+    """
+    시스템 프롬프트와 프롬프트를 YAML 형식으로 작성
+
+    키 순서(prompt, system_prompt)는 yaml.dump의 키 정렬과 같으며,
+    크기가 큰 시스템 프롬프트 부분은 캐시된 직렬화 결과를 재사용합니다.
+    """
+    # yaml과 프롬프트 캐시는 서버 시작 시간에 포함되지 않도록 처음 사용할 때 불러옴
+    import yaml
+
+    from .prompt_cache import get_prompt_cache
+
+    yaml.dump({"prompt": message}, f, default_flow_style=False, allow_unicode=True)
+    f.write(get_prompt_cache().serialize_system_prompt(system_prompt))
+
+
 def _cleanup_temp_files(*file_paths: str) -> None:
     """임시 파일 정리"""
     for file_path in file_paths:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.debug(f"임시 파일 삭제: {file_path}")
+                logger.debug("임시 파일 삭제: %s", file_path)
         except Exception as e:
             logger.warning(f"임시 파일 삭제 실패: {file_path}, {e}")
 
@@ -578,6 +1045,8 @@ def execute_with_session(
     system_prompt: str = None,
     args: list[str] = None,
     timeout: int = None,
+    process_handle: CLIProcessHandle | None = None,
+    json_output: bool = False,
 ) -> str:
     """
     세션 모드로 CLI 실행
@@ -591,6 +1060,8 @@ def execute_with_session(
         system_prompt: 시스템 프롬프트
         args: 추가 CLI 인자
         timeout: 타임아웃 초 (선택사항, None이면 CLI 기본값 사용)
+        process_handle: 다른 스레드에서 실행 중인 프로세스를 종료하기 위한 핸들 (선택사항)
+        json_output: CLI 설정의 json_output_args를 붙여 JSON 출력 요청 (기본값: False)
 
     Returns:
         CLI 응답 문자열
@@ -611,25 +1082,15 @@ def execute_with_session(
     session_manager = get_session_manager()
     session_info = session_manager.create_or_get_session(session_id, cli_name)
 
-    # 2. CLI 설정 가져오기
-    registry = get_cli_registry()
-    all_clis = registry.get_all_clis()
-
-    if cli_name not in all_clis:
-        raise CLINotFoundError(f"알 수 없는 CLI: {cli_name}")
-
-    config = all_clis[cli_name]
-    command = config["command"]
-
-    # 환경 변수 검증
-    validated_env_vars = validate_env_vars(config.get("env_vars", {}))
+    # 2. CLI 실행 계획 가져오기
+    plan = get_execution_plan(cli_name)
 
     # timeout 우선순위: 파라미터 > CLI 기본값
-    execution_timeout = validated_timeout if validated_timeout is not None else config["timeout"]
+    execution_timeout = validated_timeout if validated_timeout is not None else plan.timeout
 
     # 3. CLI 설치 확인
-    if not is_cli_installed(command):
-        raise CLINotFoundError(f"{cli_name} ({command})가 설치되지 않았습니다")
+    if plan.executable is None:
+        raise CLINotFoundError(f"{cli_name} ({plan.command})가 설치되지 않았습니다")
 
     # 4. 세션 플래그 추가 (CLI별 전략)
     session_args = _build_session_args(
@@ -639,63 +1100,103 @@ def execute_with_session(
         is_first_request=(session_info.request_count == 1),
     )
 
-    # 5. args와 session_args 병합
-    combined_args = args + session_args
+    # 5. args 검증 및 필터링 후 JSON 출력 인자와 session_args 병합
+    # (두 플래그 모두 서버가 생성하므로 supported_args 허용 목록과 무관하게 전달)
+    validated_args = _filter_args(cli_name, args, plan.supported_args)
+    if json_output:
+        validated_args += plan.json_output_args
+    validated_args += session_args
 
-    # 6. args 검증 및 필터링
-    validated_args = _validate_and_filter_args(cli_name, combined_args, config)
-
-    # 7. 임시 파일 생성
+    # 6. 임시 파일 생성
     file_session_id = str(uuid.uuid4())
     input_fd, input_path = tempfile.mkstemp(
-        suffix=".txt", prefix=f"other_agents_mcp_input_{file_session_id}_", text=True
+        suffix=".txt",
+        prefix=f"other_agents_mcp_input_{file_session_id}_",
+        dir=get_temp_dir(),
+        text=True,
     )
     output_fd, output_path = tempfile.mkstemp(
-        suffix=".txt", prefix=f"other_agents_mcp_output_{file_session_id}_", text=True
+        suffix=".txt",
+        prefix=f"other_agents_mcp_output_{file_session_id}_",
+        dir=get_temp_dir(),
+        text=True,
     )
 
     try:
-        # 8. input 파일에 메시지 작성
+        # 7. input 파일에 메시지 작성
         with os.fdopen(input_fd, "w") as f:
             if cli_name == "claude" and validated_system_prompt:
                 # Claude는 stdin에 유저 프롬프트만
                 f.write(message)
             elif validated_system_prompt:
                 # 나머지 CLI: YAML 형식
-                yaml_data = {"system_prompt": validated_system_prompt, "prompt": message}
-                yaml.dump(yaml_data, f, default_flow_style=False, allow_unicode=True)
+                _write_yaml_prompt(f, validated_system_prompt, message)
             else:
                 f.write(message)
 
         os.close(output_fd)
 
-        # 9. CLI 실행
+        # 8. CLI 실행
         _execute_cli(
-            command=command,
-            extra_args=config.get("extra_args", []),
-            env_vars=validated_env_vars,
+            command=plan.command,
+            extra_args=plan.extra_args,
+            env_vars=plan.env_vars,
             input_path=input_path,
             output_path=output_path,
             timeout=execution_timeout,
             skip_git_repo_check=skip_git_repo_check,
-            supports_skip_git_check=config.get("supports_skip_git_check", False),
-            skip_git_check_position=config.get("skip_git_check_position", "before_extra_args"),
+            supports_skip_git_check=plan.supports_skip_git_check,
+            skip_git_check_position=plan.skip_git_check_position,
             cli_name=cli_name,
             system_prompt=validated_system_prompt if cli_name == "claude" else None,
             additional_args=validated_args,
+            base_argv=plan.base_argv(skip_git_repo_check),
+            env=plan.env,
+            process_handle=process_handle,
         )
 
-        # 10. output 파일 읽기
-        with open(output_path, "r") as f:
-            response = f.read()
-
-        return response
+        # 9. output 파일 읽기
+        return _read_output(output_path)
 
     finally:
-        # 11. 임시 파일 정리
+        # 10. 임시 파일 정리
         _cleanup_temp_files(input_path, output_path)
 
 
+# 명시적 세션 ID로 세션을 재개할 수 있는 CLI (_build_session_args 참고)
+# gemini/qwen은 "--resume latest"로 재개하므로 동시에 실행 중인 다른 세션을 이어받을 수 있어 제외
+SESSION_RESUME_CLIS = {"claude"}
+
+
+def supports_session_resume(cli_name: str) -> bool:
+    """
+    CLI가 명시적 세션 ID로 세션 재개를 지원하는지 확인
+
+    Args:
+        cli_name: CLI 이름
+
+    Returns:
+        세션 재개 지원 여부
+    """
+    return cli_name in SESSION_RESUME_CLIS
+
+
+def get_json_output_args(cli_name: str) -> list[str]:
+    """
+    CLI의 JSON 출력 요청 인자 조회
+
+    Args:
+        cli_name: CLI 이름
+
+    Returns:
+        JSON 출력 인자 목록 (미지원 또는 알 수 없는 CLI는 빈 목록)
+    """
+    config = get_cli_registry().get_all_clis().get(cli_name)
+    if config is None:
+        return []
+    return list(config.get("json_output_args", []))
+
+
 def _build_session_args(
     cli_name: str, cli_session_id: str, resume: bool, is_first_request: bool
 ) -> list[str]:
@@ -718,19 +1219,19 @@ def _build_session_args(
         if resume and not is_first_request:
             # 세션 재개
             session_args.extend(["--resume", cli_session_id])
-            logger.debug(f"Claude session resume: {cli_session_id}")
+            logger.debug("Claude session resume: %s", cli_session_id)
         else:
             # 새 세션 시작 (session_id 지정)
             session_args.extend(["--session-id", cli_session_id])
-            logger.debug(f"Claude new session: {cli_session_id}")
+            logger.debug("Claude new session: %s", cli_session_id)
 
     elif cli_name in ["gemini", "qwen"]:
         # Gemini/Qwen: 첫 요청이 아니면 --resume latest
         if not is_first_request and resume:
             session_args.extend(["--resume", "latest"])
-            logger.debug(f"{cli_name} session resume: latest")
+            logger.debug("%s session resume: latest", cli_name)
         else:
-            logger.debug(f"{cli_name} new session (no flag)")
+            logger.debug("%s new session (no flag)", cli_name)
 
     elif cli_name == "codex":
         # Codex: resume 서브커맨드 사용 (첫 요청이 아닐 때)
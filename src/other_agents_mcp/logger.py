@@ -2,14 +2,269 @@
 
 로깅 설정 및 유틸리티
 
+모든 모듈 로거는 QueueHandler로 레코드를 큐에 넣기만 하고,
+실제 stderr 쓰기와 포맷팅(시각, JSON 직렬화, 예외 트레이스백)은 QueueListener 스레드가 처리합니다.
+클라이언트가 stderr를 늦게 읽어도 이벤트 루프가 쓰기에서 멈추지 않습니다.
+
+같은 로거의 같은 메시지 템플릿(record.msg)은
+초당 MCP_LOG_RATE_LIMIT건까지만 기록하고, 생략한 건수는 다음 기록(또는 종료 시 요약)에 표시합니다.
+WARNING 이상은 제한하지 않습니다.
+템플릿으로 묶이는 것은 %-스타일 인자(logger.info("... %s", value))로 남긴 메시지뿐이며,
+f-string은 값마다 다른 메시지가 되어 제한되지 않습니다.
+
 환경 변수:
     MCP_LOG_LEVEL: 로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
                    기본값: INFO
+    MCP_LOG_FORMAT: 출력 형식 ("text" 또는 "json", 기본값: text)
+    MCP_LOG_ASYNC: 큐/리스너 스레드 사용 여부 ("0"이면 호출 스레드에서 바로 기록, 기본값: 1)
+    MCP_LOG_QUEUE_SIZE: 큐 최대 레코드 수 (가득 차면 버리고 건수만 표시, 기본값: 10000)
+    MCP_LOG_RATE_LIMIT: 로거/메시지 템플릿별 초당 최대 기록 수 (0이면 제한 없음, 기본값: 10)
 """
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+LOG_FORMAT = os.environ.get("MCP_LOG_FORMAT", "text").lower()
+LOG_ASYNC = os.environ.get("MCP_LOG_ASYNC", "1") != "0"
+LOG_QUEUE_SIZE = int(os.environ.get("MCP_LOG_QUEUE_SIZE", "10000"))
+LOG_RATE_LIMIT = int(os.environ.get("MCP_LOG_RATE_LIMIT", "10"))
+
+# 레이트 리밋 기준 구간 (초)
+RATE_LIMIT_WINDOW = 1.0
+
+# 레이트 리밋 버킷이 이 수를 넘으면 만료된 버킷을 정리 (f-string 메시지로 키가 늘어나는 경우 대비)
+RATE_LIMIT_MAX_KEYS = 1024
+
+
+class TextFormatter(logging.Formatter):
+    """기본 텍스트 형식에 생략/유실 건수를 덧붙이는 포매터"""
+
+    def __init__(self):
+        super().__init__(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            text += f" (같은 메시지 {suppressed}건 생략)"
+        dropped = getattr(record, "dropped", 0)
+        if dropped:
+            text += f" (큐가 가득 차 {dropped}건 유실)"
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 한 줄짜리 JSON 객체로 출력하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("suppressed", "dropped"):
+            value = getattr(record, key, 0)
+            if value:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    로거 이름과 메시지 템플릿(record.msg)별로 구간당 기록 수를 제한하는 필터
+
+    구간이 바뀐 뒤 처음 통과하는 레코드에 직전 구간에서 생략한 건수(suppressed)를 기록합니다.
+    """
+
+    def __init__(self, limit: int, window: float = RATE_LIMIT_WINDOW):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        # (로거 이름, 메시지 템플릿) -> [구간 시작 시각, 통과 수, 생략 수, 마지막 생략 레벨]
+        self._buckets: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0 or record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or now - bucket[0] >= self.window:
+                if bucket is None and len(self._buckets) >= RATE_LIMIT_MAX_KEYS:
+                    self._evict_expired(now)
+                if bucket is not None and bucket[2]:
+                    record.suppressed = bucket[2]
+                self._buckets[key] = [now, 1, 0, record.levelno]
+                return True
+            if bucket[1] < self.limit:
+                bucket[1] += 1
+                return True
+            bucket[2] += 1
+            bucket[3] = record.levelno
+            return False
+
+    def flush_suppressed(self) -> list[logging.LogRecord]:
+        """
+        아직 표시하지 못한 생략 건수를 요약 레코드로 만들고 초기화
+
+        생략 건수는 같은 메시지의 다음 기록에 표시되므로, 이후 기록이 없으면 사라집니다.
+        리스너를 멈추기 전에 호출하여 남은 건수를 기록합니다.
+
+        Returns:
+            로거/메시지 템플릿별 요약 레코드 ('"<템플릿>" 생략 N건' 형식의 메시지)
+        """
+        records = []
+        with self._lock:
+            for (name, msg), bucket in self._buckets.items():
+                if not bucket[2]:
+                    continue
+                record = logging.LogRecord(
+                    name, bucket[3], "", 0, '"%s" 생략 %d건', (msg, bucket[2]), None
+                )
+                records.append(record)
+                bucket[2] = 0
+        return records
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [key for key, bucket in self._buckets.items() if now - bucket[0] >= self.window]
+        for key in expired:
+            del self._buckets[key]
+
+
+class StderrHandler(logging.StreamHandler):
+    """
+    기록할 때마다 현재 sys.stderr로 쓰는 핸들러
+
+    리스너 스레드는 호출 시점보다 늦게 기록하므로, 생성 시점의 sys.stderr를 붙잡아 두면
+    그 사이 교체되어 닫힌 스트림(예: 테스트 출력 캡처)에 쓰게 됩니다.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지 인자만 병합하여 큐에 넣는 핸들러
+
+    시각/JSON 포맷팅과 예외 트레이스백 문자열화는 리스너 스레드에서 수행합니다.
+    큐가 가득 차면 레코드를 버리고 다음 레코드에 유실 건수(dropped)를 기록합니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+        # enqueue는 여러 스레드에서 호출되므로 유실 건수 갱신과 전달을 함께 보호
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 레코드가 상위 로거 핸들러(예: pytest caplog)에도 전달되므로 복사본을 수정
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        with self._dropped_lock:
+            if self._dropped:
+                record.dropped = self._dropped
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1
+            else:
+                self._dropped = 0
+
+
+_formatter: Optional[logging.Formatter] = None
+_queue_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def _get_formatter() -> logging.Formatter:
+    global _formatter
+    if _formatter is None:
+        _formatter = JsonFormatter() if LOG_FORMAT == "json" else TextFormatter()
+    return _formatter
+
+
+def _get_handler() -> logging.Handler:
+    """
+    모든 모듈 로거가 공유하는 핸들러 생성 (처음 호출 시 리스너 스레드 시작)
+
+    Returns:
+        MCP_LOG_ASYNC가 켜져 있으면 AsyncQueueHandler, 아니면 StderrHandler
+    """
+    global _queue_handler, _listener
+
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        formatter = _get_formatter()
+        stream_handler = StderrHandler()
+        stream_handler.setFormatter(formatter)
+
+        if LOG_ASYNC:
+            handler: logging.Handler = AsyncQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+            # 출력 형식 확인용 (포맷팅 자체는 리스너의 stream_handler가 수행)
+            handler.setFormatter(formatter)
+            _listener = logging.handlers.QueueListener(handler.queue, stream_handler)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        else:
+            handler = stream_handler
+
+        handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT))
+        _queue_handler = handler
+        return handler
+
+
+def shutdown_logging() -> None:
+    """
+    리스너 스레드를 멈추고 큐에 남은 레코드를 모두 기록
+
+    레이트 리밋으로 생략했지만 아직 표시하지 못한 건수도 요약 레코드로 함께 기록합니다.
+    프로세스 종료 시 atexit로 자동 호출되며, 여러 번 호출해도 안전합니다.
+    """
+    global _listener
+    with _setup_lock:
+        listener, _listener = _listener, None
+        handler = _queue_handler
+    if listener is None:
+        return
+
+    if handler is not None:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, RateLimitFilter):
+                for record in log_filter.flush_suppressed():
+                    handler.emit(record)
+    listener.stop()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -31,13 +286,8 @@ def get_logger(name: str) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # 핸들러 설정
-    handler = logging.StreamHandler(sys.stderr)
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # 공유 핸들러 설정 (큐에 넣기만 하고 기록은 리스너 스레드가 담당)
+    logger.addHandler(_get_handler())
 
     # 환경 변수로 로그 레벨 설정
     log_level_str = os.environ.get("MCP_LOG_LEVEL", "INFO").upper()
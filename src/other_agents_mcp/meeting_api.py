@@ -1,6 +1,6 @@
 """Meeting API (RB-13)
 
-다중 회의모드 MCP 도구 정의
+다중 회의모드 MCP 도구 정의 (server.py의 list_tools에서 사용)
 - start_meeting: 회의 시작
 - get_meeting_status: 회의 상태 조회
 """
@@ -43,6 +43,65 @@ def get_meeting_tools() -> list[Tool]:
                         "default": "unanimous",
                         "description": "합의 유형 (선택, 기본값: unanimous). unanimous=만장일치(100%), supermajority=절대다수(2/3), majority=과반수(50%+)",
                     },
+                    "early_termination": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "라운드 결과가 확정되면 남은 에이전트 응답을 기다리지 않고 다음 단계로 진행 (선택, 기본값: true). 예: 만장일치에서 1명 반대, 5명 중 3명 찬성(과반수)",
+                    },
+                    "round_deadline": {
+                        "type": "integer",
+                        "description": "라운드 소프트 마감 초 (선택). 이 시간이 지나면 도착한 응답만으로 라운드를 마감하고 미응답 에이전트는 지연(late) 기권으로 기록. 1~timeout_per_round",
+                    },
+                    "carry_late_responses": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "마감 후 도착한 응답을 다음 라운드 맥락에 포함 (선택, 기본값: false, round_deadline과 함께 사용)",
+                    },
+                    "use_sessions": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "세션 ID로 재개할 수 있는 에이전트(claude)를 회의 전용 세션에서 실행하고 2라운드부터 새 발언만 전달 (선택, 기본값: false). 나머지 에이전트는 stateless로 참여",
+                    },
+                    "compaction": {
+                        "type": "string",
+                        "enum": ["truncate", "keep_last_k", "extractive", "summarizer"],
+                        "default": "truncate",
+                        "description": "이전 발언 압축 전략 (선택, 기본값: truncate). truncate=직전 라운드 응답당 500자, keep_last_k=최근 K 라운드 유지, extractive=핵심 문장 추출, summarizer=summarizer_agent가 요약",
+                    },
+                    "transcript_budget": {
+                        "type": "integer",
+                        "description": "이전 발언 섹션의 바이트 예산 (선택, 256~100000). 에이전트/라운드 수와 무관하게 프롬프트 크기를 일정하게 유지 (토큰 ≈ 바이트/4)",
+                    },
+                    "compaction_keep_rounds": {
+                        "type": "integer",
+                        "default": 2,
+                        "description": "keep_last_k/extractive 전략이 유지할 최근 라운드 수 (선택, 기본값: 2)",
+                    },
+                    "summarizer_agent": {
+                        "type": "string",
+                        "description": "summarizer 전략에서 요약을 맡을 에이전트 (compaction=summarizer일 때 필수)",
+                    },
+                    "max_parallel_agents": {
+                        "type": "integer",
+                        "description": "이 회의에서 동시에 실행할 최대 에이전트 수 (선택, 1~에이전트 수). 회의 외 요청용 CLI 슬롯을 남기도록 (MCP_MAX_CONCURRENT_CLI - 1) / 진행 중인 회의 수 (최소 1)를 넘지 않으며, 회의가 시작하거나 끝날 때마다 다시 계산",
+                    },
+                    "context": {
+                        "type": "string",
+                        "description": "참고 자료 (선택). 모든 라운드의 시스템 프롬프트에 주제와 함께 포함",
+                    },
+                    "context_id": {
+                        "type": "string",
+                        "description": "register_prompt로 등록한 참고 자료 ID (선택, context 대신 사용). 큰 문서를 매번 보내지 않아도 됨",
+                    },
+                    "prompt_vars": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "등록된 참고 자료의 $name 변수에 치환할 값 (선택)",
+                    },
+                    "structured_votes": {
+                        "type": "boolean",
+                        "description": "에이전트에게 JSON({opinion, vote}) 응답을 요청하고 직접 파싱 (선택, 기본값: false). JSON 출력을 지원하는 CLI(claude, gemini, qwen)는 --output-format json으로 실행. 파싱 실패 시 투표 태그 검색으로 대체",
+                    },
                 },
                 "required": ["topic", "agents"],
             },
@@ -57,6 +116,19 @@ def get_meeting_tools() -> list[Tool]:
                         "type": "string",
                         "description": "회의 ID (start_meeting에서 반환된 값)",
                     },
+                    "since_round": {
+                        "type": "integer",
+                        "description": "이미 받은 마지막 완료 라운드 번호 (선택). 지정하면 이후 라운드와 진행 중 라운드의 새 응답만 반환. 이전 응답의 next_cursor 값을 그대로 전달",
+                    },
+                    "since_response": {
+                        "type": "integer",
+                        "description": "진행 중인 라운드에서 이미 받은 응답 수 (선택, next_cursor 값 사용)",
+                    },
+                    "full_responses": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "미리보기로 축약된 완료 라운드 응답을 발언 기록 파일에서 읽어 전문으로 반환 (선택, 기본값: false)",
+                    },
                 },
                 "required": ["meeting_id"],
             },
@@ -64,49 +136,17 @@ def get_meeting_tools() -> list[Tool]:
     ]
 
 
-# MCP 도구 스키마 (server.py에서 직접 사용할 수 있도록)
-MEETING_TOOL_SCHEMAS = {
-    "start_meeting": {
-        "name": "start_meeting",
-        "description": "다중 에이전트 회의를 시작합니다. 지정된 에이전트들이 주제에 대해 만장일치가 나올 때까지 토론합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "회의 주제 (필수). 에이전트들이 토론할 내용",
-                },
-                "agents": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "참여 에이전트 목록 (필수). 예: ['claude', 'gemini', 'codex']. 최소 2개 이상",
-                },
-                "max_rounds": {
-                    "type": "integer",
-                    "default": 5,
-                    "description": "최대 라운드 수 (선택, 기본값: 5). 만장일치 없이 이 횟수에 도달하면 종료",
-                },
-                "timeout_per_round": {
-                    "type": "integer",
-                    "default": 300,
-                    "description": "라운드당 타임아웃 초 (선택, 기본값: 300)",
-                },
-            },
-            "required": ["topic", "agents"],
-        },
-    },
-    "get_meeting_status": {
-        "name": "get_meeting_status",
-        "description": "진행 중인 회의의 상태를 조회합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "meeting_id": {
-                    "type": "string",
-                    "description": "회의 ID (start_meeting에서 반환된 값)",
-                },
-            },
-            "required": ["meeting_id"],
-        },
-    },
-}
+def __getattr__(name: str):
+    """
+    MEETING_TOOL_SCHEMAS를 처음 참조할 때 생성 (import 시 도구 정의를 만들지 않음)
+
+    MCP 도구 스키마 딕셔너리는 get_meeting_tools와 같은 정의에서 만들고 모듈에 저장하여 재사용합니다.
+    """
+    if name != "MEETING_TOOL_SCHEMAS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    schemas = {
+        tool.name: tool.model_dump(include={"name", "description", "inputSchema"})
+        for tool in get_meeting_tools()
+    }
+    globals()[name] = schemas
+    return schemas
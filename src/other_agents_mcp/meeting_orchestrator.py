@@ -9,15 +9,20 @@
 
 import asyncio
 import functools
+import re
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Optional
 
 from .consensus import (
     generate_meeting_system_prompt,
+    generate_meeting_round_delta,
     parse_vote_from_response,
+    parse_structured_vote,
+    STRUCTURED_VOTE_INSTRUCTION,
     check_consensus,
     check_unanimous,
+    predict_consensus,
     should_continue_meeting,
     extract_consensus_statement,
 )
@@ -29,16 +34,29 @@ from .meeting_schema import (
     AgentResponse,
     VoteType,
     ConsensusType,
+    CompactionStrategy,
 )
-from .file_handler import execute_cli_file_based, get_cli_semaphore
+from .transcript_compaction import TruncateCompactor, create_compactor
+from .file_handler import (
+    CLIProcessHandle,
+    execute_cli_file_based,
+    execute_with_session,
+    get_cli_semaphore,
+    supports_session_resume,
+)
+from .session_manager import get_session_manager
+from .prompt_cache import PromptNotFoundError, resolve_prompt
 from .cli_manager import list_available_clis
 from .task_manager import get_task_manager
+from .meeting_store import get_meeting_storage
+from .meeting_scheduler import AgentSlots, get_meeting_scheduler
+from .meeting_transcript import MeetingTranscript, RESPONSE_PREVIEW_CHARS
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
 
-# 진행 중인 회의 저장소
+# 진행 중인 회의 (실행 중인 객체, 완료되면 회의 저장소로만 조회)
 _active_meetings: Dict[str, MeetingResult] = {}
 
 
@@ -47,6 +65,40 @@ def get_active_meeting(meeting_id: str) -> Optional[MeetingResult]:
     return _active_meetings.get(meeting_id)
 
 
+async def get_meeting(meeting_id: str) -> Optional[MeetingResult]:
+    """
+    회의 조회 (진행 중인 회의 우선, 없으면 회의 저장소)
+
+    Args:
+        meeting_id: 회의 ID
+
+    Returns:
+        MeetingResult 또는 None
+    """
+    meeting = get_active_meeting(meeting_id)
+    if meeting is not None:
+        return meeting
+    return await get_meeting_storage().get_meeting(meeting_id)
+
+
+async def _persist_meeting(meeting: MeetingResult) -> None:
+    """회의 메타데이터 저장 (저장 실패가 회의 진행을 막지 않음)"""
+    try:
+        await get_meeting_storage().save_meeting(meeting)
+    except Exception as e:
+        logger.warning(f"회의 저장 실패: {meeting.meeting_id} - {e}")
+
+
+async def _persist_round(meeting: MeetingResult, round_result: MeetingRound) -> None:
+    """완료된 라운드 저장 (저장 실패가 회의 진행을 막지 않음)"""
+    try:
+        await get_meeting_storage().append_round(meeting.meeting_id, round_result)
+    except Exception as e:
+        logger.warning(
+            f"라운드 저장 실패: {meeting.meeting_id} 라운드 {round_result.round_number} - {e}"
+        )
+
+
 def list_active_meetings() -> list[str]:
     """진행 중인 회의 ID 목록"""
     return list(_active_meetings.keys())
@@ -58,6 +110,16 @@ async def start_meeting(
     max_rounds: int = 5,
     timeout_per_round: int = 300,
     consensus_type: ConsensusType = ConsensusType.UNANIMOUS,
+    early_termination: bool = True,
+    round_deadline: Optional[int] = None,
+    carry_late_responses: bool = False,
+    use_sessions: bool = False,
+    compaction: CompactionStrategy = CompactionStrategy.TRUNCATE,
+    transcript_budget: Optional[int] = None,
+    compaction_keep_rounds: int = 2,
+    summarizer_agent: Optional[str] = None,
+    structured_votes: bool = False,
+    max_parallel_agents: Optional[int] = None,
 ) -> MeetingResult:
     """
     다중 에이전트 회의 시작
@@ -68,6 +130,16 @@ async def start_meeting(
         max_rounds: 최대 라운드 수
         timeout_per_round: 라운드당 타임아웃 (초)
         consensus_type: 합의 유형 (unanimous, supermajority, majority)
+        early_termination: 라운드 결과 확정 시 남은 응답을 기다리지 않음
+        round_deadline: 라운드 소프트 마감 (초, 선택)
+        carry_late_responses: 마감 후 도착한 응답을 다음 라운드 맥락에 포함
+        use_sessions: 에이전트별 전용 세션에서 라운드 증분만 전달
+        compaction: 이전 발언 압축 전략
+        transcript_budget: 이전 발언 섹션 바이트 예산 (선택)
+        compaction_keep_rounds: keep_last_k/extractive가 유지할 라운드 수
+        summarizer_agent: summarizer 전략의 요약 에이전트
+        structured_votes: JSON({opinion, vote}) 응답 요청 후 직접 파싱
+        max_parallel_agents: 회의 내 동시 에이전트 호출 수 제한 (선택)
 
     Returns:
         MeetingResult 객체
@@ -79,14 +151,24 @@ async def start_meeting(
         max_rounds=max_rounds,
         timeout_per_round=timeout_per_round,
         consensus_type=consensus_type,
+        early_termination=early_termination,
+        round_deadline=round_deadline,
+        carry_late_responses=carry_late_responses,
+        use_sessions=use_sessions,
+        compaction=compaction,
+        transcript_budget=transcript_budget,
+        compaction_keep_rounds=compaction_keep_rounds,
+        summarizer_agent=summarizer_agent,
+        structured_votes=structured_votes,
+        max_parallel_agents=max_parallel_agents,
     )
     config.validate()
 
-    # 2. 에이전트 유효성 확인
+    # 2. 에이전트 유효성 확인 (요약 에이전트 포함)
     available_clis = await asyncio.to_thread(list_available_clis)
     available_names = {cli.name for cli in available_clis}
 
-    invalid_agents = [a for a in agents if a not in available_names]
+    invalid_agents = [a for a in _required_agents(config) if a not in available_names]
     if invalid_agents:
         raise ValueError(f"사용할 수 없는 에이전트: {invalid_agents}")
 
@@ -101,8 +183,9 @@ async def start_meeting(
     )
 
     _active_meetings[meeting_id] = meeting
-    logger.info(f"회의 시작: {meeting_id} - 주제: {topic}")
-    logger.info(f"참여 에이전트: {agents}")
+    await _persist_meeting(meeting)
+    logger.info("회의 시작: %s - 주제: %s", meeting_id, topic)
+    logger.info("참여 에이전트: %s", agents)
 
     try:
         # 4. 라운드 루프 실행
@@ -115,13 +198,25 @@ async def start_meeting(
 
     finally:
         meeting.ended_at = datetime.now()
-        # 완료된 회의는 저장소에서 제거
-        _active_meetings.pop(meeting_id, None)
+        await _finish_meeting(meeting)
 
-    logger.info(f"회의 종료: {meeting_id} - 상태: {meeting.status.value}")
+    logger.info("회의 종료: %s - 상태: %s", meeting_id, meeting.status.value)
     return meeting
 
 
+# 세션 증분 프롬프트는 압축 전략과 무관하게 직전 라운드 발언만 예산에 맞춰 자름
+_session_delta_compactor = TruncateCompactor()
+
+
+def _required_agents(config: MeetingConfig) -> list[str]:
+    """회의에 필요한 에이전트 목록 (참여 에이전트 + 요약 에이전트)"""
+    required = list(config.agents)
+    if config.compaction == CompactionStrategy.SUMMARIZER and config.summarizer_agent:
+        if config.summarizer_agent not in required:
+            required.append(config.summarizer_agent)
+    return required
+
+
 async def _run_meeting_loop(
     meeting: MeetingResult,
     config: MeetingConfig,
@@ -138,50 +233,227 @@ async def _run_meeting_loop(
     """
     current_round = 0
     previous_responses: list[dict] = []
+    # 압축 단계 입력이 되는 발언 기록 (압축기가 필요로 하는 최근 라운드만 보관)
+    compactor = create_compactor(config)
+    transcript: list[dict] = []
+    # 마감 후에도 계속 실행 중인 에이전트 호출 (carry_late_responses 사용 시)
+    late_tasks: Optional[set[asyncio.Task]] = set() if config.carry_late_responses else None
+    # 세션 모드: 에이전트별 전용 세션 ID와 세션을 시작한 에이전트 목록
+    session_ids = (
+        _build_meeting_session_ids(meeting.meeting_id, config.agents)
+        if config.use_sessions
+        else None
+    )
+    started_sessions: set[str] = set()
+    # 전체 발언은 파일에 추가 기록하고 메모리에는 미리보기만 보관
+    transcript_file = MeetingTranscript(meeting.meeting_id)
+    meeting.transcript_path = str(transcript_file.path)
+    # 회의별 에이전트 슬롯 (지연 호출을 포함한 모든 라운드가 공유, 회의 수에 따라 스케줄러가 재조정)
+    scheduler = get_meeting_scheduler()
+    agent_slots = scheduler.open_agent_slots(meeting.meeting_id, config.max_parallel_agents)
 
-    while current_round < config.max_rounds:
-        current_round += 1
-        logger.info(f"=== 라운드 {current_round}/{config.max_rounds} 시작 ===")
+    try:
+        while current_round < config.max_rounds:
+            current_round += 1
+            logger.info("=== 라운드 %d/%d 시작 ===", current_round, config.max_rounds)
+
+            # 0. 이전 라운드 마감 이후 도착한 응답을 맥락에 추가
+            if late_tasks:
+                for entry in _collect_late_responses(late_tasks, current_round - 1):
+                    await _append_transcript(transcript_file, entry)
+                    transcript.append(entry)
+
+            # 1. 발언 기록 압축 후 시스템 프롬프트 생성
+            if transcript:
+                previous_responses = await compactor.compact(transcript, config.transcript_budget)
+
+            # 세션 에이전트용 증분: 세션에 이미 있는 이전 라운드는 빼고 직전 라운드 발언만
+            # (지연 응답은 수집한 라운드에 한 번만 직전 라운드 번호로 기록됨)
+            session_delta = None
+            if session_ids and transcript:
+                session_delta = await _session_delta_compactor.compact(
+                    [e for e in transcript if e["round_number"] == current_round - 1],
+                    config.transcript_budget,
+                )
 
-        # 1. 시스템 프롬프트 생성
-        system_prompt = generate_meeting_system_prompt(
-            topic=config.topic,
-            round_number=current_round,
-            previous_responses=previous_responses,
-        )
+            system_prompt = generate_meeting_system_prompt(
+                topic=config.topic,
+                round_number=current_round,
+                previous_responses=previous_responses,
+                max_response_chars=None,  # 압축 단계에서 이미 제한됨
+                structured_votes=config.structured_votes,
+                context=config.context,
+            )
+
+            # 2. 모든 에이전트에게 동시 질문 (도착한 응답은 진행 중 라운드로 노출)
+            in_progress_round = MeetingRound(round_number=current_round)
+            meeting.in_progress_round = in_progress_round
+            round_result = await _execute_round(
+                agents=config.agents,
+                topic=config.topic,
+                system_prompt=system_prompt,
+                round_number=current_round,
+                timeout=config.timeout_per_round,
+                consensus_type=config.consensus_type,
+                early_termination=config.early_termination,
+                deadline=config.round_deadline,
+                late_tasks=late_tasks,
+                session_ids=session_ids,
+                started_sessions=started_sessions,
+                previous_responses=session_delta,
+                on_response=functools.partial(_record_response, transcript_file, in_progress_round),
+                structured_votes=config.structured_votes,
+                agent_slots=agent_slots,
+            )
+
+            # 3. 합의 확인 (설정된 합의 유형에 따라)
+            is_consensus = check_consensus(round_result, config.consensus_type)
+            if is_consensus:
+                meeting.final_consensus = extract_consensus_statement(round_result)
+            else:
+                # 4. 다음 라운드를 위한 발언 기록 저장 (취소/지연 자리표시 응답 제외)
+                for r in round_result.responses:
+                    if not (r.cancelled or r.late):
+                        transcript.append({**r.to_dict(), "round_number": current_round})
+
+            # 전체 내용은 파일에 있으므로 라운드에는 미리보기만 남김
+            for r in round_result.responses:
+                r.shrink(RESPONSE_PREVIEW_CHARS)
+
+            # 합의 판정까지 끝난 라운드를 추가 (추가 이후에는 변경되지 않음)
+            meeting.rounds.append(round_result)
+            meeting.in_progress_round = None
+            await _persist_round(meeting, round_result)
+
+            if is_consensus:
+                meeting.status = MeetingStatus.CONSENSUS
+                logger.info(
+                    f"합의 도달! ({config.consensus_type.value}) 합의 내용: {meeting.final_consensus}"
+                )
+                break
+
+            transcript = [
+                entry
+                for entry in transcript
+                if entry["round_number"] > current_round - compactor.window_rounds
+            ]
+
+            # 5. 계속 여부 판단
+            if not should_continue_meeting(current_round, config.max_rounds, is_consensus):
+                meeting.status = MeetingStatus.NO_CONSENSUS
+                break
+    finally:
+        # 회의가 끝났으므로 아직 응답하지 않은 지연 호출은 더 이상 기다리지 않음
+        if late_tasks:
+            for task in late_tasks:
+                task.cancel()
+            await asyncio.gather(*late_tasks, return_exceptions=True)
+        if session_ids:
+            _close_meeting_sessions(session_ids)
+        scheduler.close_agent_slots(meeting.meeting_id)
 
-        # 2. 모든 에이전트에게 동시 질문
-        round_result = await _execute_round(
-            agents=config.agents,
-            topic=config.topic,
-            system_prompt=system_prompt,
-            round_number=current_round,
-            timeout=config.timeout_per_round,
-        )
+    if meeting.status == MeetingStatus.RUNNING:
+        meeting.status = MeetingStatus.NO_CONSENSUS
 
-        meeting.rounds.append(round_result)
+    return meeting
 
-        # 3. 합의 확인 (설정된 합의 유형에 따라)
-        is_consensus = check_consensus(round_result, config.consensus_type)
 
-        if is_consensus:
-            meeting.status = MeetingStatus.CONSENSUS
-            meeting.final_consensus = extract_consensus_statement(round_result)
-            logger.info(f"합의 도달! ({config.consensus_type.value}) 합의 내용: {meeting.final_consensus}")
-            break
+def _build_meeting_session_ids(meeting_id: str, agents: list[str]) -> Dict[str, str]:
+    """
+    세션 재개를 지원하는 에이전트별 전용 세션 ID 생성
 
-        # 4. 다음 라운드를 위한 이전 응답 저장
-        previous_responses = [r.to_dict() for r in round_result.responses]
+    Args:
+        meeting_id: 회의 ID
+        agents: 참여 에이전트 목록
 
-        # 5. 계속 여부 판단
-        if not should_continue_meeting(current_round, config.max_rounds, is_consensus):
-            meeting.status = MeetingStatus.NO_CONSENSUS
-            break
+    Returns:
+        에이전트 이름 → 세션 ID (세션 미지원 에이전트는 제외되어 stateless로 실행)
+    """
+    session_ids = {}
+    for agent in agents:
+        if not supports_session_resume(agent):
+            logger.info("에이전트 %s는 세션 재개를 지원하지 않아 stateless로 참여", agent)
+            continue
+        safe_agent = re.sub(r"[^a-zA-Z0-9\-_]", "_", agent)
+        session_ids[agent] = f"meeting-{meeting_id}-{safe_agent}"[:128]
+    return session_ids
+
+
+def _close_meeting_sessions(session_ids: Dict[str, str]) -> None:
+    """회의 종료 시 에이전트 세션 정리"""
+    session_manager = get_session_manager()
+    for session_id in session_ids.values():
+        if session_manager.get_session(session_id) is not None:
+            session_manager.delete_session(session_id)
+
+
+async def _append_transcript(
+    transcript_file: MeetingTranscript, entry: dict
+) -> Optional[tuple[int, int]]:
+    """
+    발언 기록 파일에 한 건 추가 (파일 기록 실패는 회의를 중단시키지 않음)
 
-    if meeting.status == MeetingStatus.RUNNING:
-        meeting.status = MeetingStatus.NO_CONSENSUS
+    파일 I/O는 스레드에서 실행하여 이벤트 루프를 막지 않으며, 회의 루프가 응답마다
+    기록을 기다리므로 한 회의의 기록은 순서대로 하나씩 추가됩니다.
 
-    return meeting
+    Args:
+        transcript_file: 회의 발언 기록 파일
+        entry: 기록할 응답 딕셔너리
+
+    Returns:
+        (바이트 오프셋, 바이트 길이), 실패 시 None
+    """
+    try:
+        return await asyncio.to_thread(transcript_file.append, entry)
+    except OSError as e:
+        logger.warning(f"회의 발언 기록 실패 ({transcript_file.meeting_id}): {e}")
+        return None
+
+
+async def _record_response(
+    transcript_file: MeetingTranscript,
+    round_result: MeetingRound,
+    response: AgentResponse,
+) -> None:
+    """
+    도착한 응답을 발언 기록 파일에 추가하고 진행 중인 라운드에 노출
+
+    Args:
+        transcript_file: 회의 발언 기록 파일
+        round_result: 진행 중인 라운드
+        response: 도착한 에이전트 응답
+    """
+    location = await _append_transcript(
+        transcript_file, {**response.to_dict(), "round_number": round_result.round_number}
+    )
+    if location is not None:
+        response.transcript_offset, response.transcript_length = location
+    round_result.responses.append(response)
+
+
+def _collect_late_responses(late_tasks: set[asyncio.Task], round_number: int) -> list[dict]:
+    """
+    완료된 지연 호출의 응답을 수집하고 late_tasks에서 제거
+
+    Args:
+        late_tasks: 이전 라운드 마감 이후에도 실행 중이던 에이전트 호출
+        round_number: 발언 기록에 표시할 라운드 번호 (가장 최근 완료 라운드)
+
+    Returns:
+        다음 라운드 맥락에 포함할 응답 딕셔너리 목록
+    """
+    carried = []
+    for task in [t for t in late_tasks if t.done()]:
+        late_tasks.discard(task)
+        if task.cancelled():
+            continue
+        _, response = task.result()
+        response_dict = response.to_dict()
+        response_dict["carried_over"] = True
+        response_dict["round_number"] = round_number
+        carried.append(response_dict)
+        logger.info("에이전트 %s의 지연 응답을 다음 라운드 맥락에 포함", response.agent_name)
+    return carried
 
 
 async def _execute_round(
@@ -190,16 +462,53 @@ async def _execute_round(
     system_prompt: str,
     round_number: int,
     timeout: int,
+    consensus_type: ConsensusType = ConsensusType.UNANIMOUS,
+    early_termination: bool = False,
+    deadline: Optional[float] = None,
+    late_tasks: Optional[set[asyncio.Task]] = None,
+    session_ids: Optional[Dict[str, str]] = None,
+    started_sessions: Optional[set[str]] = None,
+    previous_responses: Optional[list[dict]] = None,
+    on_response: Optional[Callable[[AgentResponse], Awaitable[None]]] = None,
+    structured_votes: bool = False,
+    max_parallel_agents: Optional[int] = None,
+    agent_slots: Optional[AgentSlots] = None,
 ) -> MeetingRound:
     """
     단일 라운드 실행 (모든 에이전트 병렬 호출)
 
+    응답이 도착할 때마다 합의 여부를 점진적으로 평가하며, early_termination이
+    켜져 있으면 남은 응답과 무관하게 결과가 확정되는 순간 나머지 에이전트 대기를
+    취소합니다. 취소된 에이전트는 기권(ABSTAIN)으로 기록됩니다.
+
+    deadline이 지정되면 그 시간이 지난 시점에 도착한 응답만으로 라운드를 마감하고,
+    응답하지 못한 에이전트는 지연(late) 기권으로 기록합니다. late_tasks가 주어지면
+    지연된 호출을 취소하지 않고 late_tasks에 넘겨 이후 라운드에서 응답을 활용합니다.
+
+    session_ids에 포함된 에이전트는 전용 CLI 세션에서 실행되며, 첫 라운드 이후에는
+    전체 시스템 프롬프트 대신 다른 에이전트의 지난 발언만 담은 증분 프롬프트를 받습니다.
+    이전 라운드의 지연 호출이 아직 실행 중인 세션 에이전트는 호출하지 않고 지연 기권으로 기록합니다.
+
     Args:
         agents: 에이전트 목록
         topic: 회의 주제
         system_prompt: 시스템 프롬프트
         round_number: 라운드 번호
         timeout: 타임아웃 (초)
+        consensus_type: 합의 유형 (조기 종료 판정용)
+        early_termination: 결과 확정 시 조기 종료 여부
+        deadline: 라운드 소프트 마감 (초, 선택)
+        late_tasks: 마감 후에도 계속 실행할 지연 호출을 담을 집합 (선택)
+        session_ids: 에이전트 이름 → 회의 전용 세션 ID (선택)
+        started_sessions: 세션을 시작한 에이전트 집합 (선택, CLI 프로세스를 띄우거나 응답하면 갱신)
+        previous_responses: 직전 라운드 발언 (세션 증분 프롬프트용, 세션에 이미 전달한 발언 제외)
+        on_response: 응답이 도착할 때마다 기다리는 비동기 콜백 (선택, 진행 상황 노출용)
+        structured_votes: JSON({opinion, vote}) 응답을 요청하고 직접 파싱
+                          (지원 CLI는 JSON 출력 인자로 실행, 실패 시 태그 검색으로 대체)
+        max_parallel_agents: 이 회의에서 동시에 실행할 에이전트 수
+                             (선택, 없으면 스케줄러 기본값 - 회의 외 요청용 슬롯을 남김)
+        agent_slots: 회의의 모든 라운드가 공유하는 에이전트 슬롯
+                     (선택, 지정하면 max_parallel_agents 대신 사용)
 
     Returns:
         MeetingRound 객체
@@ -207,57 +516,256 @@ async def _execute_round(
     round_result = MeetingRound(round_number=round_number)
 
     # 유저 프롬프트 (간단하게)
-    user_prompt = f"회의 주제: {topic}\n\n이 주제에 대한 의견을 제시하고, 마지막에 [AGREE], [DISAGREE], [ABSTAIN] 중 하나로 투표해주세요."
+    if structured_votes:
+        user_prompt = (
+            f"회의 주제: {topic}\n\n이 주제에 대한 의견을 제시하세요. {STRUCTURED_VOTE_INSTRUCTION}"
+        )
+    else:
+        user_prompt = f"회의 주제: {topic}\n\n이 주제에 대한 의견을 제시하고, 마지막에 [AGREE], [DISAGREE], [ABSTAIN] 중 하나로 투표해주세요."
 
-    # 병렬 실행 함수
+    # 병렬 실행 함수 (전역 CLI 슬롯 + 회의별 에이전트 슬롯)
     semaphore = get_cli_semaphore()
+    if agent_slots is None:
+        if max_parallel_agents is None:
+            max_parallel_agents = get_meeting_scheduler().default_max_parallel_agents()
+        agent_slots = AgentSlots(max_parallel_agents)
+
+    if session_ids is None:
+        session_ids = {}
+    if started_sessions is None:
+        started_sessions = set()
+
+    def build_agent_call(agent_name: str, process_handle: CLIProcessHandle) -> functools.partial:
+        """에이전트 실행 함수 구성 (세션 모드 여부에 따라 분기)"""
+        session_id = session_ids.get(agent_name)
+
+        if session_id is None:
+            # Stateless: 매 라운드 전체 시스템 프롬프트 전달
+            return functools.partial(
+                execute_cli_file_based,
+                agent_name,
+                user_prompt,
+                True,  # skip_git_repo_check
+                system_prompt,
+                [],  # args
+                timeout,
+                process_handle=process_handle,
+                # 구조화된 투표: JSON 출력을 지원하는 CLI는 JSON 출력 인자로 실행
+                json_output=structured_votes,
+            )
+
+        if agent_name not in started_sessions:
+            # 세션 첫 라운드: 전체 시스템 프롬프트로 세션 시작
+            return functools.partial(
+                execute_with_session,
+                agent_name,
+                user_prompt,
+                session_id,
+                False,  # resume
+                True,  # skip_git_repo_check
+                system_prompt,
+                [],  # args
+                timeout,
+                process_handle=process_handle,
+                # 구조화된 투표: JSON 출력을 지원하는 CLI는 JSON 출력 인자로 실행
+                json_output=structured_votes,
+            )
+
+        # 세션 재개: 라운드 증분만 전달
+        delta_prompt = generate_meeting_round_delta(
+            round_number=round_number,
+            previous_responses=previous_responses,
+            agent_name=agent_name,
+            max_response_chars=None,  # 회의 루프에서 이미 압축됨
+            structured_votes=structured_votes,
+        )
+        return functools.partial(
+            execute_with_session,
+            agent_name,
+            delta_prompt,
+            session_id,
+            True,  # resume
+            True,  # skip_git_repo_check
+            None,  # system_prompt (세션에 이미 포함)
+            [],  # args
+            timeout,
+            process_handle=process_handle,
+            json_output=structured_votes,
+        )
 
-    async def call_agent(agent_name: str) -> AgentResponse:
-        """단일 에이전트 호출"""
-        async with semaphore:
-            try:
-                logger.debug(f"에이전트 호출: {agent_name}")
-
-                execution_func = functools.partial(
-                    execute_cli_file_based,
-                    agent_name,
-                    user_prompt,
-                    True,  # skip_git_repo_check
-                    system_prompt,
-                    [],  # args
-                    timeout,
-                )
+    def release_slots() -> None:
+        """전역 CLI 슬롯과 회의별 에이전트 슬롯 반환"""
+        semaphore.release()
+        agent_slots.release()
 
-                response_text = await asyncio.to_thread(execution_func)
+    def release_when_finished(future: asyncio.Future) -> None:
+        """CLI 스레드가 실제로 끝난 뒤에 세마포어 슬롯 반환"""
+        release_slots()
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug("취소된 에이전트 호출이 에러로 종료됨: %s", future.exception())
 
-                # 투표 파싱
+    async def call_agent(agent_name: str) -> AgentResponse:
+        """단일 에이전트 호출"""
+        # 회의별 슬롯을 먼저 잡아 한 회의가 전역 슬롯을 독점하지 않도록 함
+        await agent_slots.acquire()
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            agent_slots.release()
+            raise
+        process_handle = CLIProcessHandle()
+        starts_session = agent_name in session_ids and agent_name not in started_sessions
+
+        def forget_unlaunched_session() -> None:
+            """CLI 프로세스를 띄우기 전에 끝난 세션 시작 호출은 다음 라운드에 다시 시작"""
+            if starts_session and not process_handle.launched:
+                started_sessions.discard(agent_name)
+
+        try:
+            logger.debug("에이전트 호출: %s", agent_name)
+
+            execution_func = build_agent_call(agent_name, process_handle)
+
+            # 라운드가 조기 종료되어 이 코루틴이 취소되면 CLI 프로세스를 종료하고,
+            # 슬롯은 스레드가 실제로 끝난 시점에 반환하여 동시 실행 수를 지킴
+            thread_future = asyncio.ensure_future(asyncio.to_thread(execution_func))
+        except BaseException:
+            release_slots()
+            raise
+        thread_future.add_done_callback(release_when_finished)
+
+        if starts_session:
+            # CLI가 세션을 만든 뒤 실패/취소/지연되어도 다음 라운드는 재개로 호출
+            # (같은 세션 ID로 다시 시작하면 중복 세션으로 거부될 수 있음)
+            started_sessions.add(agent_name)
+
+        try:
+            response_text = await asyncio.shield(thread_future)
+
+            # 투표 파싱 (구조화된 응답 우선, 실패 시 태그 검색)
+            vote = None
+            if structured_votes:
+                response_text, vote = parse_structured_vote(response_text)
+            if vote is None:
                 vote = parse_vote_from_response(response_text)
 
-                logger.info(f"에이전트 {agent_name} 응답 완료 - 투표: {vote.value}")
+            logger.info("에이전트 %s 응답 완료 - 투표: %s", agent_name, vote.value)
+
+            return AgentResponse(
+                agent_name=agent_name,
+                response=response_text,
+                vote=vote,
+            )
+
+        except asyncio.CancelledError:
+            # 더 이상 필요 없는 응답: 프로세스를 종료해 전역 CLI 슬롯을 바로 돌려받음
+            await asyncio.to_thread(process_handle.cancel)
+            forget_unlaunched_session()
+            raise
+
+        except Exception as e:
+            logger.error(f"에이전트 {agent_name} 호출 실패: {e}")
+            forget_unlaunched_session()
+            return AgentResponse(
+                agent_name=agent_name,
+                response=f"ERROR: {str(e)}",
+                vote=VoteType.ABSTAIN,
+            )
+
+    async def call_agent_at(index: int, agent_name: str) -> tuple[int, AgentResponse]:
+        """에이전트 순서를 유지하기 위해 인덱스와 함께 응답 반환"""
+        return index, await call_agent(agent_name)
+
+    responses: list[Optional[AgentResponse]] = [None] * len(agents)
+
+    # 이전 라운드의 지연 호출이 아직 실행 중인 세션 에이전트는 이번 라운드에서 건너뜀
+    # (같은 CLI 세션을 동시에 재개하면 세션 기록이 꼬이거나 갈라짐)
+    busy_sessions = {
+        task.get_name() for task in (late_tasks or ()) if not task.done()
+    }.intersection(session_ids)
+    for i, agent_name in enumerate(agents):
+        if agent_name in busy_sessions:
+            logger.info("에이전트 %s의 이전 라운드 세션 호출이 진행 중이어서 건너뜀", agent_name)
+            responses[i] = AgentResponse(
+                agent_name=agent_name,
+                response="LATE: 이전 라운드 세션 호출이 아직 진행 중입니다",
+                vote=VoteType.ABSTAIN,
+                late=True,
+            )
+
+    # 나머지 에이전트 병렬 호출, 도착 순서대로 처리 (지연 호출 구분을 위해 작업 이름은 에이전트 이름)
+    tasks = [
+        asyncio.create_task(call_agent_at(i, agent), name=agent)
+        for i, agent in enumerate(agents)
+        if agent not in busy_sessions
+    ]
+    arrived_votes: list[VoteType] = []
+    timed_out = False
 
-                return AgentResponse(
-                    agent_name=agent_name,
-                    response=response_text,
-                    vote=vote,
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=deadline):
+            try:
+                index, response = await next_done
+            except asyncio.TimeoutError:
+                timed_out = True
+                logger.warning(
+                    f"라운드 {round_number} 마감 ({deadline}초) - "
+                    f"{len(tasks) - len(arrived_votes)}개 에이전트 응답 없이 라운드 종료"
                 )
-
-            except Exception as e:
-                logger.error(f"에이전트 {agent_name} 호출 실패: {e}")
-                return AgentResponse(
-                    agent_name=agent_name,
-                    response=f"ERROR: {str(e)}",
-                    vote=VoteType.ABSTAIN,
+                break
+
+            responses[index] = response
+            arrived_votes.append(response.vote)
+            if on_response is not None:
+                await on_response(response)
+
+            if not early_termination or len(arrived_votes) == len(tasks):
+                continue
+
+            decided = predict_consensus(arrived_votes, len(agents), consensus_type)
+            if decided is not None:
+                round_result.decided_early = True
+                logger.info(
+                    f"라운드 {round_number} 결과 확정 ({'합의' if decided else '합의 불가'}) - "
+                    f"{len(tasks) - len(arrived_votes)}개 에이전트 응답 대기 취소"
                 )
-
-    # 모든 에이전트 병렬 호출
-    tasks = [call_agent(agent) for agent in agents]
-    responses = await asyncio.gather(*tasks)
+                break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        if timed_out and late_tasks is not None:
+            # 지연 응답은 이후 라운드에서 수집
+            late_tasks.update(pending)
+        else:
+            # 남은 에이전트 대기 취소 (실행 중인 CLI는 백그라운드에서 마무리)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    # 응답하지 못한 에이전트는 기권으로 기록
+    for i, agent_name in enumerate(agents):
+        if responses[i] is not None:
+            continue
+        if timed_out:
+            responses[i] = AgentResponse(
+                agent_name=agent_name,
+                response=f"LATE: 라운드 마감({deadline}초) 전에 응답하지 않았습니다",
+                vote=VoteType.ABSTAIN,
+                late=True,
+            )
+        else:
+            responses[i] = AgentResponse(
+                agent_name=agent_name,
+                response="CANCELLED: 라운드 결과가 확정되어 응답을 기다리지 않았습니다",
+                vote=VoteType.ABSTAIN,
+                cancelled=True,
+            )
 
     round_result.responses = list(responses)
 
     # 라운드 요약 로깅
     vote_summary = round_result.get_vote_summary()
-    logger.info(f"라운드 {round_number} 완료 - 투표 결과: {vote_summary}")
+    logger.info("라운드 %d 완료 - 투표 결과: %s", round_number, vote_summary)
 
     return round_result
 
@@ -280,6 +788,24 @@ async def handle_start_meeting(arguments: Dict[str, Any]) -> dict:
     max_rounds = arguments.get("max_rounds", 5)
     timeout_per_round = arguments.get("timeout_per_round", 300)
     consensus_type_str = arguments.get("consensus_type", "unanimous")
+    early_termination = arguments.get("early_termination", True)
+    round_deadline = arguments.get("round_deadline", None)
+    carry_late_responses = arguments.get("carry_late_responses", False)
+    use_sessions = arguments.get("use_sessions", False)
+    compaction_str = arguments.get("compaction", "truncate")
+    transcript_budget = arguments.get("transcript_budget", None)
+    compaction_keep_rounds = arguments.get("compaction_keep_rounds", 2)
+    summarizer_agent = arguments.get("summarizer_agent", None)
+    structured_votes = arguments.get("structured_votes", False)
+    max_parallel_agents = arguments.get("max_parallel_agents", None)
+
+    # 참고 자료: 본문 또는 register_prompt로 등록한 context_id (+ prompt_vars)
+    try:
+        context = resolve_prompt(arguments, "context", "context_id")
+    except PromptNotFoundError as e:
+        return {"error": str(e), "type": "PromptNotFoundError"}
+    except ValueError as e:
+        return {"error": str(e), "type": "PromptTemplateError"}
 
     # consensus_type 문자열을 enum으로 변환
     try:
@@ -287,8 +813,17 @@ async def handle_start_meeting(arguments: Dict[str, Any]) -> dict:
     except ValueError:
         return {
             "error": f"잘못된 consensus_type: {consensus_type_str}. "
-                     f"가능한 값: unanimous, supermajority, majority",
-            "type": "ValidationError"
+            f"가능한 값: unanimous, supermajority, majority",
+            "type": "ValidationError",
+        }
+
+    try:
+        compaction = CompactionStrategy(compaction_str)
+    except ValueError:
+        return {
+            "error": f"잘못된 compaction: {compaction_str}. "
+            f"가능한 값: truncate, keep_last_k, extractive, summarizer",
+            "type": "ValidationError",
         }
 
     # 설정 검증
@@ -299,6 +834,17 @@ async def handle_start_meeting(arguments: Dict[str, Any]) -> dict:
             max_rounds=max_rounds,
             timeout_per_round=timeout_per_round,
             consensus_type=consensus_type,
+            early_termination=early_termination,
+            round_deadline=round_deadline,
+            carry_late_responses=carry_late_responses,
+            use_sessions=use_sessions,
+            compaction=compaction,
+            transcript_budget=transcript_budget,
+            compaction_keep_rounds=compaction_keep_rounds,
+            summarizer_agent=summarizer_agent,
+            structured_votes=structured_votes,
+            max_parallel_agents=max_parallel_agents,
+            context=context,
         )
         config.validate()
     except ValueError as e:
@@ -309,43 +855,70 @@ async def handle_start_meeting(arguments: Dict[str, Any]) -> dict:
         available_clis = await asyncio.to_thread(list_available_clis)
         available_names = {cli.name for cli in available_clis}
 
-        invalid_agents = [a for a in agents if a not in available_names]
+        invalid_agents = [a for a in _required_agents(config) if a not in available_names]
         if invalid_agents:
             return {
                 "error": f"사용할 수 없는 에이전트: {invalid_agents}",
-                "type": "ValidationError"
+                "type": "ValidationError",
             }
     except Exception as e:
         return {"error": str(e), "type": "ValidationError"}
 
-    # 회의 ID 생성 및 초기 상태 설정
+    # 회의 ID 생성 후 스케줄러에 접수 (슬롯이 없으면 대기열, 대기열도 가득 차면 거절)
     meeting_id = str(uuid.uuid4())[:8]
+    scheduler = get_meeting_scheduler()
+    if not scheduler.submit(meeting_id):
+        stats = scheduler.get_stats()
+        return {
+            "error": f"진행 중인 회의({stats['running']}개)와 대기 중인 회의({stats['pending']}개)가 "
+            f"최대치에 도달했습니다. 잠시 후 다시 시도하세요.",
+            "type": "CapacityError",
+        }
+
+    queue_position = scheduler.queue_position(meeting_id)
     meeting = MeetingResult(
         meeting_id=meeting_id,
         topic=topic,
         agents=agents,
-        status=MeetingStatus.RUNNING,
+        status=MeetingStatus.WAITING if queue_position else MeetingStatus.RUNNING,
         started_at=datetime.now(),
     )
 
-    # _active_meetings에 등록
-    _active_meetings[meeting_id] = meeting
-
-    # 비동기로 회의 실행
-    coro = _run_meeting_async(meeting, config)
-    task_manager = get_task_manager()
-    await task_manager.start_async_task(coro, task_id=meeting_id)
+    coro = None
+    try:
+        # 진행 중인 회의로 등록하고 저장소에 기록
+        _active_meetings[meeting_id] = meeting
+        await _persist_meeting(meeting)
+
+        # 비동기로 회의 실행 (CLI 슬롯은 에이전트 호출마다 잡으므로 회의 전체를 감싸지 않음)
+        coro = _run_meeting_async(meeting, config)
+        task_manager = get_task_manager()
+        await task_manager.start_async_task(coro, task_id=meeting_id, use_semaphore=False)
+    except BaseException:
+        # 회의를 시작하지 못했으므로 접수한 슬롯(또는 대기열 자리)을 반환
+        if coro is not None:
+            coro.close()
+        _active_meetings.pop(meeting_id, None)
+        scheduler.release(meeting_id)
+        raise
 
-    logger.info(f"회의 시작됨: {meeting_id} - 주제: {topic}")
-    logger.info(f"참여 에이전트: {agents}")
+    logger.info("회의 접수됨: %s - 주제: %s - 상태: %s", meeting_id, topic, meeting.status.value)
+    logger.info("참여 에이전트: %s", agents)
 
-    return {
+    result = {
         "meeting_id": meeting_id,
-        "status": "running",
+        "status": meeting.status.value,
         "message": f"회의가 시작되었습니다. get_meeting_status로 진행 상황을 조회하세요.",
         "topic": topic,
         "agents": agents,
     }
+    if queue_position:
+        result["queue_position"] = queue_position
+        result["message"] = (
+            f"회의가 대기열 {queue_position}번으로 접수되었습니다. "
+            f"get_meeting_status로 진행 상황을 조회하세요."
+        )
+    return result
 
 
 async def _run_meeting_async(meeting: MeetingResult, config: MeetingConfig) -> dict:
@@ -357,11 +930,19 @@ async def _run_meeting_async(meeting: MeetingResult, config: MeetingConfig) -> d
         config: 회의 설정
 
     Returns:
-        회의 결과 딕셔너리
+        회의 요약 딕셔너리 (응답 전문은 transcript_path 파일 참조)
     """
     meeting_id = meeting.meeting_id
+    scheduler = get_meeting_scheduler()
 
     try:
+        # 대기열에서 실행 슬롯 배정 대기
+        if meeting.status == MeetingStatus.WAITING:
+            await scheduler.wait_for_slot(meeting_id)
+            meeting.status = MeetingStatus.RUNNING
+            meeting.started_at = datetime.now()
+            await _persist_meeting(meeting)
+
         # 라운드 루프 실행
         meeting = await _run_meeting_loop(meeting, config)
 
@@ -371,36 +952,42 @@ async def _run_meeting_async(meeting: MeetingResult, config: MeetingConfig) -> d
         meeting.error_message = str(e)
 
     finally:
+        if meeting.status in (MeetingStatus.WAITING, MeetingStatus.RUNNING):
+            # 종료 상태 없이 빠져나온 경우 (서버 종료 등으로 취소됨)
+            meeting.status = MeetingStatus.ERROR
+            meeting.error_message = "회의가 취소되었습니다."
         meeting.ended_at = datetime.now()
-        # _active_meetings 업데이트 (결과 반영)
-        _active_meetings[meeting_id] = meeting
+        await _finish_meeting(meeting)
+        scheduler.release(meeting_id)
 
-    logger.info(f"회의 종료: {meeting_id} - 상태: {meeting.status.value}")
+    logger.info("회의 종료: %s - 상태: %s", meeting_id, meeting.status.value)
 
-    # TTL 후 _active_meetings에서 제거 (메모리 누수 방지)
-    asyncio.create_task(_cleanup_meeting_after_ttl(meeting_id, ttl_seconds=3600))
+    return meeting.to_summary_dict()
 
-    return meeting.to_dict()
 
-
-async def _cleanup_meeting_after_ttl(meeting_id: str, ttl_seconds: int = 3600):
+async def _finish_meeting(meeting: MeetingResult) -> None:
     """
-    지정된 시간 후 완료된 회의를 _active_meetings에서 제거합니다.
+    완료된 회의를 저장소에 기록하고 진행 중 목록에서 제거합니다.
+
+    TTL 만료 정리는 서버 시작 시 실행되는 단일 정리 작업이 담당합니다.
 
     Args:
-        meeting_id: 회의 ID
-        ttl_seconds: TTL (기본값: 3600초 = 1시간)
+        meeting: 종료된 회의
     """
-    await asyncio.sleep(ttl_seconds)
-    removed = _active_meetings.pop(meeting_id, None)
-    if removed:
-        logger.debug(f"TTL 만료로 회의 정리됨: {meeting_id}")
+    meeting.in_progress_round = None
+    # 저장 후 제거하여 조회 공백이 생기지 않도록 함
+    await _persist_meeting(meeting)
+    _active_meetings.pop(meeting.meeting_id, None)
 
 
 async def handle_get_meeting_status(arguments: Dict[str, Any]) -> dict:
     """
     get_meeting_status MCP 도구 핸들러
 
+    since_round/since_response 커서가 주어지면 그 이후의 라운드와 응답만 반환하고,
+    다음 조회에 사용할 next_cursor를 함께 돌려줍니다. full_responses가 true이면
+    미리보기로 축약된 응답을 발언 기록 파일의 전문으로 바꿔 반환합니다.
+
     Args:
         arguments: MCP 도구 인자
 
@@ -408,9 +995,63 @@ async def handle_get_meeting_status(arguments: Dict[str, Any]) -> dict:
         회의 상태 딕셔너리
     """
     meeting_id = arguments["meeting_id"]
+    since_round = arguments.get("since_round", None)
+    since_response = arguments.get("since_response", None)
+    full_responses = arguments.get("full_responses", False)
 
-    meeting = get_active_meeting(meeting_id)
+    meeting = await get_meeting(meeting_id)
     if meeting is None:
         return {"error": f"회의를 찾을 수 없습니다: {meeting_id}", "type": "NotFoundError"}
 
-    return meeting.to_dict()
+    # 커서가 없으면 전체 결과 (완료 라운드는 캐시된 직렬화 결과 재사용)
+    if since_round is None and since_response is None:
+        result = meeting.to_dict()
+    else:
+        result = meeting.to_incremental_dict(
+            since_round=since_round or 0,
+            since_response=since_response or 0,
+        )
+
+    if full_responses:
+        result["rounds"] = await asyncio.to_thread(
+            _expand_truncated_rounds, MeetingTranscript(meeting_id), result["rounds"]
+        )
+
+    if meeting.status == MeetingStatus.WAITING:
+        result["queue_position"] = get_meeting_scheduler().queue_position(meeting_id)
+    return result
+
+
+def _expand_truncated_rounds(transcript_file: MeetingTranscript, rounds: list[dict]) -> list[dict]:
+    """
+    미리보기로 축약된 응답을 발언 기록 파일의 전문으로 교체
+
+    완료 라운드 직렬화 결과는 캐시되므로 축약된 응답이 있는 라운드만 복사하여 바꿉니다.
+    파일을 읽지 못한 응답은 미리보기를 그대로 둡니다.
+
+    Args:
+        transcript_file: 회의 발언 기록 파일
+        rounds: 직렬화된 라운드 목록
+
+    Returns:
+        전문이 반영된 라운드 목록
+    """
+    expanded = []
+    for round_dict in rounds:
+        if not any(r["truncated"] for r in round_dict["responses"]):
+            expanded.append(round_dict)
+            continue
+
+        responses = []
+        for response in round_dict["responses"]:
+            if response["truncated"]:
+                try:
+                    entry = transcript_file.read_entry(
+                        response["transcript_offset"], response["transcript_length"]
+                    )
+                    response = {**response, "response": entry["response"], "truncated": False}
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"회의 발언 전문 조회 실패 ({transcript_file.meeting_id}): {e}")
+            responses.append(response)
+        expanded.append({**round_dict, "responses": responses})
+    return expanded
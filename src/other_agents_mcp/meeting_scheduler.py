@@ -0,0 +1,246 @@
+"""Meeting Scheduler
+
+회의 동시 실행 제한 및 대기열 관리
+- 동시에 진행되는 회의 수 제한 (MCP_MAX_CONCURRENT_MEETINGS)
+- 초과한 회의는 대기열에서 순서대로 시작 (MCP_MAX_PENDING_MEETINGS)
+- 대기열도 가득 차면 새 회의를 거절
+- 회의별 동시 에이전트 수 (회의 외 요청용 CLI 슬롯 확보, 진행 중인 회의 수가 바뀌면 재조정)
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import Optional
+
+from . import file_handler
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 동시 진행 회의 수 제한 (기본값: 2)
+MAX_CONCURRENT_MEETINGS = int(os.environ.get("MCP_MAX_CONCURRENT_MEETINGS", "2"))
+
+# 대기열 최대 길이 (기본값: 10)
+MAX_PENDING_MEETINGS = int(os.environ.get("MCP_MAX_PENDING_MEETINGS", "10"))
+
+
+class AgentSlots:
+    """
+    회의별 동시 에이전트 호출 슬롯 (실행 중에 한도를 바꿀 수 있는 세마포어)
+
+    회의 하나가 모든 라운드(이전 라운드에서 넘어온 지연 호출 포함)에 같은 슬롯을 사용합니다.
+    한도를 낮추면 이미 실행 중인 호출은 그대로 두고, 새 호출은 실행 수가 한도 아래로
+    내려갈 때까지 기다립니다.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._active = 0
+        self._waiters: list[asyncio.Future] = []
+
+    @property
+    def limit(self) -> int:
+        """현재 한도"""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """실행 중인 호출 수"""
+        return self._active
+
+    def set_limit(self, limit: int) -> None:
+        """한도 변경 (늘어난 만큼 대기 중인 호출을 깨움)"""
+        self._limit = max(1, limit)
+        self._wake()
+
+    async def acquire(self) -> None:
+        """슬롯을 얻을 때까지 대기"""
+        while self._active >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # 깨운 뒤 취소되었으면 받은 차례를 다음 대기자에게 넘김
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                self._waiters.remove(waiter)
+        self._active += 1
+
+    def release(self) -> None:
+        """슬롯 반환"""
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self._limit - self._active
+        for waiter in self._waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class MeetingScheduler:
+    """회의 실행 슬롯과 대기열을 관리하는 스케줄러"""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_MEETINGS,
+        max_pending: int = MAX_PENDING_MEETINGS,
+    ):
+        self._max_concurrent = max_concurrent
+        self._max_pending = max_pending
+        self._running: set[str] = set()
+        self._pending: deque[tuple[str, asyncio.Future]] = deque()
+        # 회의 ID -> (에이전트 슬롯, 회의에서 지정한 max_parallel_agents)
+        self._agent_slots: dict[str, tuple[AgentSlots, Optional[int]]] = {}
+
+    def submit(self, meeting_id: str) -> bool:
+        """
+        회의 접수 (빈 슬롯이 있으면 즉시 배정, 없으면 대기열에 추가)
+
+        Args:
+            meeting_id: 회의 ID
+
+        Returns:
+            접수 여부 (대기열까지 가득 차면 False)
+        """
+        if len(self._running) < self._max_concurrent and not self._pending:
+            self._running.add(meeting_id)
+            self._rebalance()
+            return True
+
+        if len(self._pending) >= self._max_pending:
+            logger.warning(f"회의 대기열이 가득 차 접수 거절: {meeting_id}")
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((meeting_id, future))
+        logger.info("회의 대기열 추가: %s (대기 %s번)", meeting_id, len(self._pending))
+        return True
+
+    async def wait_for_slot(self, meeting_id: str) -> None:
+        """접수된 회의에 실행 슬롯이 배정될 때까지 대기합니다."""
+        for pending_id, future in self._pending:
+            if pending_id == meeting_id:
+                await future
+                return
+
+    def release(self, meeting_id: str) -> None:
+        """
+        회의 종료(또는 대기 중 취소) 처리 후 다음 대기 회의에 슬롯 배정
+
+        Args:
+            meeting_id: 회의 ID
+        """
+        if meeting_id in self._running:
+            self._running.discard(meeting_id)
+        else:
+            # 시작하지 못하고 취소된 회의는 대기열에서 제거
+            for entry in self._pending:
+                if entry[0] == meeting_id:
+                    self._pending.remove(entry)
+                    entry[1].cancel()
+                    break
+
+        while self._pending and len(self._running) < self._max_concurrent:
+            next_id, future = self._pending.popleft()
+            if future.done():
+                continue
+            self._running.add(next_id)
+            future.set_result(None)
+            logger.info("대기 중이던 회의 시작: %s", next_id)
+
+        self._rebalance()
+
+    def default_max_parallel_agents(self) -> int:
+        """
+        max_parallel_agents를 지정하지 않은 회의의 동시 에이전트 호출 수
+
+        전역 CLI 슬롯(MCP_MAX_CONCURRENT_CLI) 중 하나를 회의 외 요청(use_agent 등)용으로
+        남기고 나머지를 현재 진행 중인 회의 수로 나눕니다. 회의가 하나뿐이면 남은 슬롯을 모두
+        사용하고, 회의가 모두 슬롯을 채워도 다른 요청이 실행될 수 있습니다
+        (전역 슬롯이 진행 중인 회의 수 이하이면 회의당 1개).
+
+        Returns:
+            회의당 동시 에이전트 호출 수 (1 이상)
+        """
+        # 런타임 변경을 반영하도록 호출 시점에 전역 슬롯 수를 읽음
+        running = max(1, len(self._running))
+        return max(1, (file_handler.MAX_CONCURRENT_CLI - 1) // running)
+
+    def open_agent_slots(
+        self, meeting_id: str, max_parallel_agents: Optional[int] = None
+    ) -> AgentSlots:
+        """
+        회의의 에이전트 슬롯 생성 (회의가 끝나면 close_agent_slots로 반환)
+
+        한도는 default_max_parallel_agents()이며, max_parallel_agents를 지정하면 그 값을 넘지
+        않습니다. 진행 중인 회의 수가 바뀔 때마다 모든 회의의 한도를 다시 계산합니다.
+
+        Args:
+            meeting_id: 회의 ID
+            max_parallel_agents: 회의에서 지정한 동시 에이전트 수 (선택)
+
+        Returns:
+            회의의 모든 라운드가 공유하는 AgentSlots
+        """
+        slots = AgentSlots(self._agent_limit(max_parallel_agents))
+        self._agent_slots[meeting_id] = (slots, max_parallel_agents)
+        return slots
+
+    def close_agent_slots(self, meeting_id: str) -> None:
+        """회의의 에이전트 슬롯 제거"""
+        self._agent_slots.pop(meeting_id, None)
+
+    def _agent_limit(self, max_parallel_agents: Optional[int]) -> int:
+        limit = self.default_max_parallel_agents()
+        if max_parallel_agents is not None:
+            limit = min(limit, max_parallel_agents)
+        return limit
+
+    def _rebalance(self) -> None:
+        """진행 중인 회의 수가 바뀐 뒤 회의별 에이전트 한도 재계산"""
+        for slots, max_parallel_agents in self._agent_slots.values():
+            slots.set_limit(self._agent_limit(max_parallel_agents))
+
+    def queue_position(self, meeting_id: str) -> Optional[int]:
+        """
+        대기열 순번 조회
+
+        Args:
+            meeting_id: 회의 ID
+
+        Returns:
+            1부터 시작하는 순번 (대기 중이 아니면 None)
+        """
+        for position, (pending_id, _) in enumerate(self._pending, start=1):
+            if pending_id == meeting_id:
+                return position
+        return None
+
+    def get_stats(self) -> dict:
+        """스케줄러 현황"""
+        return {
+            "running": len(self._running),
+            "pending": len(self._pending),
+            "max_concurrent": self._max_concurrent,
+            "max_pending": self._max_pending,
+        }
+
+
+# 싱글톤 인스턴스
+_scheduler_instance: Optional[MeetingScheduler] = None
+
+
+def get_meeting_scheduler() -> MeetingScheduler:
+    """Meeting Scheduler 싱글톤 인스턴스를 반환합니다."""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = MeetingScheduler()
+    return _scheduler_instance
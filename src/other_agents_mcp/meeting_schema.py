@@ -8,18 +8,23 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+# 참고 자료 최대 길이 (시스템 프롬프트 한도 100KB 안에 주제와 이전 발언이 들어갈 여유를 둠)
+MAX_CONTEXT_CHARS = 50000
+
 
 class MeetingStatus(Enum):
     """회의 상태"""
-    WAITING = "waiting"      # 시작 대기
-    RUNNING = "running"      # 진행 중
+
+    WAITING = "waiting"  # 시작 대기
+    RUNNING = "running"  # 진행 중
     CONSENSUS = "consensus"  # 합의 도달
     NO_CONSENSUS = "no_consensus"  # 합의 실패 (최대 라운드 도달)
-    ERROR = "error"          # 에러 발생
+    ERROR = "error"  # 에러 발생
 
 
 class VoteType(Enum):
     """투표 타입"""
+
     AGREE = "agree"
     DISAGREE = "disagree"
     ABSTAIN = "abstain"
@@ -27,18 +32,34 @@ class VoteType(Enum):
 
 class ConsensusType(Enum):
     """합의 유형"""
-    UNANIMOUS = "unanimous"      # 만장일치 (100%)
+
+    UNANIMOUS = "unanimous"  # 만장일치 (100%)
     SUPERMAJORITY = "supermajority"  # 절대다수 (2/3 이상)
-    MAJORITY = "majority"        # 과반수 (50% 초과)
+    MAJORITY = "majority"  # 과반수 (50% 초과)
+
+
+class CompactionStrategy(Enum):
+    """발언 기록 압축 전략"""
+
+    TRUNCATE = "truncate"  # 직전 라운드, 응답당 길이 제한 (기본값)
+    KEEP_LAST_K = "keep_last_k"  # 최근 K 라운드 유지
+    EXTRACTIVE = "extractive"  # 문장 단위 추출 요약
+    SUMMARIZER = "summarizer"  # 요약 에이전트가 요약
 
 
 @dataclass
 class AgentResponse:
     """에이전트 응답"""
+
     agent_name: str
     response: str
     vote: VoteType
     timestamp: datetime = field(default_factory=datetime.now)
+    cancelled: bool = False  # 라운드 결과 확정으로 응답 대기 취소됨
+    late: bool = False  # 라운드 마감 시간 내에 응답하지 못함
+    truncated: bool = False  # response가 미리보기로 축약됨 (전체 내용은 발언 기록 파일)
+    transcript_offset: Optional[int] = None  # 발언 기록 파일 내 바이트 위치
+    transcript_length: Optional[int] = None  # 발언 기록 파일 내 바이트 길이
 
     def to_dict(self) -> dict:
         return {
@@ -46,24 +67,66 @@ class AgentResponse:
             "response": self.response,
             "vote": self.vote.value,
             "timestamp": self.timestamp.isoformat(),
+            "cancelled": self.cancelled,
+            "late": self.late,
+            "truncated": self.truncated,
+            "transcript_offset": self.transcript_offset,
+            "transcript_length": self.transcript_length,
         }
 
+    def shrink(self, preview_chars: int) -> None:
+        """
+        응답을 미리보기 길이로 축약 (전체 내용은 발언 기록 파일에 보관된 경우에만)
+
+        Args:
+            preview_chars: 보관할 최대 문자 수
+        """
+        if self.transcript_offset is not None and len(self.response) > preview_chars:
+            self.response = self.response[:preview_chars]
+            self.truncated = True
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AgentResponse":
+        return cls(
+            agent_name=data["agent_name"],
+            response=data["response"],
+            vote=VoteType(data["vote"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            cancelled=data.get("cancelled", False),
+            late=data.get("late", False),
+            truncated=data.get("truncated", False),
+            transcript_offset=data.get("transcript_offset"),
+            transcript_length=data.get("transcript_length"),
+        )
+
 
 @dataclass
 class MeetingRound:
     """회의 라운드"""
+
     round_number: int
     responses: list[AgentResponse] = field(default_factory=list)
     is_unanimous: bool = False
+    decided_early: bool = False  # 모든 응답 전에 결과가 확정되어 조기 종료됨
 
     def to_dict(self) -> dict:
         return {
             "round_number": self.round_number,
             "responses": [r.to_dict() for r in self.responses],
             "is_unanimous": self.is_unanimous,
+            "decided_early": self.decided_early,
             "vote_summary": self.get_vote_summary(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "MeetingRound":
+        return cls(
+            round_number=data["round_number"],
+            responses=[AgentResponse.from_dict(r) for r in data.get("responses", [])],
+            is_unanimous=data.get("is_unanimous", False),
+            decided_early=data.get("decided_early", False),
+        )
+
     def get_vote_summary(self) -> dict:
         """투표 요약"""
         summary = {VoteType.AGREE.value: 0, VoteType.DISAGREE.value: 0, VoteType.ABSTAIN.value: 0}
@@ -75,6 +138,7 @@ class MeetingRound:
 @dataclass
 class MeetingResult:
     """회의 결과"""
+
     meeting_id: str
     topic: str
     agents: list[str]
@@ -84,6 +148,18 @@ class MeetingResult:
     started_at: datetime = field(default_factory=datetime.now)
     ended_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    in_progress_round: Optional[MeetingRound] = None  # 진행 중인 라운드 (도착한 응답만)
+    transcript_path: Optional[str] = None  # 전체 발언 기록(JSONL) 파일 경로
+    # 완료된 라운드의 직렬화 캐시 (라운드는 rounds에 추가된 뒤 변경되지 않음)
+    _serialized_rounds: list[dict] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def serialized_rounds(self) -> list[dict]:
+        """완료된 라운드 직렬화 결과 (새로 추가된 라운드만 직렬화)"""
+        for round_result in self.rounds[len(self._serialized_rounds) :]:
+            self._serialized_rounds.append(round_result.to_dict())
+        return self._serialized_rounds
 
     def to_dict(self) -> dict:
         return {
@@ -91,12 +167,82 @@ class MeetingResult:
             "topic": self.topic,
             "agents": self.agents,
             "status": self.status.value,
-            "rounds": [r.to_dict() for r in self.rounds],
+            "rounds": list(self.serialized_rounds()),
             "total_rounds": len(self.rounds),
             "final_consensus": self.final_consensus,
             "started_at": self.started_at.isoformat(),
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "error_message": self.error_message,
+            "transcript_path": self.transcript_path,
+        }
+
+    def to_summary_dict(self) -> dict:
+        """
+        라운드 응답 본문을 제외한 요약 직렬화 (전체 내용은 transcript_path 파일 참조)
+
+        Returns:
+            라운드별 투표 요약과 합의 결과를 포함한 딕셔너리
+        """
+        return {
+            "meeting_id": self.meeting_id,
+            "topic": self.topic,
+            "agents": self.agents,
+            "status": self.status.value,
+            "rounds": [
+                {
+                    "round_number": r.round_number,
+                    "vote_summary": r.get_vote_summary(),
+                    "decided_early": r.decided_early,
+                }
+                for r in self.rounds
+            ],
+            "total_rounds": len(self.rounds),
+            "final_consensus": self.final_consensus,
+            "started_at": self.started_at.isoformat(),
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "error_message": self.error_message,
+            "transcript_path": self.transcript_path,
+        }
+
+    def to_incremental_dict(self, since_round: int = 0, since_response: int = 0) -> dict:
+        """
+        커서 이후의 변경분만 직렬화
+
+        Args:
+            since_round: 클라이언트가 이미 받은 마지막 완료 라운드 번호
+            since_response: 진행 중인 라운드에서 이미 받은 응답 수
+                            (since_round가 마지막 완료 라운드일 때만 적용)
+
+        Returns:
+            새 라운드/응답과 다음 조회용 커서(next_cursor)를 포함한 딕셔너리
+        """
+        rounds = [r for r in self.serialized_rounds() if r["round_number"] > since_round]
+        last_round = self.rounds[-1].round_number if self.rounds else 0
+
+        in_progress = None
+        in_progress_count = 0
+        if self.in_progress_round is not None:
+            responses = self.in_progress_round.responses
+            in_progress_count = len(responses)
+            # 완료 라운드를 모두 받은 클라이언트에게만 응답 커서 적용
+            skip = since_response if since_round >= last_round else 0
+            in_progress = {
+                "round_number": self.in_progress_round.round_number,
+                "responses": [r.to_dict() for r in responses[skip:]],
+                "response_count": in_progress_count,
+            }
+
+        return {
+            "meeting_id": self.meeting_id,
+            "status": self.status.value,
+            "rounds": rounds,
+            "in_progress_round": in_progress,
+            "total_rounds": len(self.rounds),
+            "final_consensus": self.final_consensus,
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "error_message": self.error_message,
+            "transcript_path": self.transcript_path,
+            "next_cursor": {"since_round": last_round, "since_response": in_progress_count},
         }
 
     def get_summary(self) -> str:
@@ -121,11 +267,23 @@ class MeetingResult:
 @dataclass
 class MeetingConfig:
     """회의 설정"""
+
     topic: str
     agents: list[str]
     max_rounds: int = 5
     timeout_per_round: int = 300  # 초
     consensus_type: ConsensusType = ConsensusType.UNANIMOUS
+    early_termination: bool = True  # 결과 확정 시 남은 에이전트 응답을 기다리지 않음
+    round_deadline: Optional[int] = None  # 라운드 소프트 마감 (초), None이면 모든 응답 대기
+    carry_late_responses: bool = False  # 마감 후 도착한 응답을 다음 라운드 맥락에 포함
+    use_sessions: bool = False  # 세션 지원 에이전트는 전용 CLI 세션에서 라운드 증분만 전달
+    compaction: CompactionStrategy = CompactionStrategy.TRUNCATE  # 이전 발언 압축 전략
+    transcript_budget: Optional[int] = None  # 이전 발언 섹션 바이트 예산, None이면 응답당 500자
+    compaction_keep_rounds: int = 2  # keep_last_k/extractive가 유지할 최근 라운드 수
+    summarizer_agent: Optional[str] = None  # summarizer 전략에서 요약을 맡을 에이전트
+    structured_votes: bool = False  # JSON({opinion, vote}) 응답 요청 후 직접 파싱
+    max_parallel_agents: Optional[int] = None  # 회의 내 동시 호출 상한 (None: 스케줄러 기본값)
+    context: Optional[str] = None  # 참고 자료 (context 또는 register_prompt로 등록한 context_id)
 
     def validate(self) -> None:
         """설정 유효성 검사"""
@@ -141,5 +299,30 @@ class MeetingConfig:
         if self.timeout_per_round < 30 or self.timeout_per_round > 3600:
             raise ValueError("timeout_per_round는 30~3600초 범위여야 합니다")
 
+        if self.round_deadline is not None and not (
+            1 <= self.round_deadline <= self.timeout_per_round
+        ):
+            raise ValueError("round_deadline은 1초 이상 timeout_per_round 이하여야 합니다")
+
+        if not isinstance(self.compaction, CompactionStrategy):
+            raise ValueError("compaction은 CompactionStrategy여야 합니다")
+
+        if self.transcript_budget is not None and not (256 <= self.transcript_budget <= 100000):
+            raise ValueError("transcript_budget은 256~100000 바이트 범위여야 합니다")
+
+        if self.compaction_keep_rounds < 1 or self.compaction_keep_rounds > 20:
+            raise ValueError("compaction_keep_rounds는 1~20 범위여야 합니다")
+
+        if self.compaction == CompactionStrategy.SUMMARIZER and not self.summarizer_agent:
+            raise ValueError("summarizer 압축 전략에는 summarizer_agent가 필요합니다")
+
+        if self.context is not None and len(self.context) > MAX_CONTEXT_CHARS:
+            raise ValueError(f"context는 {MAX_CONTEXT_CHARS}자 이하여야 합니다")
+
+        if self.max_parallel_agents is not None and not (
+            1 <= self.max_parallel_agents <= len(self.agents)
+        ):
+            raise ValueError("max_parallel_agents는 1 이상 에이전트 수 이하여야 합니다")
+
         if not isinstance(self.consensus_type, ConsensusType):
             raise ValueError("consensus_type은 ConsensusType이어야 합니다")
@@ -0,0 +1,147 @@
+"""Meeting Store
+
+회의 결과 저장소
+- 진행 중인 회의는 라운드가 끝날 때마다 저장
+- 완료된 회의는 TTL이 지나면 단일 정리 작업(sweeper)이 삭제
+- SQLite 저장소 사용 시 서버 재시작 후에도 회의 기록 조회 가능
+"""
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from . import config
+from .meeting_schema import MeetingResult, MeetingRound
+from .meeting_transcript import delete_transcripts
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 완료된 회의 보관 시간 (초)
+MEETING_TTL_SECONDS = int(os.environ.get("MCP_MEETING_TTL_SECONDS", "3600"))
+
+# 만료 회의 정리 주기 (초)
+MEETING_SWEEP_INTERVAL = int(os.environ.get("MCP_MEETING_SWEEP_INTERVAL", "600"))
+
+# 재시작으로 중단된 회의에 기록되는 에러 메시지
+RESTART_ERROR_MESSAGE = "서버 재시작으로 회의가 중단되었습니다."
+
+
+class MeetingStorage(ABC):
+    """회의 저장소의 추상 베이스 클래스 (인터페이스)"""
+
+    @abstractmethod
+    async def save_meeting(self, meeting: MeetingResult) -> None:
+        """회의 메타데이터(상태, 합의 내용, 종료 시각 등)를 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def append_round(self, meeting_id: str, round_result: MeetingRound) -> None:
+        """완료된 라운드를 회의에 추가 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def get_meeting(self, meeting_id: str) -> Optional[MeetingResult]:
+        """ID로 회의를 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, ttl_seconds: int) -> list[str]:
+        """종료 후 TTL이 지난 회의를 삭제하고 삭제된 회의 ID 목록을 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def recover_meetings(self) -> int:
+        """'running' 상태로 남은 회의를 'error'로 복구하고 복구 수를 반환합니다."""
+        pass
+
+
+class InMemoryMeetingStorage(MeetingStorage):
+    """인-메모리 회의 저장소"""
+
+    def __init__(self):
+        self._meetings: Dict[str, MeetingResult] = {}
+
+    async def save_meeting(self, meeting: MeetingResult) -> None:
+        self._meetings[meeting.meeting_id] = meeting
+
+    async def append_round(self, meeting_id: str, round_result: MeetingRound) -> None:
+        # 회의 객체 자체를 보관하므로 라운드는 이미 반영되어 있음
+        pass
+
+    async def get_meeting(self, meeting_id: str) -> Optional[MeetingResult]:
+        return self._meetings.get(meeting_id)
+
+    async def delete_expired(self, ttl_seconds: int) -> list[str]:
+        cutoff = datetime.now() - timedelta(seconds=ttl_seconds)
+        expired = [
+            meeting_id
+            for meeting_id, meeting in self._meetings.items()
+            if meeting.ended_at is not None and meeting.ended_at < cutoff
+        ]
+        for meeting_id in expired:
+            del self._meetings[meeting_id]
+        return expired
+
+    async def recover_meetings(self) -> int:
+        # 프로세스와 함께 사라지므로 복구할 회의가 없음
+        return 0
+
+
+# 싱글톤 인스턴스
+_meeting_storage_instance: Optional[MeetingStorage] = None
+_sweeper_task: Optional[asyncio.Task] = None
+
+
+def get_meeting_storage() -> MeetingStorage:
+    """회의 저장소 싱글톤 인스턴스를 반환합니다 (STORAGE_TYPE 설정을 따름)."""
+    global _meeting_storage_instance
+    if _meeting_storage_instance is None:
+        if config.STORAGE_TYPE in ("sqlite", "tiered"):
+            logger.info("Using SqliteMeetingStorage at: %s", config.SQLITE_DB_PATH)
+            from .sqlite_storage import SqliteMeetingStorage
+
+            storage: MeetingStorage = SqliteMeetingStorage(db_path=config.SQLITE_DB_PATH)
+        else:
+            storage = InMemoryMeetingStorage()
+
+        _meeting_storage_instance = storage
+    return _meeting_storage_instance
+
+
+async def _sweep_expired_meetings(
+    storage: MeetingStorage,
+    interval: int = MEETING_SWEEP_INTERVAL,
+    ttl: int = MEETING_TTL_SECONDS,
+):
+    """주기적으로 TTL이 지난 완료 회의를 정리합니다."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await storage.delete_expired(ttl)
+            if removed:
+                # 회의 기록과 함께 발언 기록 파일도 삭제
+                await asyncio.to_thread(delete_transcripts, removed)
+                logger.debug("TTL 만료로 회의 %s개 정리됨", len(removed))
+        except Exception as e:
+            logger.warning(f"만료 회의 정리 실패: {e}")
+
+
+def start_meeting_sweeper() -> None:
+    """만료 회의 정리 작업을 시작합니다 (현재 이벤트 루프에서 이미 실행 중이면 무시)."""
+    global _sweeper_task
+    loop = asyncio.get_running_loop()
+    if _sweeper_task is None or _sweeper_task.done() or _sweeper_task.get_loop() is not loop:
+        _sweeper_task = asyncio.create_task(_sweep_expired_meetings(get_meeting_storage()))
+
+
+async def stop_meeting_sweeper() -> None:
+    """만료 회의 정리 작업을 중지합니다."""
+    global _sweeper_task
+    if _sweeper_task is not None:
+        _sweeper_task.cancel()
+        await asyncio.gather(_sweeper_task, return_exceptions=True)
+        _sweeper_task = None
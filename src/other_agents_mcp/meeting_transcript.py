@@ -0,0 +1,87 @@
+"""Meeting Transcript
+
+회의 발언 기록을 회의별 JSONL 파일에 추가 기록 (append-only)
+- 응답이 도착할 때마다 한 줄씩 기록하므로 진행 중에도 파일을 tail로 확인 가능
+- 메모리/저장소에는 응답 미리보기와 파일 내 위치(offset, length)만 보관
+- get_meeting_status(full_responses=true)는 위치로 전문을 다시 읽어 반환
+"""
+
+import json
+import os
+from pathlib import Path
+
+from . import config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 메모리/저장소에 보관하는 응답 미리보기 길이 (문자 수)
+RESPONSE_PREVIEW_CHARS = int(os.environ.get("MCP_MEETING_PREVIEW_CHARS", "500"))
+
+
+def get_transcript_path(meeting_id: str) -> Path:
+    """회의 발언 기록 파일 경로를 반환합니다."""
+    return config.MEETING_TRANSCRIPT_DIR / f"{meeting_id}.jsonl"
+
+
+class MeetingTranscript:
+    """회의별 발언 기록 파일 (한 줄에 응답 하나)"""
+
+    def __init__(self, meeting_id: str):
+        self.meeting_id = meeting_id
+        self.path = get_transcript_path(meeting_id)
+        self._dir_ready = False
+
+    def append(self, entry: dict) -> tuple[int, int]:
+        """
+        발언 한 건을 파일 끝에 추가
+
+        Args:
+            entry: 기록할 응답 딕셔너리
+
+        Returns:
+            (바이트 오프셋, 바이트 길이) - read_entry로 다시 읽을 때 사용
+        """
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        if not self._dir_ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        # 추가 모드로 열면 파일 끝에서 시작하므로 tell()이 이 줄의 시작 위치
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        return offset, len(line)
+
+    def read_entry(self, offset: int, length: int) -> dict:
+        """
+        오프셋 위치의 발언 한 건 조회
+
+        Args:
+            offset: append가 반환한 바이트 오프셋
+            length: append가 반환한 바이트 길이
+
+        Returns:
+            기록된 응답 딕셔너리
+        """
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def delete(self) -> None:
+        """발언 기록 파일을 삭제합니다 (없으면 무시)."""
+        self.path.unlink(missing_ok=True)
+
+
+def delete_transcripts(meeting_ids: list[str]) -> None:
+    """
+    만료된 회의의 발언 기록 파일 삭제
+
+    Args:
+        meeting_ids: 회의 ID 목록
+    """
+    for meeting_id in meeting_ids:
+        try:
+            MeetingTranscript(meeting_id).delete()
+        except OSError as e:
+            logger.warning(f"회의 발언 기록 삭제 실패 ({meeting_id}): {e}")
@@ -0,0 +1,250 @@
+"""Profiling
+
+도구 호출 단위의 선택적 프로파일링과 메모리 스냅샷
+- MCP_PROFILE_TOOLS에 지정한 도구(또는 "*")를 MCP_PROFILE_SAMPLE_RATE 비율로 프로파일링
+- 도구 인자 "_profile": true로 개별 호출만 프로파일링 가능
+- cProfile(.pstats) 또는 샘플링 프로파일러(.collapsed, flamegraph.pl/speedscope 입력)로 기록
+- tracemalloc 스냅샷으로 메모리 사용 위치 조회 (memory_snapshot 도구)
+
+환경 변수:
+    MCP_PROFILE_DIR: 프로파일 파일 저장 폴더 (config.PROFILE_DIR, 기본값: .data/profiles)
+    MCP_PROFILE_TOOLS: 항상 프로파일링할 도구 이름 (config.PROFILE_TOOLS, 쉼표 구분, "*"는 전체, 기본값: 없음)
+    MCP_PROFILE_SAMPLE_RATE: 지정한 도구 중 프로파일링할 호출 비율 (0~1, 기본값: 1)
+    MCP_PROFILE_MODE: "cprofile" 또는 "sampling" (기본값: cprofile)
+    MCP_PROFILE_INTERVAL_MS: 샘플링 간격 (밀리초, 기본값: 5)
+"""
+
+import asyncio
+import cProfile
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Optional
+
+from . import config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+PROFILE_SAMPLE_RATE = float(os.environ.get("MCP_PROFILE_SAMPLE_RATE", "1"))
+PROFILE_MODE = os.environ.get("MCP_PROFILE_MODE", "cprofile").lower()
+PROFILE_INTERVAL_MS = int(os.environ.get("MCP_PROFILE_INTERVAL_MS", "5"))
+
+# tracemalloc이 기록할 호출 스택 깊이
+TRACEMALLOC_FRAMES = int(os.environ.get("MCP_TRACEMALLOC_FRAMES", "10"))
+
+# cProfile은 스레드당 하나만 활성화할 수 있으므로 동시 호출은 건너뜀
+_cprofile_lock = threading.Lock()
+
+# memory_snapshot의 compare 기준 (직전 스냅샷)
+_last_snapshot: Optional[tracemalloc.Snapshot] = None
+
+
+def should_profile(name: str, arguments: dict) -> bool:
+    """
+    이번 도구 호출을 프로파일링할지 결정
+
+    Args:
+        name: 도구 이름
+        arguments: 도구 인자 (_profile 키 확인)
+
+    Returns:
+        프로파일링 여부
+    """
+    if arguments.get(config.PROFILE_ARGUMENT):
+        return True
+    if "*" not in config.PROFILE_TOOLS and name not in config.PROFILE_TOOLS:
+        return False
+    return random.random() < PROFILE_SAMPLE_RATE
+
+
+def _profile_path(name: str, suffix: str) -> Path:
+    """프로파일 파일 경로 생성 (시각_도구_ID.확장자)"""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    profile_dir = Path(config.PROFILE_DIR)
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return profile_dir / f"{stamp}_{name}_{uuid.uuid4().hex[:8]}{suffix}"
+
+
+class StackSampler:
+    """
+    주기적으로 모든 스레드의 호출 스택을 수집하는 샘플링 프로파일러
+
+    asyncio.to_thread로 실행되는 CLI 호출 스레드까지 포함하며,
+    결과는 "frame;frame;frame count" 형식(collapsed stack)으로 기록합니다.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="mcp-stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self._interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def dump(self, path: Path) -> None:
+        """수집한 스택을 collapsed 형식으로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+async def profile_call(name: str, call: Awaitable[Any]) -> tuple[Any, Optional[Path]]:
+    """
+    도구 호출을 프로파일링하며 실행 (호출이 실패해도 프로파일은 저장)
+
+    cProfile은 이벤트 루프 스레드만 기록하며 같은 시간에 실행된 다른 코루틴도 포함됩니다.
+    스레드에서 실행되는 CLI 호출까지 보려면 sampling 모드를 사용합니다.
+
+    Args:
+        name: 도구 이름 (파일 이름에 사용)
+        call: 실행할 도구 코루틴
+
+    Returns:
+        (도구 결과, 프로파일 파일 경로 - 프로파일링하지 못했으면 None)
+    """
+    started = time.perf_counter()
+
+    if PROFILE_MODE == "sampling":
+        sampler = StackSampler(PROFILE_INTERVAL_MS / 1000)
+        sampler.start()
+        try:
+            result = await call
+        finally:
+            sampler.stop()
+            path = _profile_path(name, ".collapsed")
+            await asyncio.to_thread(sampler.dump, path)
+            logger.info(
+                f"도구 프로파일 저장 ({name}, {time.perf_counter() - started:.3f}초): {path}"
+            )
+        return result, path
+
+    if not _cprofile_lock.acquire(blocking=False):
+        logger.debug("다른 호출을 프로파일링 중이라 건너뜀: %s", name)
+        return await call, None
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        try:
+            result = await call
+        finally:
+            profiler.disable()
+            path = _profile_path(name, ".pstats")
+            await asyncio.to_thread(profiler.dump_stats, str(path))
+            logger.info(
+                f"도구 프로파일 저장 ({name}, {time.perf_counter() - started:.3f}초): {path}"
+            )
+    finally:
+        _cprofile_lock.release()
+    return result, path
+
+
+def memory_snapshot(
+    limit: int = 20, group_by: str = "lineno", compare: bool = False, save: bool = False
+) -> dict:
+    """
+    tracemalloc 스냅샷으로 메모리를 많이 사용하는 위치 조회
+
+    추적 중이 아니면 추적을 시작만 하고 반환합니다 (이후 할당부터 기록되므로 다시 호출).
+
+    Args:
+        limit: 반환할 상위 항목 수
+        group_by: 묶는 기준 ("lineno", "filename", "traceback")
+        compare: 직전 스냅샷 대비 증가량 기준으로 정렬
+        save: 스냅샷을 PROFILE_DIR에 파일로 저장 (tracemalloc.Snapshot.load로 분석)
+
+    Returns:
+        tracing, current_kb, peak_kb, top(위치/크기/개수 목록), snapshot_path(save 시)
+    """
+    global _last_snapshot
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        _last_snapshot = None
+        logger.info("tracemalloc 추적 시작 (프레임 %s개)", TRACEMALLOC_FRAMES)
+        return {
+            "tracing": True,
+            "started": True,
+            "message": "메모리 추적을 시작했습니다. 부하를 준 뒤 다시 호출하세요.",
+        }
+
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+    current, peak = tracemalloc.get_traced_memory()
+
+    if compare and _last_snapshot is not None:
+        stats = snapshot.compare_to(_last_snapshot, group_by)
+        top = [
+            {
+                "location": _format_traceback(stat.traceback, group_by),
+                "size_kb": round(stat.size / 1024, 1),
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+    else:
+        top = [
+            {
+                "location": _format_traceback(stat.traceback, group_by),
+                "size_kb": round(stat.size / 1024, 1),
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics(group_by)[:limit]
+        ]
+    _last_snapshot = snapshot
+
+    result: dict[str, Any] = {
+        "tracing": True,
+        "current_kb": round(current / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "top": top,
+    }
+    if save:
+        path = _profile_path("memory", ".tracemalloc")
+        snapshot.dump(str(path))
+        result["snapshot_path"] = str(path)
+    return result
+
+
+def _format_traceback(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    """
+    스냅샷 통계의 위치를 문자열로 변환합니다.
+
+    tracemalloc.Traceback은 가장 바깥(오래된) 프레임부터 정렬되어 있으므로,
+    "traceback" 그룹은 뒤집어 할당이 일어난 안쪽 프레임부터 표시합니다.
+    "filename"/"lineno" 그룹의 traceback은 프레임이 하나뿐입니다.
+    """
+    if group_by == "traceback":
+        return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback))
+    frame = traceback[0]
+    return frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
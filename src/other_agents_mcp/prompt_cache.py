@@ -0,0 +1,241 @@
+"""Prompt Cache
+
+서버 측 프롬프트 템플릿 캐시
+- register_prompt 도구로 큰 프롬프트를 한 번만 전송하고, 내용 해시(SHA-256)를 ID로 받음
+- use_agent/use_agents/start_meeting은 본문 대신 ID와 prompt_vars로 프롬프트를 참조
+- 템플릿 변수는 string.Template 형식($name 또는 ${name}) - JSON 예시의 중괄호와 충돌하지 않음
+- 변수 치환 결과와 시스템 프롬프트의 YAML 직렬화 결과를 캐시하여 요청마다 다시 만들지 않음
+
+환경 변수:
+    MCP_PROMPT_CACHE_SIZE: 캐시할 템플릿/치환 결과/직렬화 결과 수 (각각 LRU, 기본값: 64)
+    MCP_MAX_PROMPT_TEMPLATE_BYTES: 등록 가능한 템플릿 최대 크기 (바이트, 기본값: 1048576)
+"""
+
+import hashlib
+import os
+import string
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+PROMPT_CACHE_SIZE = int(os.environ.get("MCP_PROMPT_CACHE_SIZE", "64"))
+MAX_PROMPT_TEMPLATE_BYTES = int(os.environ.get("MCP_MAX_PROMPT_TEMPLATE_BYTES", "1048576"))
+
+
+class PromptNotFoundError(Exception):
+    """등록되지 않았거나 캐시에서 밀려난 프롬프트 ID"""
+
+    pass
+
+
+def _template_variables(template: string.Template) -> list[str]:
+    """템플릿에서 사용하는 변수 이름 목록 (등장 순서, 중복 제거)"""
+    names: Dict[str, None] = {}
+    for match in template.pattern.finditer(template.template):
+        name = match.group("named") or match.group("braced")
+        if name:
+            names[name] = None
+    return list(names)
+
+
+class PromptCache:
+    """내용 해시로 참조하는 프롬프트 템플릿 LRU 캐시"""
+
+    def __init__(self, capacity: int = PROMPT_CACHE_SIZE):
+        self._capacity = capacity
+        self._templates: "OrderedDict[str, string.Template]" = OrderedDict()
+        # (프롬프트 ID, 정렬된 변수) -> 치환 결과 (같은 문자열 객체를 돌려주어 하위 캐시 조회가 빠름)
+        self._rendered: "OrderedDict[Tuple[str, tuple], str]" = OrderedDict()
+        # 시스템 프롬프트 -> YAML 직렬화 결과 ("system_prompt: ..." 부분)
+        self._serialized: "OrderedDict[str, str]" = OrderedDict()
+        self._stats: Dict[str, int] = {
+            "render_hits": 0,
+            "renders": 0,
+            "serialize_hits": 0,
+            "serializations": 0,
+            "not_found": 0,
+        }
+        # 동기 실행 스레드(asyncio.to_thread)에서도 직렬화 캐시를 사용
+        self._lock = threading.Lock()
+
+    def register(self, text: str) -> dict:
+        """
+        프롬프트 템플릿 등록 (같은 내용은 같은 ID)
+
+        Args:
+            text: 프롬프트 본문 ($name/${name} 변수 사용 가능, 리터럴 $는 $$)
+
+        Returns:
+            {"prompt_id", "size", "variables", "cached"(이미 등록되어 있었는지)}
+
+        Raises:
+            ValueError: 문자열이 아니거나 너무 큰 경우
+        """
+        if not isinstance(text, str):
+            raise ValueError(f"프롬프트는 문자열이어야 합니다: {type(text)}")
+
+        data = text.encode("utf-8")
+        if len(data) > MAX_PROMPT_TEMPLATE_BYTES:
+            raise ValueError(
+                f"프롬프트가 너무 깁니다: {len(data)} > {MAX_PROMPT_TEMPLATE_BYTES} 바이트"
+            )
+
+        prompt_id = hashlib.sha256(data).hexdigest()
+        template = string.Template(text)
+        with self._lock:
+            cached = prompt_id in self._templates
+            if cached:
+                self._templates.move_to_end(prompt_id)
+                template = self._templates[prompt_id]
+            else:
+                self._templates[prompt_id] = template
+                while len(self._templates) > self._capacity:
+                    evicted, _ = self._templates.popitem(last=False)
+                    self._drop_rendered(evicted)
+
+        logger.debug("Prompt registered: %s (%d bytes, cached=%s)", prompt_id, len(data), cached)
+        return {
+            "prompt_id": prompt_id,
+            "size": len(data),
+            "variables": _template_variables(template),
+            "cached": cached,
+        }
+
+    def render(self, prompt_id: str, variables: Optional[Dict[str, object]] = None) -> str:
+        """
+        등록된 템플릿에 변수를 치환한 프롬프트 반환 (같은 변수 조합은 캐시 재사용)
+
+        Args:
+            prompt_id: register가 반환한 프롬프트 ID
+            variables: 템플릿 변수 (값은 문자열로 변환)
+
+        Returns:
+            치환된 프롬프트
+
+        Raises:
+            PromptNotFoundError: 등록되지 않은 ID
+            ValueError: 변수 누락 또는 잘못된 $ 사용
+        """
+        if variables is not None and not isinstance(variables, dict):
+            raise ValueError(f"prompt_vars는 객체여야 합니다: {type(variables)}")
+
+        values = {str(key): str(value) for key, value in (variables or {}).items()}
+        key = (prompt_id, tuple(sorted(values.items())))
+
+        with self._lock:
+            template = self._templates.get(prompt_id)
+            if template is None:
+                self._stats["not_found"] += 1
+                raise PromptNotFoundError(
+                    f"등록되지 않은 프롬프트 ID: {prompt_id} (register_prompt로 다시 등록하세요)"
+                )
+            self._templates.move_to_end(prompt_id)
+
+            rendered = self._rendered.get(key)
+            if rendered is not None:
+                self._stats["render_hits"] += 1
+                self._rendered.move_to_end(key)
+                return rendered
+
+        try:
+            rendered = template.substitute(values)
+        except KeyError as e:
+            raise ValueError(f"프롬프트 변수가 없습니다: {e.args[0]}") from e
+        except ValueError as e:
+            raise ValueError(f"잘못된 프롬프트 템플릿 ($는 $$로 작성): {e}") from e
+
+        with self._lock:
+            self._stats["renders"] += 1
+            self._rendered[key] = rendered
+            while len(self._rendered) > self._capacity:
+                self._rendered.popitem(last=False)
+        return rendered
+
+    def serialize_system_prompt(self, system_prompt: str) -> str:
+        """
+        시스템 프롬프트의 YAML 직렬화 결과 반환 (캐시 재사용)
+
+        YAML 입력 파일의 최상위 키는 키마다 독립적으로 직렬화되므로
+        {"prompt": ...} 직렬화 뒤에 이어 쓰면 전체를 한 번에 직렬화한 결과와 같습니다.
+
+        Args:
+            system_prompt: 검증된 시스템 프롬프트
+
+        Returns:
+            "system_prompt: ..." YAML 문자열
+        """
+        with self._lock:
+            serialized = self._serialized.get(system_prompt)
+            if serialized is not None:
+                self._stats["serialize_hits"] += 1
+                self._serialized.move_to_end(system_prompt)
+                return serialized
+
+        # yaml은 import 비용이 커서 서버 시작 시간에 포함되지 않도록 처음 사용할 때 불러옴
+        import yaml
+
+        serialized = yaml.dump(
+            {"system_prompt": system_prompt}, default_flow_style=False, allow_unicode=True
+        )
+        with self._lock:
+            self._stats["serializations"] += 1
+            self._serialized[system_prompt] = serialized
+            while len(self._serialized) > self._capacity:
+                self._serialized.popitem(last=False)
+        return serialized
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 현황 (등록 수, 치환/직렬화 캐시 적중 수 등)"""
+        with self._lock:
+            return {
+                **self._stats,
+                "prompts": len(self._templates),
+                "rendered": len(self._rendered),
+                "serialized": len(self._serialized),
+                "capacity": self._capacity,
+            }
+
+    def _drop_rendered(self, prompt_id: str) -> None:
+        for key in [key for key in self._rendered if key[0] == prompt_id]:
+            del self._rendered[key]
+
+
+def resolve_prompt(arguments: dict, text_key: str, id_key: str) -> Optional[str]:
+    """
+    도구 인자에서 프롬프트 결정 (본문 또는 등록된 프롬프트 ID + prompt_vars)
+
+    Args:
+        arguments: MCP 도구 인자
+        text_key: 본문 인자 이름 (예: "system_prompt")
+        id_key: 프롬프트 ID 인자 이름 (예: "system_prompt_id")
+
+    Returns:
+        프롬프트 (둘 다 없으면 None)
+
+    Raises:
+        PromptNotFoundError: 등록되지 않은 ID
+        ValueError: 본문과 ID를 함께 지정했거나 변수 치환 실패
+    """
+    prompt_id = arguments.get(id_key)
+    if prompt_id is None:
+        return arguments.get(text_key)
+    if arguments.get(text_key) is not None:
+        raise ValueError(f"{text_key}와 {id_key}는 함께 지정할 수 없습니다")
+    return get_prompt_cache().render(prompt_id, arguments.get("prompt_vars"))
+
+
+# 싱글톤 인스턴스
+_prompt_cache_instance: Optional[PromptCache] = None
+
+
+def get_prompt_cache() -> PromptCache:
+    """Prompt Cache 싱글톤 인스턴스를 반환합니다."""
+    global _prompt_cache_instance
+    if _prompt_cache_instance is None:
+        _prompt_cache_instance = PromptCache()
+    return _prompt_cache_instance
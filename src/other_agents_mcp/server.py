@@ -5,13 +5,15 @@ Other Agents MCP 서버 진입점
 
 import asyncio
 import functools
+from contextlib import asynccontextmanager
 from dataclasses import asdict
-from typing import Any, Dict, AsyncGenerator
+from typing import Any, Dict, AsyncGenerator, Optional
 
 # MCP SDK import
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+from . import config
 from .cli_manager import list_available_clis
 from .cli_registry import get_cli_registry
 from .file_handler import (
@@ -24,34 +26,64 @@ from .file_handler import (
     CLITimeoutError,
 )
 from .logger import get_logger
-from .task_manager import get_task_manager
-from .meeting_orchestrator import handle_start_meeting, handle_get_meeting_status
+from .task_manager import (
+    get_task_manager,
+    TaskQuery,
+    RESULT_SPILL_BYTES,
+    RESULT_PAGE_BYTES,
+    LIST_TASKS_DEFAULT_LIMIT,
+    LIST_TASKS_MAX_LIMIT,
+)
 
 logger = get_logger(__name__)
 
 
-# MCP Server 인스턴스 생성
-app = Server("other-agents-mcp")
-
-
-@app.lifespan
+@asynccontextmanager
 async def lifespan(app: Server) -> AsyncGenerator[Dict[str, Any], None]:
-    """서버 생명주기 동안 TaskManager를 관리합니다."""
+    """서버 생명주기 동안 TaskManager와 만료 회의 정리 작업을 관리합니다."""
+    # 회의 저장소(회의 스키마 포함)는 import 시점이 아닌 서버 시작 시 불러옴
+    from .meeting_store import get_meeting_storage, start_meeting_sweeper, stop_meeting_sweeper
+
     logger.info("서버 시작... TaskManager를 초기화하고 시작합니다.")
     task_manager = get_task_manager()
     await task_manager.start()
+    # 이전 프로세스에서 진행 중이던 회의를 에러 상태로 복구
+    recovered = await get_meeting_storage().recover_meetings()
+    if recovered:
+        logger.info("재시작으로 중단된 회의 %s개를 에러 상태로 복구했습니다.", recovered)
+    # 복구된 회의와 이전 프로세스가 남긴 만료 회의도 정리되도록 시작 시 실행
+    start_meeting_sweeper()
 
     yield {}
 
     logger.info("서버 종료... TaskManager를 중지합니다.")
     await task_manager.stop()
+    await stop_meeting_sweeper()
+
+
+# MCP Server 인스턴스 생성 (lifespan은 app.run 실행 동안 유지)
+app = Server("other-agents-mcp", lifespan=lifespan)
+
+
+# list_tools 응답은 실행 중에 바뀌지 않으므로 처음 요청 시 한 번만 생성
+_tools: Optional[list] = None
 
 
 @app.list_tools()
 async def list_available_tools():
-    """도구 목록 반환"""
+    """도구 목록 반환 (처음 호출 시 생성한 목록 재사용)"""
+    global _tools
+    if _tools is None:
+        _tools = _build_tools()
+    return _tools
+
+
+def _build_tools() -> list:
+    """도구 정의 생성 (회의 도구 스키마는 meeting_api에서 관리)"""
     from mcp.types import Tool
 
+    from .meeting_api import get_meeting_tools
+
     return [
         Tool(
             name="list_agents",
@@ -93,6 +125,15 @@ async def list_available_tools():
                         "type": "string",
                         "description": "시스템 프롬프트 (선택사항). Claude는 --append-system-prompt, 나머지는 YAML 형식으로 처리됨",
                     },
+                    "system_prompt_id": {
+                        "type": "string",
+                        "description": "register_prompt로 등록한 시스템 프롬프트 ID (선택사항, system_prompt 대신 사용). 큰 프롬프트를 매번 보내지 않아도 됨",
+                    },
+                    "prompt_vars": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "등록된 프롬프트의 $name 변수에 치환할 값 (선택사항)",
+                    },
                     "skip_git_repo_check": {
                         "type": "boolean",
                         "description": "Git 저장소 체크 건너뛰기 (Codex만 지원, 기본값: true)",
@@ -129,6 +170,15 @@ async def list_available_tools():
                         "type": "string",
                         "description": "시스템 프롬프트 (선택사항)",
                     },
+                    "system_prompt_id": {
+                        "type": "string",
+                        "description": "register_prompt로 등록한 시스템 프롬프트 ID (선택사항, system_prompt 대신 사용)",
+                    },
+                    "prompt_vars": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "등록된 프롬프트의 $name 변수에 치환할 값 (선택사항)",
+                    },
                     "skip_git_repo_check": {
                         "type": "boolean",
                         "description": "Git 저장소 체크 건너뛰기 (기본값: true)",
@@ -156,6 +206,69 @@ async def list_available_tools():
                 "required": ["task_id"],
             },
         ),
+        Tool(
+            name="get_task_result",
+            description="완료된 작업의 결과를 바이트 범위 단위로 나눠 조회합니다. get_task_status나 use_agent 응답에 truncated=true와 next_offset이 있으면, next_offset이 null이 될 때까지 offset을 넘겨 이어서 받습니다.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_id": {"type": "string", "description": "조회할 작업 ID"},
+                    "offset": {
+                        "type": "integer",
+                        "description": "시작 바이트 위치 (기본값: 0). 이전 응답의 next_offset을 전달합니다.",
+                        "minimum": 0,
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": f"최대 바이트 수 (기본값 겸 최대값: {RESULT_PAGE_BYTES}). UTF-8 문자 경계에 맞춰 조정됩니다.",
+                        "minimum": 1,
+                    },
+                },
+                "required": ["task_id"],
+            },
+        ),
+        Tool(
+            name="list_tasks",
+            description="작업 목록을 최근 생성 순으로 조회합니다 (결과 본문 제외). 상태, CLI, 세션, 생성/완료 시각 범위로 필터링하고 offset/limit으로 페이지를 나눕니다.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "enum": ["running", "completed", "failed"],
+                        "description": "작업 상태 필터",
+                    },
+                    "cli_name": {"type": "string", "description": "실행한 CLI 이름 필터"},
+                    "session_id": {"type": "string", "description": "세션 ID 필터"},
+                    "created_after": {
+                        "type": "number",
+                        "description": "생성 시각 하한 (Unix 시간, 초, 포함)",
+                    },
+                    "created_before": {
+                        "type": "number",
+                        "description": "생성 시각 상한 (Unix 시간, 초, 미포함)",
+                    },
+                    "completed_after": {
+                        "type": "number",
+                        "description": "완료 시각 하한 (Unix 시간, 초, 포함)",
+                    },
+                    "completed_before": {
+                        "type": "number",
+                        "description": "완료 시각 상한 (Unix 시간, 초, 미포함)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": f"페이지 크기 (기본값: {LIST_TASKS_DEFAULT_LIMIT}, 최대: {LIST_TASKS_MAX_LIMIT})",
+                        "minimum": 1,
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "건너뛸 작업 수 (기본값: 0). 이전 응답의 next_offset을 전달합니다.",
+                        "minimum": 0,
+                    },
+                },
+            },
+        ),
         Tool(
             name="add_agent",
             description="동적으로 새로운 AI CLI 도구 추가 (런타임)",
@@ -191,58 +304,55 @@ async def list_available_tools():
                         "items": {"type": "string"},
                         "description": "지원하는 CLI 인자 목록 (선택, 기본값: [])",
                     },
+                    "json_output_args": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": 'JSON 출력 요청 인자 (선택, 기본값: [], 예: ["--output-format", "json"]). 지정하면 structured_votes 회의에서 구조화된 투표를 사용하며, supported_args에 없어도 전달됩니다',
+                    },
                 },
                 "required": ["name", "command"],
             },
         ),
         Tool(
-            name="start_meeting",
-            description="다중 에이전트 회의를 시작합니다. 지정된 에이전트들이 주제에 대해 합의가 나올 때까지 토론합니다.",
+            name="register_prompt",
+            description="큰 시스템 프롬프트나 회의 참고 자료를 서버에 한 번 등록하고 내용 해시(prompt_id)를 받습니다. 이후 use_agent/use_agents의 system_prompt_id, start_meeting의 context_id로 참조하면 매 호출마다 본문을 다시 보내지 않아도 됩니다. $name 형식의 변수는 호출 시 prompt_vars로 치환됩니다 (리터럴 $는 $$).",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "topic": {
+                    "prompt": {
                         "type": "string",
-                        "description": "회의 주제 (필수). 에이전트들이 토론할 내용",
-                    },
-                    "agents": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "minItems": 2,
-                        "description": "참여 에이전트 목록 (필수). 예: ['claude', 'gemini', 'codex']. 최소 2개 이상",
-                    },
-                    "max_rounds": {
-                        "type": "integer",
-                        "default": 5,
-                        "description": "최대 라운드 수 (선택, 기본값: 5). 합의 없이 이 횟수에 도달하면 종료",
-                    },
-                    "timeout_per_round": {
-                        "type": "integer",
-                        "default": 300,
-                        "description": "라운드당 타임아웃 초 (선택, 기본값: 300)",
-                    },
-                    "consensus_type": {
-                        "type": "string",
-                        "enum": ["unanimous", "supermajority", "majority"],
-                        "default": "unanimous",
-                        "description": "합의 유형 (선택, 기본값: unanimous). unanimous=만장일치(100%), supermajority=절대다수(2/3), majority=과반수(50%+)",
+                        "description": "등록할 프롬프트 본문. 같은 내용은 항상 같은 prompt_id를 반환",
                     },
                 },
-                "required": ["topic", "agents"],
+                "required": ["prompt"],
             },
         ),
+        *get_meeting_tools(),
         Tool(
-            name="get_meeting_status",
-            description="진행 중인 회의의 상태를 조회합니다.",
+            name="memory_snapshot",
+            description="서버 메모리 사용 위치를 tracemalloc으로 조회합니다 (진단용). 추적 중이 아니면 첫 호출은 추적만 시작하므로, 부하를 준 뒤 다시 호출하세요. 계층형 작업 저장소(MCP_STORAGE_TYPE=tiered)를 쓰면 메모리 계층 적중률 등 task_storage 통계도 함께 반환합니다.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "meeting_id": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "반환할 상위 항목 수 (기본값: 20)",
+                        "minimum": 1,
+                    },
+                    "group_by": {
                         "type": "string",
-                        "description": "회의 ID (start_meeting에서 반환된 값)",
+                        "enum": ["lineno", "filename", "traceback"],
+                        "description": "묶는 기준 (기본값: lineno)",
+                    },
+                    "compare": {
+                        "type": "boolean",
+                        "description": "직전 스냅샷 대비 증가량 기준으로 정렬 (기본값: false)",
+                    },
+                    "save": {
+                        "type": "boolean",
+                        "description": "스냅샷을 MCP_PROFILE_DIR에 파일로 저장 (기본값: false)",
                     },
                 },
-                "required": ["meeting_id"],
             },
         ),
     ]
@@ -250,6 +360,29 @@ async def list_available_tools():
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]):
+    """도구 실행 (MCP_PROFILE_TOOLS 또는 _profile 인자로 선택적 프로파일링)"""
+    # 프로파일링을 설정하지도 요청하지도 않은 호출은 profiling 모듈을 불러오지 않음
+    if not config.PROFILE_TOOLS and config.PROFILE_ARGUMENT not in arguments:
+        return await _dispatch_tool(name, arguments)
+
+    from .profiling import profile_call, should_profile
+
+    requested = bool(arguments.get(config.PROFILE_ARGUMENT))
+    profile = should_profile(name, arguments)
+    if config.PROFILE_ARGUMENT in arguments:
+        arguments = {k: v for k, v in arguments.items() if k != config.PROFILE_ARGUMENT}
+
+    if not profile:
+        return await _dispatch_tool(name, arguments)
+
+    result, path = await profile_call(name, _dispatch_tool(name, arguments))
+    # 호출자가 직접 요청한 경우에만 응답에 파일 경로 포함
+    if requested and path is not None and isinstance(result, dict):
+        result = {**result, "profile_path": str(path)}
+    return result
+
+
+async def _dispatch_tool(name: str, arguments: Dict[str, Any]):
     """도구 실행 (비동기 처리 개선)"""
     if name == "list_agents":
         # 비동기로 실행하여 블로킹 방지
@@ -263,15 +396,18 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
         run_async = arguments.get("run_async", False)
         session_id = arguments.get("session_id", None)
         resume = arguments.get("resume", False)
-        system_prompt = arguments.get("system_prompt", None)
         skip_git_repo_check = arguments.get("skip_git_repo_check", True)
         args = arguments.get("args", [])
         timeout = arguments.get("timeout", None)
 
+        system_prompt, error = _resolve_system_prompt(arguments)
+        if error:
+            return error
+
         # 실행할 로직 선택 (Session vs Stateless)
         if session_id:
             # Session 모드
-            logger.info(f"Session mode: {session_id} (resume: {resume})")
+            logger.debug("Session mode: %s (resume: %s)", session_id, resume)
             execution_func = functools.partial(
                 execute_with_session,
                 cli_name,
@@ -285,7 +421,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
             )
         else:
             # Stateless 모드
-            logger.info("Stateless mode")
+            logger.debug("Stateless mode")
             execution_func = functools.partial(
                 execute_cli_file_based,
                 cli_name,
@@ -300,7 +436,9 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
         if run_async:
             # 비동기 실행: TaskManager에 등록하고 ID 즉시 반환
             task_manager = get_task_manager()
-            task_id = await task_manager.start_task(execution_func)
+            task_id = await task_manager.start_task(
+                execution_func, cli_name=cli_name, session_id=session_id
+            )
             return {
                 "task_id": task_id,
                 "status": "running",
@@ -312,7 +450,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
             async with semaphore:
                 try:
                     response = await asyncio.to_thread(execution_func)
-                    return {"response": response}
+                    return await _page_large_response(response, cli_name, session_id)
                 except ValueError as e:
                     logger.error(f"Session validation error: {e}")
                     return {"error": str(e), "type": "SessionValidationError"}
@@ -333,6 +471,29 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
         status = await task_manager.get_task_status(task_id, timeout=timeout)
         return status
 
+    elif name == "get_task_result":
+        task_manager = get_task_manager()
+        return await task_manager.get_task_result(
+            arguments["task_id"],
+            offset=arguments.get("offset", 0),
+            length=arguments.get("length", RESULT_PAGE_BYTES),
+        )
+
+    elif name == "list_tasks":
+        task_manager = get_task_manager()
+        query = TaskQuery(
+            status=arguments.get("status"),
+            cli_name=arguments.get("cli_name"),
+            session_id=arguments.get("session_id"),
+            created_after=arguments.get("created_after"),
+            created_before=arguments.get("created_before"),
+            completed_after=arguments.get("completed_after"),
+            completed_before=arguments.get("completed_before"),
+            limit=arguments.get("limit", LIST_TASKS_DEFAULT_LIMIT),
+            offset=arguments.get("offset", 0),
+        )
+        return await task_manager.list_tasks(query)
+
     elif name == "add_agent":
         # 필수 필드
         cli_name = arguments["name"]
@@ -345,6 +506,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
         supports_skip_git_check = arguments.get("supports_skip_git_check")
         skip_git_check_position = arguments.get("skip_git_check_position")
         supported_args = arguments.get("supported_args")
+        json_output_args = arguments.get("json_output_args")
 
         try:
             registry = get_cli_registry()
@@ -357,8 +519,9 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
                 supports_skip_git_check=supports_skip_git_check,
                 skip_git_check_position=skip_git_check_position,
                 supported_args=supported_args,
+                json_output_args=json_output_args,
             )
-            logger.info(f"CLI '{cli_name}' 추가 성공")
+            logger.info("CLI '%s' 추가 성공", cli_name)
             return {
                 "success": True,
                 "message": f"CLI '{cli_name}' 추가 완료",
@@ -371,17 +534,20 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
     elif name == "use_agents":
         message = arguments["message"]
         cli_names = arguments.get("cli_names", None)
-        system_prompt = arguments.get("system_prompt", None)
         skip_git_repo_check = arguments.get("skip_git_repo_check", True)
         timeout = arguments.get("timeout", None)
 
+        system_prompt, error = _resolve_system_prompt(arguments)
+        if error:
+            return error
+
         # CLI 목록 결정: 지정되지 않은 경우 모든 활성화된 CLI
         if cli_names is None:
             clis = await asyncio.to_thread(list_available_clis)
             cli_names = [cli.name for cli in clis]
-            logger.info(f"대상 CLI 목록(전체): {cli_names}")
+            logger.info("대상 CLI 목록(전체): %s", cli_names)
         else:
-            logger.info(f"대상 CLI 목록(지정): {cli_names}")
+            logger.info("대상 CLI 목록(지정): %s", cli_names)
 
         # 병렬 실행 함수 (세마포어로 동시성 제어)
         semaphore = get_cli_semaphore()
@@ -400,7 +566,10 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
                         timeout,
                     )
                     response = await asyncio.to_thread(execution_func)
-                    return (cli_name, {"response": response, "success": True})
+                    return (
+                        cli_name,
+                        {**await _page_large_response(response, cli_name), "success": True},
+                    )
                 except CLINotFoundError as e:
                     logger.warning(f"CLI '{cli_name}' not found: {e}")
                     return (
@@ -435,17 +604,106 @@ async def call_tool(name: str, arguments: Dict[str, Any]):
 
         return {"prompt": message, "responses": responses}
 
+    elif name == "register_prompt":
+        from .prompt_cache import get_prompt_cache
+
+        try:
+            return get_prompt_cache().register(arguments["prompt"])
+        except ValueError as e:
+            return {"error": str(e), "type": "PromptTemplateError"}
+
     elif name == "start_meeting":
+        # 회의 모듈(합의, 압축, 스케줄러)은 처음 회의 요청 시 불러옴 (서버 시작 시간 단축)
+        from .meeting_orchestrator import handle_start_meeting
+
         return await handle_start_meeting(arguments)
 
     elif name == "get_meeting_status":
+        from .meeting_orchestrator import handle_get_meeting_status
+
         return await handle_get_meeting_status(arguments)
 
+    elif name == "memory_snapshot":
+        from .profiling import memory_snapshot
+
+        snapshot = await asyncio.to_thread(
+            memory_snapshot,
+            limit=arguments.get("limit", 20),
+            group_by=arguments.get("group_by", "lineno"),
+            compare=arguments.get("compare", False),
+            save=arguments.get("save", False),
+        )
+        # 작업 저장소 통계 (계층형 저장소의 메모리 계층 적중률 등)
+        storage_stats = get_task_manager().get_storage_stats()
+        if storage_stats:
+            snapshot["task_storage"] = storage_stats
+        return snapshot
+
     else:
         logger.warning(f"Unknown tool: {name}")
         return {"error": f"Unknown tool: {name}"}
 
 
+def _resolve_system_prompt(arguments: Dict[str, Any]) -> tuple[Optional[str], Optional[dict]]:
+    """
+    system_prompt 또는 등록된 system_prompt_id(+prompt_vars)로 시스템 프롬프트 결정
+
+    Args:
+        arguments: use_agent/use_agents 도구 인자
+
+    Returns:
+        (시스템 프롬프트, None) 또는 실패 시 (None, 에러 딕셔너리)
+    """
+    # 프롬프트 캐시는 등록된 프롬프트를 처음 참조할 때 불러옴
+    if arguments.get("system_prompt_id") is None:
+        return arguments.get("system_prompt"), None
+
+    from .prompt_cache import PromptNotFoundError, resolve_prompt
+
+    try:
+        return resolve_prompt(arguments, "system_prompt", "system_prompt_id"), None
+    except PromptNotFoundError as e:
+        return None, {"error": str(e), "type": "PromptNotFoundError"}
+    except ValueError as e:
+        return None, {"error": str(e), "type": "PromptTemplateError"}
+
+
+async def _page_large_response(
+    response: str, cli_name: Optional[str] = None, session_id: Optional[str] = None
+) -> dict:
+    """
+    동기 실행 결과가 크면 완료된 작업으로 등록하고 첫 페이지만 반환
+
+    Args:
+        response: CLI 응답 문자열
+        cli_name: 실행한 CLI 이름 (작업 메타데이터)
+        session_id: 세션 ID (작업 메타데이터)
+
+    Returns:
+        {"response": ...} 또는 첫 페이지와 get_task_result용 task_id/next_offset
+    """
+    # UTF-8은 문자당 최대 4바이트이므로 짧은 응답은 인코딩 없이 통과
+    if (
+        len(response) * 4 <= RESULT_SPILL_BYTES
+        or len(response.encode("utf-8")) <= RESULT_SPILL_BYTES
+    ):
+        return {"response": response}
+
+    task_manager = get_task_manager()
+    task_id = await task_manager.store_result(response, cli_name=cli_name, session_id=session_id)
+    page = await task_manager.get_task_result(task_id)
+    logger.info(
+        "큰 응답(%s 바이트)을 작업 %s로 등록, 첫 페이지만 반환", page["result_size"], task_id
+    )
+    return {
+        "response": page["content"],
+        "truncated": True,
+        "task_id": task_id,
+        "result_size": page["result_size"],
+        "next_offset": page["next_offset"],
+    }
+
+
 def main():
     """메인 함수"""
     import signal
@@ -454,7 +712,9 @@ def main():
     logger.info("Other Agents MCP Server starting...")
     logger.info("MCP SDK version: 1.22.0")
     logger.info("Server name: other-agents-mcp")
-    logger.info("Available tools: list_agents, use_agent, use_agents, get_task_status, add_agent, start_meeting, get_meeting_status")
+    logger.info(
+        "Available tools: list_agents, use_agent, use_agents, get_task_status, get_task_result, list_tasks, add_agent, register_prompt, start_meeting, get_meeting_status, memory_snapshot"
+    )
 
     # 시작 시 오래된 임시 파일 정리
     cleanup_stale_temp_files()
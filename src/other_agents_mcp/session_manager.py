@@ -122,7 +122,7 @@ class SessionManager:
                 f"Only alphanumeric characters, hyphens, and underscores allowed (8-128 chars)"
             )
 
-        logger.debug(f"Session ID validation passed: {session_id}")
+        logger.debug("Session ID validation passed: %s", session_id)
 
     def _generate_cli_session_id(self, cli_name: str, mcp_session_id: str) -> str:
         """
@@ -181,7 +181,7 @@ class SessionManager:
         """
         if session_id in self._sessions:
             del self._sessions[session_id]
-            logger.info(f"Session deleted: {session_id}")
+            logger.info("Session deleted: %s", session_id)
             return True
 
         logger.warning(f"Session not found for deletion: {session_id}")
@@ -1,116 +1,398 @@
 """SQLite Storage for Task Manager
 
 `sqlite3`를 사용하여 Task 객체를 영속적으로 저장하는 저장소 구현.
+작업 결과는 압축된 내용 주소 블롭(result_blobs)으로 중복 없이 저장합니다.
+같은 데이터베이스에 회의 결과(MeetingResult)도 라운드 단위로 저장합니다.
 """
 
 import asyncio
+import hashlib
 import sqlite3
 import json
 import time
+import os
+import zlib
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
-from .task_manager import Storage, Task
+from .task_manager import Storage, Task, TaskQuery
+from .meeting_schema import MeetingResult, MeetingRound, MeetingStatus
+from .meeting_store import MeetingStorage, RESTART_ERROR_MESSAGE
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 작업 결과 블롭 zlib 압축 수준 (1: 빠름 ~ 9: 작음)
+RESULT_COMPRESS_LEVEL = 6
+
+# 작업 생성/변경을 모아 한 트랜잭션으로 기록하는 지연 시간 (밀리초, 0이면 즉시 기록)
+SQLITE_BATCH_WINDOW_MS = int(os.environ.get("MCP_SQLITE_BATCH_WINDOW_MS", "10"))
+
+# 지연 시간 전이라도 이 개수만큼 모이면 바로 기록
+SQLITE_BATCH_MAX_SIZE = int(os.environ.get("MCP_SQLITE_BATCH_MAX_SIZE", "256"))
+
+# 백그라운드 기록 실패 시 재시도 간격 (초, 실패할 때마다 두 배로 늘려 최대값까지)
+SQLITE_FLUSH_RETRY_SECONDS = 1
+SQLITE_FLUSH_RETRY_MAX_SECONDS = 60
+
+# 메모리에 보관할 종료 회의 수 (get_meeting_status 폴링마다 라운드를 다시 읽고 만들지 않도록, 0이면 끔)
+MEETING_CACHE_SIZE = int(os.environ.get("MCP_MEETING_CACHE_SIZE", "64"))
+
+# 더 이상 바뀌지 않는 회의 상태 (캐시 대상)
+_TERMINAL_MEETING_STATUSES = frozenset(
+    {MeetingStatus.CONSENSUS, MeetingStatus.NO_CONSENSUS, MeetingStatus.ERROR}
+)
+
+# 결과 본문을 제외한 작업 메타데이터 컬럼 (목록 조회용)
+_TASK_METADATA_COLUMNS = (
+    "task_id, status, error, created_at, completed_at, result_path, result_size, "
+    "cli_name, session_id, output_bytes"
+)
 
 
 class SqliteStorage(Storage):
-    """SQLite를 사용하여 작업을 저장하는 클래스"""
+    """SQLite를 사용하여 작업을 저장하는 클래스
+
+    작업 결과는 zlib으로 압축해 내용 해시(sha256)를 키로 'result_blobs' 테이블에
+    한 번만 저장하고, 'tasks' 행에는 해시와 크기만 기록합니다 (참조 카운트로 공유).
+
+    작업 생성/변경은 쓰기 대기열에 모았다가 batch_window_ms마다 한 트랜잭션으로
+    기록합니다 (group commit). 아직 기록되지 않은 변경도 get_task로 조회됩니다.
+    """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, batch_window_ms: int = SQLITE_BATCH_WINDOW_MS):
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._create_table()
+        self._batch_window = batch_window_ms / 1000
+        # task_id -> (작업 스냅샷, 새 작업 여부)
+        self._pending: Dict[str, tuple[Task, bool]] = {}
+        self._inflight: Dict[str, tuple[Task, bool]] = {}
+        # 지연 기록 타이머와 실제 기록을 수행하는 백그라운드 작업
+        self._flush_task: Optional[asyncio.Task] = None
+        self._background_flush: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        # close() 중에는 백그라운드 기록이 재시도를 멈춤
+        self._closing = asyncio.Event()
 
     def _get_connection(self) -> sqlite3.Connection:
         """데이터베이스 연결을 반환합니다."""
         return sqlite3.connect(self._db_path)
 
     def _create_table(self):
-        """'tasks' 테이블이 없으면 생성하고 WAL 모드를 활성화합니다."""
+        """'tasks', 'result_blobs' 테이블이 없으면 생성하고 WAL 모드를 활성화합니다."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             # WAL 모드 활성화 (동시성 향상)
             cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS tasks (
                     task_id TEXT PRIMARY KEY,
                     status TEXT NOT NULL,
                     result TEXT,
                     error TEXT,
                     created_at REAL NOT NULL,
-                    completed_at REAL
+                    completed_at REAL,
+                    result_path TEXT,
+                    result_size INTEGER,
+                    result_hash TEXT,
+                    cli_name TEXT,
+                    session_id TEXT,
+                    duration REAL,
+                    output_bytes INTEGER
                 )
-            """
+            """)
+            # 이전 버전에서 만든 테이블에 새 컬럼 추가
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
+            for column, column_type in (
+                ("result_path", "TEXT"),
+                ("result_size", "INTEGER"),
+                ("result_hash", "TEXT"),
+                ("cli_name", "TEXT"),
+                ("session_id", "TEXT"),
+                ("duration", "REAL"),
+                ("output_bytes", "INTEGER"),
+            ):
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} {column_type}")
+            # list_tasks 필터/정렬용 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks (completed_at)"
             )
-            conn.commit()
-
-    async def create_task(self, task_id: str) -> Task:
-        """새 작업을 데이터베이스에 생성하고 Task 객체를 반환합니다."""
-        task = Task(task_id=task_id)
-
-        def _db_insert():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO tasks (task_id, status, created_at) VALUES (?, ?, ?)",
-                    (task.task_id, task.status, task.created_at),
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, created_at)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_cli_name ON tasks (cli_name, created_at)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_session_id ON tasks (session_id, created_at)"
+            )
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS result_blobs (
+                    hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    refcount INTEGER NOT NULL
                 )
-                conn.commit()
+            """)
+            conn.commit()
 
-        await asyncio.to_thread(_db_insert)
+    async def create_task(
+        self, task_id: str, cli_name: Optional[str] = None, session_id: Optional[str] = None
+    ) -> Task:
+        """새 작업을 쓰기 대기열에 넣고 Task 객체를 반환합니다."""
+        task = Task(task_id=task_id, cli_name=cli_name, session_id=session_id)
+        await self._enqueue(task, is_new=True)
         return task
 
     async def get_task(self, task_id: str) -> Optional[Task]:
-        """ID로 작업을 데이터베이스에서 조회합니다."""
+        """ID로 작업과 결과를 조회합니다 (아직 기록되지 않은 변경 포함)."""
+        entry = self._pending.get(task_id) or self._inflight.get(task_id)
+        if entry is not None:
+            return replace(entry[0])
 
         def _db_select():
             with self._get_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
+                cursor.execute(
+                    """
+                    SELECT tasks.*, result_blobs.data AS blob
+                    FROM tasks LEFT JOIN result_blobs ON result_blobs.hash = tasks.result_hash
+                    WHERE task_id = ?
+                    """,
+                    (task_id,),
+                )
                 row = cursor.fetchone()
                 return self._row_to_task(row) if row else None
 
         return await asyncio.to_thread(_db_select)
 
     async def update_task(self, task: Task) -> None:
-        """작업의 상태를 데이터베이스에 업데이트합니다."""
+        """작업 상태 변경을 쓰기 대기열에 넣습니다."""
+        await self._enqueue(task, is_new=False)
 
-        def _db_update():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    UPDATE tasks
-                    SET status = ?, result = ?, error = ?, completed_at = ?
-                    WHERE task_id = ?
-                    """,
-                    (
-                        task.status,
-                        json.dumps(task.result) if task.result is not None else None,
-                        task.error,
-                        task.completed_at,
-                        task.task_id,
-                    ),
-                )
-                conn.commit()
-
-        await asyncio.to_thread(_db_update)
+    async def put_task(self, task: Task) -> None:
+        """작업 전체를 쓰기 대기열에 넣습니다 (행이 없으면 생성)."""
+        await self._enqueue(task, is_new=True)
 
     async def get_all_tasks(self) -> List[Task]:
-        """데이터베이스의 모든 작업을 반환합니다."""
+        """데이터베이스의 모든 작업 메타데이터를 반환합니다 (결과 본문은 읽지 않음)."""
+        await self.flush()
 
         def _db_select_all():
             with self._get_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM tasks")
+                cursor.execute(f"SELECT {_TASK_METADATA_COLUMNS} FROM tasks")
                 rows = cursor.fetchall()
                 return [self._row_to_task(row) for row in rows if row]
 
         return await asyncio.to_thread(_db_select_all)
 
+    async def list_tasks(self, query: TaskQuery) -> List[Task]:
+        """조건에 맞는 작업 메타데이터를 인덱스로 조회합니다 (결과 본문은 읽지 않음)."""
+        await self.flush()
+
+        conditions, params = [], []
+        for column, operator, value in (
+            ("status", "=", query.status),
+            ("cli_name", "=", query.cli_name),
+            ("session_id", "=", query.session_id),
+            ("created_at", ">=", query.created_after),
+            ("created_at", "<", query.created_before),
+            ("completed_at", ">=", query.completed_after),
+            ("completed_at", "<", query.completed_before),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        def _db_select():
+            with self._get_connection() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT {_TASK_METADATA_COLUMNS} FROM tasks {where} "
+                    "ORDER BY created_at DESC, task_id DESC LIMIT ? OFFSET ?",
+                    (*params, query.limit, query.offset),
+                )
+                return [self._row_to_task(row) for row in cursor.fetchall()]
+
+        return await asyncio.to_thread(_db_select)
+
+    async def delete_task(self, task_id: str) -> None:
+        """작업을 삭제하고 결과 블롭의 참조를 해제합니다."""
+        await self.flush()
+
+        def _db_delete():
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT result_hash FROM tasks WHERE task_id = ?", (task_id,))
+                row = cursor.fetchone()
+                cursor.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+                if row and row[0] is not None:
+                    _release_blob(cursor, row[0])
+                conn.commit()
+
+        await asyncio.to_thread(_db_delete)
+
+    async def _enqueue(self, task: Task, is_new: bool) -> None:
+        """
+        작업 스냅샷을 쓰기 대기열에 추가 (같은 작업의 변경은 마지막 상태로 합침)
+
+        Args:
+            task: 기록할 작업
+            is_new: 새로 생성된 작업 여부
+        """
+        previous = self._pending.get(task.task_id)
+        if previous is not None:
+            is_new = is_new or previous[1]
+        self._pending[task.task_id] = (replace(task), is_new)
+
+        if self._batch_window <= 0:
+            await self.flush()
+        elif len(self._pending) >= SQLITE_BATCH_MAX_SIZE:
+            # 대기열이 가득 차면 지연 시간을 기다리지 않고 바로 기록
+            self._start_background_flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """배치 지연 시간 동안 변경을 모은 뒤 백그라운드 기록을 시작합니다."""
+        await asyncio.sleep(self._batch_window)
+        self._flush_task = None
+        self._start_background_flush()
+
+    def _start_background_flush(self) -> None:
+        """백그라운드 기록 시작 (이미 실행 중이면 그 작업이 남은 변경까지 기록)"""
+        if self._background_flush is None or self._background_flush.done():
+            self._background_flush = asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        """
+        대기열이 빌 때까지 기록
+
+        실패하면 변경을 대기열에 유지한 채 재시도 간격을 두 배로 늘려 가며 다시 기록하고,
+        close()가 시작되면 재시도를 멈춥니다 (마지막 기록은 close()가 수행).
+        """
+        delay = SQLITE_FLUSH_RETRY_SECONDS
+        while self._pending and not self._closing.is_set():
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"작업 상태 일괄 기록 실패 ({delay}초 후 재시도): {e}")
+                try:
+                    await asyncio.wait_for(self._closing.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, SQLITE_FLUSH_RETRY_MAX_SECONDS)
+
+    async def close(self) -> None:
+        """
+        백그라운드 기록이 끝나기를 기다린 뒤 남은 변경을 기록합니다 (종료 시 호출).
+
+        Raises:
+            Exception: 마지막 기록 실패 (변경은 대기열에 남음)
+        """
+        self._closing.set()
+        try:
+            background = self._background_flush
+            if background is not None:
+                await asyncio.gather(background, return_exceptions=True)
+                self._background_flush = None
+            await self.flush()
+        finally:
+            self._closing.clear()
+
+    async def flush(self) -> None:
+        """쓰기 대기열의 모든 변경을 한 트랜잭션으로 기록합니다."""
+        timer = self._flush_task
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+            self._flush_task = None
+
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            # 기록하는 동안에도 조회 시 최신 상태가 보이도록 유지
+            self._inflight = batch
+            try:
+                await asyncio.to_thread(self._write_batch, list(batch.values()))
+            except Exception:
+                # 그 사이 들어온 더 새로운 변경은 유지하고 나머지는 다시 대기열로
+                for task_id, (snapshot, is_new) in batch.items():
+                    newer = self._pending.get(task_id)
+                    self._pending[task_id] = (
+                        (newer[0], newer[1] or is_new) if newer else (snapshot, is_new)
+                    )
+                raise
+            finally:
+                self._inflight = {}
+
+    def _write_batch(self, entries: list[tuple[Task, bool]]) -> None:
+        """작업 생성/변경을 하나의 트랜잭션으로 기록합니다."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for task, is_new in entries:
+                if is_new:
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO tasks (task_id, status, created_at, cli_name, session_id) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            task.task_id,
+                            task.status,
+                            task.created_at,
+                            task.cli_name,
+                            task.session_id,
+                        ),
+                    )
+                self._write_task(cursor, task)
+            conn.commit()
+
+    def _write_task(self, cursor: sqlite3.Cursor, task: Task) -> None:
+        """작업 행의 상태와 결과 블롭 참조를 갱신합니다."""
+        blob = _encode_result(task.result)
+        cursor.execute("SELECT result_hash FROM tasks WHERE task_id = ?", (task.task_id,))
+        row = cursor.fetchone()
+        old_hash = row[0] if row else None
+        new_hash = blob[0] if blob else None
+
+        if new_hash is not None and new_hash != old_hash:
+            _acquire_blob(cursor, *blob)
+        cursor.execute(
+            """
+            UPDATE tasks
+            SET status = ?, result = NULL, error = ?, completed_at = ?,
+                result_path = ?, result_size = ?, result_hash = ?,
+                cli_name = ?, session_id = ?, duration = ?, output_bytes = ?
+            WHERE task_id = ?
+            """,
+            (
+                task.status,
+                task.error,
+                task.completed_at,
+                task.result_path,
+                task.result_size if task.result_path else (blob[2] if blob else None),
+                new_hash,
+                task.cli_name,
+                task.session_id,
+                task.duration,
+                task.output_bytes,
+                task.task_id,
+            ),
+        )
+        if old_hash is not None and old_hash != new_hash:
+            _release_blob(cursor, old_hash)
+
     async def recover_tasks(self) -> None:
         """'running' 상태인 모든 작업을 'failed'로 복구합니다."""
 
@@ -139,9 +421,13 @@ class SqliteStorage(Storage):
         if not row:
             return None
 
-        result_str = row["result"]
+        keys = row.keys()
         result = None
-        if result_str:
+        if "blob" in keys and row["blob"] is not None:
+            result = json.loads(zlib.decompress(row["blob"]))
+        elif "result" in keys and row["result"]:
+            # 이전 버전에서 tasks 행에 직접 저장한 결과
+            result_str = row["result"]
             try:
                 result = json.loads(result_str)
             except (json.JSONDecodeError, TypeError):
@@ -155,4 +441,253 @@ class SqliteStorage(Storage):
             error=row["error"],
             created_at=row["created_at"],
             completed_at=row["completed_at"],
+            result_path=row["result_path"],
+            result_size=row["result_size"],
+            cli_name=row["cli_name"],
+            session_id=row["session_id"],
+            output_bytes=row["output_bytes"],
+        )
+
+
+def _encode_result(result) -> Optional[tuple[str, bytes, int]]:
+    """
+    작업 결과를 블롭으로 변환
+
+    Args:
+        result: 작업 결과 (JSON 직렬화 가능 값)
+
+    Returns:
+        (sha256 해시, zlib 압축 데이터, 원본 바이트 수), 결과가 없으면 None
+    """
+    if result is None:
+        return None
+    payload = json.dumps(result, ensure_ascii=False).encode("utf-8")
+    return (
+        hashlib.sha256(payload).hexdigest(),
+        zlib.compress(payload, RESULT_COMPRESS_LEVEL),
+        len(payload),
+    )
+
+
+def _acquire_blob(cursor: sqlite3.Cursor, blob_hash: str, data: bytes, size: int) -> None:
+    """결과 블롭을 저장하거나, 같은 내용이 이미 있으면 참조 수만 늘립니다."""
+    cursor.execute(
+        """
+        INSERT INTO result_blobs (hash, data, size, refcount) VALUES (?, ?, ?, 1)
+        ON CONFLICT(hash) DO UPDATE SET refcount = refcount + 1
+        """,
+        (blob_hash, data, size),
+    )
+
+
+def _release_blob(cursor: sqlite3.Cursor, blob_hash: str) -> None:
+    """결과 블롭의 참조 수를 줄이고, 더 이상 참조가 없으면 삭제합니다."""
+    cursor.execute("UPDATE result_blobs SET refcount = refcount - 1 WHERE hash = ?", (blob_hash,))
+    cursor.execute("DELETE FROM result_blobs WHERE hash = ? AND refcount <= 0", (blob_hash,))
+
+
+class SqliteMeetingStorage(MeetingStorage):
+    """
+    SQLite를 사용하여 회의를 라운드 단위로 저장하는 클래스
+
+    DB에서 읽은 종료 회의는 최근 조회 순으로 최대 cache_size개를 메모리에 보관합니다.
+    종료된 회의는 바뀌지 않으므로, 반복 조회 시 DB를 다시 읽지 않고
+    회의 객체의 직렬화된 라운드 캐시도 재사용합니다.
+    """
+
+    def __init__(self, db_path: Path, cache_size: int = MEETING_CACHE_SIZE):
+        self._db_path = db_path
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, MeetingResult]" = OrderedDict()
+        self._create_tables()
+
+    def _cache_meeting(self, meeting: MeetingResult) -> None:
+        """DB에서 읽은 종료 회의를 캐시에 추가"""
+        if self._cache_size <= 0 or meeting.status not in _TERMINAL_MEETING_STATUSES:
+            return
+        self._cache[meeting.meeting_id] = meeting
+        self._cache.move_to_end(meeting.meeting_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """데이터베이스 연결을 반환합니다."""
+        return sqlite3.connect(self._db_path)
+
+    def _create_tables(self):
+        """'meetings', 'meeting_rounds' 테이블이 없으면 생성합니다."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meetings (
+                    meeting_id TEXT PRIMARY KEY,
+                    topic TEXT NOT NULL,
+                    agents TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    final_consensus TEXT,
+                    error_message TEXT,
+                    started_at REAL NOT NULL,
+                    ended_at REAL,
+                    transcript_path TEXT
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meeting_rounds (
+                    meeting_id TEXT NOT NULL,
+                    round_number INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (meeting_id, round_number)
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_meetings_ended_at ON meetings (ended_at)"
+            )
+            conn.commit()
+
+    async def save_meeting(self, meeting: MeetingResult) -> None:
+        """회의 메타데이터를 저장(upsert)합니다."""
+
+        def _db_upsert():
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO meetings (
+                        meeting_id, topic, agents, status, final_consensus,
+                        error_message, started_at, ended_at, transcript_path
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(meeting_id) DO UPDATE SET
+                        status = excluded.status,
+                        final_consensus = excluded.final_consensus,
+                        error_message = excluded.error_message,
+                        ended_at = excluded.ended_at,
+                        transcript_path = excluded.transcript_path
+                    """,
+                    (
+                        meeting.meeting_id,
+                        meeting.topic,
+                        json.dumps(meeting.agents),
+                        meeting.status.value,
+                        meeting.final_consensus,
+                        meeting.error_message,
+                        meeting.started_at.timestamp(),
+                        meeting.ended_at.timestamp() if meeting.ended_at else None,
+                        meeting.transcript_path,
+                    ),
+                )
+                conn.commit()
+
+        await asyncio.to_thread(_db_upsert)
+        # 저장된 라운드는 DB에만 있을 수 있으므로 다음 조회 때 DB에서 다시 읽음
+        self._cache.pop(meeting.meeting_id, None)
+
+    async def append_round(self, meeting_id: str, round_result: MeetingRound) -> None:
+        """완료된 라운드를 저장합니다."""
+        data = json.dumps(round_result.to_dict(), ensure_ascii=False)
+
+        def _db_insert():
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meeting_rounds (meeting_id, round_number, data) "
+                    "VALUES (?, ?, ?)",
+                    (meeting_id, round_result.round_number, data),
+                )
+                conn.commit()
+
+        await asyncio.to_thread(_db_insert)
+
+    async def get_meeting(self, meeting_id: str) -> Optional[MeetingResult]:
+        """ID로 회의와 저장된 라운드를 조회합니다 (종료된 회의는 캐시에서 반환)."""
+        cached = self._cache.get(meeting_id)
+        if cached is not None:
+            self._cache.move_to_end(meeting_id)
+            return cached
+
+        def _db_select():
+            with self._get_connection() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM meetings WHERE meeting_id = ?", (meeting_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                cursor.execute(
+                    "SELECT data FROM meeting_rounds WHERE meeting_id = ? ORDER BY round_number",
+                    (meeting_id,),
+                )
+                rounds = [json.loads(r["data"]) for r in cursor.fetchall()]
+                return self._row_to_meeting(row, rounds)
+
+        meeting = await asyncio.to_thread(_db_select)
+        if meeting is not None:
+            self._cache_meeting(meeting)
+        return meeting
+
+    async def delete_expired(self, ttl_seconds: int) -> list[str]:
+        """종료 후 TTL이 지난 회의와 라운드를 삭제합니다."""
+        cutoff = time.time() - ttl_seconds
+
+        def _db_delete():
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT meeting_id FROM meetings WHERE ended_at IS NOT NULL AND ended_at < ?",
+                    (cutoff,),
+                )
+                expired = [row[0] for row in cursor.fetchall()]
+                cursor.executemany(
+                    "DELETE FROM meeting_rounds WHERE meeting_id = ?",
+                    [(meeting_id,) for meeting_id in expired],
+                )
+                cursor.executemany(
+                    "DELETE FROM meetings WHERE meeting_id = ?",
+                    [(meeting_id,) for meeting_id in expired],
+                )
+                conn.commit()
+                return expired
+
+        expired = await asyncio.to_thread(_db_delete)
+        for meeting_id in expired:
+            self._cache.pop(meeting_id, None)
+        return expired
+
+    async def recover_meetings(self) -> int:
+        """'running' 상태인 모든 회의를 'error'로 복구합니다."""
+
+        def _db_recover():
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    UPDATE meetings
+                    SET status = ?, error_message = ?, ended_at = ?
+                    WHERE status IN (?, ?)
+                    """,
+                    (
+                        MeetingStatus.ERROR.value,
+                        RESTART_ERROR_MESSAGE,
+                        time.time(),
+                        MeetingStatus.RUNNING.value,
+                        MeetingStatus.WAITING.value,
+                    ),
+                )
+                conn.commit()
+                return cursor.rowcount
+
+        return await asyncio.to_thread(_db_recover)
+
+    def _row_to_meeting(self, row: sqlite3.Row, rounds: list[dict]) -> MeetingResult:
+        """데이터베이스 row를 MeetingResult 객체로 변환합니다."""
+        return MeetingResult(
+            meeting_id=row["meeting_id"],
+            topic=row["topic"],
+            agents=json.loads(row["agents"]),
+            status=MeetingStatus(row["status"]),
+            rounds=[MeetingRound.from_dict(r) for r in rounds],
+            final_consensus=row["final_consensus"],
+            started_at=datetime.fromtimestamp(row["started_at"]),
+            ended_at=datetime.fromtimestamp(row["ended_at"]) if row["ended_at"] else None,
+            error_message=row["error_message"],
+            transcript_path=row["transcript_path"],
         )
@@ -3,12 +3,16 @@
 비동기 작업을 관리하고 상태를 추적합니다.
 """
 
+import io
+import json
+import os
 import time
 import asyncio
 import uuid
 from functools import partial
 from typing import Literal, Optional, Any, Dict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from pathlib import Path
 from abc import ABC, abstractmethod
 
 from . import config
@@ -21,6 +25,19 @@ logger = get_logger(__name__)
 # 작업 상태 정의
 TaskStatus = Literal["running", "completed", "failed", "not_found"]
 
+# 이 크기(바이트)를 넘는 문자열 결과는 메모리 대신 파일에 보관 (기본값: 256KB)
+RESULT_SPILL_BYTES = int(os.environ.get("MCP_RESULT_SPILL_BYTES", "262144"))
+
+# get_task_result 페이지 크기 (바이트, 기본값 겸 최대값: 64KB)
+RESULT_PAGE_BYTES = int(os.environ.get("MCP_RESULT_PAGE_BYTES", "65536"))
+
+# list_tasks 페이지 크기 (기본값, 최대값)
+LIST_TASKS_DEFAULT_LIMIT = 50
+LIST_TASKS_MAX_LIMIT = 200
+
+# UTF-8 문자 하나의 최대 바이트 수 (페이지가 문자 하나는 담을 수 있도록 하는 최소 길이)
+_MAX_UTF8_CHAR_BYTES = 4
+
 
 @dataclass
 class Task:
@@ -32,6 +49,11 @@ class Task:
     error: Optional[str] = None
     created_at: float = field(default_factory=time.time)
     completed_at: Optional[float] = None
+    result_path: Optional[str] = None  # 파일에 보관된 결과 경로 (이 경우 result는 None)
+    result_size: Optional[int] = None  # 저장된 결과 크기 (바이트, 파일 또는 SQLite 블롭)
+    cli_name: Optional[str] = None  # 작업을 실행한 CLI
+    session_id: Optional[str] = None  # 세션 모드 실행 시 세션 ID
+    output_bytes: Optional[int] = None  # 문자열 결과의 UTF-8 바이트 수
 
     @property
     def elapsed_time(self) -> float:
@@ -39,12 +61,77 @@ class Task:
             return self.completed_at - self.created_at
         return time.time() - self.created_at
 
+    @property
+    def duration(self) -> Optional[float]:
+        """완료까지 걸린 시간 (초, 진행 중이면 None)"""
+        if self.completed_at:
+            return self.completed_at - self.created_at
+        return None
+
+    def to_summary(self) -> Dict[str, Any]:
+        """결과 본문을 제외한 작업 메타데이터"""
+        return {
+            "task_id": self.task_id,
+            "status": self.status,
+            "cli_name": self.cli_name,
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "duration": round(self.duration, 3) if self.duration is not None else None,
+            "output_bytes": self.output_bytes,
+            "error": self.error,
+        }
+
+
+@dataclass
+class TaskQuery:
+    """작업 목록 조회 조건 (None인 조건은 적용하지 않음, 최근 생성 순 정렬)"""
+
+    status: Optional[str] = None
+    cli_name: Optional[str] = None
+    session_id: Optional[str] = None
+    created_after: Optional[float] = None
+    created_before: Optional[float] = None
+    completed_after: Optional[float] = None
+    completed_before: Optional[float] = None
+    limit: int = LIST_TASKS_DEFAULT_LIMIT
+    offset: int = 0
+
+    def matches(self, task: Task) -> bool:
+        """작업이 모든 조건을 만족하는지 확인합니다."""
+        if self.status is not None and task.status != self.status:
+            return False
+        if self.cli_name is not None and task.cli_name != self.cli_name:
+            return False
+        if self.session_id is not None and task.session_id != self.session_id:
+            return False
+        if self.created_after is not None and task.created_at < self.created_after:
+            return False
+        if self.created_before is not None and task.created_at >= self.created_before:
+            return False
+        if self.completed_after is not None or self.completed_before is not None:
+            if task.completed_at is None:
+                return False
+            if self.completed_after is not None and task.completed_at < self.completed_after:
+                return False
+            if self.completed_before is not None and task.completed_at >= self.completed_before:
+                return False
+        return True
+
+
+def sort_and_page(tasks: list[Task], query: TaskQuery) -> list[Task]:
+    """최근 생성 순으로 정렬하고 offset/limit 범위를 잘라냅니다."""
+    tasks.sort(key=lambda t: (t.created_at, t.task_id), reverse=True)
+    return tasks[query.offset : query.offset + query.limit]
+
 
 class Storage(ABC):
     """작업 저장소의 추상 베이스 클래스 (인터페이스)"""
 
     @abstractmethod
-    async def create_task(self, task_id: str) -> Task:
+    async def create_task(
+        self, task_id: str, cli_name: Optional[str] = None, session_id: Optional[str] = None
+    ) -> Task:
         """새 작업을 저장소에 생성하고 반환합니다."""
         pass
 
@@ -60,19 +147,51 @@ class Storage(ABC):
 
     @abstractmethod
     async def get_all_tasks(self) -> list[Task]:
-        """모든 작업을 반환합니다."""
+        """모든 작업을 반환합니다 (결과 본문은 포함하지 않을 수 있음)."""
+        pass
+
+    @abstractmethod
+    async def delete_task(self, task_id: str) -> None:
+        """작업을 삭제합니다 (없으면 무시)."""
+        pass
+
+    @abstractmethod
+    async def list_tasks(self, query: TaskQuery) -> list[Task]:
+        """조건에 맞는 작업을 최근 생성 순으로 반환합니다 (결과 본문은 포함하지 않을 수 있음)."""
+        pass
+
+    async def flush(self) -> None:
+        """아직 기록되지 않은 변경을 저장합니다 (쓰기를 모아 두는 저장소만 재정의)."""
+        pass
+
+    async def close(self) -> None:
+        """종료 시 호출: 백그라운드 작업을 마치고 남은 변경을 저장합니다."""
+        await self.flush()
+
+    async def recover_tasks(self) -> None:
+        """이전 프로세스에서 'running'으로 남은 작업을 복구합니다 (영속 저장소만 재정의)."""
         pass
 
+    def get_stats(self) -> dict:
+        """저장소 현황을 반환합니다 (통계를 집계하는 저장소만 재정의, 기본값은 빈 딕셔너리)."""
+        return {}
+
 
 class InMemoryStorage(Storage):
     """인-메모리 작업 저장소 (MVP용)"""
 
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
-
-    async def create_task(self, task_id: str) -> Task:
-        task = Task(task_id=task_id)
+        # 보조 인덱스: (필드, 값) -> task_id 집합, task_id -> 색인된 (필드, 값) 목록
+        self._index: Dict[tuple[str, Any], set[str]] = {}
+        self._indexed_keys: Dict[str, list[tuple[str, Any]]] = {}
+
+    async def create_task(
+        self, task_id: str, cli_name: Optional[str] = None, session_id: Optional[str] = None
+    ) -> Task:
+        task = Task(task_id=task_id, cli_name=cli_name, session_id=session_id)
         self._tasks[task_id] = task
+        self._reindex(task)
         return task
 
     async def get_task(self, task_id: str) -> Optional[Task]:
@@ -81,10 +200,91 @@ class InMemoryStorage(Storage):
     async def update_task(self, task: Task) -> None:
         if task.task_id in self._tasks:
             self._tasks[task.task_id] = task
+            self._reindex(task)
 
     async def get_all_tasks(self) -> list[Task]:
         return list(self._tasks.values())
 
+    async def delete_task(self, task_id: str) -> None:
+        self._tasks.pop(task_id, None)
+        self._unindex(task_id)
+
+    async def list_tasks(self, query: TaskQuery) -> list[Task]:
+        # 지정된 조건 중 후보가 가장 적은 인덱스에서 시작
+        candidate_sets = [
+            self._index.get((name, value), set())
+            for name, value in (
+                ("status", query.status),
+                ("cli_name", query.cli_name),
+                ("session_id", query.session_id),
+            )
+            if value is not None
+        ]
+        if candidate_sets:
+            candidate_ids = min(candidate_sets, key=len)
+            candidates = [self._tasks[task_id] for task_id in candidate_ids]
+        else:
+            candidates = list(self._tasks.values())
+        return sort_and_page([t for t in candidates if query.matches(t)], query)
+
+    def _reindex(self, task: Task) -> None:
+        """작업의 현재 상태/CLI/세션 값으로 보조 인덱스를 갱신합니다."""
+        self._unindex(task.task_id)
+        keys = [
+            (name, value)
+            for name, value in (
+                ("status", task.status),
+                ("cli_name", task.cli_name),
+                ("session_id", task.session_id),
+            )
+            if value is not None
+        ]
+        for key in keys:
+            self._index.setdefault(key, set()).add(task.task_id)
+        self._indexed_keys[task.task_id] = keys
+
+    def _unindex(self, task_id: str) -> None:
+        """보조 인덱스에서 작업을 제거합니다."""
+        for key in self._indexed_keys.pop(task_id, []):
+            task_ids = self._index.get(key)
+            if task_ids is not None:
+                task_ids.discard(task_id)
+                if not task_ids:
+                    del self._index[key]
+
+
+def _read_utf8_page(f, offset: int, length: int) -> tuple[str, int, int]:
+    """
+    바이너리 스트림에서 UTF-8 문자 경계에 맞춘 페이지 읽기
+
+    Args:
+        f: 읽기용 바이너리 스트림
+        offset: 시작 바이트 위치 (문자 중간이면 다음 문자부터)
+        length: 최대 바이트 수 (끝이 문자 중간이면 그 문자는 다음 페이지로)
+
+    Returns:
+        (페이지 문자열, 실제 시작 위치, 실제 끝 위치)
+    """
+    f.seek(offset)
+    chunk = f.read(length)
+
+    # 연속 바이트(10xxxxxx)로 시작하면 다음 문자 경계까지 건너뜀
+    start = 0
+    while start < len(chunk) and chunk[start] & 0xC0 == 0x80:
+        start += 1
+
+    # 마지막 문자의 시작 바이트를 찾아 완결되지 않았으면 잘라냄
+    end = len(chunk)
+    lead = end - 1
+    while lead > start and end - lead < _MAX_UTF8_CHAR_BYTES and chunk[lead] & 0xC0 == 0x80:
+        lead -= 1
+    if lead >= start and chunk[lead] >= 0xC0:
+        char_bytes = 2 if chunk[lead] < 0xE0 else 3 if chunk[lead] < 0xF0 else 4
+        if end - lead < char_bytes:
+            end = lead
+
+    return chunk[start:end].decode("utf-8"), offset + start, offset + end
+
 
 class TaskManager:
     """비동기 작업 관리자"""
@@ -96,13 +296,8 @@ class TaskManager:
 
     async def start(self):
         """Task Manager를 시작하고 주기적인 정리 작업을 스케줄링합니다."""
-        # SQLite 사용 시, 시작할 때 'running' 상태의 작업을 복구
-        try:
-            from .sqlite_storage import SqliteStorage
-            if isinstance(self._storage, SqliteStorage):
-                await self._storage.recover_tasks()
-        except ImportError:
-            pass  # Should not happen if configured correctly
+        # 영속 저장소 사용 시, 시작할 때 'running' 상태의 작업을 복구
+        await self._storage.recover_tasks()
 
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
@@ -112,27 +307,46 @@ class TaskManager:
         if self._cleanup_task:
             self._cleanup_task.cancel()
             self._cleanup_task = None
-        for task in self._running_tasks.values():
+        running = list(self._running_tasks.values())
+        for task in running:
             task.cancel()
+        # 취소된 작업의 마지막 상태 기록까지 기다린 뒤 대기 중인 쓰기를 모두 반영
+        await asyncio.gather(*running, return_exceptions=True)
         self._running_tasks.clear()
+        await self._storage.close()
 
-    async def start_task(self, coro_func: partial) -> str:
-        """함수를 백그라운드 작업으로 시작하고 task_id를 반환합니다."""
+    async def start_task(
+        self,
+        coro_func: partial,
+        cli_name: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """함수를 백그라운드 작업으로 시작하고 task_id를 반환합니다.
+
+        Args:
+            coro_func: 스레드에서 실행할 함수
+            cli_name: 실행할 CLI 이름 (list_tasks 필터용, 선택)
+            session_id: 세션 모드의 세션 ID (list_tasks 필터용, 선택)
+        """
         task_id = str(uuid.uuid4())
 
         # 새 작업을 저장소에 즉시 생성
-        task = await self._storage.create_task(task_id)
+        task = await self._storage.create_task(task_id, cli_name=cli_name, session_id=session_id)
 
         background_task = asyncio.create_task(self._run_and_update(task, coro_func))
         self._running_tasks[task_id] = background_task
         return task_id
 
-    async def start_async_task(self, coro, task_id: Optional[str] = None) -> str:
+    async def start_async_task(
+        self, coro, task_id: Optional[str] = None, use_semaphore: bool = True
+    ) -> str:
         """비동기 코루틴을 백그라운드 작업으로 시작하고 task_id를 반환합니다.
 
         Args:
             coro: 실행할 코루틴 객체
             task_id: 선택적 task_id (지정하지 않으면 UUID 생성)
+            use_semaphore: 코루틴 전체를 CLI 세마포어 슬롯 하나로 감쌀지 여부.
+                           내부에서 CLI 호출마다 슬롯을 직접 잡는 코루틴(회의 등)은 False
 
         Returns:
             task_id 문자열
@@ -143,20 +357,22 @@ class TaskManager:
         # 새 작업을 저장소에 즉시 생성
         task = await self._storage.create_task(task_id)
 
-        background_task = asyncio.create_task(self._run_async_and_update(task, coro))
+        background_task = asyncio.create_task(self._run_async_and_update(task, coro, use_semaphore))
         self._running_tasks[task_id] = background_task
         return task_id
 
-    async def _run_async_and_update(self, task: Task, coro):
+    async def _run_async_and_update(self, task: Task, coro, use_semaphore: bool = True):
         """비동기 코루틴을 실행하고 결과를 저장소에 업데이트합니다."""
         task_id = task.task_id
         try:
-            # 세마포어를 사용하여 동시 실행 수 제한
-            async with get_cli_semaphore():
+            if use_semaphore:
+                # 세마포어를 사용하여 동시 실행 수 제한
+                async with get_cli_semaphore():
+                    result = await coro
+            else:
                 result = await coro
-            
-            task.status = "completed"
-            task.result = result
+
+            await self._set_result(task, result)
         except Exception as e:
             task.status = "failed"
             task.error = str(e)
@@ -175,8 +391,7 @@ class TaskManager:
                 loop = asyncio.get_running_loop()
                 result = await loop.run_in_executor(None, coro_func)
 
-            task.status = "completed"
-            task.result = result
+            await self._set_result(task, result)
         except Exception as e:
             task.status = "failed"
             task.error = str(e)
@@ -185,9 +400,119 @@ class TaskManager:
             await self._storage.update_task(task)
             self._running_tasks.pop(task_id, None)
 
+    async def _set_result(self, task: Task, result: Any) -> None:
+        """작업을 완료 처리하고, 큰 문자열 결과는 파일에 보관합니다."""
+        task.status = "completed"
+        if isinstance(result, str):
+            data = result.encode("utf-8")
+            task.output_bytes = len(data)
+            if len(data) > RESULT_SPILL_BYTES:
+                path = config.RESULT_SPILL_DIR / f"{task.task_id}.txt"
+                try:
+                    await asyncio.to_thread(self._write_result_file, path, data)
+                    task.result_path = str(path)
+                    task.result_size = len(data)
+                    return
+                except OSError as e:
+                    logger.warning(
+                        f"결과 파일 저장 실패, 메모리에 보관합니다 ({task.task_id}): {e}"
+                    )
+        task.result = result
+
+    @staticmethod
+    def _write_result_file(path: Path, data: bytes) -> None:
+        """결과 파일을 기록합니다."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    async def store_result(
+        self, result: Any, cli_name: Optional[str] = None, session_id: Optional[str] = None
+    ) -> str:
+        """이미 얻은 결과를 완료된 작업으로 등록하고 task_id를 반환합니다.
+
+        동기 실행 결과가 너무 커서 get_task_result로 나눠 받아야 할 때 사용합니다.
+        """
+        task = await self._storage.create_task(
+            str(uuid.uuid4()), cli_name=cli_name, session_id=session_id
+        )
+        await self._set_result(task, result)
+        task.completed_at = time.time()
+        await self._storage.update_task(task)
+        return task.task_id
+
+    async def get_task_result(
+        self, task_id: str, offset: int = 0, length: int = RESULT_PAGE_BYTES
+    ) -> Dict[str, Any]:
+        """완료된 작업 결과를 바이트 범위 단위로 조회합니다.
+
+        Args:
+            task_id: 작업 ID
+            offset: 시작 바이트 위치 (이전 응답의 next_offset)
+            length: 최대 바이트 수 (RESULT_PAGE_BYTES로 제한)
+
+        Returns:
+            content, offset, next_offset(마지막 페이지면 None), result_size를 포함한 딕셔너리
+        """
+        task = await self._storage.get_task(task_id)
+        if not task:
+            return {"status": "not_found", "error": "Task ID not found or expired."}
+        if task.status != "completed":
+            response: Dict[str, Any] = {"status": task.status}
+            if task.error:
+                response["error"] = task.error
+            return response
+
+        length = min(max(length, _MAX_UTF8_CHAR_BYTES), RESULT_PAGE_BYTES)
+        offset = max(offset, 0)
+
+        def _read_page():
+            if task.result_path:
+                with open(task.result_path, "rb") as f:
+                    return _read_utf8_page(f, offset, length), task.result_size
+            result = task.result
+            if not isinstance(result, str):
+                result = json.dumps(result, ensure_ascii=False)
+            data = result.encode("utf-8")
+            return _read_utf8_page(io.BytesIO(data), offset, length), len(data)
+
+        try:
+            (content, start, end), size = await asyncio.to_thread(_read_page)
+        except FileNotFoundError:
+            return {"status": "not_found", "error": "Task result file not found or expired."}
+
+        return {
+            "status": "completed",
+            "content": content,
+            "offset": start,
+            "next_offset": end if end < size else None,
+            "result_size": size,
+        }
+
+    async def list_tasks(self, query: TaskQuery) -> Dict[str, Any]:
+        """조건에 맞는 작업 메타데이터를 페이지 단위로 조회합니다.
+
+        Args:
+            query: 조회 조건 (limit은 LIST_TASKS_MAX_LIMIT로 제한)
+
+        Returns:
+            tasks(최근 생성 순)와 다음 페이지 offset(마지막 페이지면 None)
+        """
+        limit = min(max(query.limit, 1), LIST_TASKS_MAX_LIMIT)
+        offset = max(query.offset, 0)
+        # 한 건 더 조회하여 다음 페이지 존재 여부 확인
+        tasks = await self._storage.list_tasks(replace(query, limit=limit + 1, offset=offset))
+        return {
+            "tasks": [task.to_summary() for task in tasks[:limit]],
+            "next_offset": offset + limit if len(tasks) > limit else None,
+        }
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """작업 저장소 현황 (계층형 저장소의 메모리 계층 적중률 등, 없으면 빈 딕셔너리)"""
+        return self._storage.get_stats()
+
     async def get_task_status(self, task_id: str, timeout: float = 0.0) -> Dict[str, Any]:
         """task_id로 작업 상태를 조회합니다.
-        
+
         Args:
             task_id: 작업 ID
             timeout: 상태가 running일 경우 대기할 최대 시간 (초). 0이면 즉시 반환.
@@ -203,8 +528,7 @@ class TaskManager:
                     # 실제 asyncio 태스크가 완료될 때까지 대기
                     # shield를 사용하여 대기 중 취소되어도 원본 태스크는 유지
                     await asyncio.wait_for(
-                        asyncio.shield(self._running_tasks[task_id]), 
-                        timeout=timeout
+                        asyncio.shield(self._running_tasks[task_id]), timeout=timeout
                     )
                     # 대기 후 상태 다시 조회
                     task = await self._storage.get_task(task_id)
@@ -221,7 +545,17 @@ class TaskManager:
         if task.status == "running":
             response["elapsed_time"] = round(task.elapsed_time, 2)
         elif task.status == "completed":
-            response["result"] = task.result
+            if task.result_path:
+                # 파일에 보관된 큰 결과는 첫 페이지만 반환 (나머지는 get_task_result)
+                page = await self.get_task_result(task_id)
+                if page["status"] != "completed":
+                    return page
+                response["result"] = page["content"]
+                response["truncated"] = True
+                response["result_size"] = page["result_size"]
+                response["next_offset"] = page["next_offset"]
+            else:
+                response["result"] = task.result
         else:  # failed
             response["error"] = task.error
 
@@ -236,9 +570,9 @@ class TaskManager:
             for task in tasks:
                 if task.status in ["completed", "failed"] and task.completed_at:
                     if now - task.completed_at > ttl:
-                        # In-memory storage에서는 직접 삭제
-                        if isinstance(self._storage, InMemoryStorage):
-                            self._storage._tasks.pop(task.task_id, None)
+                        await self._storage.delete_task(task.task_id)
+                        if task.result_path:
+                            Path(task.result_path).unlink(missing_ok=True)
 
 
 # 싱글톤 인스턴스
@@ -250,12 +584,19 @@ def get_task_manager() -> TaskManager:
     global _task_manager_instance
     if _task_manager_instance is None:
         if config.STORAGE_TYPE == "sqlite":
-            logger.info(f"Using SqliteStorage at: {config.SQLITE_DB_PATH}")
+            logger.info("Using SqliteStorage at: %s", config.SQLITE_DB_PATH)
             from .sqlite_storage import SqliteStorage
+
             storage: Storage = SqliteStorage(db_path=config.SQLITE_DB_PATH)
+        elif config.STORAGE_TYPE == "tiered":
+            logger.info("Using TieredStorage (memory + SQLite at: %s)", config.SQLITE_DB_PATH)
+            from .sqlite_storage import SqliteStorage
+            from .tiered_storage import TieredStorage
+
+            storage = TieredStorage(SqliteStorage(db_path=config.SQLITE_DB_PATH))
         else:
             logger.info("Using InMemoryStorage")
             storage = InMemoryStorage()
 
         _task_manager_instance = TaskManager(storage=storage)
-    return _task_manager_instance
\ No newline at end of file
+    return _task_manager_instance
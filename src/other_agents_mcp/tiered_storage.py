@@ -0,0 +1,153 @@
+"""Tiered Storage for Task Manager
+
+메모리(hot)와 SQLite(cold) 두 계층으로 작업을 저장하는 저장소 구현.
+- 실행 중인 작업과 최근 사용한 작업은 크기가 제한된 LRU 메모리 계층에서 처리
+- 한도를 넘으면 가장 오래 사용하지 않은 완료 작업을 SQLite 계층으로 내림
+- 내려간 작업은 조회 시 SQLite에서 읽어 다시 메모리 계층으로 올림
+- 작업 생성과 종료 상태 변경은 SQLite 계층에도 바로 기록(쓰기 대기열)하여
+  비정상 종료 후에도 recover_tasks가 실행 중이던 작업을 찾을 수 있음
+"""
+
+import os
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from .task_manager import Storage, Task, TaskQuery, sort_and_page
+from .sqlite_storage import SqliteStorage
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 메모리 계층에 보관할 최대 작업 수 (실행 중인 작업은 한도와 무관하게 유지)
+HOT_TASK_LIMIT = int(os.environ.get("MCP_HOT_TASK_LIMIT", "1000"))
+
+
+class TieredStorage(Storage):
+    """LRU 메모리 계층 + SQLite 계층 작업 저장소"""
+
+    def __init__(self, cold: SqliteStorage, capacity: int = HOT_TASK_LIMIT):
+        self._cold = cold
+        self._capacity = capacity
+        self._hot: "OrderedDict[str, Task]" = OrderedDict()
+        # SQLite 계층과 내용이 같은 메모리 작업 (내릴 때 다시 기록하지 않음)
+        self._clean: set[str] = set()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "demotions": 0, "promotions": 0}
+
+    async def create_task(
+        self, task_id: str, cli_name: Optional[str] = None, session_id: Optional[str] = None
+    ) -> Task:
+        task = Task(task_id=task_id, cli_name=cli_name, session_id=session_id)
+        # 비정상 종료 후 복구할 수 있도록 생성 시점에 SQLite 계층에도 기록
+        await self._cold.put_task(task)
+        await self._put_hot(task, clean=True)
+        return task
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        task = self._hot.get(task_id)
+        if task is not None:
+            self._stats["hits"] += 1
+            self._hot.move_to_end(task_id)
+            return task
+
+        self._stats["misses"] += 1
+        task = await self._cold.get_task(task_id)
+        if task is not None:
+            self._stats["promotions"] += 1
+            await self._put_hot(task, clean=True)
+        return task
+
+    async def update_task(self, task: Task) -> None:
+        if task.task_id not in self._hot:
+            await self._cold.update_task(task)
+        elif task.status == "running":
+            await self._put_hot(task, clean=False)
+        else:
+            # 종료 상태는 바로 SQLite 계층에도 기록 (내릴 때 다시 기록하지 않음)
+            await self._cold.put_task(task)
+            await self._put_hot(task, clean=True)
+
+    async def get_all_tasks(self) -> List[Task]:
+        cold_tasks = await self._cold.get_all_tasks()
+        return list(self._hot.values()) + [t for t in cold_tasks if t.task_id not in self._hot]
+
+    async def delete_task(self, task_id: str) -> None:
+        self._hot.pop(task_id, None)
+        self._clean.discard(task_id)
+        await self._cold.delete_task(task_id)
+
+    async def list_tasks(self, query: TaskQuery) -> List[Task]:
+        # 메모리 계층의 최신 상태가 우선 (SQLite 쪽의 이전 기록은 제외)
+        hot = [t for t in self._hot.values() if query.matches(t)]
+        cold_query = replace(query, limit=query.offset + query.limit + len(self._hot), offset=0)
+        cold = [t for t in await self._cold.list_tasks(cold_query) if t.task_id not in self._hot]
+        return sort_and_page(hot + cold, query)
+
+    async def flush(self) -> None:
+        """메모리 계층에만 있는 변경을 SQLite 계층에 기록합니다 (종료 시 호출)."""
+        for task_id, task in self._hot.items():
+            if task_id not in self._clean:
+                await self._cold.put_task(task)
+                self._clean.add(task_id)
+        await self._cold.flush()
+
+    async def close(self) -> None:
+        """메모리 계층의 변경을 기록하고 SQLite 계층을 닫습니다."""
+        await self.flush()
+        await self._cold.close()
+
+    async def recover_tasks(self) -> None:
+        await self._cold.recover_tasks()
+
+    def get_stats(self) -> dict:
+        """
+        계층별 현황과 메모리 계층 적중률
+
+        Returns:
+            hits, misses, hit_rate, demotions, promotions, hot_size, capacity
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "hot_size": len(self._hot),
+            "capacity": self._capacity,
+        }
+
+    async def _put_hot(self, task: Task, clean: bool) -> None:
+        """작업을 메모리 계층의 가장 최근 위치에 두고 한도를 넘으면 내립니다."""
+        self._hot[task.task_id] = task
+        self._hot.move_to_end(task.task_id)
+        if clean:
+            self._clean.add(task.task_id)
+        else:
+            self._clean.discard(task.task_id)
+        await self._evict()
+
+    async def _evict(self) -> None:
+        """한도를 넘는 만큼 오래된 완료 작업을 SQLite 계층으로 내립니다."""
+        overflow = len(self._hot) - self._capacity
+        if overflow <= 0:
+            return
+
+        # 실행 중인 작업은 고정 (LRU 순서로 완료 작업만 선택)
+        victims = []
+        for task_id, task in self._hot.items():
+            if task.status != "running":
+                victims.append(task)
+                if len(victims) == overflow:
+                    break
+
+        for task in victims:
+            del self._hot[task.task_id]
+            if task.task_id in self._clean:
+                self._clean.discard(task.task_id)
+            else:
+                await self._cold.put_task(task)
+            self._stats["demotions"] += 1
+
+        if len(victims) < overflow:
+            logger.debug(
+                f"실행 중인 작업이 많아 메모리 계층 한도를 초과합니다: {len(self._hot)}/{self._capacity}"
+            )
@@ -0,0 +1,275 @@
+"""Transcript Compaction
+
+회의 발언 기록 압축 단계
+- truncate: 직전 라운드 발언을 응답당 500자로 자름 (기본값)
+- keep_last_k: 최근 K 라운드 발언 유지
+- extractive: 문장 단위 추출 요약
+- summarizer: 지정된 요약 에이전트가 발언 기록을 요약
+
+모든 전략은 회의별 프롬프트 바이트 예산(transcript_budget)을 지킵니다.
+예산이 없으면 응답당 500자 제한만 적용합니다.
+"""
+
+import asyncio
+import functools
+import re
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from .meeting_schema import CompactionStrategy, MeetingConfig
+from .file_handler import execute_cli_file_based, get_cli_semaphore
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# 예산이 없을 때 응답당 최대 길이 (문자)
+DEFAULT_RESPONSE_CHARS = 500
+
+# 문장 분리 패턴 (마침표/물음표/느낌표 뒤 공백 또는 줄바꿈)
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+# 투표 태그 (추출 요약에서 제외)
+_VOTE_TAG = re.compile(r"\[(AGREE|DISAGREE|ABSTAIN|동의|찬성|반대|이의|기권)\]", re.IGNORECASE)
+
+# 주장/근거를 담은 문장에 가중치를 주는 표지어
+_KEY_MARKERS = re.compile(
+    r"때문|따라서|그러므로|제안|결론|핵심|우려|근거|반드시|because|therefore|propose|"
+    r"recommend|should|must|concern|conclusion",
+    re.IGNORECASE,
+)
+
+
+def fit_to_budget(text: str, max_bytes: int) -> str:
+    """
+    UTF-8 바이트 예산에 맞게 문자열 자르기 (멀티바이트 문자 경계 보존)
+
+    Args:
+        text: 원본 문자열
+        max_bytes: 최대 바이트 수
+
+    Returns:
+        예산 이내의 문자열
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[: max(max_bytes, 0)].decode("utf-8", errors="ignore")
+
+
+def _limit_text(text: str, max_bytes: Optional[int]) -> str:
+    """응답당 제한 적용 (예산이 없으면 기본 문자 수 제한)"""
+    if max_bytes is None:
+        return text[:DEFAULT_RESPONSE_CHARS]
+    return fit_to_budget(text, max_bytes)
+
+
+def _per_entry_budget(budget: Optional[int], entry_count: int) -> Optional[int]:
+    """전체 예산을 발언 수로 균등 분배"""
+    if budget is None or entry_count == 0:
+        return None
+    return budget // entry_count
+
+
+def _latest_rounds(transcript: list[dict], rounds: int) -> list[dict]:
+    """발언 기록에서 최근 N개 라운드의 발언만 선택"""
+    if not transcript:
+        return []
+    latest = max(entry.get("round_number", 0) for entry in transcript)
+    return [entry for entry in transcript if entry.get("round_number", 0) > latest - rounds]
+
+
+def _compacted_entry(entry: dict, response: str) -> dict:
+    """압축된 발언 항목 생성 (프롬프트 생성에 필요한 키만 유지)"""
+    compacted = {
+        "agent_name": entry.get("agent_name", "Unknown"),
+        "response": response,
+        "round_number": entry.get("round_number"),
+    }
+    if entry.get("carried_over"):
+        compacted["carried_over"] = True
+    return compacted
+
+
+class TranscriptCompactor(ABC):
+    """발언 기록 압축기의 추상 베이스 클래스 (인터페이스)"""
+
+    # 압축에 필요한 최근 라운드 수 (회의 루프는 이 범위의 기록만 보관)
+    window_rounds: int = 1
+
+    @abstractmethod
+    async def compact(self, transcript: list[dict], budget: Optional[int] = None) -> list[dict]:
+        """
+        발언 기록을 다음 라운드 프롬프트용으로 압축합니다.
+
+        Args:
+            transcript: round_number가 포함된 발언 딕셔너리 목록
+            budget: 전체 발언 섹션의 바이트 예산 (None이면 응답당 기본 제한)
+
+        Returns:
+            agent_name/response를 가진 압축된 발언 목록
+        """
+        pass
+
+
+class TruncateCompactor(TranscriptCompactor):
+    """직전 라운드 발언을 응답당 길이 제한으로 자르는 압축기 (기본값)"""
+
+    window_rounds = 1
+
+    async def compact(self, transcript: list[dict], budget: Optional[int] = None) -> list[dict]:
+        entries = _latest_rounds(transcript, self.window_rounds)
+        share = _per_entry_budget(budget, len(entries))
+        return [
+            _compacted_entry(entry, _limit_text(entry.get("response", ""), share))
+            for entry in entries
+        ]
+
+
+class KeepLastKCompactor(TranscriptCompactor):
+    """최근 K 라운드 발언을 유지하는 압축기"""
+
+    def __init__(self, keep_rounds: int = 2):
+        self.window_rounds = keep_rounds
+
+    async def compact(self, transcript: list[dict], budget: Optional[int] = None) -> list[dict]:
+        entries = _latest_rounds(transcript, self.window_rounds)
+        share = _per_entry_budget(budget, len(entries))
+        return [
+            _compacted_entry(entry, _limit_text(entry.get("response", ""), share))
+            for entry in entries
+        ]
+
+
+class ExtractiveCompactor(TranscriptCompactor):
+    """문장 단위 추출 요약 압축기
+
+    각 발언에서 첫 문장과 주장/근거 표지어가 있는 문장을 우선 선택하여
+    원래 순서대로 이어 붙입니다.
+    """
+
+    def __init__(self, keep_rounds: int = 1):
+        self.window_rounds = keep_rounds
+
+    async def compact(self, transcript: list[dict], budget: Optional[int] = None) -> list[dict]:
+        entries = _latest_rounds(transcript, self.window_rounds)
+        share = _per_entry_budget(budget, len(entries))
+        return [
+            _compacted_entry(entry, self._extract(entry.get("response", ""), share))
+            for entry in entries
+        ]
+
+    def _extract(self, text: str, max_bytes: Optional[int]) -> str:
+        """예산 안에서 점수가 높은 문장을 선택"""
+        if max_bytes is None:
+            max_bytes = len(text[:DEFAULT_RESPONSE_CHARS].encode("utf-8"))
+
+        sentences = [
+            s.strip() for s in _SENTENCE_SPLIT.split(_VOTE_TAG.sub("", text)) if s and s.strip()
+        ]
+        if not sentences:
+            return ""
+
+        def score(index: int) -> int:
+            value = 2 if index == 0 else 0
+            if _KEY_MARKERS.search(sentences[index]):
+                value += 1
+            return value
+
+        ranked = sorted(range(len(sentences)), key=lambda i: (-score(i), i))
+
+        selected: list[int] = []
+        used = 0
+        for index in ranked:
+            size = len(sentences[index].encode("utf-8")) + 1  # 구분 공백 포함
+            if used + size > max_bytes:
+                continue
+            selected.append(index)
+            used += size
+
+        if not selected:
+            # 어떤 문장도 예산에 맞지 않으면 첫 문장을 잘라서 사용
+            return fit_to_budget(sentences[0], max_bytes)
+
+        return " ".join(sentences[i] for i in sorted(selected))
+
+
+class SummarizerCompactor(TranscriptCompactor):
+    """지정된 요약 에이전트가 발언 기록을 요약하는 압축기
+
+    요약 에이전트 호출이 실패하면 TruncateCompactor로 대체합니다.
+    """
+
+    def __init__(self, agent_name: str, timeout: int = 300, keep_rounds: int = 1):
+        self.agent_name = agent_name
+        self.timeout = timeout
+        self.window_rounds = keep_rounds
+        self._fallback = TruncateCompactor()
+
+    async def compact(self, transcript: list[dict], budget: Optional[int] = None) -> list[dict]:
+        entries = _latest_rounds(transcript, self.window_rounds)
+        if not entries:
+            return []
+
+        max_bytes = budget if budget is not None else DEFAULT_RESPONSE_CHARS * len(entries)
+        prompt = self._build_prompt(entries, max_bytes)
+
+        try:
+            async with get_cli_semaphore():
+                execution_func = functools.partial(
+                    execute_cli_file_based,
+                    self.agent_name,
+                    prompt,
+                    True,  # skip_git_repo_check
+                    None,  # system_prompt
+                    [],  # args
+                    self.timeout,
+                )
+                summary = await asyncio.to_thread(execution_func)
+        except Exception as e:
+            logger.warning(f"요약 에이전트 {self.agent_name} 호출 실패, 단순 자르기로 대체: {e}")
+            return await self._fallback.compact(transcript, budget)
+
+        latest_round = max(entry.get("round_number", 0) for entry in entries)
+        return [
+            {
+                "agent_name": f"회의 요약 ({self.agent_name})",
+                "response": fit_to_budget(summary.strip(), max_bytes),
+                "round_number": latest_round,
+            }
+        ]
+
+    def _build_prompt(self, entries: list[dict], max_bytes: int) -> str:
+        """요약 요청 프롬프트 생성"""
+        lines = [
+            "다음은 다중 에이전트 회의의 발언 기록입니다.",
+            f"각 에이전트의 핵심 주장과 근거를 보존하여 {max_bytes}바이트 이내로 요약하세요.",
+            "투표 결과([AGREE], [DISAGREE], [ABSTAIN])는 언급하지 마세요.",
+            "",
+        ]
+        for entry in entries:
+            lines.append(f"- {entry.get('agent_name', 'Unknown')}: {entry.get('response', '')}")
+        return "\n".join(lines)
+
+
+def create_compactor(config: MeetingConfig) -> TranscriptCompactor:
+    """
+    회의 설정에 맞는 압축기 생성
+
+    Args:
+        config: 회의 설정
+
+    Returns:
+        TranscriptCompactor 인스턴스
+    """
+    strategy = config.compaction
+    if strategy == CompactionStrategy.KEEP_LAST_K:
+        return KeepLastKCompactor(keep_rounds=config.compaction_keep_rounds)
+    if strategy == CompactionStrategy.EXTRACTIVE:
+        return ExtractiveCompactor(keep_rounds=config.compaction_keep_rounds)
+    if strategy == CompactionStrategy.SUMMARIZER:
+        return SummarizerCompactor(
+            agent_name=config.summarizer_agent,
+            timeout=config.timeout_per_round,
+        )
+    return TruncateCompactor()
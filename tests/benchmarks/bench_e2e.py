@@ -0,0 +1,319 @@
+"""End-to-End MCP Benchmark
+
+실제 stdio MCP로 서버를 띄우고 가짜 CLI(fake_cli)를 등록하여 도구 호출의 처리량과 지연 측정
+- 시나리오: use_agent, use_agents, run_async + get_task_status 폴링, 회의
+- 동시성 단계별 requests/sec, p50/p95/p99 지연, 호출당 서버 오버헤드(지연 - CLI 지연)
+- 결과를 JSON으로 저장하고 기준선(baseline) 대비 회귀가 임계값을 넘으면 실패 (종료 코드 1)
+
+기준선은 실행 환경에 따라 달라지므로 같은 머신에서 --update-baseline으로 만든 뒤 비교합니다.
+
+실행:
+    python tests/benchmarks/bench_e2e.py [--concurrency 1,4,16] [--requests 20] [--delay 0.05]
+    python tests/benchmarks/bench_e2e.py --update-baseline
+    python tests/benchmarks/bench_e2e.py --threshold 0.2 --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from other_agents_mcp.fake_cli import fake_cli_args
+
+SCENARIOS = ("use_agent", "use_agents", "async_poll", "meeting")
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "e2e_baseline.json"
+
+# use_agents/회의에 참여하는 가짜 에이전트 수
+FAKE_AGENT_COUNT = 3
+
+# 회의 상태 폴링 간격 (초)
+MEETING_POLL_INTERVAL = 0.02
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(latencies: list[float], wall: float, concurrency: int, cli_seconds: float) -> dict:
+    """
+    지연 목록을 통계로 요약 (시간 단위: 밀리초)
+
+    Args:
+        latencies: 요청별 지연 (초)
+        wall: 전체 실행 시간 (초)
+        concurrency: 동시 요청 수
+        cli_seconds: 요청 하나가 CLI에서 보내는 최소 시간 (오버헤드 계산 기준)
+
+    Returns:
+        requests, concurrency, rps, p50/p95/p99/mean (ms), overhead_p50_ms
+    """
+    ms = [latency * 1000 for latency in latencies]
+    p50 = percentile(ms, 50)
+    return {
+        "requests": len(ms),
+        "concurrency": concurrency,
+        "rps": round(len(ms) / wall, 2) if wall > 0 else 0.0,
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "mean_ms": round(sum(ms) / len(ms), 2) if ms else 0.0,
+        "overhead_p50_ms": round(max(p50 - cli_seconds * 1000, 0.0), 2),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    기준선 대비 회귀 항목 찾기
+
+    Args:
+        current: 이번 실행 결과 (results 딕셔너리)
+        baseline: 기준선 결과 (results 딕셔너리)
+        threshold: 허용 비율 (0.2면 p95 20% 증가 또는 rps 20% 감소까지 허용)
+
+    Returns:
+        회귀 설명 목록 (비어 있으면 통과)
+    """
+    regressions = []
+    for key, stats in current.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if base["p95_ms"] > 0 and stats["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{key}: p95 {base['p95_ms']}ms -> {stats['p95_ms']}ms")
+        if base["rps"] > 0 and stats["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{key}: rps {base['rps']} -> {stats['rps']}")
+    return regressions
+
+
+def _tool_result(result) -> dict:
+    """도구 응답의 JSON 본문을 딕셔너리로 변환합니다."""
+    if result.isError:
+        raise RuntimeError(result.content[0].text if result.content else "tool error")
+    return json.loads(result.content[0].text)
+
+
+async def _call(session: ClientSession, name: str, arguments: dict) -> dict:
+    response = _tool_result(await session.call_tool(name, arguments))
+    if "error" in response:
+        raise RuntimeError(f"{name}: {response['error']}")
+    return response
+
+
+async def _run_request(
+    session: ClientSession, scenario: str, agents: list[str], index: int
+) -> None:
+    """시나리오별 논리 요청 하나를 끝까지 실행합니다."""
+    message = f"benchmark request {index}"
+
+    if scenario == "use_agent":
+        await _call(session, "use_agent", {"cli_name": agents[0], "message": message})
+
+    elif scenario == "use_agents":
+        await _call(session, "use_agents", {"cli_names": agents, "message": message})
+
+    elif scenario == "async_poll":
+        started = await _call(
+            session, "use_agent", {"cli_name": agents[0], "message": message, "run_async": True}
+        )
+        status = {"status": "running"}
+        while status["status"] == "running":
+            status = await _call(
+                session, "get_task_status", {"task_id": started["task_id"], "timeout": 5}
+            )
+
+    elif scenario == "meeting":
+        started = await _call(
+            session,
+            "start_meeting",
+            {"topic": message, "agents": agents, "max_rounds": 1},
+        )
+        status = {"status": started["status"]}
+        while status["status"] in ("waiting", "running"):
+            await asyncio.sleep(MEETING_POLL_INTERVAL)
+            status = await _call(
+                session, "get_meeting_status", {"meeting_id": started["meeting_id"]}
+            )
+
+    else:
+        raise ValueError(f"알 수 없는 시나리오: {scenario}")
+
+
+async def run_scenario(
+    session: ClientSession,
+    scenario: str,
+    agents: list[str],
+    concurrency: int,
+    requests: int,
+    cli_seconds: float,
+) -> dict:
+    """
+    동시성 concurrency로 requests개 요청을 실행하고 통계를 반환
+
+    Args:
+        session: 초기화된 MCP 클라이언트 세션
+        scenario: SCENARIOS 중 하나
+        agents: 등록된 가짜 CLI 이름 목록
+        concurrency: 동시에 진행할 요청 수
+        requests: 전체 요청 수
+        cli_seconds: 요청 하나의 최소 CLI 시간 (초)
+
+    Returns:
+        summarize 결과
+    """
+    latencies: list[float] = []
+    next_index = iter(range(requests))
+
+    async def worker():
+        for index in next_index:
+            started = time.perf_counter()
+            await _run_request(session, scenario, agents, index)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, concurrency, cli_seconds)
+
+
+async def run_benchmark(
+    scenarios: tuple[str, ...] = SCENARIOS,
+    concurrency_levels: tuple[int, ...] = (1, 4, 16),
+    requests: int = 20,
+    delay: float = 0.05,
+) -> dict:
+    """
+    서버를 stdio로 실행하고 시나리오 x 동시성 조합을 측정
+
+    Args:
+        scenarios: 측정할 시나리오
+        concurrency_levels: 동시성 단계
+        requests: 조합별 요청 수
+        delay: 가짜 CLI 시작 지연 (초)
+
+    Returns:
+        {"meta": 실행 환경, "results": {"<시나리오>@c<동시성>": 통계}}
+    """
+    with tempfile.TemporaryDirectory(prefix="other_agents_bench_") as data_dir:
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=["-m", "other_agents_mcp.server"],
+            env={
+                "MCP_STORAGE_TYPE": "memory",
+                "MCP_RESULT_DIR": os.path.join(data_dir, "results"),
+                "MCP_MEETING_TRANSCRIPT_DIR": os.path.join(data_dir, "meetings"),
+            },
+        )
+        with open(os.devnull, "w") as errlog:
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+
+                    agents = [f"bench-fake-{i}" for i in range(FAKE_AGENT_COUNT)]
+                    for name in agents:
+                        await _call(
+                            session,
+                            "add_agent",
+                            {
+                                "name": name,
+                                "command": sys.executable,
+                                "extra_args": fake_cli_args(delay=delay, vote="agree"),
+                                "timeout": 60,
+                            },
+                        )
+
+                    results = {}
+                    for scenario in scenarios:
+                        for concurrency in concurrency_levels:
+                            results[f"{scenario}@c{concurrency}"] = await run_scenario(
+                                session, scenario, agents, concurrency, requests, delay
+                            )
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": requests,
+            "delay": delay,
+        },
+        "results": results,
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"{'case':<20}{'rps':>9}{'p50 (ms)':>11}{'p95 (ms)':>11}"
+        f"{'p99 (ms)':>11}{'overhead (ms)':>15}"
+    )
+    for key, stats in report["results"].items():
+        print(
+            f"{key:<20}{stats['rps']:>9.1f}{stats['p50_ms']:>11.1f}{stats['p95_ms']:>11.1f}"
+            f"{stats['p99_ms']:>11.1f}{stats['overhead_p50_ms']:>15.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 서버 E2E 처리량/지연 벤치마크")
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="측정할 시나리오 (쉼표 구분)"
+    )
+    parser.add_argument("--concurrency", default="1,4,16", help="동시성 단계 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=20, help="조합별 요청 수")
+    parser.add_argument("--delay", type=float, default=0.05, help="가짜 CLI 시작 지연 (초)")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="이번 결과를 기준선으로 저장"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 회귀 비율 (기본값: 0.2)")
+    args = parser.parse_args()
+
+    scenarios = tuple(s for s in args.scenarios.split(",") if s)
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+    levels = tuple(int(c) for c in args.concurrency.split(",") if c)
+
+    report = asyncio.run(run_benchmark(scenarios, levels, args.requests, args.delay))
+    _print_report(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n기준선 저장: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\n기준선 없음 ({args.baseline}) - --update-baseline으로 생성하세요")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(report["results"], baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n회귀 감지 (허용 {args.threshold:.0%}):")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print(f"\n기준선 대비 회귀 없음 (허용 {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""File Handler Overhead Benchmark
+
+모델 지연과 무관한 요청당 서버 측 비용을 file_handler 단계별로 측정
+- 레지스트리 병합, 캐시된 실행 계획 조회, is_cli_installed, 인자/환경 변수 검증, os.environ.copy, YAML 작성,
+  임시 파일 생성/삭제, 출력 읽기, 아무것도 하지 않는 CLI(true) 실행
+- 실행할 때마다 결과를 history JSONL에 추가하고 직전 기록과 비교하여 변화율 출력
+
+실행:
+    python tests/benchmarks/bench_file_handler.py [--number N] [--repeat R]
+    python tests/benchmarks/bench_file_handler.py --no-record
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import yaml
+
+from other_agents_mcp.cli_manager import is_cli_installed
+from other_agents_mcp.cli_registry import get_cli_registry
+from other_agents_mcp.file_handler import (
+    _cleanup_temp_files,
+    _read_output,
+    _validate_and_filter_args,
+    execute_cli_file_based,
+    get_execution_plan,
+    get_temp_dir,
+    validate_env_vars,
+)
+
+DEFAULT_HISTORY = Path(__file__).parent / "history" / "file_handler.jsonl"
+
+# 측정에 사용하는 아무것도 하지 않는 CLI
+NOOP_CLI = "bench-noop"
+NOOP_COMMAND = "true"
+
+MESSAGE = "캐시 계층 도입에 대한 의견을 주세요. " * 20
+SYSTEM_PROMPT = "당신은 소프트웨어 아키텍트입니다. " * 10
+ARGS = ["--model", "sonnet", "--unsupported", "x", "--verbose"]
+
+# 출력 읽기 측정용 응답 크기 (바이트)
+OUTPUT_BYTES = 16 * 1024
+
+
+def _create_and_remove_temp_files() -> None:
+    """execute_cli_file_based와 같은 방식으로 입력/출력 임시 파일을 만들고 지웁니다."""
+    input_fd, input_path = tempfile.mkstemp(
+        suffix=".txt", prefix="other_agents_mcp_input_", dir=get_temp_dir(), text=True
+    )
+    output_fd, output_path = tempfile.mkstemp(
+        suffix=".txt", prefix="other_agents_mcp_output_", dir=get_temp_dir(), text=True
+    )
+    with os.fdopen(input_fd, "w") as f:
+        f.write(MESSAGE)
+    os.close(output_fd)
+    _cleanup_temp_files(input_path, output_path)
+
+
+def build_steps(output_path: str) -> list[tuple[str, Callable[[], object], bool]]:
+    """
+    측정 단계 목록 생성
+
+    Args:
+        output_path: 출력 읽기 단계에서 사용할 파일 경로
+
+    Returns:
+        (이름, 호출 함수, 프로세스 실행 여부) 목록 - 프로세스를 실행하는 단계는 반복 횟수를 줄임
+    """
+    registry = get_cli_registry()
+    config = registry.get_all_clis()[NOOP_CLI]
+    env_vars = config["env_vars"]
+
+    def dump_yaml():
+        yaml.dump(
+            {"system_prompt": SYSTEM_PROMPT, "prompt": MESSAGE},
+            io.StringIO(),
+            default_flow_style=False,
+            allow_unicode=True,
+        )
+
+    def spawn_noop():
+        with open(os.devnull, "r") as stdin:
+            subprocess.run(
+                [NOOP_COMMAND],
+                stdin=stdin,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+    return [
+        ("registry.get_all_clis", registry.get_all_clis, False),
+        ("get_execution_plan (cached)", lambda: get_execution_plan(NOOP_CLI), False),
+        ("is_cli_installed", lambda: is_cli_installed(NOOP_COMMAND), False),
+        (
+            "_validate_and_filter_args",
+            lambda: _validate_and_filter_args(NOOP_CLI, ARGS, config),
+            False,
+        ),
+        ("validate_env_vars", lambda: validate_env_vars(env_vars), False),
+        ("os.environ.copy", os.environ.copy, False),
+        ("yaml.dump (system prompt)", dump_yaml, False),
+        ("temp files create/unlink", _create_and_remove_temp_files, False),
+        (f"_read_output ({OUTPUT_BYTES // 1024}KB)", lambda: _read_output(output_path), False),
+        ("subprocess.run (no-op)", spawn_noop, True),
+        (
+            "execute_cli_file_based (no-op)",
+            lambda: execute_cli_file_based(
+                NOOP_CLI, MESSAGE, system_prompt=SYSTEM_PROMPT, args=ARGS
+            ),
+            True,
+        ),
+    ]
+
+
+def run(number: int, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    단계별 호출당 시간(마이크로초) 측정
+
+    Args:
+        number: 측정 1회당 호출 횟수 (프로세스 실행 단계는 1/10)
+        repeat: 측정 반복 횟수
+
+    Returns:
+        {단계 이름: {"best_us": 최솟값, "median_us": 중앙값}}
+    """
+    get_cli_registry().add_cli(
+        name=NOOP_CLI,
+        command=NOOP_COMMAND,
+        env_vars={"OPENAI_MODEL": "bench", "HTTP_PROXY": ""},
+        supported_args=["--model", "--verbose"],
+    )
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        f.write("x" * OUTPUT_BYTES)
+        output_path = f.name
+
+    try:
+        results = {}
+        for name, func, spawns in build_steps(output_path):
+            calls = max(number // 10, 1) if spawns else number
+            timings = [t / calls * 1e6 for t in timeit.repeat(func, number=calls, repeat=repeat)]
+            results[name] = {
+                "best_us": round(min(timings), 2),
+                "median_us": round(statistics.median(timings), 2),
+            }
+        return results
+    finally:
+        os.remove(output_path)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_last_entry(history: Path) -> Optional[dict]:
+    """history JSONL의 마지막 기록을 반환합니다 (없으면 None)."""
+    if not history.exists():
+        return None
+    lines = [line for line in history.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def append_entry(history: Path, results: dict) -> dict:
+    """
+    측정 결과를 history JSONL에 한 줄로 추가
+
+    Args:
+        history: 기록 파일 경로
+        results: run 결과
+
+    Returns:
+        기록한 항목
+    """
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="file_handler 단계별 오버헤드 벤치마크")
+    parser.add_argument("--number", type=int, default=1000, help="측정 1회당 호출 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="기록 JSONL 경로")
+    parser.add_argument("--no-record", action="store_true", help="결과를 기록하지 않음")
+    args = parser.parse_args()
+
+    # 지원하지 않는 인자 경고 로그가 측정 출력에 섞이지 않도록 함
+    logging.disable(logging.WARNING)
+
+    previous = load_last_entry(args.history)
+    results = run(args.number, args.repeat)
+
+    print(f"{'step':<34}{'best (us)':>12}{'median (us)':>14}{'vs last':>10}")
+    for name, stats in results.items():
+        change = ""
+        if previous and name in previous["results"]:
+            before = previous["results"][name]["best_us"]
+            if before > 0:
+                change = f"{(stats['best_us'] - before) / before:+.0%}"
+        print(f"{name:<34}{stats['best_us']:>12.1f}{stats['median_us']:>14.1f}{change:>10}")
+
+    if previous:
+        print(f"\n비교 기준: {previous['timestamp']} ({previous.get('revision') or 'unknown'})")
+    if not args.no_record:
+        append_entry(args.history, results)
+        print(f"기록: {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Startup Benchmark
+
+IDE 창마다 stdio 서버를 새로 띄우는 환경에서 서버 시작 비용을 측정
+- import 시간: python -X importtime으로 서버 모듈 전체와 이 패키지 모듈의 import 시간
+- 지연 import 확인: 첫 사용 시 불러오도록 한 모듈(yaml, 회의/프로파일링/프롬프트 캐시 모듈)이 시작 시 로드되지 않는지
+- 첫 응답: 프로세스 실행부터 initialize 완료, 첫 list_tools, 두 번째 list_tools(캐시) 응답까지
+
+실행:
+    python tests/benchmarks/bench_startup.py [--runs 5] [--output report.json]
+    python tests/benchmarks/bench_startup.py --budget-ms 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_MODULE = "other_agents_mcp.server"
+
+PACKAGE = "other_agents_mcp"
+
+# 서버 시작 시 로드되면 안 되는 모듈 (첫 사용 시 import)
+DEFERRED_MODULES = (
+    "yaml",
+    "other_agents_mcp.meeting_orchestrator",
+    "other_agents_mcp.consensus",
+    "other_agents_mcp.transcript_compaction",
+    "other_agents_mcp.meeting_scheduler",
+    "other_agents_mcp.meeting_api",
+    "other_agents_mcp.meeting_store",
+    "other_agents_mcp.meeting_schema",
+    "other_agents_mcp.meeting_transcript",
+    "other_agents_mcp.profiling",
+    "other_agents_mcp.prompt_cache",
+)
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """
+    python -X importtime 출력 파싱
+
+    Args:
+        output: stderr 출력 ("import time: self | cumulative | module" 형식 줄)
+
+    Returns:
+        [{"module", "self_us", "cumulative_us"}] (import 완료 순서)
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # 헤더 줄 ("self [us] | cumulative | imported package")
+            continue
+        entries.append(
+            {
+                "module": fields[2].strip(),
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return entries
+
+
+def measure_imports(module: str = SERVER_MODULE, top: int = 10) -> dict:
+    """
+    새 프로세스에서 모듈 import 시간 측정
+
+    Args:
+        module: import할 모듈
+        top: 보고할 패키지 모듈 수 (자체 시간 순)
+
+    Returns:
+        total_ms(모듈 전체), package_ms(이 패키지 모듈 자체 시간 합), package_top, deferred_loaded
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {module}; "
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = parse_importtime(result.stderr)
+    total = next(e["cumulative_us"] for e in entries if e["module"] == module)
+    own = sorted(
+        (e for e in entries if e["module"].split(".")[0] == PACKAGE),
+        key=lambda e: e["self_us"],
+        reverse=True,
+    )
+    return {
+        "total_ms": round(total / 1000, 2),
+        "package_ms": round(sum(e["self_us"] for e in own) / 1000, 2),
+        "package_top": [
+            {"module": e["module"], "self_ms": round(e["self_us"] / 1000, 2)} for e in own[:top]
+        ],
+        "deferred_loaded": [m for m in result.stdout.strip().split(",") if m],
+    }
+
+
+async def measure_first_response() -> dict:
+    """
+    stdio 서버를 실행하여 첫 응답까지의 시간 측정 (밀리초)
+
+    Returns:
+        initialize_ms, first_list_tools_ms, cached_list_tools_ms, tools
+    """
+    with tempfile.TemporaryDirectory(prefix="other_agents_startup_") as data_dir:
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=["-m", SERVER_MODULE],
+            env={
+                "MCP_STORAGE_TYPE": "memory",
+                "MCP_RESULT_DIR": os.path.join(data_dir, "results"),
+                "MCP_MEETING_TRANSCRIPT_DIR": os.path.join(data_dir, "meetings"),
+            },
+        )
+        started = time.perf_counter()
+        with open(os.devnull, "w") as errlog:
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    initialized = time.perf_counter()
+                    tools = await session.list_tools()
+                    listed = time.perf_counter()
+                    await session.list_tools()
+                    cached = time.perf_counter() - listed
+
+    return {
+        "initialize_ms": round((initialized - started) * 1000, 2),
+        "first_list_tools_ms": round((listed - initialized) * 1000, 2),
+        "cached_list_tools_ms": round(cached * 1000, 2),
+        "tools": len(tools.tools),
+    }
+
+
+def run(runs: int = 5) -> dict:
+    """
+    import 시간과 첫 응답 시간을 runs회 측정하여 중앙값 보고
+
+    Args:
+        runs: 측정 반복 횟수 (매번 새 프로세스)
+
+    Returns:
+        {"meta": 실행 환경, "imports": 중앙값 측정 결과, "first_response": 중앙값 측정 결과}
+    """
+    imports = [measure_imports() for _ in range(runs)]
+    responses = [asyncio.run(measure_first_response()) for _ in range(runs)]
+
+    def median(samples: list[dict], key: str) -> float:
+        return round(statistics.median(sample[key] for sample in samples), 2)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs,
+        },
+        "imports": {
+            "total_ms": median(imports, "total_ms"),
+            "package_ms": median(imports, "package_ms"),
+            "package_top": imports[-1]["package_top"],
+            "deferred_loaded": sorted({m for sample in imports for m in sample["deferred_loaded"]}),
+        },
+        "first_response": {
+            key: median(responses, key)
+            for key in ("initialize_ms", "first_list_tools_ms", "cached_list_tools_ms")
+        },
+    }
+
+
+def _print_report(report: dict) -> None:
+    imports = report["imports"]
+    print(f"import {SERVER_MODULE}: {imports['total_ms']:.1f} ms")
+    print(f"  {PACKAGE} 모듈 자체 시간: {imports['package_ms']:.1f} ms")
+    for entry in imports["package_top"]:
+        print(f"    {entry['module']:<45}{entry['self_ms']:>8.2f} ms")
+    for key, value in report["first_response"].items():
+        print(f"{key:<24}{value:>10.1f} ms")
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="MCP 서버 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="패키지 모듈 import 시간 상한 (초과하면 종료 코드 1)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.runs)
+    _print_report(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    failures = []
+    if report["imports"]["deferred_loaded"]:
+        failures.append(
+            f"시작 시 로드된 지연 모듈: {', '.join(report['imports']['deferred_loaded'])}"
+        )
+    if args.budget_ms is not None and report["imports"]["package_ms"] > args.budget_ms:
+        failures.append(
+            f"패키지 import 시간 {report['imports']['package_ms']:.1f} ms > 상한 {args.budget_ms} ms"
+        )
+    if failures:
+        for line in failures:
+            print(f"\n실패: {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Vote Parser Benchmark
+
+기존 패턴 순회 방식과 결합 정규식 방식의 투표 파싱 성능 비교
+
+실행:
+    python tests/benchmarks/bench_vote_parser.py [--repeat N]
+"""
+
+import argparse
+import logging
+import re
+import timeit
+
+from other_agents_mcp.consensus import VOTE_PATTERNS, parse_vote_from_response
+from other_agents_mcp.meeting_schema import VoteType
+
+
+def legacy_parse_vote_from_response(response: str) -> VoteType:
+    """패턴마다 re.search로 전체 응답을 훑던 기존 구현 (비교 기준)"""
+    for vote_type, patterns in VOTE_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, response, re.IGNORECASE):
+                return vote_type
+    return VoteType.ABSTAIN
+
+
+def _filler(size: int) -> str:
+    sentence = "캐시 계층 도입은 응답 지연을 줄이지만 무효화 전략이 필요합니다. "
+    return (sentence * (size // len(sentence) + 1))[:size]
+
+
+# (이름, 응답) - 투표 태그가 끝에 있는 일반 응답, 태그가 없는 응답, 기권 응답
+CASES = [
+    (f"{size // 1000}KB tail [AGREE]", _filler(size) + "\n\n[AGREE]")
+    for size in (1_000, 10_000, 100_000)
+] + [
+    ("10KB no tag", _filler(10_000)),
+    ("10KB tail [ABSTAIN]", _filler(10_000) + "\n\n[ABSTAIN]"),
+]
+
+
+def run(repeat: int) -> list[tuple[str, float, float]]:
+    """각 케이스의 호출당 평균 시간(마이크로초) 측정"""
+    results = []
+    for name, response in CASES:
+        legacy = timeit.timeit(lambda: legacy_parse_vote_from_response(response), number=repeat)
+        current = timeit.timeit(lambda: parse_vote_from_response(response), number=repeat)
+        results.append((name, legacy / repeat * 1e6, current / repeat * 1e6))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="투표 파서 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="케이스별 반복 횟수")
+    args = parser.parse_args()
+
+    # 패턴 미발견 경고 로그가 측정에 섞이지 않도록 함
+    logging.disable(logging.WARNING)
+
+    print(f"{'case':<22}{'legacy (us)':>14}{'combined (us)':>16}{'speedup':>10}")
+    for name, legacy_us, current_us in run(args.repeat):
+        print(f"{name:<22}{legacy_us:>14.1f}{current_us:>16.1f}{legacy_us / current_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Tests for the E2E MCP benchmark (통계/회귀 판정, stdio 스모크 실행)
+"""
+
+import pytest
+
+from tests.benchmarks.bench_e2e import SCENARIOS, compare, percentile, run_benchmark, summarize
+
+
+def test_percentile_nearest_rank():
+    """최근접 순위 백분위수"""
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_reports_overhead():
+    """CLI 지연을 뺀 오버헤드와 처리량 계산"""
+    stats = summarize([0.1, 0.12, 0.2, 0.11], wall=0.5, concurrency=2, cli_seconds=0.1)
+
+    assert stats["requests"] == 4
+    assert stats["rps"] == 8.0
+    assert stats["p50_ms"] == 110.0
+    assert stats["p99_ms"] == 200.0
+    assert stats["overhead_p50_ms"] == 10.0
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """p95 증가/rps 감소가 임계값을 넘을 때만 회귀"""
+    baseline = {"use_agent@c1": {"p95_ms": 100.0, "rps": 10.0}}
+
+    assert compare({"use_agent@c1": {"p95_ms": 115.0, "rps": 9.0}}, baseline, 0.2) == []
+    assert len(compare({"use_agent@c1": {"p95_ms": 130.0, "rps": 7.0}}, baseline, 0.2)) == 2
+    # 기준선에 없는 조합은 비교하지 않음
+    assert compare({"meeting@c4": {"p95_ms": 999.0, "rps": 0.1}}, baseline, 0.2) == []
+
+
+@pytest.mark.slow
+async def test_benchmark_smoke():
+    """실제 stdio 서버로 모든 시나리오를 짧게 실행"""
+    report = await run_benchmark(concurrency_levels=(1, 2), requests=2, delay=0.0)
+
+    assert set(report["results"]) == {f"{s}@c{c}" for s in SCENARIOS for c in (1, 2)}
+    for stats in report["results"].values():
+        assert stats["requests"] == 2
+        assert stats["rps"] > 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
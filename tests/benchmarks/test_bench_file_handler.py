@@ -0,0 +1,27 @@
+"""
+Tests for the file_handler overhead benchmark (단계 측정, 기록 파일)
+"""
+
+from tests.benchmarks.bench_file_handler import append_entry, load_last_entry, run
+
+
+def test_run_measures_every_step(reset_cli_registry, instance_temp_dir, clear_execution_plans):
+    """모든 단계가 양수 시간으로 측정됨"""
+    results = run(number=2, repeat=1)
+
+    assert "execute_cli_file_based (no-op)" in results
+    assert "yaml.dump (system prompt)" in results
+    for stats in results.values():
+        assert 0 < stats["best_us"] <= stats["median_us"]
+
+
+def test_history_appends_and_loads_last_entry(tmp_path):
+    """기록은 한 줄씩 추가되고 마지막 기록을 비교 기준으로 사용"""
+    history = tmp_path / "history" / "file_handler.jsonl"
+    assert load_last_entry(history) is None
+
+    append_entry(history, {"step": {"best_us": 1.0, "median_us": 1.0}})
+    append_entry(history, {"step": {"best_us": 2.0, "median_us": 2.0}})
+
+    assert len(history.read_text(encoding="utf-8").splitlines()) == 2
+    assert load_last_entry(history)["results"]["step"]["best_us"] == 2.0
@@ -0,0 +1,52 @@
+"""
+Tests for the startup benchmark (importtime 파싱, 지연 import, stdio 첫 응답)
+"""
+
+import pytest
+
+from tests.benchmarks.bench_startup import (
+    DEFERRED_MODULES,
+    measure_first_response,
+    measure_imports,
+    parse_importtime,
+)
+
+
+def test_parse_importtime_skips_header():
+    """헤더 줄은 건너뛰고 들여쓰기된 모듈 이름을 정리"""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   other_agents_mcp.config\n"
+        "import time:      3000 |       4500 | other_agents_mcp.server\n"
+        "unrelated line\n"
+    )
+
+    assert parse_importtime(output) == [
+        {"module": "other_agents_mcp.config", "self_us": 120, "cumulative_us": 120},
+        {"module": "other_agents_mcp.server", "self_us": 3000, "cumulative_us": 4500},
+    ]
+
+
+def test_server_import_defers_heavy_modules():
+    """서버 import 시 yaml, 회의 저장소/스키마, 프로파일링, 프롬프트 캐시 모듈은 로드되지 않음"""
+    assert {
+        "other_agents_mcp.meeting_store",
+        "other_agents_mcp.meeting_schema",
+        "other_agents_mcp.profiling",
+        "other_agents_mcp.prompt_cache",
+    } <= set(DEFERRED_MODULES)
+
+    result = measure_imports()
+
+    assert result["deferred_loaded"] == []
+    assert 0 < result["package_ms"] < result["total_ms"]
+
+
+@pytest.mark.slow
+async def test_first_response_smoke():
+    """실제 stdio 서버의 initialize/list_tools 시간 측정"""
+    result = await measure_first_response()
+
+    assert result["tools"] == 11
+    assert result["initialize_ms"] > 0
+    assert result["first_list_tools_ms"] > 0
@@ -57,3 +57,89 @@ async def task_manager_fixture():
     await manager.stop()
     # 싱글톤 인스턴스 초기화
     TaskManager._task_manager_instance = None
+
+
+@pytest.fixture
+def meeting_transcript_dir(tmp_path, monkeypatch):
+    """회의 발언 기록(JSONL) 폴더를 테스트별 임시 폴더로 바꿉니다.
+
+    회의 루프나 MeetingTranscript로 발언을 기록하는 테스트가 요청합니다.
+    기록 파일 이름은 회의 ID로 정해지므로 폴더를 공유하면 이전 테스트의 발언이 섞일 수 있습니다.
+    """
+    from other_agents_mcp import config
+
+    transcript_dir = tmp_path / "meetings"
+    monkeypatch.setattr(config, "MEETING_TRANSCRIPT_DIR", transcript_dir)
+    return transcript_dir
+
+
+@pytest.fixture
+def result_spill_dir(tmp_path, monkeypatch):
+    """큰 작업 결과를 보관하는 폴더를 테스트별 임시 폴더로 바꿉니다.
+
+    MCP_RESULT_SPILL_BYTES를 넘는 결과를 만드는 테스트가 요청하며,
+    반환된 경로로 결과 파일이 만들어지고 정리되었는지 확인할 수 있습니다.
+    """
+    from other_agents_mcp import config
+
+    spill_dir = tmp_path / "results"
+    monkeypatch.setattr(config, "RESULT_SPILL_DIR", spill_dir)
+    return spill_dir
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    """프로파일(.pstats)과 메모리 스냅샷 저장 폴더를 테스트별 임시 폴더로 바꿉니다.
+
+    profile 인자나 memory_snapshot 도구로 파일을 남기는 테스트가 저장 경로를 검사할 때 요청합니다.
+    """
+    from other_agents_mcp import config
+
+    directory = tmp_path / "profiles"
+    monkeypatch.setattr(config, "PROFILE_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def instance_temp_dir(tmp_path, monkeypatch):
+    """CLI 입출력 임시 파일의 인스턴스 폴더를 테스트마다 새로 만들고 테스트 후 삭제합니다.
+
+    CLI를 실행하거나 file_handler 임시 파일 경로를 다루는 테스트가 요청합니다.
+    인스턴스 폴더와 잠금 fd는 프로세스 전역 상태라 초기화하지 않으면 이전 테스트의 폴더를 재사용합니다.
+    """
+    from other_agents_mcp import file_handler
+
+    root = tmp_path / "tmp"
+    monkeypatch.setattr(file_handler, "TEMP_ROOT", str(root))
+    monkeypatch.setattr(file_handler, "_instance_temp_dir", None)
+    monkeypatch.setattr(file_handler, "_instance_lock_fd", None)
+    # os.path.exists 등을 모킹하는 테스트에서도 동작하도록 미리 생성
+    file_handler.get_temp_dir()
+    yield root
+    file_handler.remove_temp_dir()
+
+
+@pytest.fixture
+def clear_execution_plans():
+    """CLI 실행 계획 캐시를 테스트 전후로 비웁니다.
+
+    실행 계획은 레지스트리 버전이 같으면 재사용되므로, is_cli_installed나 PATH를
+    테스트마다 다르게 모킹하며 CLI를 실행하는 모듈이 이전 테스트의 실행 파일 경로를 받지 않도록 요청합니다.
+    """
+    from other_agents_mcp import file_handler
+
+    file_handler.clear_execution_plans()
+    yield
+    file_handler.clear_execution_plans()
+
+
+@pytest.fixture
+def reset_prompt_cache(monkeypatch):
+    """프롬프트 캐시 싱글톤을 테스트마다 새로 만듭니다.
+
+    등록 여부(cached)나 치환/직렬화 적중 수를 검사하는 테스트가 요청합니다.
+    다른 테스트가 남긴 템플릿과 통계가 있으면 결과가 실행 순서에 따라 달라집니다.
+    """
+    from other_agents_mcp import prompt_cache
+
+    monkeypatch.setattr(prompt_cache, "_prompt_cache_instance", None)
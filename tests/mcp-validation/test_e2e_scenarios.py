@@ -19,7 +19,9 @@ class TestE2EBasicWorkflow:
         # Step 1: 도구 목록 조회
         tools = await list_tools()
 
-        assert len(tools) == 7  # 기존 5개 + start_meeting, get_meeting_status
+        assert (
+            len(tools) == 11
+        )  # 기존 5개 + start_meeting, get_meeting_status, get_task_result, list_tasks, memory_snapshot, register_prompt
         tool_names = {tool.name for tool in tools}
         assert "list_agents" in tool_names
         assert "use_agent" in tool_names
@@ -298,7 +300,9 @@ class TestE2EIntegration:
         """시나리오: 전체 사용자 여정"""
         # 1. 사용 가능한 도구 확인
         tools = await list_tools()
-        assert len(tools) == 7  # 기존 5개 + start_meeting, get_meeting_status
+        assert (
+            len(tools) == 11
+        )  # 기존 5개 + start_meeting, get_meeting_status, get_task_result, list_tasks, memory_snapshot, register_prompt
 
         # 2. CLI 목록 조회
         clis_result = await call_tool("list_agents", {})
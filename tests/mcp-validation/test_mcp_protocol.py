@@ -31,9 +31,9 @@ class TestListToolsHandler:
 
     @pytest.mark.asyncio
     async def test_list_tools_count(self):
-        """도구가 7개인지 확인 (list_agents, use_agent, use_agents, get_task_status, add_agent, start_meeting, get_meeting_status)"""
+        """도구가 11개인지 확인 (list_agents, use_agent, use_agents, get_task_status, get_task_result, list_tasks, add_agent, register_prompt, start_meeting, get_meeting_status, memory_snapshot)"""
         tools = await list_tools()
-        assert len(tools) == 7
+        assert len(tools) == 11
 
     @pytest.mark.asyncio
     async def test_list_tools_schema_structure(self):
@@ -24,6 +24,8 @@ from other_agents_mcp.file_handler import (
     CLITimeoutError,
 )
 
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
 
 class TestListAvailableCLIs:
     """list_available_clis 도구 기능 테스트"""
@@ -9,6 +9,8 @@ import pytest
 from other_agents_mcp.server import call_tool
 from other_agents_mcp.task_manager import get_task_manager, InMemoryStorage
 
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
 
 @pytest.fixture(autouse=True)
 def reset_task_manager():
@@ -0,0 +1,142 @@
+"""
+Tests for per-CLI execution plans (레지스트리 버전별 실행 계획 캐시)
+"""
+
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from other_agents_mcp import cli_registry, file_handler
+from other_agents_mcp.file_handler import (
+    CLINotFoundError,
+    execute_cli_file_based,
+    get_execution_plan,
+)
+
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
+
+@pytest.fixture
+def custom_clis_path(tmp_path, monkeypatch):
+    """custom_clis.json 경로를 임시 파일로 바꾸고 파일 변경을 바로 확인하도록 합니다."""
+    path = tmp_path / "custom_clis.json"
+    monkeypatch.setattr(cli_registry, "CUSTOM_CLIS_PATH", path)
+    monkeypatch.setattr(cli_registry, "CUSTOM_CLIS_CHECK_INTERVAL", 0)
+    return path
+
+
+def test_plan_is_precomputed_and_reused(reset_cli_registry, custom_clis_path):
+    """설정에서 파생한 값은 한 번만 계산하고 같은 레지스트리 버전에서는 재사용"""
+    registry = file_handler.get_cli_registry()
+    registry.add_cli(
+        name="plan-cli",
+        command="cat",
+        extra_args=["-"],
+        env_vars={"OPENAI_MODEL": "test", "PATH": "/blocked"},
+        supports_skip_git_check=True,
+        skip_git_check_position="after_extra_args",
+        supported_args=["--model"],
+    )
+
+    with patch.object(registry, "get_all_clis", wraps=registry.get_all_clis) as get_all:
+        plan = get_execution_plan("plan-cli")
+        assert get_execution_plan("plan-cli") is plan
+        assert get_all.call_count == 1
+
+    assert plan.executable == shutil.which("cat")
+    assert plan.supported_args == frozenset({"--model"})
+    assert dict(plan.env_vars) == {"OPENAI_MODEL": "test"}
+    assert plan.env["OPENAI_MODEL"] == "test"
+    assert plan.env["PATH"] == os.environ["PATH"]
+    assert plan.base_argv(False) == (plan.executable, "-")
+    assert plan.base_argv(True) == (plan.executable, "-", "--skip-git-repo-check")
+    with pytest.raises(TypeError):
+        plan.env["OPENAI_MODEL"] = "changed"
+
+
+def test_plan_without_env_vars_inherits_environment(reset_cli_registry, custom_clis_path):
+    """CLI 환경 변수가 없으면 환경을 복사하지 않고 서버 환경을 상속"""
+    file_handler.get_cli_registry().add_cli(name="echo-cli", command="cat")
+
+    with patch.object(os.environ, "copy") as environ_copy:
+        plan = get_execution_plan("echo-cli")
+        assert execute_cli_file_based("echo-cli", "hello") == "hello"
+
+    assert plan.env is None
+    environ_copy.assert_not_called()
+
+
+def test_plan_is_rebuilt_when_registry_changes(reset_cli_registry, custom_clis_path):
+    """add_cli나 custom_clis.json 변경 시 새 계획 생성"""
+    registry = file_handler.get_cli_registry()
+    registry.add_cli(name="plan-cli", command="cat", timeout=10)
+    plan = get_execution_plan("plan-cli")
+
+    registry.add_cli(name="plan-cli", command="cat", timeout=20)
+    updated = get_execution_plan("plan-cli")
+    assert updated is not plan
+    assert updated.timeout == 20
+
+    custom_clis_path.write_text('{"plan-cli": {"command": "cat", "timeout": 30}}')
+    registry._runtime_clis.clear()
+    registry.add_cli(name="other-cli", command="cat")
+    assert get_execution_plan("plan-cli").timeout == 30
+
+    custom_clis_path.write_text('{"plan-cli": {"command": "cat", "timeout": 400}}')
+    assert get_execution_plan("plan-cli").timeout == 400
+
+
+def test_file_signature_check_is_throttled(reset_cli_registry, custom_clis_path, monkeypatch):
+    """version은 확인 간격마다 한 번만 파일을 stat하고, 간격이 지나면 파일 변경을 반영"""
+    monkeypatch.setattr(cli_registry, "CUSTOM_CLIS_CHECK_INTERVAL", 60)
+    registry = file_handler.get_cli_registry()
+    registry.add_cli(name="plan-cli", command="cat", timeout=10)
+    plan = get_execution_plan("plan-cli")
+
+    custom_clis_path.write_text('{"plan-cli": {"command": "cat", "timeout": 30}}')
+    registry._runtime_clis.clear()
+    with patch.object(registry, "_file_signature", wraps=registry._file_signature) as signature:
+        for _ in range(3):
+            assert get_execution_plan("plan-cli") is plan
+        assert signature.call_count == 0
+
+        now = cli_registry.time.monotonic()
+        with patch.object(cli_registry.time, "monotonic", return_value=now + 61):
+            assert get_execution_plan("plan-cli").timeout == 30
+        # 버전 확인 1회 + 바뀐 파일을 다시 읽을 때 1회
+        assert signature.call_count == 2
+
+
+def test_uninstalled_cli_is_checked_on_every_call(reset_cli_registry, custom_clis_path):
+    """미설치 CLI의 계획은 캐시하지 않아 설치 후 바로 사용 가능"""
+    file_handler.get_cli_registry().add_cli(name="late-cli", command="late-cli-cmd")
+
+    with patch.object(file_handler, "is_cli_installed", return_value=False):
+        with pytest.raises(CLINotFoundError, match="설치되지 않았습니다"):
+            execute_cli_file_based("late-cli", "hello")
+
+    with patch.object(file_handler, "is_cli_installed", return_value=True):
+        assert get_execution_plan("late-cli").executable == "late-cli-cmd"
+
+
+def test_unknown_cli_raises(reset_cli_registry, custom_clis_path):
+    """레지스트리에 없는 CLI"""
+    with pytest.raises(CLINotFoundError, match="알 수 없는 CLI"):
+        get_execution_plan("no-such-cli")
+
+
+def test_json_output_args_bypass_supported_args(reset_cli_registry, custom_clis_path):
+    """JSON 출력 인자는 supported_args에 없어도 json_output 요청 시에만 전달"""
+    file_handler.get_cli_registry().add_cli(
+        name="json-cli",
+        command="echo",
+        supported_args=["--model"],
+        json_output_args=["--format", "json"],
+    )
+
+    assert get_execution_plan("json-cli").json_output_args == ("--format", "json")
+    assert execute_cli_file_based("json-cli", "hello").strip() == ""
+    output = execute_cli_file_based("json-cli", "hello", args=["--format"], json_output=True)
+    assert output.strip() == "--format json"
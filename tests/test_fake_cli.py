@@ -0,0 +1,103 @@
+"""
+Tests for Fake CLI (부하/지연 테스트용 가짜 CLI)
+"""
+
+import io
+import random
+import sys
+import time
+
+import pytest
+
+from other_agents_mcp import fake_cli
+from other_agents_mcp.consensus import parse_vote_from_response
+from other_agents_mcp.file_handler import (
+    CLIExecutionError,
+    CLITimeoutError,
+    execute_cli_file_based,
+)
+from other_agents_mcp.meeting_schema import VoteType
+
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
+
+def _run_main(monkeypatch, capsys, prompt: str, *argv: str) -> tuple[int, str, str]:
+    """stdin을 바꿔 main을 실행하고 (종료 코드, stdout, stderr)를 반환합니다."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO(prompt))
+    code = fake_cli.main(list(argv))
+    captured = capsys.readouterr()
+    return code, captured.out, captured.err
+
+
+def test_build_response_size_and_vote():
+    """응답 크기를 맞추고 끝에 투표 태그를 붙임"""
+    response = fake_cli.build_response("hello", 1000, "disagree", random.Random(0))
+
+    assert len(response.encode("utf-8")) == 1000
+    assert response.endswith("[DISAGREE]\n")
+    assert parse_vote_from_response(response) == VoteType.DISAGREE
+
+    assert "[" not in fake_cli.build_response("hello", 0, "none", random.Random(0))
+
+
+def test_main_is_deterministic_per_prompt(monkeypatch, capsys):
+    """시드가 없으면 같은 프롬프트에 같은 응답, 알 수 없는 인자는 무시"""
+    first = _run_main(monkeypatch, capsys, "같은 질문", "--vote", "random", "--skip-git-repo-check")
+    second = _run_main(monkeypatch, capsys, "같은 질문", "--vote", "random")
+
+    assert first[0] == 0
+    assert first == second
+
+
+def test_main_exit_code(monkeypatch, capsys):
+    """종료 코드와 stderr 메시지를 설정"""
+    code, out, err = _run_main(monkeypatch, capsys, "q", "--exit-code", "3", "--error", "boom")
+
+    assert code == 3
+    assert out == ""
+    assert err == "boom\n"
+
+
+def test_stream_output_respects_rate():
+    """rate가 있으면 바이트/초 속도에 맞춰 출력"""
+    out = io.StringIO()
+    started = time.monotonic()
+    fake_cli.stream_output("x" * 400, rate=2000, chunk_size=100, out=out)
+
+    assert out.getvalue() == "x" * 400
+    assert time.monotonic() - started >= 0.19
+
+
+def test_fake_cli_args():
+    """기본값이 아닌 옵션만 인자로 변환"""
+    assert fake_cli.fake_cli_args() == ["-m", "other_agents_mcp.fake_cli", "--vote", "agree"]
+    assert fake_cli.fake_cli_args(delay=0.5, size=10, hang=True)[4:] == [
+        "--delay",
+        "0.5",
+        "--size",
+        "10",
+        "--hang",
+    ]
+    with pytest.raises(ValueError):
+        fake_cli.fake_cli_args(vote="maybe")
+
+
+def test_registered_fake_cli_runs_through_file_handler(reset_cli_registry):
+    """등록한 가짜 CLI가 실제 실행 경로(서브프로세스)로 응답"""
+    fake_cli.register_fake_cli("fake", size=2048, vote="abstain")
+
+    response = execute_cli_file_based("fake", "부하 테스트")
+
+    assert len(response.encode("utf-8")) == 2048
+    assert parse_vote_from_response(response) == VoteType.ABSTAIN
+
+
+def test_registered_fake_cli_failures(reset_cli_registry):
+    """종료 코드와 무응답은 실행 에러/타임아웃으로 전달"""
+    fake_cli.register_fake_cli("failing", exit_code=2)
+    fake_cli.register_fake_cli("hanging", hang=True)
+
+    with pytest.raises(CLIExecutionError, match="코드 2"):
+        execute_cli_file_based("failing", "q")
+    with pytest.raises(CLITimeoutError):
+        execute_cli_file_based("hanging", "q", timeout=1)
@@ -10,6 +10,8 @@ from other_agents_mcp.file_handler import (
     CLIExecutionError,
 )
 
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
 
 class TestExecuteCliFileBased:
     """Test execute_cli_file_based function"""
@@ -11,6 +11,8 @@ from other_agents_mcp.file_handler import (
     CLIExecutionError,
 )
 
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
 
 class TestFileHandlerMocked:
     """Mock 기반 file_handler 테스트"""
@@ -14,6 +14,8 @@ from other_agents_mcp.file_handler import (
     CLIExecutionError,
 )
 
+pytestmark = pytest.mark.usefixtures("instance_temp_dir", "clear_execution_plans")
+
 
 class TestExecuteCliFileBasedIntegration:
     """execute_cli_file_based 통합 테스트"""
@@ -0,0 +1,83 @@
+"""
+Tests for per-instance temp directories (인스턴스 임시 폴더, 잠금 기반 정리)
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from other_agents_mcp import file_handler
+from other_agents_mcp.file_handler import (
+    TEMP_LOCK_NAME,
+    cleanup_stale_temp_files,
+    execute_cli_file_based,
+    get_temp_dir,
+    remove_temp_dir,
+)
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def _make_instance_dir(parent: Path, name: str, age: float, locked: bool = False):
+    """다른 인스턴스가 남긴 폴더를 흉내 냅니다 (locked면 잠금을 쥔 fd 반환)."""
+    path = parent / name
+    path.mkdir()
+    (path / "other_agents_mcp_input_x.txt").write_text("leftover")
+    fd = os.open(path / TEMP_LOCK_NAME, os.O_CREAT | os.O_RDWR)
+    if locked:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        os.close(fd)
+        fd = None
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path, fd
+
+
+def test_instance_dir_holds_cli_temp_files_and_is_removed(
+    instance_temp_dir, reset_cli_registry, clear_execution_plans
+):
+    """CLI 입출력 파일은 인스턴스 폴더에 만들어지고 종료 시 폴더째 삭제"""
+    temp_dir = Path(get_temp_dir())
+    assert temp_dir.parent.parent == instance_temp_dir
+    assert temp_dir.name.startswith(f"{os.getpid()}-")
+    assert get_temp_dir() == str(temp_dir)
+
+    file_handler.get_cli_registry().add_cli(name="echo-cli", command="cat")
+    assert execute_cli_file_based("echo-cli", "hello") == "hello"
+    assert [p.name for p in temp_dir.iterdir()] == [TEMP_LOCK_NAME]
+
+    remove_temp_dir()
+    remove_temp_dir()
+    assert not temp_dir.exists()
+
+
+def test_cleanup_reaps_only_unlocked_instance_dirs(instance_temp_dir):
+    """잠금이 풀린 오래된 폴더만 삭제하고 사용 중이거나 갓 만든 폴더와 다른 파일은 유지"""
+    own = Path(get_temp_dir())
+    parent = own.parent
+    dead, _ = _make_instance_dir(parent, "111-dead", age=60)
+    young, _ = _make_instance_dir(parent, "222-young", age=0)
+    live, live_fd = _make_instance_dir(parent, "333-live", age=60, locked=True)
+    unrelated = instance_temp_dir / "other_agents_mcp_output_legacy.txt"
+    unrelated.write_text("not ours")
+
+    try:
+        assert cleanup_stale_temp_files() == 1
+    finally:
+        os.close(live_fd)
+
+    assert not dead.exists()
+    assert young.exists() and live.exists() and own.exists()
+    assert unrelated.exists()
+    # 소유 프로세스가 종료되어 잠금이 풀리면 다음 시작 때 정리
+    assert cleanup_stale_temp_files() == 1
+    assert not live.exists()
+
+
+def test_cleanup_without_parent_dir(instance_temp_dir, monkeypatch):
+    """인스턴스 폴더를 만든 적이 없으면 아무것도 하지 않음"""
+    monkeypatch.setattr(file_handler, "TEMP_ROOT", str(instance_temp_dir / "empty"))
+    assert cleanup_stale_temp_files() == 0
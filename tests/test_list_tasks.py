@@ -0,0 +1,143 @@
+"""
+Tests for list_tasks (작업 목록 필터/페이지 조회)
+"""
+
+import asyncio
+import functools
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from other_agents_mcp.sqlite_storage import SqliteStorage
+from other_agents_mcp.task_manager import InMemoryStorage, TaskManager, TaskQuery
+from other_agents_mcp.tiered_storage import TieredStorage
+
+
+async def _add(storage, task_id: str, status: str = "completed", **metadata):
+    """작업을 추가하고 실행 중이 아니면 완료 처리합니다."""
+    task = await storage.create_task(task_id, **metadata)
+    if status != "running":
+        task.status = status
+        task.completed_at = task.created_at + 0.5
+        task.result = f"{task_id} 결과"
+        await storage.update_task(task)
+    return task
+
+
+async def _seed(storage) -> dict:
+    """생성 시각이 서로 다른 작업 네 개를 추가합니다."""
+    tasks = {}
+    for task_id, status, metadata in (
+        ("t1", "completed", {"cli_name": "claude", "session_id": "s1"}),
+        ("t2", "failed", {"cli_name": "gemini"}),
+        ("t3", "completed", {"cli_name": "claude", "session_id": "s2"}),
+        ("t4", "running", {"cli_name": "claude", "session_id": "s1"}),
+    ):
+        tasks[task_id] = await _add(storage, task_id, status, **metadata)
+        await asyncio.sleep(0.002)
+    return tasks
+
+
+@pytest.fixture(params=["memory", "sqlite", "tiered"])
+def storage(request, tmp_path: Path):
+    """세 가지 저장소 구현에 같은 조회 테스트를 적용합니다."""
+    if request.param == "memory":
+        return InMemoryStorage()
+    cold = SqliteStorage(db_path=tmp_path / "tasks.db", batch_window_ms=0)
+    if request.param == "sqlite":
+        return cold
+    return TieredStorage(cold, capacity=2)
+
+
+@pytest.mark.asyncio
+async def test_filters_and_order(storage):
+    """상태/CLI/세션/시각 범위 필터가 조합되고 최근 생성 순으로 정렬"""
+    tasks = await _seed(storage)
+
+    async def ids(**filters):
+        return [t.task_id for t in await storage.list_tasks(TaskQuery(**filters))]
+
+    assert await ids() == ["t4", "t3", "t2", "t1"]
+    assert await ids(cli_name="claude") == ["t4", "t3", "t1"]
+    assert await ids(cli_name="claude", status="completed") == ["t3", "t1"]
+    assert await ids(session_id="s1") == ["t4", "t1"]
+    assert await ids(
+        created_after=tasks["t2"].created_at, created_before=tasks["t4"].created_at
+    ) == ["t3", "t2"]
+    # 완료 시각 필터는 실행 중인 작업을 제외
+    assert await ids(completed_after=0) == ["t3", "t2", "t1"]
+    assert await ids(completed_before=tasks["t3"].completed_at) == ["t2", "t1"]
+    assert await ids(cli_name="codex") == []
+
+
+@pytest.mark.asyncio
+async def test_pagination(storage):
+    """offset/limit으로 페이지를 나눠 조회"""
+    await _seed(storage)
+
+    first = await storage.list_tasks(TaskQuery(limit=3))
+    second = await storage.list_tasks(TaskQuery(limit=3, offset=3))
+    assert [t.task_id for t in first] == ["t4", "t3", "t2"]
+    assert [t.task_id for t in second] == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_index_follows_status_change():
+    """상태가 바뀌면 보조 인덱스도 갱신"""
+    storage = InMemoryStorage()
+    task = await storage.create_task("a", cli_name="claude")
+
+    assert [t.task_id for t in await storage.list_tasks(TaskQuery(status="running"))] == ["a"]
+
+    task.status = "completed"
+    await storage.update_task(task)
+    assert await storage.list_tasks(TaskQuery(status="running")) == []
+    assert [t.task_id for t in await storage.list_tasks(TaskQuery(status="completed"))] == ["a"]
+
+    await storage.delete_task("a")
+    assert await storage.list_tasks(TaskQuery(cli_name="claude")) == []
+    assert storage._index == {}
+
+
+@pytest.mark.asyncio
+async def test_manager_returns_summaries_and_next_offset(tmp_path: Path):
+    """TaskManager는 결과 본문 없이 메타데이터와 다음 페이지 offset을 반환"""
+    manager = TaskManager(storage=SqliteStorage(db_path=tmp_path / "tasks.db"))
+    task_id = await manager.start_task(
+        functools.partial(lambda: "가나다"), cli_name="claude", session_id="s1"
+    )
+    await manager.get_task_status(task_id, timeout=5)
+    await manager.store_result("x" * 10, cli_name="gemini")
+    await manager.stop()
+
+    reopened = TaskManager(storage=SqliteStorage(db_path=tmp_path / "tasks.db"))
+    page = await reopened.list_tasks(TaskQuery(cli_name="claude"))
+    assert page["next_offset"] is None
+    [summary] = page["tasks"]
+    assert summary["task_id"] == task_id
+    assert summary["session_id"] == "s1"
+    assert summary["output_bytes"] == 9
+    assert summary["duration"] >= 0
+    assert "result" not in summary
+
+    page = await reopened.list_tasks(TaskQuery(limit=1))
+    assert len(page["tasks"]) == 1
+    assert page["next_offset"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_tool():
+    """list_tasks 도구가 인자를 조회 조건으로 전달"""
+    from other_agents_mcp import server
+
+    manager = TaskManager(storage=InMemoryStorage())
+    await _seed(manager._storage)
+
+    with patch.object(server, "get_task_manager", return_value=manager):
+        response = await server.call_tool(
+            "list_tasks", {"cli_name": "claude", "status": "completed", "limit": 1}
+        )
+
+    assert [t["task_id"] for t in response["tasks"]] == ["t3"]
+    assert response["next_offset"] == 1
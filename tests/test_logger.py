@@ -3,9 +3,28 @@
 로깅 설정 및 유틸리티 테스트
 """
 
+import io
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
 
-from other_agents_mcp.logger import get_logger
+from other_agents_mcp import logger as logger_module
+from other_agents_mcp.logger import (
+    AsyncQueueHandler,
+    JsonFormatter,
+    RateLimitFilter,
+    TextFormatter,
+    get_logger,
+    shutdown_logging,
+)
+
+
+def _record(msg, *args, level=logging.INFO, name="test.pipeline", exc_info=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args or None, exc_info)
 
 
 class TestGetLogger:
@@ -52,3 +71,127 @@ class TestGetLogger:
         assert "%(name)s" in formatter._fmt
         assert "%(levelname)s" in formatter._fmt
         assert "%(message)s" in formatter._fmt
+
+
+class TestLoggingPipeline:
+    """큐/리스너 기반 로깅 파이프라인 테스트"""
+
+    def test_rate_limit_per_message_template(self):
+        """같은 템플릿은 구간당 limit건만 통과, 다음 구간 첫 기록에 생략 건수 표시"""
+        rate_filter = RateLimitFilter(limit=2, window=0.05)
+
+        results = [rate_filter.filter(_record("Total %d CLIs", i)) for i in range(5)]
+        assert results == [True, True, False, False, False]
+        # 다른 템플릿과 WARNING 이상은 제한하지 않음
+        assert rate_filter.filter(_record("다른 메시지"))
+        assert rate_filter.filter(_record("Total %d CLIs", 9, level=logging.WARNING))
+
+        time.sleep(0.06)
+        record = _record("Total %d CLIs", 10)
+        assert rate_filter.filter(record)
+        assert record.suppressed == 3
+
+    def test_queue_handler_defers_formatting_to_listener(self):
+        """핸들러는 인자만 병합하고 리스너 스레드가 형식에 맞춰 기록"""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(TextFormatter())
+        handler = AsyncQueueHandler(queue.Queue())
+        listener = logging.handlers.QueueListener(handler.queue, target)
+
+        logger = logging.getLogger("test.pipeline.listener")
+        logger.propagate = False
+        logger.addHandler(handler)
+        listener.start()
+        try:
+            original = _record("에이전트 %s 응답 완료", "claude")
+            handler.handle(original)
+        finally:
+            listener.stop()
+            logger.removeHandler(handler)
+
+        # 다른 핸들러에 전달되는 원본 레코드는 변경하지 않음
+        assert original.args == ("claude",)
+        assert stream.getvalue().rstrip().endswith("INFO - 에이전트 claude 응답 완료")
+
+    def test_full_queue_drops_and_reports_count(self):
+        """큐가 가득 차면 버리고 다음으로 들어간 레코드에 유실 건수 기록"""
+        handler = AsyncQueueHandler(queue.Queue(maxsize=1))
+        for i in range(3):
+            handler.handle(_record("msg %d", i))
+
+        handler.queue.get_nowait()
+        handler.handle(_record("msg %d", 3))
+        assert handler.queue.get_nowait().dropped == 2
+
+    def test_concurrent_drops_are_counted_exactly(self):
+        """여러 스레드가 동시에 넣어도 유실 건수를 빠짐없이 집계"""
+        handler = AsyncQueueHandler(queue.Queue(maxsize=1))
+        handler.enqueue(_record("first"))
+
+        def flood():
+            for i in range(500):
+                handler.enqueue(_record("msg %d", i))
+
+        threads = [threading.Thread(target=flood) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        handler.queue.get_nowait()
+        handler.enqueue(_record("last"))
+        assert handler.queue.get_nowait().dropped == 8 * 500
+
+    def test_shutdown_reports_pending_suppressed_counts(self, monkeypatch):
+        """리스너 종료 시 다음 기록이 없어 표시하지 못한 생략 건수를 기록"""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(TextFormatter())
+        handler = AsyncQueueHandler(queue.Queue())
+        handler.addFilter(RateLimitFilter(limit=2, window=60))
+        listener = logging.handlers.QueueListener(handler.queue, target)
+        listener.start()
+        monkeypatch.setattr(logger_module, "_queue_handler", handler)
+        monkeypatch.setattr(logger_module, "_listener", listener)
+
+        for i in range(5):
+            handler.handle(_record("Total %d CLIs", i))
+        shutdown_logging()
+        shutdown_logging()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 3
+        assert lines[-1].endswith('INFO - "Total %d CLIs" 생략 3건')
+
+    def test_json_formatter(self):
+        """JSON 형식은 한 줄 객체로 레벨/로거/메시지/예외 포함"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("실패: %s", "x", level=logging.ERROR, exc_info=sys.exc_info())
+        record.suppressed = 4
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["level"] == "ERROR"
+        assert entry["logger"] == "test.pipeline"
+        assert entry["message"] == "실패: x"
+        assert entry["suppressed"] == 4
+        assert "ValueError: boom" in entry["exception"]
+
+    def test_stderr_handler_follows_replaced_stderr(self, monkeypatch):
+        """리스너 핸들러는 생성 시점이 아닌 기록 시점의 sys.stderr에 기록"""
+        original = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", original)
+        handler = logger_module.StderrHandler()
+        handler.setFormatter(TextFormatter())
+
+        # 핸들러 생성 후 stderr가 교체되고 이전 스트림은 닫힘
+        original.close()
+        current = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", current)
+
+        handler.emit(_record("서버 시작"))
+
+        assert current.getvalue().rstrip().endswith("INFO - 서버 시작")
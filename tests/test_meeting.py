@@ -18,9 +18,12 @@ from other_agents_mcp.meeting_schema import (
 )
 from other_agents_mcp.consensus import (
     generate_meeting_system_prompt,
+    generate_meeting_round_delta,
     parse_vote_from_response,
+    parse_structured_vote,
     check_unanimous,
     check_consensus,
+    predict_consensus,
     should_continue_meeting,
     extract_consensus_statement,
 )
@@ -207,6 +210,23 @@ class TestConsensusProtocol:
         assert "이전 라운드 발언" in prompt
         assert "claude" in prompt
 
+    def test_generate_round_delta_excludes_own_response(self):
+        """세션 증분 프롬프트는 자신의 발언을 제외"""
+        previous = [
+            {"agent_name": "claude", "response": "클로드 발언", "vote": "agree"},
+            {"agent_name": "gemini", "response": "제미니 발언", "vote": "disagree"},
+        ]
+        delta = generate_meeting_round_delta(
+            round_number=3,
+            previous_responses=previous,
+            agent_name="claude",
+        )
+        assert "라운드: 3" in delta
+        assert "제미니 발언" in delta
+        assert "클로드 발언" not in delta
+        assert "[AGREE]" in delta
+        assert "disagree" not in delta.lower().replace("[disagree]", "")
+
     def test_extract_consensus_statement(self):
         """합의 내용 추출"""
         round_result = MeetingRound(round_number=1)
@@ -238,10 +258,12 @@ class TestMeetingOrchestratorMocked:
         from other_agents_mcp.meeting_orchestrator import handle_start_meeting
 
         # 빈 에이전트 목록
-        result = await handle_start_meeting({
-            "topic": "테스트",
-            "agents": ["claude"],  # 1개만 - 에러
-        })
+        result = await handle_start_meeting(
+            {
+                "topic": "테스트",
+                "agents": ["claude"],  # 1개만 - 에러
+            }
+        )
 
         assert "error" in result
         assert result["type"] == "ValidationError"
@@ -251,9 +273,11 @@ class TestMeetingOrchestratorMocked:
         """존재하지 않는 회의 조회"""
         from other_agents_mcp.meeting_orchestrator import handle_get_meeting_status
 
-        result = await handle_get_meeting_status({
-            "meeting_id": "nonexistent-id",
-        })
+        result = await handle_get_meeting_status(
+            {
+                "meeting_id": "nonexistent-id",
+            }
+        )
 
         assert "error" in result
         assert result["type"] == "NotFoundError"
@@ -279,25 +303,98 @@ class TestMeetingOrchestratorMocked:
 class TestVotePatterns:
     """투표 패턴 상세 테스트"""
 
-    @pytest.mark.parametrize("response,expected", [
-        ("I agree with this proposal. [AGREE]", VoteType.AGREE),
-        ("This is great, agreed!", VoteType.AGREE),
-        ("[동의] 좋은 의견입니다", VoteType.AGREE),
-        ("찬성합니다", VoteType.AGREE),
-        ("I disagree. [DISAGREE]", VoteType.DISAGREE),
-        ("disagreed with the approach", VoteType.DISAGREE),
-        ("[반대] 다른 방법이 좋겠습니다", VoteType.DISAGREE),
-        ("동의하지 않습니다", VoteType.DISAGREE),
-        ("[ABSTAIN] Need more information", VoteType.ABSTAIN),
-        ("기권합니다", VoteType.ABSTAIN),
-        ("판단을 유보합니다", VoteType.ABSTAIN),
-        ("No vote pattern here", VoteType.ABSTAIN),
-    ])
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            ("I agree with this proposal. [AGREE]", VoteType.AGREE),
+            ("This is great, agreed!", VoteType.AGREE),
+            ("[동의] 좋은 의견입니다", VoteType.AGREE),
+            ("찬성합니다", VoteType.AGREE),
+            ("I disagree. [DISAGREE]", VoteType.DISAGREE),
+            ("disagreed with the approach", VoteType.DISAGREE),
+            ("[반대] 다른 방법이 좋겠습니다", VoteType.DISAGREE),
+            ("동의하지 않습니다", VoteType.DISAGREE),
+            ("[ABSTAIN] Need more information", VoteType.ABSTAIN),
+            ("기권합니다", VoteType.ABSTAIN),
+            ("판단을 유보합니다", VoteType.ABSTAIN),
+            ("No vote pattern here", VoteType.ABSTAIN),
+        ],
+    )
     def test_vote_patterns(self, response, expected):
         """다양한 투표 패턴 테스트"""
         vote = parse_vote_from_response(response)
         assert vote == expected
 
+    def test_matches_legacy_parser(self):
+        """응답 끝 태그가 없는 응답은 기존 패턴 순회 구현과 동일하게 판정"""
+        import itertools
+        from tests.benchmarks.bench_vote_parser import legacy_parse_vote_from_response
+
+        phrases = [
+            "반대합니다",
+            "동의합니다",
+            "기권합니다",
+            "I Agree",
+            "I DISAGREE",
+            "disagreed",
+            "Agreed",
+            "undisagreed",
+            "판단을 유보",
+            "i abstain",
+            "의견",
+            "[동의]",
+            "[이의]",
+        ]
+        for combo in itertools.permutations(phrases, 3):
+            response = " ... ".join(combo) + " " + "설명 " * 100
+            assert parse_vote_from_response(response) == legacy_parse_vote_from_response(
+                response
+            ), response
+
+    def test_structured_vote_plain_json(self):
+        """JSON 응답에서 의견과 투표를 직접 추출"""
+        opinion, vote = parse_structured_vote(
+            '{"opinion": "캐시가 필요합니다", "vote": "disagree"}'
+        )
+        assert opinion == "캐시가 필요합니다"
+        assert vote == VoteType.DISAGREE
+
+    def test_structured_vote_unwraps_cli_envelope(self):
+        """CLI JSON 출력 래퍼(result/response)와 코드 블록 안의 투표 추출"""
+        import json
+
+        inner = '설명입니다.\n```json\n{"opinion": "좋은 안 {v2}", "vote": "AGREE"}\n```'
+        for key in ("result", "response"):
+            opinion, vote = parse_structured_vote(json.dumps({key: inner, "stats": {}}))
+            assert opinion == "좋은 안 {v2}"
+            assert vote == VoteType.AGREE
+
+    def test_structured_vote_fallback_returns_text(self):
+        """구조화된 투표가 없으면 래퍼를 벗긴 텍스트와 None 반환"""
+        import json
+
+        text, vote = parse_structured_vote(json.dumps({"result": "동의합니다 [AGREE]"}))
+        assert text == "동의합니다 [AGREE]"
+        assert vote is None
+
+        text, vote = parse_structured_vote('{"opinion": "x", "vote": "maybe"}')
+        assert vote is None
+
+    def test_tail_tag_precedence(self):
+        """응답 끝의 태그끼리도 DISAGREE > AGREE > ABSTAIN 우선순위 적용"""
+        assert parse_vote_from_response("의견 [AGREE] [DISAGREE]") == VoteType.DISAGREE
+        assert parse_vote_from_response("의견 [abstain] [agree]") == VoteType.AGREE
+
+    def test_tail_tag_overrides_quoted_phrase(self):
+        """본문에서 인용한 반대 표현보다 응답 끝의 명시적 투표 태그를 우선"""
+        response = "gemini는 '반대합니다'라고 했지만 " + "근거를 검토했습니다. " * 40 + "[AGREE]"
+        assert parse_vote_from_response(response) == VoteType.AGREE
+
+    def test_tag_outside_tail_found_by_full_scan(self):
+        """응답 끝 범위 밖의 태그는 전체 검사로 찾음"""
+        response = "[DISAGREE] " + "이유 " * 200
+        assert parse_vote_from_response(response) == VoteType.DISAGREE
+
 
 class TestConsensusTypes:
     """다양한 합의 유형 테스트"""
@@ -373,6 +470,47 @@ class TestConsensusTypes:
         assert check_consensus(round_result, ConsensusType.MAJORITY) is True
 
 
+class TestPredictConsensus:
+    """부분 응답 기반 조기 판정 테스트"""
+
+    def test_unanimous_one_disagree_is_decided(self):
+        """만장일치 - 1명 반대 시 나머지와 무관하게 합의 불가"""
+        votes = [VoteType.DISAGREE]
+        assert predict_consensus(votes, 3, ConsensusType.UNANIMOUS) is False
+
+    def test_unanimous_partial_agree_is_undecided(self):
+        """만장일치 - 일부 찬성만으로는 미정"""
+        votes = [VoteType.AGREE, VoteType.AGREE]
+        assert predict_consensus(votes, 3, ConsensusType.UNANIMOUS) is None
+
+    def test_majority_three_of_five_is_decided(self):
+        """과반수 - 5명 중 3명 찬성 시 합의 확정"""
+        votes = [VoteType.AGREE, VoteType.AGREE, VoteType.AGREE]
+        assert predict_consensus(votes, 5, ConsensusType.MAJORITY) is True
+
+    def test_majority_three_disagree_of_five_is_decided(self):
+        """과반수 - 5명 중 3명 반대 시 합의 불가"""
+        votes = [VoteType.DISAGREE, VoteType.ABSTAIN, VoteType.DISAGREE]
+        assert predict_consensus(votes, 5, ConsensusType.MAJORITY) is False
+
+    def test_supermajority_undecided(self):
+        """절대다수 - 남은 투표에 따라 달라지면 미정"""
+        votes = [VoteType.AGREE, VoteType.DISAGREE]
+        assert predict_consensus(votes, 4, ConsensusType.SUPERMAJORITY) is None
+
+    def test_prediction_matches_check_consensus(self):
+        """확정 판정은 미응답을 기권으로 채운 최종 판정과 일치"""
+        votes = [VoteType.AGREE, VoteType.AGREE, VoteType.AGREE]
+        round_result = MeetingRound(round_number=1)
+        round_result.responses = [AgentResponse(f"a{i}", "", v) for i, v in enumerate(votes)]
+        round_result.responses += [
+            AgentResponse("a3", "", VoteType.ABSTAIN),
+            AgentResponse("a4", "", VoteType.ABSTAIN),
+        ]
+        assert predict_consensus(votes, 5, ConsensusType.MAJORITY) is True
+        assert check_consensus(round_result, ConsensusType.MAJORITY) is True
+
+
 class TestBlindVoting:
     """블라인드 투표 (투표 마스킹) 테스트"""
 
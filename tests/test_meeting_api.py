@@ -3,7 +3,11 @@
 meeting_api.py 커버리지 테스트
 """
 
+import subprocess
+import sys
+
 import pytest
+from other_agents_mcp import meeting_api
 from other_agents_mcp.meeting_api import get_meeting_tools, MEETING_TOOL_SCHEMAS
 
 
@@ -51,6 +55,19 @@ class TestMeetingToolSchemas:
         assert "start_meeting" in MEETING_TOOL_SCHEMAS
         assert "get_meeting_status" in MEETING_TOOL_SCHEMAS
 
+    def test_schemas_built_on_first_access(self):
+        """import 시에는 만들지 않고 처음 참조할 때 한 번 생성하여 재사용"""
+        code = (
+            "from other_agents_mcp import meeting_api; "
+            "assert 'MEETING_TOOL_SCHEMAS' not in vars(meeting_api); "
+            "schemas = meeting_api.MEETING_TOOL_SCHEMAS; "
+            "assert vars(meeting_api)['MEETING_TOOL_SCHEMAS'] is schemas"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        with pytest.raises(AttributeError):
+            meeting_api.NO_SUCH_NAME
+
     def test_start_meeting_schema_structure(self):
         """start_meeting 스키마 구조 확인"""
         schema = MEETING_TOOL_SCHEMAS["start_meeting"]
@@ -8,6 +8,8 @@ meeting_orchestrator.py의 미커버 라인 테스트
 - 283-284, 298, 302-304, 323: 핸들러 분기
 """
 
+import os
+
 import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock, AsyncMock
@@ -80,8 +82,10 @@ class TestStartMeeting:
     @pytest.mark.asyncio
     async def test_start_meeting_success(self):
         """회의 시작 성공"""
-        with patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list, \
-             patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list,
+            patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop,
+        ):
 
             # 모킹 설정
             mock_cli1 = MagicMock()
@@ -111,8 +115,10 @@ class TestStartMeeting:
     @pytest.mark.asyncio
     async def test_start_meeting_error_during_loop(self):
         """회의 루프 중 에러 발생"""
-        with patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list, \
-             patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list,
+            patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop,
+        ):
 
             mock_cli1 = MagicMock()
             mock_cli1.name = "claude"
@@ -134,8 +140,10 @@ class TestStartMeeting:
     @pytest.mark.asyncio
     async def test_start_meeting_with_consensus_type(self):
         """합의 유형 지정 테스트"""
-        with patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list, \
-             patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_list,
+            patch("other_agents_mcp.meeting_orchestrator._run_meeting_loop") as mock_loop,
+        ):
 
             mock_cli1 = MagicMock()
             mock_cli1.name = "claude"
@@ -176,8 +184,10 @@ class TestRunMeetingLoop:
             max_rounds=5,
         )
 
-        with patch("other_agents_mcp.meeting_orchestrator._execute_round") as mock_round, \
-             patch("other_agents_mcp.meeting_orchestrator.check_consensus") as mock_check:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator._execute_round") as mock_round,
+            patch("other_agents_mcp.meeting_orchestrator.check_consensus") as mock_check,
+        ):
 
             # 첫 라운드에서 합의 도달
             mock_round_result = MeetingRound(round_number=1)
@@ -209,8 +219,10 @@ class TestRunMeetingLoop:
             max_rounds=2,
         )
 
-        with patch("other_agents_mcp.meeting_orchestrator._execute_round") as mock_round, \
-             patch("other_agents_mcp.meeting_orchestrator.check_consensus") as mock_check:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator._execute_round") as mock_round,
+            patch("other_agents_mcp.meeting_orchestrator.check_consensus") as mock_check,
+        ):
 
             # 항상 합의 실패
             mock_round_result = MeetingRound(round_number=1)
@@ -272,15 +284,569 @@ class TestExecuteRound:
             error_response = next(r for r in result.responses if "ERROR" in r.response)
             assert error_response.vote == VoteType.ABSTAIN
 
+    @pytest.mark.asyncio
+    async def test_execute_round_reports_each_arrival(self):
+        """응답이 도착할 때마다 on_response 콜백 호출"""
+        arrived = []
+
+        async def record(response):
+            arrived.append(response)
+
+        with patch("other_agents_mcp.meeting_orchestrator.execute_cli_file_based") as mock_exec:
+            mock_exec.return_value = "동의합니다 [AGREE]"
+
+            await _execute_round(
+                agents=["claude", "gemini"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                on_response=record,
+            )
+
+        assert sorted(r.agent_name for r in arrived) == ["claude", "gemini"]
+
+    @pytest.mark.asyncio
+    async def test_execute_round_structured_votes(self):
+        """구조화된 투표: JSON 출력 인자로 실행하고 JSON 투표를 직접 사용"""
+        outputs = {
+            "claude": '{"type": "result", "result": "{\\"opinion\\": \\"좋습니다\\", \\"vote\\": \\"agree\\"}"}',
+            "codex": "JSON을 잊었습니다. 반대합니다.",
+        }
+
+        def fake_exec(cli_name, message, skip_git, system_prompt, args, timeout, **kwargs):
+            fake_exec.json_output_by_agent[cli_name] = kwargs["json_output"]
+            return outputs[cli_name]
+
+        fake_exec.json_output_by_agent = {}
+
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+            side_effect=fake_exec,
+        ):
+            result = await _execute_round(
+                agents=["claude", "codex"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                structured_votes=True,
+            )
+
+        by_agent = {r.agent_name: r for r in result.responses}
+        # JSON 출력 인자는 실행 계획이 CLI 설정에서 붙임 (미지원 CLI는 빈 목록)
+        assert fake_exec.json_output_by_agent == {"claude": True, "codex": True}
+        assert by_agent["claude"].response == "좋습니다"
+        assert by_agent["claude"].vote == VoteType.AGREE
+        # JSON이 없는 응답은 태그/표현 검색으로 대체
+        assert by_agent["codex"].vote == VoteType.DISAGREE
+
+
+class TestExecuteRoundEarlyTermination:
+    """라운드 조기 종료 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_unanimous_disagree_cancels_stragglers(self):
+        """만장일치에서 반대가 나오면 느린 에이전트를 기다리지 않음"""
+        import threading
+
+        release = threading.Event()
+
+        def fake_exec(agent_name, *args, **kwargs):
+            if agent_name == "slow":
+                release.wait(timeout=5)
+                return "늦은 응답 [AGREE]"
+            return "반대 의견입니다 [DISAGREE]"
+
+        try:
+            with patch(
+                "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+                side_effect=fake_exec,
+            ):
+                result = await _execute_round(
+                    agents=["fast", "slow"],
+                    topic="테스트",
+                    system_prompt="",
+                    round_number=1,
+                    timeout=60,
+                    consensus_type=ConsensusType.UNANIMOUS,
+                    early_termination=True,
+                )
+        finally:
+            release.set()
+
+        assert result.decided_early is True
+        assert [r.agent_name for r in result.responses] == ["fast", "slow"]
+        assert result.responses[0].vote == VoteType.DISAGREE
+        assert result.responses[1].cancelled is True
+        assert result.responses[1].vote == VoteType.ABSTAIN
+
+    @pytest.mark.asyncio
+    async def test_without_early_termination_waits_for_all(self):
+        """조기 종료 비활성화 시 모든 응답 대기"""
+        with patch("other_agents_mcp.meeting_orchestrator.execute_cli_file_based") as mock_exec:
+            mock_exec.side_effect = lambda agent_name, *a, **kw: (
+                "[DISAGREE]" if agent_name == "a1" else "[AGREE]"
+            )
+
+            result = await _execute_round(
+                agents=["a1", "a2", "a3"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                consensus_type=ConsensusType.UNANIMOUS,
+                early_termination=False,
+            )
+
+        assert result.decided_early is False
+        assert not any(r.cancelled for r in result.responses)
+        assert mock_exec.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_straggler_process_is_killed(
+        self, tmp_path, monkeypatch, instance_temp_dir, clear_execution_plans
+    ):
+        """조기 종료로 취소된 에이전트의 CLI 프로세스를 종료하고 전역 슬롯을 바로 반환"""
+        import asyncio
+        import sys
+        import time
+
+        pid_file = tmp_path / "slow.pid"
+        scripts = {
+            # 느린 에이전트의 프로세스가 시작된 뒤에 반대하여 라운드를 확정
+            "claude": (
+                "import os, time\n"
+                f"while not os.path.exists({str(pid_file)!r}):\n"
+                "    time.sleep(0.01)\n"
+                "print('반대 의견입니다 [DISAGREE]')\n"
+            ),
+            "gemini": (
+                "import os, time\n"
+                f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+                "time.sleep(60)\n"
+            ),
+        }
+        for name, body in scripts.items():
+            script = tmp_path / name
+            script.write_text(f"#!{sys.executable}\n{body}")
+            script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        semaphore = asyncio.Semaphore(2)
+        started = time.monotonic()
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.get_cli_semaphore", return_value=semaphore
+        ):
+            result = await _execute_round(
+                agents=["claude", "gemini"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                consensus_type=ConsensusType.UNANIMOUS,
+                early_termination=True,
+            )
+            # 프로세스가 종료되면 스레드가 끝나면서 슬롯 반환
+            for _ in range(100):
+                if semaphore._value == 2:
+                    break
+                await asyncio.sleep(0.05)
+
+        assert result.responses[1].cancelled is True
+        assert semaphore._value == 2
+        assert time.monotonic() - started < 30
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+
+class TestRoundDeadline:
+    """라운드 소프트 마감 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_deadline_records_late_agents(self):
+        """마감 시간 내 미응답 에이전트는 지연 기권으로 기록"""
+        import threading
+
+        release = threading.Event()
+
+        def fake_exec(agent_name, *args, **kwargs):
+            if agent_name == "slow":
+                release.wait(timeout=5)
+            return "의견입니다 [AGREE]"
+
+        try:
+            with patch(
+                "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+                side_effect=fake_exec,
+            ):
+                result = await _execute_round(
+                    agents=["fast", "slow"],
+                    topic="테스트",
+                    system_prompt="",
+                    round_number=1,
+                    timeout=60,
+                    deadline=0.2,
+                )
+        finally:
+            release.set()
+
+        assert result.responses[0].vote == VoteType.AGREE
+        assert result.responses[1].late is True
+        assert result.responses[1].vote == VoteType.ABSTAIN
+        assert result.responses[1].cancelled is False
+
+    @pytest.mark.asyncio
+    async def test_late_responses_carried_into_next_round(self, meeting_transcript_dir):
+        """지연 응답이 다음 라운드 시스템 프롬프트에 포함됨"""
+        import asyncio
+        import threading
+
+        release = threading.Event()
+        prompts = []
+
+        def fake_exec(agent_name, message, skip_git, system_prompt, *args, **kwargs):
+            prompts.append(system_prompt)
+            if agent_name == "slow" and len(prompts) <= 2:
+                release.wait(timeout=5)
+                return "늦었지만 중요한 의견 [DISAGREE]"
+            return "빠른 의견 [DISAGREE]"
+
+        meeting = MeetingResult(
+            meeting_id="test-late-1",
+            topic="테스트",
+            agents=["fast", "slow"],
+            status=MeetingStatus.RUNNING,
+        )
+        config = MeetingConfig(
+            topic="테스트",
+            agents=["fast", "slow"],
+            max_rounds=2,
+            timeout_per_round=60,
+            early_termination=False,
+            round_deadline=1,
+            carry_late_responses=True,
+        )
+
+        original_execute_round = _execute_round
+
+        async def execute_round_then_release(**kwargs):
+            result = await original_execute_round(**kwargs)
+            if kwargs["round_number"] == 1:
+                release.set()
+                await asyncio.sleep(0.2)
+            return result
+
+        with (
+            patch(
+                "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+                side_effect=fake_exec,
+            ),
+            patch(
+                "other_agents_mcp.meeting_orchestrator._execute_round",
+                side_effect=execute_round_then_release,
+            ),
+        ):
+            result = await _run_meeting_loop(meeting, config)
+
+        assert result.rounds[0].responses[1].late is True
+        round2_prompt = prompts[-1]
+        assert "늦었지만 중요한 의견" in round2_prompt
+        assert "지연 응답" in round2_prompt
+
+    def test_deadline_validation(self):
+        """round_deadline은 timeout_per_round를 넘을 수 없음"""
+        config = MeetingConfig(
+            topic="테스트",
+            agents=["claude", "gemini"],
+            timeout_per_round=60,
+            round_deadline=120,
+        )
+        with pytest.raises(ValueError, match="round_deadline"):
+            config.validate()
+
+
+class TestSessionBackedRounds:
+    """세션 기반 회의 참여자 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_first_round_starts_session_with_system_prompt(self):
+        """첫 라운드는 전체 시스템 프롬프트로 세션 시작"""
+        started = set()
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.execute_with_session") as mock_session,
+            patch("other_agents_mcp.meeting_orchestrator.execute_cli_file_based") as mock_exec,
+        ):
+            mock_session.return_value = "의견 [AGREE]"
+            mock_exec.return_value = "의견 [AGREE]"
+
+            await _execute_round(
+                agents=["claude", "codex"],
+                topic="테스트",
+                system_prompt="전체 시스템 프롬프트",
+                round_number=1,
+                timeout=60,
+                session_ids={"claude": "meeting-abc-claude"},
+                started_sessions=started,
+            )
+
+        # 세션 에이전트: resume=False, 시스템 프롬프트 전달
+        args = mock_session.call_args.args
+        assert args[0] == "claude"
+        assert args[2] == "meeting-abc-claude"
+        assert args[3] is False
+        assert args[5] == "전체 시스템 프롬프트"
+        # 세션 미지원 에이전트는 stateless
+        assert mock_exec.call_args.args[0] == "codex"
+        assert started == {"claude"}
+
+    @pytest.mark.asyncio
+    async def test_later_round_sends_only_delta(self):
+        """이후 라운드는 다른 에이전트 발언만 담은 증분 프롬프트 전달"""
+        previous = [
+            {"agent_name": "claude", "response": "내 이전 발언", "vote": "agree"},
+            {"agent_name": "gemini", "response": "제미니의 이전 발언", "vote": "disagree"},
+        ]
+        with patch("other_agents_mcp.meeting_orchestrator.execute_with_session") as mock_session:
+            mock_session.return_value = "의견 [AGREE]"
+
+            await _execute_round(
+                agents=["claude", "gemini"],
+                topic="테스트",
+                system_prompt="전체 시스템 프롬프트",
+                round_number=2,
+                timeout=60,
+                session_ids={"claude": "meeting-abc-claude", "gemini": "meeting-abc-gemini"},
+                started_sessions={"claude", "gemini"},
+                previous_responses=previous,
+            )
+
+        calls = {c.args[0]: c.args for c in mock_session.call_args_list}
+        claude_args = calls["claude"]
+        assert claude_args[3] is True  # resume
+        assert claude_args[5] is None  # 시스템 프롬프트 재전송 안 함
+        assert "제미니의 이전 발언" in claude_args[1]
+        assert "내 이전 발언" not in claude_args[1]
+        assert "전체 시스템 프롬프트" not in claude_args[1]
+
+    @pytest.mark.asyncio
+    async def test_failed_session_start_after_launch_resumes_next_round(self):
+        """CLI 프로세스를 띄운 뒤 실패한 세션은 시작된 것으로 보고 다음 라운드에 재개"""
+
+        def launch_then_fail(*args, process_handle, **kwargs):
+            process_handle.attach(MagicMock())
+            raise RuntimeError("timeout")
+
+        started = set()
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.execute_with_session",
+            side_effect=launch_then_fail,
+        ):
+            result = await _execute_round(
+                agents=["claude"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                session_ids={"claude": "meeting-abc-claude"},
+                started_sessions=started,
+            )
+
+        assert result.responses[0].response.startswith("ERROR")
+        assert started == {"claude"}
+
+    @pytest.mark.asyncio
+    async def test_failed_session_start_before_launch_starts_again(self):
+        """CLI 프로세스를 띄우기 전에 실패한 세션은 다음 라운드에 다시 시작"""
+        started = set()
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.execute_with_session",
+            side_effect=ValueError("지원하지 않는 인자"),
+        ):
+            await _execute_round(
+                agents=["claude"],
+                topic="테스트",
+                system_prompt="",
+                round_number=1,
+                timeout=60,
+                session_ids={"claude": "meeting-abc-claude"},
+                started_sessions=started,
+            )
+
+        assert started == set()
+
+    @pytest.mark.asyncio
+    async def test_delta_sends_only_previous_round_with_keep_last_k(self, meeting_transcript_dir):
+        """keep_last_k로 여러 라운드를 보관해도 세션 증분에는 직전 라운드 발언만 포함"""
+        from other_agents_mcp.meeting_schema import CompactionStrategy
+
+        meeting = MeetingResult(
+            meeting_id="delta-k",
+            topic="테스트",
+            agents=["claude", "gemini"],
+            status=MeetingStatus.RUNNING,
+        )
+        config = MeetingConfig(
+            topic="테스트",
+            agents=["claude", "gemini"],
+            max_rounds=3,
+            use_sessions=True,
+            compaction=CompactionStrategy.KEEP_LAST_K,
+            compaction_keep_rounds=3,
+        )
+        gemini_round = {"n": 0}
+
+        def gemini_exec(*args, **kwargs):
+            gemini_round["n"] += 1
+            return f"제미니 {gemini_round['n']}라운드 발언 [DISAGREE]"
+
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.execute_with_session") as mock_session,
+            patch(
+                "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+                side_effect=gemini_exec,
+            ),
+            patch("other_agents_mcp.meeting_orchestrator._close_meeting_sessions"),
+        ):
+            mock_session.return_value = "의견 [AGREE]"
+            await _run_meeting_loop(meeting, config)
+
+        round3_delta = mock_session.call_args_list[2].args[1]
+        assert "제미니 2라운드 발언" in round3_delta
+        assert "제미니 1라운드 발언" not in round3_delta
+
+    @pytest.mark.asyncio
+    async def test_skips_session_with_call_still_in_flight(self):
+        """이전 라운드 지연 호출이 실행 중인 세션 에이전트는 다시 재개하지 않음"""
+        import asyncio
+
+        in_flight = asyncio.create_task(asyncio.sleep(10), name="claude")
+        try:
+            with (
+                patch("other_agents_mcp.meeting_orchestrator.execute_with_session") as mock_session,
+                patch("other_agents_mcp.meeting_orchestrator.execute_cli_file_based") as mock_exec,
+            ):
+                mock_exec.return_value = "의견 [AGREE]"
+
+                result = await _execute_round(
+                    agents=["claude", "gemini"],
+                    topic="테스트",
+                    system_prompt="",
+                    round_number=2,
+                    timeout=60,
+                    late_tasks={in_flight},
+                    session_ids={"claude": "meeting-abc-claude"},
+                    started_sessions={"claude"},
+                )
+        finally:
+            in_flight.cancel()
+
+        mock_session.assert_not_called()
+        claude, gemini = result.responses
+        assert claude.late is True
+        assert claude.vote == VoteType.ABSTAIN
+        assert gemini.vote == VoteType.AGREE
+
+    def test_build_meeting_session_ids_skips_unsupported(self):
+        """세션 미지원 에이전트는 세션 ID를 받지 않음"""
+        from other_agents_mcp.meeting_orchestrator import _build_meeting_session_ids
+
+        session_ids = _build_meeting_session_ids("abc12345", ["claude", "codex", "gemini"])
+
+        # gemini는 "--resume latest"로만 재개하므로 회의 전용 세션을 보장할 수 없음
+        assert set(session_ids) == {"claude"}
+        assert session_ids["claude"] == "meeting-abc12345-claude"
+
+    @pytest.mark.asyncio
+    async def test_session_rounds_real_argv(
+        self, tmp_path, monkeypatch, instance_temp_dir, clear_execution_plans
+    ):
+        """실제 CLI 인자: 1라운드 --session-id로 세션 생성, 2라운드 같은 ID로 --resume"""
+        import json
+        import sys
+
+        from other_agents_mcp.meeting_orchestrator import (
+            _build_meeting_session_ids,
+            _close_meeting_sessions,
+        )
+
+        argv_log = tmp_path / "argv.jsonl"
+        for name in ("claude", "gemini"):
+            script = tmp_path / name
+            script.write_text(
+                f"#!{sys.executable}\n"
+                "import json, os, sys\n"
+                "with open(os.environ['FAKE_CLI_ARGV_LOG'], 'a') as f:\n"
+                f"    f.write(json.dumps([{name!r}] + sys.argv[1:]) + '\\n')\n"
+                "print('의견 [DISAGREE]')\n"
+            )
+            script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+        monkeypatch.setenv("FAKE_CLI_ARGV_LOG", str(argv_log))
+
+        session_ids = _build_meeting_session_ids("abc12345", ["claude", "gemini"])
+        started: set[str] = set()
+        try:
+            round1 = await _execute_round(
+                agents=["claude", "gemini"],
+                topic="테스트",
+                system_prompt="전체 시스템 프롬프트",
+                round_number=1,
+                timeout=60,
+                session_ids=session_ids,
+                started_sessions=started,
+            )
+            await _execute_round(
+                agents=["claude", "gemini"],
+                topic="테스트",
+                system_prompt="전체 시스템 프롬프트",
+                round_number=2,
+                timeout=60,
+                session_ids=session_ids,
+                started_sessions=started,
+                previous_responses=[
+                    {"agent_name": r.agent_name, "response": r.response, "vote": r.vote.value}
+                    for r in round1.responses
+                ],
+            )
+        finally:
+            _close_meeting_sessions(session_ids)
+
+        calls = [json.loads(line) for line in argv_log.read_text().splitlines()]
+        claude_calls = [argv[1:] for argv in calls if argv[0] == "claude"]
+        gemini_calls = [argv[1:] for argv in calls if argv[0] == "gemini"]
+
+        assert len(claude_calls) == 2
+        cli_session_id = claude_calls[0][claude_calls[0].index("--session-id") + 1]
+        assert "--resume" not in claude_calls[0]
+        assert claude_calls[1][claude_calls[1].index("--resume") + 1] == cli_session_id
+        assert "--session-id" not in claude_calls[1]
+        # stateless 에이전트는 세션 플래그 없이 실행
+        assert len(gemini_calls) == 2
+        assert all("--resume" not in argv for argv in gemini_calls)
+
 
 class TestHandleStartMeeting:
     """handle_start_meeting 핸들러 테스트"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_scheduler(self):
+        """테스트마다 빈 회의 스케줄러 사용 (실행되지 않은 회의가 슬롯을 점유하지 않도록)"""
+        from other_agents_mcp.meeting_scheduler import MeetingScheduler
+
+        scheduler = MeetingScheduler(max_concurrent=1, max_pending=1)
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.get_meeting_scheduler", return_value=scheduler
+        ):
+            yield scheduler
+
     @pytest.mark.asyncio
     async def test_handle_start_meeting_success(self):
         """성공적인 회의 시작 - 비동기로 즉시 meeting_id 반환"""
-        with patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis, \
-             patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis,
+            patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm,
+        ):
             # Mock available CLIs
             mock_clis.return_value = [
                 type("CLI", (), {"name": "claude"})(),
@@ -292,10 +858,12 @@ class TestHandleStartMeeting:
             mock_task_manager.start_async_task = AsyncMock(return_value="test-task-id")
             mock_tm.return_value = mock_task_manager
 
-            result = await handle_start_meeting({
-                "topic": "테스트",
-                "agents": ["claude", "gemini"],
-            })
+            result = await handle_start_meeting(
+                {
+                    "topic": "테스트",
+                    "agents": ["claude", "gemini"],
+                }
+            )
 
             # 비동기 동작 확인: 즉시 meeting_id 반환
             assert "meeting_id" in result
@@ -307,8 +875,10 @@ class TestHandleStartMeeting:
     @pytest.mark.asyncio
     async def test_handle_start_meeting_with_options(self):
         """옵션이 있는 회의 시작"""
-        with patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis, \
-             patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm:
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis,
+            patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm,
+        ):
             mock_clis.return_value = [
                 type("CLI", (), {"name": "claude"})(),
                 type("CLI", (), {"name": "gemini"})(),
@@ -317,25 +887,91 @@ class TestHandleStartMeeting:
             mock_task_manager.start_async_task = AsyncMock(return_value="test-task-id")
             mock_tm.return_value = mock_task_manager
 
-            result = await handle_start_meeting({
-                "topic": "테스트",
-                "agents": ["claude", "gemini"],
-                "max_rounds": 10,
-                "timeout_per_round": 120,
-                "consensus_type": "majority",
-            })
+            result = await handle_start_meeting(
+                {
+                    "topic": "테스트",
+                    "agents": ["claude", "gemini"],
+                    "max_rounds": 10,
+                    "timeout_per_round": 120,
+                    "consensus_type": "majority",
+                }
+            )
 
             assert "meeting_id" in result
             assert result["status"] == "running"
 
+    @pytest.mark.asyncio
+    async def test_handle_start_meeting_queues_then_rejects(self, fresh_scheduler):
+        """슬롯이 없으면 대기열에 넣고, 대기열도 가득 차면 거절"""
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis,
+            patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm,
+        ):
+            mock_clis.return_value = [
+                type("CLI", (), {"name": "claude"})(),
+                type("CLI", (), {"name": "gemini"})(),
+            ]
+            mock_task_manager = MagicMock()
+            mock_task_manager.start_async_task = AsyncMock(return_value="test-task-id")
+            mock_tm.return_value = mock_task_manager
+            arguments = {"topic": "테스트", "agents": ["claude", "gemini"]}
+
+            try:
+                first = await handle_start_meeting(arguments)
+                second = await handle_start_meeting(arguments)
+                third = await handle_start_meeting(arguments)
+
+                assert first["status"] == "running"
+                assert second["status"] == "waiting"
+                assert second["queue_position"] == 1
+                assert third["type"] == "CapacityError"
+
+                status = await handle_get_meeting_status({"meeting_id": second["meeting_id"]})
+                assert status["status"] == "waiting"
+                assert status["queue_position"] == 1
+
+                # 회의는 에이전트 호출마다 CLI 슬롯을 잡으므로 전체를 감싸지 않음
+                assert mock_task_manager.start_async_task.call_args.kwargs["use_semaphore"] is False
+            finally:
+                for result in (first, second):
+                    _active_meetings.pop(result["meeting_id"], None)
+                for call in mock_task_manager.start_async_task.call_args_list:
+                    call.args[0].close()
+
+    @pytest.mark.asyncio
+    async def test_handle_start_meeting_releases_slot_on_failure(self, fresh_scheduler):
+        """작업 시작에 실패하면 접수한 스케줄러 슬롯을 반환"""
+        with (
+            patch("other_agents_mcp.meeting_orchestrator.list_available_clis") as mock_clis,
+            patch("other_agents_mcp.meeting_orchestrator.get_task_manager") as mock_tm,
+        ):
+            mock_clis.return_value = [
+                type("CLI", (), {"name": "claude"})(),
+                type("CLI", (), {"name": "gemini"})(),
+            ]
+            mock_task_manager = MagicMock()
+            mock_task_manager.start_async_task = AsyncMock(side_effect=RuntimeError("boom"))
+            mock_tm.return_value = mock_task_manager
+
+            with pytest.raises(RuntimeError, match="boom"):
+                await handle_start_meeting({"topic": "테스트", "agents": ["claude", "gemini"]})
+
+        stats = fresh_scheduler.get_stats()
+        assert stats["running"] == 0
+        assert stats["pending"] == 0
+        meeting_id = mock_task_manager.start_async_task.call_args.kwargs["task_id"]
+        assert meeting_id not in _active_meetings
+
     @pytest.mark.asyncio
     async def test_handle_start_meeting_invalid_consensus_type(self):
         """잘못된 consensus_type"""
-        result = await handle_start_meeting({
-            "topic": "테스트",
-            "agents": ["claude", "gemini"],
-            "consensus_type": "invalid_type",
-        })
+        result = await handle_start_meeting(
+            {
+                "topic": "테스트",
+                "agents": ["claude", "gemini"],
+                "consensus_type": "invalid_type",
+            }
+        )
 
         assert "error" in result
         assert result["type"] == "ValidationError"
@@ -344,10 +980,12 @@ class TestHandleStartMeeting:
     @pytest.mark.asyncio
     async def test_handle_start_meeting_validation_error(self):
         """검증 에러"""
-        result = await handle_start_meeting({
-            "topic": "테스트",
-            "agents": ["claude"],  # 1개만 - 에러
-        })
+        result = await handle_start_meeting(
+            {
+                "topic": "테스트",
+                "agents": ["claude"],  # 1개만 - 에러
+            }
+        )
 
         assert "error" in result
         assert result["type"] == "ValidationError"
@@ -360,10 +998,12 @@ class TestHandleStartMeeting:
                 type("CLI", (), {"name": "claude"})(),
             ]
 
-            result = await handle_start_meeting({
-                "topic": "테스트",
-                "agents": ["claude", "invalid_agent"],
-            })
+            result = await handle_start_meeting(
+                {
+                    "topic": "테스트",
+                    "agents": ["claude", "invalid_agent"],
+                }
+            )
 
             assert "error" in result
             assert result["type"] == "ValidationError"
@@ -388,9 +1028,7 @@ class TestHandleGetMeetingStatus:
             )
             _active_meetings["test-status-1"] = test_meeting
 
-            result = await handle_get_meeting_status({
-                "meeting_id": "test-status-1"
-            })
+            result = await handle_get_meeting_status({"meeting_id": "test-status-1"})
 
             assert result["meeting_id"] == "test-status-1"
             assert result["status"] == "running"
@@ -401,13 +1039,86 @@ class TestHandleGetMeetingStatus:
     @pytest.mark.asyncio
     async def test_handle_get_meeting_status_not_found(self):
         """존재하지 않는 회의 조회"""
-        result = await handle_get_meeting_status({
-            "meeting_id": "nonexistent-id"
-        })
+        result = await handle_get_meeting_status({"meeting_id": "nonexistent-id"})
 
         assert "error" in result
         assert result["type"] == "NotFoundError"
 
+    @pytest.mark.asyncio
+    async def test_cursor_returns_only_new_rounds_and_responses(self):
+        """커서 이후의 라운드와 진행 중 라운드의 새 응답만 반환"""
+        backup = _active_meetings.copy()
+        _active_meetings.clear()
+
+        try:
+            meeting = MeetingResult(
+                meeting_id="test-cursor-1",
+                topic="테스트",
+                agents=["claude", "gemini"],
+                status=MeetingStatus.RUNNING,
+            )
+            for n in (1, 2):
+                meeting.rounds.append(
+                    MeetingRound(
+                        round_number=n,
+                        responses=[
+                            AgentResponse(
+                                agent_name="claude", response=f"r{n}", vote=VoteType.DISAGREE
+                            ),
+                        ],
+                    )
+                )
+            meeting.in_progress_round = MeetingRound(
+                round_number=3,
+                responses=[
+                    AgentResponse(agent_name="claude", response="new-1", vote=VoteType.AGREE),
+                    AgentResponse(agent_name="gemini", response="new-2", vote=VoteType.AGREE),
+                ],
+            )
+            _active_meetings["test-cursor-1"] = meeting
+
+            result = await handle_get_meeting_status(
+                {
+                    "meeting_id": "test-cursor-1",
+                    "since_round": 1,
+                    "since_response": 5,
+                }
+            )
+            # 완료 라운드를 다 받지 않았으므로 응답 커서는 무시됨
+            assert [r["round_number"] for r in result["rounds"]] == [2]
+            assert len(result["in_progress_round"]["responses"]) == 2
+            assert result["next_cursor"] == {"since_round": 2, "since_response": 2}
+
+            result = await handle_get_meeting_status(
+                {
+                    "meeting_id": "test-cursor-1",
+                    "since_round": 2,
+                    "since_response": 1,
+                }
+            )
+            assert result["rounds"] == []
+            assert [r["response"] for r in result["in_progress_round"]["responses"]] == ["new-2"]
+            assert "topic" not in result
+        finally:
+            _active_meetings.clear()
+            _active_meetings.update(backup)
+
+    def test_completed_rounds_serialized_once(self):
+        """완료된 라운드는 한 번만 직렬화되고 이후 조회에서 재사용됨"""
+        meeting = MeetingResult(
+            meeting_id="m", topic="t", agents=["a", "b"], status=MeetingStatus.RUNNING
+        )
+        meeting.rounds.append(MeetingRound(round_number=1))
+
+        with patch.object(
+            MeetingRound, "to_dict", return_value={"round_number": 1}
+        ) as mock_to_dict:
+            meeting.to_dict()
+            meeting.to_dict()
+            meeting.to_incremental_dict(since_round=0)
+
+        assert mock_to_dict.call_count == 1
+
 
 class TestConsensusTypes:
     """다양한 합의 유형 테스트"""
@@ -415,22 +1126,30 @@ class TestConsensusTypes:
     @pytest.mark.asyncio
     async def test_supermajority_consensus(self):
         """절대다수 합의"""
-        result = await handle_start_meeting({
-            "topic": "테스트",
-            "agents": ["claude", "gemini"],
-            "consensus_type": "supermajority",
-        })
+        result = await handle_start_meeting(
+            {
+                "topic": "테스트",
+                "agents": ["claude", "gemini"],
+                "consensus_type": "supermajority",
+            }
+        )
 
         # ValidationError가 아니어야 함 (유효한 타입)
-        assert result.get("type") != "ValidationError" or "consensus_type" not in result.get("error", "")
+        assert result.get("type") != "ValidationError" or "consensus_type" not in result.get(
+            "error", ""
+        )
 
     @pytest.mark.asyncio
     async def test_unanimous_consensus(self):
         """만장일치 합의"""
-        result = await handle_start_meeting({
-            "topic": "테스트",
-            "agents": ["claude", "gemini"],
-            "consensus_type": "unanimous",
-        })
+        result = await handle_start_meeting(
+            {
+                "topic": "테스트",
+                "agents": ["claude", "gemini"],
+                "consensus_type": "unanimous",
+            }
+        )
 
-        assert result.get("type") != "ValidationError" or "consensus_type" not in result.get("error", "")
+        assert result.get("type") != "ValidationError" or "consensus_type" not in result.get(
+            "error", ""
+        )
@@ -0,0 +1,230 @@
+"""
+Tests for Meeting Scheduler (회의 동시 실행 제한, 대기열, 회의별 에이전트 제한)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from other_agents_mcp.meeting_scheduler import AgentSlots, MeetingScheduler
+from other_agents_mcp.meeting_orchestrator import _execute_round
+from other_agents_mcp.meeting_schema import MeetingConfig
+from other_agents_mcp.task_manager import InMemoryStorage, TaskManager
+
+
+@pytest.mark.asyncio
+async def test_queue_order_and_release():
+    """슬롯이 차면 대기열에 넣고, 종료 시 접수 순서대로 시작"""
+    scheduler = MeetingScheduler(max_concurrent=1, max_pending=2)
+
+    assert scheduler.submit("a") is True
+    assert scheduler.submit("b") is True
+    assert scheduler.submit("c") is True
+    assert scheduler.submit("d") is False  # 대기열 가득 참
+
+    assert scheduler.queue_position("a") is None
+    assert scheduler.queue_position("b") == 1
+    assert scheduler.queue_position("c") == 2
+
+    waiter = asyncio.create_task(scheduler.wait_for_slot("b"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    scheduler.release("a")
+    await asyncio.wait_for(waiter, timeout=1)
+    assert scheduler.queue_position("c") == 1
+    assert scheduler.get_stats()["running"] == 1
+
+
+@pytest.mark.asyncio
+async def test_release_while_waiting_removes_from_queue():
+    """대기 중 취소된 회의는 대기열에서 빠지고 슬롯을 차지하지 않음"""
+    scheduler = MeetingScheduler(max_concurrent=1, max_pending=2)
+    scheduler.submit("a")
+    scheduler.submit("b")
+    scheduler.submit("c")
+
+    scheduler.release("b")
+    assert scheduler.queue_position("c") == 1
+
+    scheduler.release("a")
+    assert scheduler.queue_position("c") is None
+    assert scheduler.get_stats() == {
+        "running": 1,
+        "pending": 0,
+        "max_concurrent": 1,
+        "max_pending": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_max_parallel_agents_caps_round_concurrency():
+    """max_parallel_agents가 라운드 내 동시 에이전트 호출 수를 제한"""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_exec(*args, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return "동의합니다 [AGREE]"
+
+    with patch(
+        "other_agents_mcp.meeting_orchestrator.execute_cli_file_based", side_effect=fake_exec
+    ):
+        result = await _execute_round(
+            agents=["claude", "gemini", "codex", "qwen"],
+            topic="테스트",
+            system_prompt="",
+            round_number=1,
+            timeout=60,
+            max_parallel_agents=2,
+        )
+
+    assert len(result.responses) == 4
+    assert state["peak"] == 2
+
+
+def _scheduler_with_running(max_concurrent: int, running: int) -> MeetingScheduler:
+    scheduler = MeetingScheduler(max_concurrent=max_concurrent)
+    for i in range(running):
+        assert scheduler.submit(f"m{i}") is True
+    return scheduler
+
+
+def test_default_max_parallel_agents_leaves_free_slot():
+    """기본 회의별 제한은 전역 슬롯 하나를 남기고 진행 중인 회의 수로 나눈 값 (최소 1)"""
+    with patch("other_agents_mcp.file_handler.MAX_CONCURRENT_CLI", 5):
+        assert _scheduler_with_running(2, 0).default_max_parallel_agents() == 4
+        assert _scheduler_with_running(2, 1).default_max_parallel_agents() == 4
+        assert _scheduler_with_running(2, 2).default_max_parallel_agents() == 2
+        assert _scheduler_with_running(4, 4).default_max_parallel_agents() == 1
+    with patch("other_agents_mcp.file_handler.MAX_CONCURRENT_CLI", 9):
+        assert _scheduler_with_running(2, 2).default_max_parallel_agents() == 4
+
+
+@pytest.mark.asyncio
+async def test_agent_slots_limit_change_applies_to_new_calls():
+    """한도를 낮추면 실행 중인 호출은 유지하고 새 호출은 한도 아래로 내려갈 때까지 대기"""
+    slots = AgentSlots(3)
+    for _ in range(3):
+        await slots.acquire()
+
+    slots.set_limit(1)
+    waiter = asyncio.create_task(slots.acquire())
+    slots.release()
+    slots.release()
+    await asyncio.sleep(0)
+    assert not waiter.done()  # 실행 중 1개 = 한도 1
+
+    slots.set_limit(2)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert slots.active == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_slots_rebalanced_when_meetings_start_and_end():
+    """회의가 추가/종료될 때 진행 중인 모든 회의의 에이전트 한도를 다시 계산"""
+    with patch("other_agents_mcp.file_handler.MAX_CONCURRENT_CLI", 5):
+        scheduler = MeetingScheduler(max_concurrent=2)
+        assert scheduler.submit("a") is True
+        first = scheduler.open_agent_slots("a")
+        assert first.limit == 4
+
+        assert scheduler.submit("b") is True
+        second = scheduler.open_agent_slots("b", max_parallel_agents=3)
+        assert (first.limit, second.limit) == (2, 2)
+
+        scheduler.close_agent_slots("a")
+        scheduler.release("a")
+        assert second.limit == 3  # 지정한 max_parallel_agents를 넘지 않음
+
+
+@pytest.mark.asyncio
+async def test_use_agent_gets_slot_while_meetings_saturated():
+    """동시 회의가 모두 에이전트를 실행 중이어도 use_agent는 CLI 슬롯을 얻음"""
+    from other_agents_mcp import server
+
+    release = threading.Event()
+    lock = threading.Lock()
+    state = {"active": 0}
+
+    def blocking_exec(*args, **kwargs):
+        with lock:
+            state["active"] += 1
+        release.wait(timeout=5)
+        with lock:
+            state["active"] -= 1
+        return "동의합니다 [AGREE]"
+
+    semaphore = asyncio.Semaphore(5)
+    agents = ["claude", "gemini", "codex", "qwen"]
+    with (
+        patch("other_agents_mcp.file_handler.MAX_CONCURRENT_CLI", 5),
+        patch(
+            "other_agents_mcp.meeting_orchestrator.get_meeting_scheduler",
+            return_value=_scheduler_with_running(2, 2),
+        ),
+        patch("other_agents_mcp.meeting_orchestrator.get_cli_semaphore", return_value=semaphore),
+        patch("other_agents_mcp.server.get_cli_semaphore", return_value=semaphore),
+        patch(
+            "other_agents_mcp.meeting_orchestrator.execute_cli_file_based",
+            side_effect=blocking_exec,
+        ),
+        patch("other_agents_mcp.server.execute_cli_file_based", return_value="ok"),
+    ):
+        meetings = [
+            asyncio.create_task(
+                _execute_round(
+                    agents=agents, topic="테스트", system_prompt="", round_number=1, timeout=60
+                )
+            )
+            for _ in range(2)
+        ]
+        try:
+            # 두 회의가 회의별 기본 제한(2)만큼 에이전트를 실행할 때까지 대기
+            for _ in range(200):
+                if state["active"] == 4:
+                    break
+                await asyncio.sleep(0.01)
+            assert state["active"] == 4
+
+            result = await asyncio.wait_for(
+                server.call_tool("use_agent", {"cli_name": "claude", "message": "hi"}), timeout=2
+            )
+            assert result == {"response": "ok"}
+        finally:
+            release.set()
+            await asyncio.gather(*meetings)
+
+
+def test_max_parallel_agents_validation():
+    """max_parallel_agents는 1 이상 에이전트 수 이하"""
+    config = MeetingConfig(topic="t", agents=["a", "b"], max_parallel_agents=3)
+    with pytest.raises(ValueError, match="max_parallel_agents"):
+        config.validate()
+
+
+@pytest.mark.asyncio
+async def test_start_async_task_without_semaphore():
+    """use_semaphore=False이면 코루틴이 CLI 슬롯을 점유하지 않음"""
+    manager = TaskManager(storage=InMemoryStorage())
+    semaphore = asyncio.Semaphore(1)
+    observed = {}
+
+    async def coro():
+        observed["locked"] = semaphore.locked()
+        return "done"
+
+    with patch("other_agents_mcp.task_manager.get_cli_semaphore", return_value=semaphore):
+        task_id = await manager.start_async_task(coro(), use_semaphore=False)
+        status = await manager.get_task_status(task_id, timeout=1)
+
+    assert status["result"] == "done"
+    assert observed["locked"] is False
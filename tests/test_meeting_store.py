@@ -0,0 +1,185 @@
+"""
+Tests for Meeting Store (InMemoryMeetingStorage, SqliteMeetingStorage)
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from other_agents_mcp.meeting_schema import (
+    AgentResponse,
+    MeetingConfig,
+    MeetingResult,
+    MeetingRound,
+    MeetingStatus,
+    VoteType,
+)
+from other_agents_mcp.meeting_store import InMemoryMeetingStorage
+from other_agents_mcp.sqlite_storage import SqliteMeetingStorage
+from other_agents_mcp import meeting_orchestrator
+
+
+def _meeting(
+    meeting_id: str = "m-1", status: MeetingStatus = MeetingStatus.RUNNING
+) -> MeetingResult:
+    return MeetingResult(
+        meeting_id=meeting_id,
+        topic="캐시 도입",
+        agents=["claude", "gemini"],
+        status=status,
+    )
+
+
+def _round(round_number: int) -> MeetingRound:
+    return MeetingRound(
+        round_number=round_number,
+        responses=[
+            AgentResponse("claude", "찬성 [AGREE]", VoteType.AGREE),
+            AgentResponse("gemini", "반대 [DISAGREE]", VoteType.DISAGREE, late=True),
+        ],
+    )
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path: Path) -> SqliteMeetingStorage:
+    """테스트용 SqliteMeetingStorage 인스턴스를 생성합니다."""
+    return SqliteMeetingStorage(db_path=tmp_path / "test_meetings.db")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_persists_rounds_incrementally(sqlite_storage: SqliteMeetingStorage):
+    """라운드 단위 저장 후 회의 전체가 복원되는지 확인합니다."""
+    meeting = _meeting()
+    await sqlite_storage.save_meeting(meeting)
+    await sqlite_storage.append_round(meeting.meeting_id, _round(1))
+    await sqlite_storage.append_round(meeting.meeting_id, _round(2))
+
+    meeting.status = MeetingStatus.NO_CONSENSUS
+    meeting.ended_at = datetime.now()
+    await sqlite_storage.save_meeting(meeting)
+
+    restored = await sqlite_storage.get_meeting(meeting.meeting_id)
+    assert restored is not None
+    assert restored.status == MeetingStatus.NO_CONSENSUS
+    assert restored.agents == ["claude", "gemini"]
+    assert [r.round_number for r in restored.rounds] == [1, 2]
+    assert restored.rounds[0].responses[1].late is True
+    assert restored.rounds[0].get_vote_summary() == {"agree": 1, "disagree": 1, "abstain": 0}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_survives_reopen_and_recovers_running(tmp_path: Path):
+    """재시작(새 인스턴스) 후 진행 중이던 회의가 에러로 복구되는지 확인합니다."""
+    db_path = tmp_path / "test_meetings.db"
+    await SqliteMeetingStorage(db_path).save_meeting(_meeting("interrupted"))
+    finished = _meeting("finished", MeetingStatus.CONSENSUS)
+    finished.ended_at = datetime.now()
+    await SqliteMeetingStorage(db_path).save_meeting(finished)
+
+    reopened = SqliteMeetingStorage(db_path)
+    assert await reopened.recover_meetings() == 1
+
+    interrupted = await reopened.get_meeting("interrupted")
+    assert interrupted.status == MeetingStatus.ERROR
+    assert interrupted.ended_at is not None
+    assert (await reopened.get_meeting("finished")).status == MeetingStatus.CONSENSUS
+
+
+@pytest.mark.asyncio
+async def test_sqlite_delete_expired(sqlite_storage: SqliteMeetingStorage):
+    """TTL이 지난 완료 회의만 라운드와 함께 삭제되는지 확인합니다."""
+    old = _meeting("old", MeetingStatus.CONSENSUS)
+    old.ended_at = datetime.now() - timedelta(hours=2)
+    await sqlite_storage.save_meeting(old)
+    await sqlite_storage.append_round("old", _round(1))
+    await sqlite_storage.save_meeting(_meeting("running"))
+
+    assert await sqlite_storage.delete_expired(ttl_seconds=3600) == ["old"]
+    assert await sqlite_storage.get_meeting("old") is None
+    assert await sqlite_storage.get_meeting("running") is not None
+
+
+@pytest.mark.asyncio
+async def test_memory_delete_expired():
+    """인-메모리 저장소도 TTL이 지난 완료 회의만 삭제하는지 확인합니다."""
+    storage = InMemoryMeetingStorage()
+    old = _meeting("old", MeetingStatus.CONSENSUS)
+    old.ended_at = datetime.now() - timedelta(hours=2)
+    await storage.save_meeting(old)
+    await storage.save_meeting(_meeting("running"))
+
+    assert await storage.delete_expired(ttl_seconds=3600) == ["old"]
+    assert await storage.get_meeting("old") is None
+    assert await storage.get_meeting("running") is not None
+
+
+@pytest.mark.asyncio
+async def test_finished_meeting_served_from_store(sqlite_storage: SqliteMeetingStorage):
+    """완료된 회의는 진행 중 목록에서 빠지고 저장소에서 조회되는지 확인합니다."""
+    meeting = _meeting("done-1")
+    config = MeetingConfig(topic="캐시 도입", agents=["claude", "gemini"])
+
+    async def fake_loop(meeting, config):
+        meeting.rounds.append(_round(1))
+        await meeting_orchestrator._persist_round(meeting, meeting.rounds[0])
+        meeting.status = MeetingStatus.NO_CONSENSUS
+        return meeting
+
+    with (
+        patch.object(meeting_orchestrator, "get_meeting_storage", return_value=sqlite_storage),
+        patch.object(meeting_orchestrator, "_run_meeting_loop", side_effect=fake_loop),
+    ):
+        meeting_orchestrator._active_meetings["done-1"] = meeting
+        await meeting_orchestrator._persist_meeting(meeting)
+
+        await meeting_orchestrator._run_meeting_async(meeting, config)
+
+        assert "done-1" not in meeting_orchestrator._active_meetings
+
+        status = await meeting_orchestrator.handle_get_meeting_status({"meeting_id": "done-1"})
+
+    assert status["status"] == "no_consensus"
+    assert status["total_rounds"] == 1
+    assert status["ended_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_single_sweeper_task():
+    """정리 작업은 회의 수와 무관하게 하나만 실행되는지 확인합니다."""
+    from other_agents_mcp import meeting_store
+
+    meeting_store.start_meeting_sweeper()
+    first = meeting_store._sweeper_task
+    meeting_store.start_meeting_sweeper()
+
+    assert meeting_store._sweeper_task is first
+
+    await meeting_store.stop_meeting_sweeper()
+    assert meeting_store._sweeper_task is None
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_caches_finished_meetings(tmp_path: Path):
+    """종료된 회의는 한 번 읽은 뒤 같은 객체로 반환하고, 진행 중인 회의는 매번 DB에서 읽음"""
+    storage = SqliteMeetingStorage(db_path=tmp_path / "test_meetings.db", cache_size=1)
+    for meeting_id in ("done-a", "done-b"):
+        meeting = _meeting(meeting_id, MeetingStatus.CONSENSUS)
+        meeting.ended_at = datetime.now()
+        await storage.save_meeting(meeting)
+        await storage.append_round(meeting_id, _round(1))
+    await storage.save_meeting(_meeting("running"))
+
+    first = await storage.get_meeting("done-a")
+    assert [r.round_number for r in first.rounds] == [1]
+    assert await storage.get_meeting("done-a") is first
+    assert await storage.get_meeting("running") is not await storage.get_meeting("running")
+
+    # 캐시 크기를 넘으면 가장 오래 조회하지 않은 회의부터 제거
+    await storage.get_meeting("done-b")
+    assert await storage.get_meeting("done-a") is not first
+
+    # 만료 삭제된 회의는 캐시에서도 제거
+    assert set(await storage.delete_expired(ttl_seconds=-1)) == {"done-a", "done-b"}
+    assert await storage.get_meeting("done-a") is None
@@ -0,0 +1,154 @@
+"""
+Tests for Meeting Transcript (회의 발언 기록 JSONL 파일)
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from other_agents_mcp import meeting_store
+from other_agents_mcp import meeting_orchestrator
+from other_agents_mcp.meeting_orchestrator import _run_meeting_loop, handle_get_meeting_status
+from other_agents_mcp.meeting_schema import (
+    AgentResponse,
+    MeetingConfig,
+    MeetingResult,
+    MeetingRound,
+    MeetingStatus,
+    VoteType,
+)
+from other_agents_mcp.meeting_store import InMemoryMeetingStorage
+from other_agents_mcp.meeting_transcript import MeetingTranscript, get_transcript_path
+
+pytestmark = pytest.mark.usefixtures("meeting_transcript_dir")
+
+
+def test_append_and_read_entry_by_offset():
+    """append가 반환한 위치로 해당 발언만 다시 읽을 수 있음"""
+    transcript = MeetingTranscript("t-1")
+    first = transcript.append({"agent_name": "claude", "response": "첫 번째 발언"})
+    second = transcript.append({"agent_name": "gemini", "response": "두 번째 발언"})
+
+    assert first[0] == 0
+    assert second[0] == first[1]
+    assert transcript.read_entry(*second)["response"] == "두 번째 발언"
+
+
+@pytest.mark.asyncio
+async def test_record_response_writes_off_event_loop():
+    """응답 기록 파일 I/O는 이벤트 루프 스레드가 아닌 작업 스레드에서 실행"""
+    transcript = MeetingTranscript("t-2")
+    round_result = MeetingRound(round_number=1)
+    writer_threads = []
+    append = transcript.append
+
+    def recording_append(entry):
+        writer_threads.append(threading.current_thread())
+        return append(entry)
+
+    with patch.object(transcript, "append", side_effect=recording_append):
+        await meeting_orchestrator._record_response(
+            transcript, round_result, AgentResponse("claude", "의견", VoteType.AGREE)
+        )
+
+    assert writer_threads and writer_threads[0] is not threading.current_thread()
+    assert round_result.responses[0].transcript_offset == 0
+
+
+@pytest.mark.asyncio
+async def test_meeting_loop_streams_full_responses_and_keeps_previews():
+    """응답 전문은 파일에 기록되고 라운드에는 미리보기만 남음"""
+    long_answer = "캐시 도입에 찬성합니다. " * 200 + "[AGREE]"
+
+    def fake_exec(cli_name, *args, **kwargs):
+        return long_answer
+
+    meeting = MeetingResult(
+        meeting_id="stream-1",
+        topic="캐시",
+        agents=["claude", "gemini"],
+        status=MeetingStatus.RUNNING,
+    )
+    config = MeetingConfig(topic="캐시", agents=["claude", "gemini"], max_rounds=1)
+
+    with (
+        patch(
+            "other_agents_mcp.meeting_orchestrator.execute_cli_file_based", side_effect=fake_exec
+        ),
+        patch("other_agents_mcp.meeting_orchestrator.RESPONSE_PREVIEW_CHARS", 100),
+    ):
+        result = await _run_meeting_loop(meeting, config)
+
+    assert result.status == MeetingStatus.CONSENSUS
+    assert result.transcript_path == str(get_transcript_path("stream-1"))
+
+    lines = [json.loads(line) for line in open(result.transcript_path, encoding="utf-8")]
+    assert [entry["round_number"] for entry in lines] == [1, 1]
+    assert all(entry["response"] == long_answer for entry in lines)
+
+    transcript = MeetingTranscript("stream-1")
+    for response in result.rounds[0].responses:
+        assert response.truncated is True
+        assert len(response.response) == 100
+        full = transcript.read_entry(response.transcript_offset, response.transcript_length)
+        assert full["agent_name"] == response.agent_name
+        assert full["response"] == long_answer
+
+    # full_responses=true이면 저장된 미리보기 대신 파일의 전문 반환
+    storage = InMemoryMeetingStorage()
+    await storage.save_meeting(result)
+    with patch.object(meeting_orchestrator, "get_meeting_storage", return_value=storage):
+        preview = await handle_get_meeting_status({"meeting_id": "stream-1"})
+        full = await handle_get_meeting_status({"meeting_id": "stream-1", "full_responses": True})
+
+    assert all(len(r["response"]) == 100 for r in preview["rounds"][0]["responses"])
+    assert all(r["response"] == long_answer for r in full["rounds"][0]["responses"])
+    assert not any(r["truncated"] for r in full["rounds"][0]["responses"])
+    assert result.serialized_rounds()[0]["responses"][0]["truncated"] is True
+
+    summary = result.to_summary_dict()
+    assert summary["rounds"] == [
+        {
+            "round_number": 1,
+            "vote_summary": {"agree": 2, "disagree": 0, "abstain": 0},
+            "decided_early": False,
+        }
+    ]
+    assert summary["transcript_path"] == result.transcript_path
+
+
+def test_shrink_keeps_responses_without_transcript():
+    """파일에 기록되지 않은 응답은 축약하지 않음"""
+    response = AgentResponse("claude", "x" * 1000, VoteType.AGREE)
+    response.shrink(10)
+    assert response.truncated is False
+    assert len(response.response) == 1000
+
+
+@pytest.mark.asyncio
+async def test_sweeper_deletes_expired_transcripts():
+    """TTL 만료 정리 시 발언 기록 파일도 함께 삭제"""
+    storage = InMemoryMeetingStorage()
+    old = MeetingResult(meeting_id="old", topic="t", agents=["a"], status=MeetingStatus.CONSENSUS)
+    old.ended_at = datetime.now() - timedelta(hours=2)
+    await storage.save_meeting(old)
+    MeetingTranscript("old").append({"n": 1})
+    MeetingTranscript("keep").append({"n": 1})
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        # 두 번째 대기에서 루프 종료
+        sleeps.append(seconds)
+        if len(sleeps) > 1:
+            raise RuntimeError("stop")
+
+    with patch.object(meeting_store.asyncio, "sleep", side_effect=fake_sleep):
+        with pytest.raises(RuntimeError):
+            await meeting_store._sweep_expired_meetings(storage, interval=1, ttl=3600)
+
+    assert not get_transcript_path("old").exists()
+    assert get_transcript_path("keep").exists()
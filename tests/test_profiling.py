@@ -0,0 +1,107 @@
+"""
+Tests for Profiling (도구 호출 프로파일링, 메모리 스냅샷)
+"""
+
+import asyncio
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from other_agents_mcp import config, profiling, server
+from other_agents_mcp.task_manager import InMemoryStorage, TaskManager
+
+
+@pytest.fixture
+def no_tracemalloc():
+    """테스트 전후로 tracemalloc 추적을 중지합니다."""
+    tracemalloc.stop()
+    yield
+    tracemalloc.stop()
+
+
+def test_should_profile_by_argument_env_and_rate():
+    """_profile 인자, MCP_PROFILE_TOOLS, 샘플링 비율로 결정"""
+    assert profiling.should_profile("list_tasks", {"_profile": True})
+    assert not profiling.should_profile("list_tasks", {})
+
+    with patch.object(config, "PROFILE_TOOLS", frozenset({"use_agent"})):
+        assert profiling.should_profile("use_agent", {})
+        assert not profiling.should_profile("list_tasks", {})
+        with patch.object(profiling, "PROFILE_SAMPLE_RATE", 0.0):
+            assert not profiling.should_profile("use_agent", {})
+
+    with patch.object(config, "PROFILE_TOOLS", frozenset({"*"})):
+        assert profiling.should_profile("list_tasks", {})
+
+
+@pytest.mark.asyncio
+async def test_call_tool_writes_pstats_when_requested(profile_dir: Path):
+    """_profile 인자는 도구에 전달되지 않고 pstats 파일 경로가 응답에 포함"""
+    manager = TaskManager(storage=InMemoryStorage())
+
+    with patch.object(server, "get_task_manager", return_value=manager):
+        response = await server.call_tool("list_tasks", {"_profile": True, "limit": 5})
+        plain = await server.call_tool("list_tasks", {"limit": 5})
+
+    path = Path(response["profile_path"])
+    assert path.parent == profile_dir
+    assert path.suffix == ".pstats"
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert response["tasks"] == []
+    assert "profile_path" not in plain
+
+
+@pytest.mark.asyncio
+async def test_sampling_mode_captures_worker_threads(profile_dir: Path):
+    """sampling 모드는 스레드에서 실행된 함수까지 collapsed 형식으로 기록"""
+
+    def blocking_work():
+        time.sleep(0.1)
+        return "done"
+
+    with (
+        patch.object(profiling, "PROFILE_MODE", "sampling"),
+        patch.object(profiling, "PROFILE_INTERVAL_MS", 1),
+    ):
+        result, path = await profiling.profile_call("demo", asyncio.to_thread(blocking_work))
+
+    assert result == "done"
+    assert path.suffix == ".collapsed"
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert any("blocking_work" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_profile_is_saved_for_failing_call(profile_dir: Path):
+    """도구가 실패해도 프로파일은 저장되고 예외는 그대로 전달"""
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await profiling.profile_call("failing", failing())
+
+    assert len(list(profile_dir.glob("*_failing_*.pstats"))) == 1
+
+
+def test_memory_snapshot_start_top_compare_and_save(no_tracemalloc, profile_dir: Path):
+    """첫 호출은 추적 시작, 이후 상위 할당 위치와 직전 대비 증가량 조회"""
+    assert profiling.memory_snapshot()["started"] is True
+
+    retained = [bytearray(1024) for _ in range(200)]
+    snapshot = profiling.memory_snapshot(limit=5)
+    assert snapshot["current_kb"] > 0
+    assert len(snapshot["top"]) <= 5
+    assert any("test_profiling.py" in item["location"] for item in snapshot["top"])
+
+    retained.extend(bytearray(1024) for _ in range(200))
+    diff = profiling.memory_snapshot(limit=3, compare=True, save=True)
+    assert "size_diff_kb" in diff["top"][0]
+    assert Path(diff["snapshot_path"]).parent == profile_dir
+    assert tracemalloc.Snapshot.load(diff["snapshot_path"]).traces
+    del retained
@@ -0,0 +1,173 @@
+"""
+Tests for Prompt Cache (register_prompt, 해시 참조, 변수 치환, 직렬화 캐시)
+"""
+
+import hashlib
+import io
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from other_agents_mcp import server
+from other_agents_mcp.consensus import generate_meeting_system_prompt
+from other_agents_mcp.file_handler import _write_yaml_prompt
+from other_agents_mcp.meeting_orchestrator import handle_start_meeting
+from other_agents_mcp.prompt_cache import PromptCache, PromptNotFoundError, get_prompt_cache
+
+pytestmark = pytest.mark.usefixtures("reset_prompt_cache")
+
+REVIEWER = "당신은 $language 코드 리뷰어입니다. 비용은 $$0입니다. ${style} 스타일로 답하세요."
+
+
+def test_register_returns_content_hash_and_variables():
+    """같은 내용은 같은 ID, 변수 목록과 기존 등록 여부 반환"""
+    cache = PromptCache()
+
+    first = cache.register(REVIEWER)
+    second = cache.register(REVIEWER)
+
+    assert first["prompt_id"] == hashlib.sha256(REVIEWER.encode("utf-8")).hexdigest()
+    assert first["variables"] == ["language", "style"]
+    assert first["size"] == len(REVIEWER.encode("utf-8"))
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["prompt_id"] == first["prompt_id"]
+
+
+def test_render_substitutes_and_reuses_result():
+    """변수 치환 결과는 같은 변수 조합에서 재사용"""
+    cache = PromptCache()
+    prompt_id = cache.register(REVIEWER)["prompt_id"]
+
+    rendered = cache.render(prompt_id, {"style": "간결한", "language": "Python"})
+    again = cache.render(prompt_id, {"language": "Python", "style": "간결한"})
+
+    assert rendered == "당신은 Python 코드 리뷰어입니다. 비용은 $0입니다. 간결한 스타일로 답하세요."
+    assert again is rendered
+    assert cache.get_stats()["renders"] == 1
+    assert cache.get_stats()["render_hits"] == 1
+
+
+def test_render_errors():
+    """누락된 변수, 잘못된 $, 등록되지 않은 ID"""
+    cache = PromptCache()
+    prompt_id = cache.register(REVIEWER)["prompt_id"]
+    broken_id = cache.register("가격: $ 10")["prompt_id"]
+
+    with pytest.raises(ValueError, match="style"):
+        cache.render(prompt_id, {"language": "Go"})
+    with pytest.raises(ValueError, match="\\$\\$"):
+        cache.render(broken_id)
+    with pytest.raises(PromptNotFoundError):
+        cache.render("0" * 64)
+
+
+def test_lru_eviction_drops_oldest_prompt():
+    """용량을 넘으면 가장 오래 사용하지 않은 템플릿과 그 치환 결과를 제거"""
+    cache = PromptCache(capacity=2)
+    first = cache.register("first $x")["prompt_id"]
+    second = cache.register("second")["prompt_id"]
+    cache.render(first, {"x": "1"})
+
+    third = cache.register("third")["prompt_id"]
+
+    cache.render(first, {"x": "1"})
+    cache.render(third)
+    with pytest.raises(PromptNotFoundError):
+        cache.render(second)
+
+
+def test_register_rejects_oversized_prompt():
+    """MCP_MAX_PROMPT_TEMPLATE_BYTES 초과"""
+    with patch("other_agents_mcp.prompt_cache.MAX_PROMPT_TEMPLATE_BYTES", 10):
+        with pytest.raises(ValueError, match="너무 깁니다"):
+            PromptCache().register("x" * 11)
+
+
+@pytest.mark.parametrize(
+    "system_prompt, message",
+    [
+        ("짧은 프롬프트", "질문"),
+        ("여러 줄\n  들여쓰기\n- 목록\nkey: value\n", "'따옴표' \"큰따옴표\" #주석"),
+        ("긴 줄 " * 300, "\n\n빈 줄\n"),
+        ("yes", "null"),
+    ],
+)
+def test_yaml_prompt_matches_single_dump(system_prompt, message):
+    """시스템 프롬프트를 따로 직렬화해도 전체를 한 번에 직렬화한 결과와 같음"""
+    expected = yaml.dump(
+        {"system_prompt": system_prompt, "prompt": message},
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+
+    for _ in range(2):
+        buffer = io.StringIO()
+        _write_yaml_prompt(buffer, system_prompt, message)
+        assert buffer.getvalue() == expected
+
+    stats = get_prompt_cache().get_stats()
+    assert (stats["serializations"], stats["serialize_hits"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_use_agent_with_registered_system_prompt():
+    """use_agent는 system_prompt_id와 prompt_vars로 시스템 프롬프트를 만들어 실행"""
+    registered = await server.call_tool("register_prompt", {"prompt": REVIEWER})
+
+    with patch.object(server, "execute_cli_file_based", return_value="ok") as mock_execute:
+        result = await server.call_tool(
+            "use_agent",
+            {
+                "cli_name": "claude",
+                "message": "리뷰해 주세요",
+                "system_prompt_id": registered["prompt_id"],
+                "prompt_vars": {"language": "Rust", "style": "친절한"},
+            },
+        )
+
+    assert result == {"response": "ok"}
+    system_prompt = mock_execute.call_args.args[3]
+    assert system_prompt.startswith("당신은 Rust 코드 리뷰어입니다.")
+
+
+@pytest.mark.asyncio
+async def test_use_agents_prompt_errors():
+    """등록되지 않은 ID, 본문과 ID 동시 지정, 변수 누락은 에러 딕셔너리로 반환"""
+    missing = await server.call_tool(
+        "use_agents", {"message": "hi", "cli_names": ["claude"], "system_prompt_id": "abc"}
+    )
+    assert missing["type"] == "PromptNotFoundError"
+
+    prompt_id = (await server.call_tool("register_prompt", {"prompt": REVIEWER}))["prompt_id"]
+    both = await server.call_tool(
+        "use_agent",
+        {
+            "cli_name": "claude",
+            "message": "hi",
+            "system_prompt": "inline",
+            "system_prompt_id": prompt_id,
+        },
+    )
+    assert both["type"] == "PromptTemplateError"
+
+    unfilled = await server.call_tool(
+        "use_agents", {"message": "hi", "cli_names": ["claude"], "system_prompt_id": prompt_id}
+    )
+    assert unfilled["type"] == "PromptTemplateError"
+
+
+@pytest.mark.asyncio
+async def test_start_meeting_context_id():
+    """회의는 context_id로 참고 자료를 참조하고 시스템 프롬프트에 포함"""
+    missing = await handle_start_meeting(
+        {"topic": "캐시 도입", "agents": ["claude", "gemini"], "context_id": "abc"}
+    )
+    assert missing["type"] == "PromptNotFoundError"
+
+    prompt_id = get_prompt_cache().register("설계 문서: $doc")["prompt_id"]
+    context = get_prompt_cache().render(prompt_id, {"doc": "LRU 캐시 설계"})
+    prompt = generate_meeting_system_prompt("캐시 도입", 1, context=context)
+
+    assert "## 참고 자료\n설계 문서: LRU 캐시 설계" in prompt
+    assert prompt.index("## 회의 주제") < prompt.index("## 참고 자료")
@@ -19,7 +19,6 @@ from other_agents_mcp.server import (
     main,
 )
 
-
 # Lifespan 테스트는 test_server_lifecycle.py에서 진행됨
 # @app.lifespan 데코레이터로 인해 직접 테스트가 어려움
 
@@ -30,16 +29,19 @@ class TestCallToolMeetingHandlers:
     @pytest.mark.asyncio
     async def test_call_tool_start_meeting(self):
         """start_meeting 도구 호출"""
-        with patch("other_agents_mcp.server.handle_start_meeting") as mock_handler:
+        with patch("other_agents_mcp.meeting_orchestrator.handle_start_meeting") as mock_handler:
             mock_handler.return_value = {
                 "meeting_id": "test-123",
                 "status": "running",
             }
 
-            result = await call_tool("start_meeting", {
-                "topic": "테스트",
-                "agents": ["claude", "gemini"],
-            })
+            result = await call_tool(
+                "start_meeting",
+                {
+                    "topic": "테스트",
+                    "agents": ["claude", "gemini"],
+                },
+            )
 
             mock_handler.assert_called_once()
             assert result["meeting_id"] == "test-123"
@@ -47,15 +49,20 @@ class TestCallToolMeetingHandlers:
     @pytest.mark.asyncio
     async def test_call_tool_get_meeting_status(self):
         """get_meeting_status 도구 호출"""
-        with patch("other_agents_mcp.server.handle_get_meeting_status") as mock_handler:
+        with patch(
+            "other_agents_mcp.meeting_orchestrator.handle_get_meeting_status"
+        ) as mock_handler:
             mock_handler.return_value = {
                 "meeting_id": "test-456",
                 "status": "consensus",
             }
 
-            result = await call_tool("get_meeting_status", {
-                "meeting_id": "test-456",
-            })
+            result = await call_tool(
+                "get_meeting_status",
+                {
+                    "meeting_id": "test-456",
+                },
+            )
 
             mock_handler.assert_called_once()
             assert result["status"] == "consensus"
@@ -66,9 +73,11 @@ class TestMainFunction:
 
     def test_main_signal_handler_setup(self):
         """시그널 핸들러 설정 확인"""
-        with patch("other_agents_mcp.server.asyncio.run") as mock_run, \
-             patch("other_agents_mcp.server.cleanup_stale_temp_files"), \
-             patch("signal.signal") as mock_signal:
+        with (
+            patch("other_agents_mcp.server.asyncio.run") as mock_run,
+            patch("other_agents_mcp.server.cleanup_stale_temp_files"),
+            patch("signal.signal") as mock_signal,
+        ):
 
             mock_run.return_value = None
 
@@ -81,10 +90,12 @@ class TestMainFunction:
 
     def test_main_keyboard_interrupt(self):
         """KeyboardInterrupt 처리"""
-        with patch("other_agents_mcp.server.asyncio.run") as mock_run, \
-             patch("other_agents_mcp.server.cleanup_stale_temp_files"), \
-             patch("other_agents_mcp.server.logger") as mock_logger, \
-             patch("sys.exit") as mock_exit:
+        with (
+            patch("other_agents_mcp.server.asyncio.run") as mock_run,
+            patch("other_agents_mcp.server.cleanup_stale_temp_files"),
+            patch("other_agents_mcp.server.logger") as mock_logger,
+            patch("sys.exit") as mock_exit,
+        ):
 
             mock_run.side_effect = KeyboardInterrupt()
 
@@ -95,9 +106,11 @@ class TestMainFunction:
 
     def test_main_cleanup_called(self):
         """시작 시 임시 파일 정리 호출"""
-        with patch("other_agents_mcp.server.asyncio.run") as mock_run, \
-             patch("other_agents_mcp.server.cleanup_stale_temp_files") as mock_cleanup, \
-             patch("signal.signal"):
+        with (
+            patch("other_agents_mcp.server.asyncio.run") as mock_run,
+            patch("other_agents_mcp.server.cleanup_stale_temp_files") as mock_cleanup,
+            patch("signal.signal"),
+        ):
 
             mock_run.return_value = None
 
@@ -107,10 +120,12 @@ class TestMainFunction:
 
     def test_main_logs_startup_info(self):
         """시작 정보 로깅"""
-        with patch("other_agents_mcp.server.asyncio.run") as mock_run, \
-             patch("other_agents_mcp.server.cleanup_stale_temp_files"), \
-             patch("other_agents_mcp.server.logger") as mock_logger, \
-             patch("signal.signal"):
+        with (
+            patch("other_agents_mcp.server.asyncio.run") as mock_run,
+            patch("other_agents_mcp.server.cleanup_stale_temp_files"),
+            patch("other_agents_mcp.server.logger") as mock_logger,
+            patch("signal.signal"),
+        ):
 
             mock_run.return_value = None
 
@@ -28,12 +28,18 @@ class TestServerInitialization:
         tools = await list_available_tools()
 
         # 5개 툴 확인
-        assert len(tools) == 7  # 기존 5개 + start_meeting, get_meeting_status
+        assert (
+            len(tools) == 11
+        )  # 기존 5개 + start_meeting, get_meeting_status, get_task_result, list_tasks, memory_snapshot, register_prompt
 
         tool_names = [tool.name for tool in tools]
         assert "list_agents" in tool_names
         assert "use_agent" in tool_names
         assert "get_task_status" in tool_names
+        assert "get_task_result" in tool_names
+        assert "list_tasks" in tool_names
+        assert "memory_snapshot" in tool_names
+        assert "register_prompt" in tool_names
         assert "add_agent" in tool_names
         assert "use_agents" in tool_names
 
@@ -353,6 +359,29 @@ class TestCallToolAddTool:
         cli_names = [cli["name"] for cli in list_result["clis"]]
         assert "test_cli" in cli_names
 
+    @pytest.mark.asyncio
+    async def test_call_tool_add_tool_json_output_args(self):
+        """add_agent로 추가한 CLI도 구조화된 투표용 JSON 출력 인자 사용"""
+        from other_agents_mcp.file_handler import get_json_output_args
+        from other_agents_mcp.server import list_available_tools
+
+        tools = await list_available_tools()
+        add_agent_tool = next(t for t in tools if t.name == "add_agent")
+        assert "json_output_args" in add_agent_tool.inputSchema["properties"]
+
+        result = await call_tool(
+            "add_agent",
+            {
+                "name": "json_cli",
+                "command": "json-cli",
+                "supported_args": ["--format"],
+                "json_output_args": ["--format", "json"],
+            },
+        )
+
+        assert result["success"] is True
+        assert get_json_output_args("json_cli") == ["--format", "json"]
+
     @pytest.mark.asyncio
     async def test_call_tool_add_tool_with_error(self):
         """add_agent 실패 케이스"""
@@ -4,9 +4,9 @@
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from other_agents_mcp.server import app, main
+from other_agents_mcp.server import app, lifespan, main
 
 
 class MockExceptionGroup(Exception):
@@ -27,6 +27,28 @@ class TestServerLifecycle:
         # lifespan은 실제 서버 실행 시에만 완전히 테스트 가능
         assert hasattr(app, "lifespan")
         assert callable(app.lifespan)
+        assert app.lifespan is lifespan
+
+    @pytest.mark.asyncio
+    async def test_lifespan_starts_meeting_sweeper(self):
+        """서버 시작 시 회의 복구와 함께 만료 회의 정리 작업 시작, 종료 시 중지"""
+        from other_agents_mcp import meeting_store
+
+        with patch("other_agents_mcp.server.get_task_manager") as mock_get_task_manager:
+            task_manager = mock_get_task_manager.return_value
+            task_manager.start = AsyncMock()
+            task_manager.stop = AsyncMock()
+
+            async with lifespan(app):
+                sweeper = meeting_store._sweeper_task
+                assert sweeper is not None
+                assert not sweeper.done()
+
+            task_manager.start.assert_awaited_once()
+            task_manager.stop.assert_awaited_once()
+
+        assert meeting_store._sweeper_task is None
+        assert sweeper.cancelled()
 
 
 class TestMainFunction:
@@ -2,11 +2,14 @@
 Tests for SqliteStorage
 """
 
+import asyncio
 import pytest
 import sqlite3
 from pathlib import Path
 
+from other_agents_mcp import sqlite_storage
 from other_agents_mcp.sqlite_storage import SqliteStorage
+from other_agents_mcp.task_manager import TaskManager
 
 
 @pytest.fixture
@@ -109,6 +112,7 @@ async def test_recover_tasks(db_path: Path):
     completed_task.status = "completed"
     completed_task.result = "done"
     await storage1.update_task(completed_task)
+    await storage1.flush()
 
     # 3. 새로운 저장소 인스턴스를 생성하여 서버 재시작을 시뮬레이션합니다.
     storage2 = SqliteStorage(db_path=db_path)
@@ -128,3 +132,194 @@ async def test_recover_tasks(db_path: Path):
     assert task3 is not None
     assert task3.status == "completed"
     assert task3.result == "done"
+
+
+def _blob_rows(db_path: Path) -> list[tuple]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT hash, size, refcount, length(data) FROM result_blobs"
+        ).fetchall()
+
+
+async def _complete(storage: SqliteStorage, task_id: str, result) -> None:
+    task = await storage.create_task(task_id)
+    task.status = "completed"
+    task.result = result
+    await storage.update_task(task)
+    await storage.flush()
+
+
+@pytest.mark.asyncio
+async def test_identical_results_share_compressed_blob(storage: SqliteStorage, db_path: Path):
+    """같은 결과는 압축 블롭 하나를 참조 카운트로 공유하는지 확인합니다."""
+    result = "반복되는 회의 응답입니다. " * 500
+    await _complete(storage, "dup-1", result)
+    await _complete(storage, "dup-2", result)
+
+    [(_, size, refcount, stored_bytes)] = _blob_rows(db_path)
+    assert refcount == 2
+    assert stored_bytes < size  # 압축 저장
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT result, result_size FROM tasks").fetchall()
+    assert rows == [(None, size), (None, size)]
+
+    assert (await storage.get_task("dup-2")).result == result
+
+
+@pytest.mark.asyncio
+async def test_delete_task_releases_blob(storage: SqliteStorage, db_path: Path):
+    """작업 삭제/결과 변경 시 참조가 없는 블롭이 삭제되는지 확인합니다."""
+    await _complete(storage, "a", "같은 결과")
+    await _complete(storage, "b", "같은 결과")
+
+    await storage.delete_task("a")
+    assert [row[2] for row in _blob_rows(db_path)] == [1]
+
+    task = await storage.get_task("b")
+    task.result = "다른 결과"
+    await storage.update_task(task)
+    await storage.flush()
+    assert [row[2] for row in _blob_rows(db_path)] == [1]
+
+    await storage.delete_task("b")
+    assert _blob_rows(db_path) == []
+    assert await storage.get_task("b") is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_skips_results(storage: SqliteStorage):
+    """get_all_tasks는 결과 본문 없이 메타데이터만 반환하는지 확인합니다."""
+    await _complete(storage, "meta-1", {"output": "큰 결과"})
+
+    [task] = await storage.get_all_tasks()
+    assert task.status == "completed"
+    assert task.result is None
+    assert task.result_size is not None
+
+
+@pytest.mark.asyncio
+async def test_legacy_inline_result_still_readable(db_path: Path):
+    """이전 버전 스키마(결과를 tasks 행에 저장)도 그대로 조회되는지 확인합니다."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE tasks (task_id TEXT PRIMARY KEY, status TEXT NOT NULL, result TEXT, "
+            "error TEXT, created_at REAL NOT NULL, completed_at REAL)"
+        )
+        conn.execute(
+            "INSERT INTO tasks VALUES ('old', 'completed', ?, NULL, 1.0, 2.0)",
+            ('"예전 결과"',),
+        )
+
+    storage = SqliteStorage(db_path=db_path)
+    task = await storage.get_task("old")
+    assert task.result == "예전 결과"
+
+    await storage.update_task(task)
+    await storage.flush()
+    assert (await storage.get_task("old")).result == "예전 결과"
+    assert len(_blob_rows(db_path)) == 1
+
+
+@pytest.mark.asyncio
+async def test_burst_of_writes_is_group_committed(db_path: Path):
+    """짧은 시간에 몰린 생성/변경이 하나의 트랜잭션으로 합쳐지는지 확인합니다."""
+    storage = SqliteStorage(db_path=db_path, batch_window_ms=50)
+    batches = []
+    write_batch = storage._write_batch
+
+    def counting_write(entries):
+        batches.append(len(entries))
+        write_batch(entries)
+
+    storage._write_batch = counting_write
+
+    for i in range(20):
+        task = await storage.create_task(f"burst-{i}")
+        task.status = "completed"
+        task.result = f"result-{i}"
+        await storage.update_task(task)
+
+    # 기록 전에도 마지막 상태가 조회됨 (read-your-writes)
+    assert (await storage.get_task("burst-7")).result == "result-7"
+    assert batches == []
+
+    await storage.flush()
+    assert batches == [20]  # 작업당 생성+변경이 한 건으로 합쳐짐
+
+    reopened = SqliteStorage(db_path=db_path)
+    assert (await reopened.get_task("burst-19")).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_pending_writes_flush_after_window(db_path: Path):
+    """지연 시간이 지나면 명시적 flush 없이도 기록되는지 확인합니다."""
+    storage = SqliteStorage(db_path=db_path, batch_window_ms=10)
+    await storage.create_task("later")
+
+    await asyncio.sleep(0.2)
+    assert storage._pending == {}
+    assert await SqliteStorage(db_path=db_path).get_task("later") is not None
+
+
+@pytest.mark.asyncio
+async def test_background_flush_retries_after_failure(db_path: Path, monkeypatch):
+    """백그라운드 기록이 실패하면 변경을 유지한 채 다시 기록하고, close가 그 작업을 정리"""
+    monkeypatch.setattr(sqlite_storage, "SQLITE_FLUSH_RETRY_SECONDS", 0.01)
+    storage = SqliteStorage(db_path=db_path, batch_window_ms=1)
+    write_batch = storage._write_batch
+    failures = []
+
+    def flaky_write_batch(entries):
+        if not failures:
+            failures.append(len(entries))
+            raise sqlite3.OperationalError("database is locked")
+        write_batch(entries)
+
+    monkeypatch.setattr(storage, "_write_batch", flaky_write_batch)
+    await storage.create_task("retry-1")
+
+    for _ in range(200):
+        if storage._background_flush is not None and storage._background_flush.done():
+            break
+        await asyncio.sleep(0.01)
+
+    assert failures == [1]
+    assert storage._pending == {}
+    assert await SqliteStorage(db_path=db_path).get_task("retry-1") is not None
+
+    await storage.close()
+    assert storage._background_flush is None
+
+
+@pytest.mark.asyncio
+async def test_close_stops_retrying_and_keeps_pending(db_path: Path, monkeypatch):
+    """기록이 계속 실패하면 close는 재시도를 멈추고 실패를 알리며 변경은 대기열에 남김"""
+    storage = SqliteStorage(db_path=db_path, batch_window_ms=1)
+
+    def failing_write_batch(entries):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(storage, "_write_batch", failing_write_batch)
+    await storage.create_task("stuck-1")
+    while storage._background_flush is None:
+        await asyncio.sleep(0.01)
+
+    with pytest.raises(sqlite3.OperationalError):
+        await asyncio.wait_for(storage.close(), timeout=5)
+
+    assert storage._background_flush is None
+    assert "stuck-1" in storage._pending
+
+
+@pytest.mark.asyncio
+async def test_task_manager_stop_flushes_pending_writes(db_path: Path):
+    """TaskManager.stop이 대기 중인 쓰기를 모두 반영하는지 확인합니다."""
+    manager = TaskManager(storage=SqliteStorage(db_path=db_path, batch_window_ms=60_000))
+    task_id = await manager.store_result("종료 직전 결과")
+
+    await manager.stop()
+
+    task = await SqliteStorage(db_path=db_path).get_task(task_id)
+    assert task.status == "completed"
+    assert task.result == "종료 직전 결과"
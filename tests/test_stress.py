@@ -0,0 +1,297 @@
+"""
+Concurrency stress tests (가짜 CLI로 대량 동시 요청 실행)
+
+- 동기/비동기/회의 요청을 섞어 수천 건 실행하고 교착, 임시 파일/프로세스 누수, 메모리 증가를 검사
+- 회의(CLI 호출마다 세마포어)와 비동기 작업(작업 전체에 세마포어)이 슬롯 하나를 두고 경쟁하는 경우
+- 무응답 CLI로 실행 슬롯이 모두 찬 상태에서 스레드 수와 상태 조회 응답성
+- 완료 작업 정리 루프와 long-polling 조회의 경합
+
+모두 slow로 표시되어 기본 실행에서는 제외됩니다:
+    pytest tests/test_stress.py -m slow -s
+    MCP_STRESS_REQUESTS=1000 pytest tests/test_stress.py -m slow -s
+"""
+
+import asyncio
+import gc
+import os
+import random
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from other_agents_mcp import (
+    file_handler,
+    meeting_orchestrator,
+    meeting_scheduler,
+    meeting_store,
+    server,
+    task_manager,
+)
+from other_agents_mcp.fake_cli import register_fake_cli
+from other_agents_mcp.meeting_scheduler import MeetingScheduler
+from other_agents_mcp.meeting_store import InMemoryMeetingStorage, stop_meeting_sweeper
+from other_agents_mcp.task_manager import InMemoryStorage, TaskManager
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.usefixtures("meeting_transcript_dir", "instance_temp_dir", "clear_execution_plans"),
+]
+
+# 혼합 부하 요청 수 (기본값은 pytest-timeout 30초 안에 끝나는 규모, 더 큰 부하는 환경 변수로 지정)
+STRESS_REQUESTS = int(os.environ.get("MCP_STRESS_REQUESTS", "100"))
+
+# 워밍업 요청 수
+STRESS_WARMUP_REQUESTS = 50
+
+# 동시에 진행하는 클라이언트 요청 수
+STRESS_CLIENTS = int(os.environ.get("MCP_STRESS_CLIENTS", "64"))
+
+# CLI 실행 슬롯 (MCP_MAX_CONCURRENT_CLI)
+STRESS_CLI_SLOTS = 4
+
+# 워밍업 이후 허용하는 Python 힙 증가량 (바이트)
+MEMORY_BUDGET_BYTES = 32 * 1024 * 1024
+
+AGENTS = ["stress-a", "stress-b", "stress-c"]
+
+
+@pytest.fixture
+def stress_env(monkeypatch, tmp_path: Path, reset_cli_registry):
+    """격리된 작업 관리자/회의 저장소/임시 폴더와 가짜 CLI를 준비합니다."""
+    # 임시 파일은 conftest의 instance_temp_dir 폴더 아래 인스턴스 폴더에 생성
+    temp_dir = Path(file_handler.get_temp_dir())
+
+    monkeypatch.setattr(file_handler, "MAX_CONCURRENT_CLI", STRESS_CLI_SLOTS)
+    monkeypatch.setattr(file_handler, "_cli_semaphore", None)
+
+    manager = TaskManager(storage=InMemoryStorage())
+    monkeypatch.setattr(task_manager, "_task_manager_instance", manager)
+    monkeypatch.setattr(meeting_store, "_meeting_storage_instance", InMemoryMeetingStorage())
+    monkeypatch.setattr(
+        meeting_scheduler,
+        "_scheduler_instance",
+        MeetingScheduler(max_concurrent=8, max_pending=STRESS_REQUESTS),
+    )
+
+    for name in AGENTS:
+        register_fake_cli(name, vote="agree")
+    register_fake_cli("stress-hang", hang=True)
+
+    yield {"manager": manager, "temp_dir": temp_dir}
+
+    meeting_orchestrator._active_meetings.clear()
+
+
+def _child_pids() -> set[int]:
+    """현재 프로세스의 자식 프로세스 ID (/proc 기반, 없으면 빈 집합)"""
+    children = set()
+    proc = Path("/proc")
+    if not proc.exists():
+        return children
+    parent = os.getpid()
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ..." - comm에 공백이 있을 수 있어 마지막 ')' 이후를 파싱
+        fields = stat[stat.rfind(")") + 2 :].split()
+        if int(fields[1]) == parent:
+            children.add(int(entry.name))
+    return children
+
+
+def _leftover_temp_files(temp_dir: Path) -> list[str]:
+    return [p.name for p in temp_dir.iterdir() if p.name != file_handler.TEMP_LOCK_NAME]
+
+
+def _report(name: str, count: int, elapsed: float) -> None:
+    print(f"\n[stress] {name}: {count}건 {elapsed:.1f}초 ({count / elapsed:.1f} req/s)")
+
+
+async def _tool(name: str, arguments: dict) -> dict:
+    response = await server.call_tool(name, arguments)
+    assert "error" not in response, response
+    return response
+
+
+async def _mixed_request(index: int) -> None:
+    """10건 중 1건은 회의, 3건은 비동기 + long-polling, 나머지는 동기 요청"""
+    message = f"stress {index}"
+    kind = index % 10
+
+    if kind == 0:
+        started = await _tool(
+            "start_meeting", {"topic": message, "agents": AGENTS[:2], "max_rounds": 1}
+        )
+        status = {"status": started["status"]}
+        while status["status"] in ("waiting", "running"):
+            await asyncio.sleep(0.05)
+            status = await _tool("get_meeting_status", {"meeting_id": started["meeting_id"]})
+        assert status["status"] == "consensus", status
+
+    elif kind <= 3:
+        started = await _tool(
+            "use_agent", {"cli_name": AGENTS[index % 3], "message": message, "run_async": True}
+        )
+        status = {"status": "running"}
+        while status["status"] == "running":
+            status = await _tool("get_task_status", {"task_id": started["task_id"], "timeout": 10})
+        assert status["status"] == "completed", status
+        assert "[AGREE]" in status["result"]
+
+    else:
+        response = await _tool("use_agent", {"cli_name": AGENTS[index % 3], "message": message})
+        assert "[AGREE]" in response["response"]
+
+
+async def _run_clients(count: int, start: int = 0) -> None:
+    """STRESS_CLIENTS개 클라이언트가 count건의 혼합 요청을 나눠 실행합니다."""
+    indexes = iter(range(start, start + count))
+
+    async def client():
+        for index in indexes:
+            await _mixed_request(index)
+
+    await asyncio.gather(*(client() for _ in range(min(STRESS_CLIENTS, count))))
+
+
+# 요청당 교착 판정 시간(1초)에 워밍업/정리 여유를 더한 제한
+@pytest.mark.timeout(30 + STRESS_WARMUP_REQUESTS + STRESS_REQUESTS)
+async def test_mixed_load_has_no_deadlocks_or_leaks(stress_env):
+    """동기/비동기/회의 혼합 부하 후 슬롯, 작업, 임시 파일, 자식 프로세스, 메모리가 원상태"""
+    manager = stress_env["manager"]
+    children_before = _child_pids()
+
+    tracemalloc.start()
+    try:
+        await _run_clients(min(STRESS_WARMUP_REQUESTS, STRESS_REQUESTS))
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        started = time.perf_counter()
+        # 요청당 1초를 넘으면 교착으로 간주
+        await asyncio.wait_for(
+            _run_clients(STRESS_REQUESTS, start=STRESS_WARMUP_REQUESTS), timeout=STRESS_REQUESTS
+        )
+        elapsed = time.perf_counter() - started
+
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        await stop_meeting_sweeper()
+
+    _report("mixed load", STRESS_REQUESTS, elapsed)
+    print(f"[stress] heap: +{(current - baseline) / 1024:.0f}KB, peak {peak / 1024 / 1024:.1f}MB")
+
+    assert current - baseline < MEMORY_BUDGET_BYTES
+    assert manager._running_tasks == {}
+    assert file_handler.get_cli_semaphore()._value == STRESS_CLI_SLOTS
+    assert meeting_scheduler.get_meeting_scheduler().get_stats()["running"] == 0
+    assert _leftover_temp_files(stress_env["temp_dir"]) == []
+    assert _child_pids() - children_before == set()
+
+
+async def test_meetings_and_async_tasks_share_single_slot(stress_env, monkeypatch):
+    """슬롯이 하나뿐이어도 회의(호출별 슬롯)와 비동기 작업(작업 전체 슬롯)이 교착 없이 완료"""
+    monkeypatch.setattr(file_handler, "MAX_CONCURRENT_CLI", 1)
+    monkeypatch.setattr(file_handler, "_cli_semaphore", None)
+    manager = stress_env["manager"]
+
+    meetings = [
+        await _tool("start_meeting", {"topic": f"m{i}", "agents": AGENTS, "max_rounds": 1})
+        for i in range(6)
+    ]
+    task_ids = [
+        (
+            await _tool(
+                "use_agent", {"cli_name": AGENTS[i % 3], "message": f"t{i}", "run_async": True}
+            )
+        )["task_id"]
+        for i in range(20)
+    ]
+
+    started = time.perf_counter()
+    await asyncio.wait_for(asyncio.gather(*manager._running_tasks.values()), timeout=120)
+    _report(
+        "single slot", len(meetings) * len(AGENTS) + len(task_ids), time.perf_counter() - started
+    )
+    await stop_meeting_sweeper()
+
+    for meeting in meetings:
+        status = await _tool("get_meeting_status", {"meeting_id": meeting["meeting_id"]})
+        assert status["status"] == "consensus"
+    for task_id in task_ids:
+        assert (await _tool("get_task_status", {"task_id": task_id}))["status"] == "completed"
+    assert file_handler.get_cli_semaphore()._value == 1
+
+
+async def test_hanging_clis_do_not_exhaust_threads(stress_env):
+    """무응답 CLI가 슬롯을 모두 차지해도 스레드 수는 슬롯 수로 제한되고 조회는 즉시 응답"""
+    children_before = _child_pids()
+    threads_before = threading.active_count()
+
+    task_ids = [
+        (
+            await _tool(
+                "use_agent",
+                {"cli_name": "stress-hang", "message": f"h{i}", "run_async": True, "timeout": 1},
+            )
+        )["task_id"]
+        for i in range(STRESS_CLI_SLOTS * 3)
+    ]
+
+    await asyncio.sleep(0.3)
+    # 실행 슬롯이 가득 찬 동안에도 CLI를 쓰지 않는 도구는 바로 응답
+    started = time.perf_counter()
+    await _tool("get_task_status", {"task_id": task_ids[-1]})
+    await _tool("list_tasks", {"cli_name": "stress-hang"})
+    assert time.perf_counter() - started < 0.5
+    assert threading.active_count() - threads_before <= STRESS_CLI_SLOTS + 1
+
+    manager = stress_env["manager"]
+    await asyncio.wait_for(asyncio.gather(*manager._running_tasks.values()), timeout=60)
+
+    for task_id in task_ids:
+        status = await server.call_tool("get_task_status", {"task_id": task_id})
+        assert status["status"] == "failed"
+        assert "타임아웃" in status["error"]
+    assert _child_pids() - children_before == set()
+    assert _leftover_temp_files(stress_env["temp_dir"]) == []
+
+
+async def test_cleanup_races_with_long_polls(stress_env):
+    """정리 루프가 완료 작업을 지우는 동안 long-polling 조회는 완료 또는 not_found만 반환"""
+    manager = stress_env["manager"]
+    cleanup = asyncio.create_task(manager._periodic_cleanup(interval=0.001, ttl=0))
+
+    async def quick_job(i: int) -> str:
+        await asyncio.sleep(random.uniform(0, 0.05))
+        return f"job {i}"
+
+    async def submit_and_poll(i: int) -> str:
+        task_id = await manager.start_async_task(quick_job(i), use_semaphore=i % 2 == 0)
+        while True:
+            status = await manager.get_task_status(task_id, timeout=5)
+            if status["status"] != "running":
+                return status["status"]
+
+    count = max(STRESS_REQUESTS // 2, 100)
+    started = time.perf_counter()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(submit_and_poll(i) for i in range(count))), timeout=60
+        )
+    finally:
+        cleanup.cancel()
+        await asyncio.gather(cleanup, return_exceptions=True)
+    _report("cleanup vs long poll", count, time.perf_counter() - started)
+
+    assert set(results) <= {"completed", "not_found"}
+    assert manager._running_tasks == {}
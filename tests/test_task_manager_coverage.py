@@ -120,19 +120,19 @@ class TestTaskManagerCoverage:
     @pytest.mark.asyncio
     async def test_get_task_status_long_polling(self, manager):
         """get_task_status: timeout(long polling) 테스트"""
-        
+
         # 1. 1초 뒤에 끝나는 작업 시작
         async def slow_task():
             await asyncio.sleep(1.0)
             return "finished"
 
         task_id = await manager.start_async_task(slow_task())
-        
+
         # 2. Timeout 0.5초로 호출 -> 여전히 running이어야 함 (0.5초 대기 후 반환)
         start_time = time.time()
         status = await manager.get_task_status(task_id, timeout=0.5)
         elapsed = time.time() - start_time
-        
+
         assert status["status"] == "running"
         assert 0.4 < elapsed < 0.7  # 대략 0.5초 대기했는지 확인
 
@@ -172,6 +172,10 @@ class TestTaskManagerCoverage:
                 "other_agents_mcp.sqlite_storage.SqliteStorage.recover_tasks",
                 new_callable=AsyncMock,
             ) as MockRecover,
+            patch(
+                "other_agents_mcp.sqlite_storage.SqliteStorage.close",
+                new_callable=AsyncMock,
+            ) as MockClose,
         ):
 
             mgr3 = get_task_manager()
@@ -184,6 +188,7 @@ class TestTaskManagerCoverage:
             await mgr3.start()
             MockRecover.assert_called_once()
             await mgr3.stop()
+            MockClose.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_start_cleanup_twice(self, manager):
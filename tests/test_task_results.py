@@ -0,0 +1,136 @@
+"""
+Tests for large task results (파일 보관, get_task_result 페이지 조회, 출력 크기 제한)
+"""
+
+import functools
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from other_agents_mcp import file_handler
+from other_agents_mcp.sqlite_storage import SqliteStorage
+from other_agents_mcp.task_manager import InMemoryStorage, TaskManager, _read_utf8_page
+
+
+async def _collect_pages(manager: TaskManager, task_id: str, length: int) -> str:
+    """next_offset을 따라 모든 페이지를 이어 붙입니다."""
+    parts, offset = [], 0
+    while offset is not None:
+        page = await manager.get_task_result(task_id, offset=offset, length=length)
+        parts.append(page["content"])
+        offset = page["next_offset"]
+    return "".join(parts)
+
+
+def test_read_utf8_page_respects_char_boundaries():
+    """페이지 경계가 멀티바이트 문자 중간이면 문자 단위로 조정"""
+    data = "가나다".encode("utf-8")  # 문자당 3바이트
+
+    assert _read_utf8_page(io.BytesIO(data), 0, 4) == ("가", 0, 3)
+    # 문자 중간에서 시작하면 다음 문자부터
+    assert _read_utf8_page(io.BytesIO(data), 1, 6) == ("나", 3, 6)
+    assert _read_utf8_page(io.BytesIO(data), 6, 10) == ("다", 6, 9)
+
+
+@pytest.mark.asyncio
+async def test_large_result_spills_to_file_and_pages(result_spill_dir: Path):
+    """임계값을 넘는 결과는 파일에 보관되고 페이지로 나눠 조회"""
+    manager = TaskManager(storage=InMemoryStorage())
+    result = "결과 한 줄입니다.\n" * 200
+
+    with (
+        patch("other_agents_mcp.task_manager.RESULT_SPILL_BYTES", 1024),
+        patch("other_agents_mcp.task_manager.RESULT_PAGE_BYTES", 1000),
+    ):
+        task_id = await manager.start_task(functools.partial(lambda: result))
+        status = await manager.get_task_status(task_id, timeout=5)
+
+        task = await manager._storage.get_task(task_id)
+        assert task.result is None
+        assert Path(task.result_path).parent == result_spill_dir
+        assert task.result_size == len(result.encode("utf-8"))
+
+        assert status["truncated"] is True
+        assert status["result_size"] == task.result_size
+        assert len(status["result"].encode("utf-8")) <= 1000
+        assert status["next_offset"] == len(status["result"].encode("utf-8"))
+
+        assert await _collect_pages(manager, task_id, length=777) == result
+
+
+@pytest.mark.asyncio
+async def test_small_result_stays_in_memory():
+    """작은 결과는 기존처럼 그대로 반환되고 get_task_result로도 조회 가능"""
+    manager = TaskManager(storage=InMemoryStorage())
+    task_id = await manager.store_result("짧은 결과")
+
+    status = await manager.get_task_status(task_id)
+    assert status == {"status": "completed", "result": "짧은 결과"}
+
+    page = await manager.get_task_result(task_id)
+    assert page["content"] == "짧은 결과"
+    assert page["next_offset"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_task_result_not_found_and_running():
+    """없는 작업/진행 중 작업은 상태만 반환"""
+    manager = TaskManager(storage=InMemoryStorage())
+    assert (await manager.get_task_result("missing"))["status"] == "not_found"
+
+    await manager._storage.create_task("running-1")
+    assert await manager.get_task_result("running-1") == {"status": "running"}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_keeps_result_location(tmp_path: Path, result_spill_dir: Path):
+    """SQLite 저장소가 결과 파일 위치를 보존"""
+    manager = TaskManager(storage=SqliteStorage(db_path=tmp_path / "tasks.db"))
+    result = "x" * 5000
+
+    with patch("other_agents_mcp.task_manager.RESULT_SPILL_BYTES", 1024):
+        task_id = await manager.store_result(result)
+    await manager.stop()
+
+    reopened = TaskManager(storage=SqliteStorage(db_path=tmp_path / "tasks.db"))
+    assert await _collect_pages(reopened, task_id, length=1500) == result
+
+
+@pytest.mark.asyncio
+async def test_sync_use_agent_pages_large_response(result_spill_dir: Path):
+    """동기 use_agent의 큰 응답은 첫 페이지와 task_id를 반환"""
+    from other_agents_mcp import server
+
+    manager = TaskManager(storage=InMemoryStorage())
+    large = "y" * 3000
+
+    with (
+        patch.object(server, "execute_cli_file_based", return_value=large),
+        patch.object(server, "get_task_manager", return_value=manager),
+        patch.object(server, "RESULT_SPILL_BYTES", 1024),
+        patch("other_agents_mcp.task_manager.RESULT_SPILL_BYTES", 1024),
+        patch("other_agents_mcp.task_manager.RESULT_PAGE_BYTES", 1000),
+    ):
+        response = await server.call_tool("use_agent", {"cli_name": "claude", "message": "hi"})
+
+        assert response["truncated"] is True
+        assert response["response"] == "y" * 1000
+        assert response["next_offset"] == 1000
+        assert await _collect_pages(manager, response["task_id"], length=1000) == large
+
+
+def test_read_output_caps_bytes(tmp_path: Path):
+    """MCP_MAX_OUTPUT_BYTES를 넘는 출력은 문자 경계에서 잘림"""
+    output = tmp_path / "out.txt"
+    output.write_text("가" * 100, encoding="utf-8")
+
+    with patch.object(file_handler, "MAX_OUTPUT_BYTES", 10):
+        response = file_handler._read_output(str(output))
+
+    assert response.startswith("가가가\n\n")
+    assert "MCP_MAX_OUTPUT_BYTES" in response
+
+    with patch.object(file_handler, "MAX_OUTPUT_BYTES", 300):
+        assert file_handler._read_output(str(output)) == "가" * 100
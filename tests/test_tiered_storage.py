@@ -0,0 +1,139 @@
+"""
+Tests for TieredStorage (LRU 메모리 계층 + SQLite 계층)
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from other_agents_mcp import config, task_manager
+from other_agents_mcp.sqlite_storage import SqliteStorage
+from other_agents_mcp.task_manager import TaskManager, get_task_manager
+from other_agents_mcp.tiered_storage import TieredStorage
+
+
+@pytest.fixture
+def cold(tmp_path: Path) -> SqliteStorage:
+    """테스트용 SQLite 계층을 생성합니다."""
+    return SqliteStorage(db_path=tmp_path / "tiered.db", batch_window_ms=0)
+
+
+async def _complete(storage: TieredStorage, task_id: str, result: str):
+    task = await storage.create_task(task_id)
+    task.status = "completed"
+    task.result = result
+    await storage.update_task(task)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_lru_demotes_completed_tasks_to_sqlite(cold: SqliteStorage):
+    """한도를 넘으면 가장 오래 사용하지 않은 완료 작업이 SQLite로 내려감"""
+    storage = TieredStorage(cold, capacity=2)
+    await _complete(storage, "a", "A")
+    await _complete(storage, "b", "B")
+    await storage.get_task("a")  # a를 최근 사용으로 갱신
+    await _complete(storage, "c", "C")
+
+    assert list(storage._hot) == ["a", "c"]
+    assert (await cold.get_task("b")).result == "B"
+
+    # 내려간 작업도 투명하게 조회되고 다시 메모리 계층으로 올라옴
+    assert (await storage.get_task("b")).result == "B"
+    assert "b" in storage._hot
+
+    stats = storage.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["demotions"] == 2  # b, 이후 b를 올리면서 a
+    assert stats["hot_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_running_tasks_are_pinned(cold: SqliteStorage):
+    """실행 중인 작업은 한도를 넘어도 메모리 계층에 유지"""
+    storage = TieredStorage(cold, capacity=1)
+    await storage.create_task("run-1")
+    await storage.create_task("run-2")
+    await _complete(storage, "done", "D")
+
+    assert set(storage._hot) == {"run-1", "run-2"}
+    assert (await cold.get_task("done")).result == "D"
+
+
+@pytest.mark.asyncio
+async def test_running_tasks_written_through_for_crash_recovery(
+    cold: SqliteStorage, tmp_path: Path
+):
+    """메모리 계층에만 있는 실행 중 작업도 SQLite에 기록되어 비정상 종료 후 복구 가능"""
+    storage = TieredStorage(cold, capacity=10)
+    await storage.create_task("running")
+    await _complete(storage, "done", "D")
+
+    # close() 없이 새 인스턴스로 재시작 (비정상 종료)
+    restarted = TieredStorage(SqliteStorage(db_path=tmp_path / "tiered.db"), capacity=10)
+    await restarted.recover_tasks()
+    assert (await restarted.get_task("running")).status == "failed"
+    assert (await restarted.get_task("done")).result == "D"
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_hot_tasks_and_recover(cold: SqliteStorage, tmp_path: Path):
+    """종료 시 메모리 계층 작업을 기록하고, 재시작 후 실행 중이던 작업을 복구"""
+    manager = TaskManager(storage=TieredStorage(cold, capacity=10))
+    task_id = await manager.store_result("결과")
+    await manager._storage.create_task("interrupted")
+    await manager.stop()
+
+    restarted = TieredStorage(SqliteStorage(db_path=tmp_path / "tiered.db"), capacity=10)
+    await restarted.recover_tasks()
+    assert (await restarted.get_task(task_id)).result == "결과"
+    assert (await restarted.get_task("interrupted")).status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_delete_and_get_all_tasks_span_both_tiers(cold: SqliteStorage):
+    """전체 조회/삭제가 두 계층 모두에 적용"""
+    storage = TieredStorage(cold, capacity=1)
+    await _complete(storage, "old", "O")
+    await _complete(storage, "new", "N")
+
+    assert {t.task_id for t in await storage.get_all_tasks()} == {"old", "new"}
+
+    await storage.delete_task("old")
+    assert await storage.get_task("old") is None
+    assert {t.task_id for t in await storage.get_all_tasks()} == {"new"}
+
+
+def test_get_task_manager_tiered(tmp_path: Path):
+    """STORAGE_TYPE=tiered이면 TieredStorage 사용"""
+    task_manager._task_manager_instance = None
+    try:
+        with (
+            patch.object(config, "STORAGE_TYPE", "tiered"),
+            patch.object(config, "SQLITE_DB_PATH", tmp_path / "tasks.db"),
+        ):
+            assert isinstance(get_task_manager()._storage, TieredStorage)
+    finally:
+        task_manager._task_manager_instance = None
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshot_reports_tier_stats(cold: SqliteStorage):
+    """memory_snapshot 도구가 계층형 저장소의 적중률 통계를 함께 반환"""
+    from other_agents_mcp.server import call_tool
+
+    manager = TaskManager(storage=TieredStorage(cold, capacity=10))
+    await _complete(manager._storage, "a", "A")
+    await manager._storage.get_task("a")
+
+    with (
+        patch("other_agents_mcp.server.get_task_manager", return_value=manager),
+        patch("other_agents_mcp.profiling.memory_snapshot", return_value={"tracing": True}),
+    ):
+        result = await call_tool("memory_snapshot", {})
+
+    assert result["tracing"] is True
+    assert result["task_storage"]["hits"] == 1
+    assert result["task_storage"]["hit_rate"] == 1.0
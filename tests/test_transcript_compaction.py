@@ -0,0 +1,162 @@
+"""Transcript Compaction Tests
+
+회의 발언 기록 압축 단계 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from other_agents_mcp.meeting_schema import CompactionStrategy, MeetingConfig
+from other_agents_mcp.transcript_compaction import (
+    TruncateCompactor,
+    KeepLastKCompactor,
+    ExtractiveCompactor,
+    SummarizerCompactor,
+    create_compactor,
+    fit_to_budget,
+)
+
+
+def _entry(agent: str, response: str, round_number: int) -> dict:
+    return {
+        "agent_name": agent,
+        "response": response,
+        "vote": "agree",
+        "round_number": round_number,
+    }
+
+
+class TestFitToBudget:
+    """바이트 예산 자르기 테스트"""
+
+    def test_within_budget_unchanged(self):
+        assert fit_to_budget("hello", 10) == "hello"
+
+    def test_multibyte_boundary_preserved(self):
+        """한글(3바이트)이 중간에서 잘리지 않음"""
+        result = fit_to_budget("가나다라", 7)
+        assert result == "가나"
+        assert len(result.encode("utf-8")) <= 7
+
+
+class TestTruncateCompactor:
+    """기본 압축기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_latest_round_with_500_chars(self):
+        """직전 라운드만 응답당 500자로 유지 (기존 동작)"""
+        transcript = [
+            _entry("claude", "old", 1),
+            _entry("claude", "x" * 1000, 2),
+            _entry("gemini", "짧은 의견", 2),
+        ]
+
+        result = await TruncateCompactor().compact(transcript)
+
+        assert [r["agent_name"] for r in result] == ["claude", "gemini"]
+        assert len(result[0]["response"]) == 500
+        assert "vote" not in result[0]
+
+    @pytest.mark.asyncio
+    async def test_budget_bounds_total_size(self):
+        """예산이 있으면 발언 수와 무관하게 전체 크기 제한"""
+        transcript = [_entry(f"agent{i}", "의견" * 500, 1) for i in range(10)]
+
+        result = await TruncateCompactor().compact(transcript, budget=1000)
+
+        total = sum(len(r["response"].encode("utf-8")) for r in result)
+        assert total <= 1000
+        assert len(result) == 10
+
+
+class TestKeepLastKCompactor:
+    """최근 K 라운드 압축기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_keeps_last_k_rounds(self):
+        transcript = [_entry("claude", f"round {n}", n) for n in range(1, 5)]
+
+        result = await KeepLastKCompactor(keep_rounds=2).compact(transcript)
+
+        assert [r["response"] for r in result] == ["round 3", "round 4"]
+
+    def test_window_rounds(self):
+        assert KeepLastKCompactor(keep_rounds=3).window_rounds == 3
+
+
+class TestExtractiveCompactor:
+    """추출 요약 압축기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_prefers_lead_and_key_sentences(self):
+        text = (
+            "캐시 계층을 도입해야 합니다. 날씨가 좋네요. 오늘은 화요일입니다. "
+            "응답 지연이 크기 때문에 효과가 있습니다. [AGREE]"
+        )
+        transcript = [_entry("claude", text, 1)]
+
+        result = await ExtractiveCompactor(keep_rounds=1).compact(transcript, budget=120)
+
+        summary = result[0]["response"]
+        assert summary.startswith("캐시 계층을 도입해야 합니다.")
+        assert "때문에" in summary
+        assert "[AGREE]" not in summary
+        assert len(summary.encode("utf-8")) <= 120
+
+
+class TestSummarizerCompactor:
+    """요약 에이전트 압축기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_uses_summarizer_agent(self):
+        transcript = [_entry("claude", "의견 A", 1), _entry("gemini", "의견 B", 1)]
+
+        with patch(
+            "other_agents_mcp.transcript_compaction.execute_cli_file_based",
+            return_value="A와 B의 요약",
+        ) as mock_exec:
+            result = await SummarizerCompactor("qwen").compact(transcript, budget=500)
+
+        assert mock_exec.call_args.args[0] == "qwen"
+        assert "의견 A" in mock_exec.call_args.args[1]
+        assert len(result) == 1
+        assert result[0]["response"] == "A와 B의 요약"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_on_error(self):
+        transcript = [_entry("claude", "의견 A", 1)]
+
+        with patch(
+            "other_agents_mcp.transcript_compaction.execute_cli_file_based",
+            side_effect=Exception("요약 실패"),
+        ):
+            result = await SummarizerCompactor("qwen").compact(transcript)
+
+        assert result[0]["agent_name"] == "claude"
+        assert result[0]["response"] == "의견 A"
+
+
+class TestCreateCompactor:
+    """설정 기반 압축기 생성 테스트"""
+
+    def test_default_is_truncate(self):
+        config = MeetingConfig(topic="t", agents=["a", "b"])
+        assert isinstance(create_compactor(config), TruncateCompactor)
+
+    def test_summarizer_requires_agent(self):
+        config = MeetingConfig(
+            topic="t", agents=["a", "b"], compaction=CompactionStrategy.SUMMARIZER
+        )
+        with pytest.raises(ValueError, match="summarizer_agent"):
+            config.validate()
+
+    def test_keep_last_k_uses_keep_rounds(self):
+        config = MeetingConfig(
+            topic="t",
+            agents=["a", "b"],
+            compaction=CompactionStrategy.KEEP_LAST_K,
+            compaction_keep_rounds=3,
+        )
+        compactor = create_compactor(config)
+        assert isinstance(compactor, KeepLastKCompactor)
+        assert compactor.window_rounds == 3